@@ -5,6 +5,7 @@
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, messagebox, simpledialog
 try:
     import ttkbootstrap as ttb
@@ -17,6 +18,9 @@ except ImportError:
 import threading
 import queue
 import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from itertools import accumulate
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 import json
@@ -33,13 +37,17 @@ from core.agent.chat_engine import (
 class ChatBubble(tk.Frame):
     """聊天气泡组件"""
 
-    def __init__(self, parent, message: str, role: str, timestamp: str = None, **kwargs):
+    # 消息内容的换行宽度（像素）
+    WRAP_LENGTH = 400
+
+    def __init__(self, parent, message: str, role: str, timestamp: str = None, streaming: bool = False, **kwargs):
         super().__init__(parent, **kwargs)
 
         self.role = role
         self.message = message
         self.timestamp = timestamp or datetime.now().strftime("%H:%M:%S")
         self.msg_label = None  # 用于后续更新消息内容
+        self.msg_text = None  # 流式气泡使用Text组件，新内容只追加到末尾
 
         # 设置样式
         self.configure(bg="#f0f0f0")
@@ -67,14 +75,14 @@ class ChatBubble(tk.Frame):
             )
             role_label.pack(side=tk.RIGHT, padx=(0, 5))
 
-            time_label = tk.Label(
+            self.time_label = tk.Label(
                 info_frame,
                 text=self.timestamp,
                 bg="#f0f0f0",
                 fg="#999999",
                 font=("Microsoft YaHei UI", 7)
             )
-            time_label.pack(side=tk.RIGHT, padx=(0, 8))
+            self.time_label.pack(side=tk.RIGHT, padx=(0, 8))
 
             # 消息气泡
             bubble_frame = tk.Frame(right_container, bg="#007bff", relief=tk.RAISED, bd=1)
@@ -110,37 +118,97 @@ class ChatBubble(tk.Frame):
             )
             role_label.pack(side=tk.LEFT, padx=(5, 0))
 
-            time_label = tk.Label(
+            self.time_label = tk.Label(
                 info_frame,
                 text=self.timestamp,
                 bg="#f0f0f0",
                 fg="#999999",
                 font=("Microsoft YaHei UI", 7)
             )
-            time_label.pack(side=tk.LEFT, padx=(8, 0))
+            self.time_label.pack(side=tk.LEFT, padx=(8, 0))
 
             # 消息气泡
             bubble_frame = tk.Frame(left_container, bg="white", relief=tk.RAISED, bd=1)
             bubble_frame.pack(fill=tk.X, pady=(2, 0), padx=(0, 50))
 
             # 消息内容
-            self.msg_label = tk.Label(
-                bubble_frame,
-                text=message,
-                bg="white",
-                fg="black",
-                wraplength=400,  # 减少wraplength避免超出显示区域
-                justify=tk.LEFT,
-                font=("Microsoft YaHei UI", 10)
-            )
-            self.msg_label.pack(padx=12, pady=10, anchor="w")
+            if streaming:
+                # Label每次更新都要重新排版全部文本，流式回复改用Text组件逐段追加
+                font = ("Microsoft YaHei UI", 10)
+                char_width = max(1, tkfont.Font(font=font).measure("0"))
+                self.msg_text = tk.Text(
+                    bubble_frame,
+                    bg="white",
+                    fg="black",
+                    font=font,
+                    wrap=tk.WORD,
+                    width=self.WRAP_LENGTH // char_width,
+                    height=1,
+                    relief=tk.FLAT,
+                    bd=0,
+                    highlightthickness=0,
+                    cursor="arrow"
+                )
+                self.msg_text.insert(tk.END, message)
+                self.msg_text.configure(state=tk.DISABLED)
+                self.msg_text.pack(padx=12, pady=10, anchor="w")
+                self._fit_text_height()
+            else:
+                self.msg_label = tk.Label(
+                    bubble_frame,
+                    text=message,
+                    bg="white",
+                    fg="black",
+                    wraplength=self.WRAP_LENGTH,  # 减少wraplength避免超出显示区域
+                    justify=tk.LEFT,
+                    font=("Microsoft YaHei UI", 10)
+                )
+                self.msg_label.pack(padx=12, pady=10, anchor="w")
 
     def update_message(self, text: str):
         """更新消息内容"""
-        if self.msg_label:
+        if self.msg_text:
+            self.msg_text.configure(state=tk.NORMAL)
+            self.msg_text.delete("1.0", tk.END)
+            self.msg_text.insert(tk.END, text)
+            self.msg_text.configure(state=tk.DISABLED)
+            self._fit_text_height()
+            self.message = text
+        elif self.msg_label:
             self.msg_label.configure(text=text)
             self.message = text
 
+    def show_message(self, message: str, timestamp: str = None):
+        """复用气泡显示另一条同角色的消息"""
+        self.timestamp = timestamp or datetime.now().strftime("%H:%M:%S")
+        self.time_label.configure(text=self.timestamp)
+        self.update_message(message)
+
+    def append_message(self, delta: str):
+        """在消息末尾追加文本，只排版新增部分"""
+        if not delta:
+            return
+        if self.msg_text:
+            self.msg_text.configure(state=tk.NORMAL)
+            self.msg_text.insert(tk.END, delta)
+            self.msg_text.configure(state=tk.DISABLED)
+            self._fit_text_height()
+            self.message += delta
+        else:
+            self.update_message(self.message + delta)
+
+    def _fit_text_height(self):
+        """让Text组件的高度与显示行数一致，效果与自动换行的Label相同"""
+        if self.msg_text.winfo_ismapped():
+            # displaylines统计的是跨过的换行数，比显示行数少1
+            wrapped = self.msg_text.count("1.0", "end-1c", "displaylines")
+            lines = (wrapped[0] if isinstance(wrapped, tuple) else wrapped or 0) + 1
+        else:
+            # 组件尚未完成布局时按逻辑行数估算
+            lines = int(self.msg_text.index("end-1c").split(".")[0])
+        if int(self.msg_text.cget("height")) != lines:
+            self.msg_text.configure(height=lines)
+
 
 class SessionListFrame(ttb.Frame):
     """会话列表框架"""
@@ -444,7 +512,23 @@ class SessionListFrame(ttb.Frame):
 
 
 class ChatDisplayFrame(ttb.Frame):
-    """聊天显示框架"""
+    """聊天显示框架
+
+    以虚拟列表显示消息：只为可见区域附近的消息放置气泡，气泡组件按角色放入池中循环复用；
+    滚动到顶部附近时通过键集分页加载更早的消息。消息实测高度按内容缓存，
+    切换会话只需加载并排版一页消息，与会话长度无关
+    """
+
+    # 每次加载的消息条数
+    PAGE_SIZE = 50
+    # 可见区域上下额外放置气泡的像素，快速滚动时减少空白
+    OVERSCAN = 400
+    # 距离顶部不足该像素时加载更早的消息
+    LOAD_MORE_THRESHOLD = 200
+    # 气泡之间的垂直间距
+    BUBBLE_SPACING = 4
+    # 缓存实测高度的消息条数
+    HEIGHT_CACHE_SIZE = 4096
 
     def __init__(self, parent, chat_app, **kwargs):
         super().__init__(parent, **kwargs)
@@ -452,106 +536,376 @@ class ChatDisplayFrame(ttb.Frame):
 
         # 创建滚动区域
         self.canvas = tk.Canvas(self, bg="#f0f0f0", highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
-        self.chat_frame = tk.Frame(self.canvas, bg="#f0f0f0")
-
-        self.chat_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-
-        self.canvas.create_window((0, 0), window=self.chat_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
 
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         # 鼠标滚轮支持
         def _on_mousewheel(event):
             self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
         self.canvas.bind("<MouseWheel>", _on_mousewheel)
-
-        self.bubbles = []
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+
+        self.messages = []  # 已加载的消息，按时间顺序
+        self.heights = []  # 每条消息占用的高度（像素，含间距），未实测的为估算值
+        self.offsets = [0]  # offsets[i] 为第i条消息顶部的y坐标，最后一项为总高度
+        self.has_more = False  # 是否还有更早的消息未加载
+        self.visible = {}  # 消息下标 -> (气泡, 画布窗口id)
+        self.pool = {"user": [], "assistant": []}  # 空闲的 (气泡, 画布窗口id)
+        self.streaming_index = None  # 正在流式生成的回复在消息列表中的下标
+        self.streaming_bubble = None
+        self.streaming_window = None
+        self.height_cache = OrderedDict()  # (角色, 内容) -> 实测高度
+        self.font = tkfont.Font(font=("Microsoft YaHei UI", 10))
+        self.chrome_height = 60  # 气泡中文字以外部分的高度，实测单行消息后校正
+        self._width = 1
+        self._region_height = 1
+        self._render_pending = False
+
+        self.empty_label = tk.Label(
+            self.canvas,
+            text="暂无对话记录\n开始你的第一次对话吧！",
+            font=("Microsoft YaHei UI", 12),
+            bg="#f0f0f0",
+            fg="#999999"
+        )
+        self.empty_window = self.canvas.create_window(0, 20, window=self.empty_label, anchor="n", state="hidden")
 
         # 延迟显示，等待会话初始化完成
         self.chat_app.root.after(100, self.refresh_display)
 
     def refresh_display(self):
-        """刷新聊天显示"""
-        # 清空现有气泡
-        for bubble in self.bubbles:
-            bubble.destroy()
-        self.bubbles.clear()
+        """刷新聊天显示，只加载最新的一页消息"""
+        self._reset()
 
         if not self.chat_app.current_session_id:
             self.show_empty_state()
             return
 
-        # 获取对话历史
-        history = self.chat_app.conversation_manager.get_conversation_history(
-            self.chat_app.current_session_id, 50
+        page = self.chat_app.conversation_manager.get_conversation_page(
+            self.chat_app.current_session_id, limit=self.PAGE_SIZE
         )
-
-        if not history:
+        if not page:
             self.show_empty_state()
             return
 
-        # 按时间顺序显示消息（最早的消息在前）
-        for message in reversed(history):
-            bubble = ChatBubble(
-                self.chat_frame,
-                message=message['content'],
-                role=message['role'],
-                timestamp=message.get('timestamp', '')
-            )
-            bubble.pack(fill=tk.X, pady=2)
-            self.bubbles.append(bubble)
+        self.messages = list(page)
+        self.heights = [self._message_height(message) for message in self.messages]
+        self.has_more = len(page) == self.PAGE_SIZE
+        self._relayout()
 
         # 滚动到底部
-        self.scroll_to_bottom()
+        self.canvas.yview_moveto(1.0)
+        self._render()
 
     def show_empty_state(self):
         """显示空状态"""
-        empty_label = tk.Label(
-            self.chat_frame,
-            text="暂无对话记录\n开始你的第一次对话吧！",
-            font=("Microsoft YaHei UI", 12),
-            bg="#f0f0f0",
-            fg="#999999"
-        )
-        empty_label.pack(expand=True, pady=20)
-        self.bubbles.append(empty_label)
+        self.canvas.itemconfigure(self.empty_window, state="normal")
 
-    def add_message(self, message: str, role: str):
+    def add_message(self, message: str, role: str, message_id: str = None):
         """添加新消息"""
-        # 移除空状态提示
-        if len(self.bubbles) == 1 and isinstance(self.bubbles[0], tk.Label):
-            self.bubbles[0].destroy()
-            self.bubbles.clear()
-
-        bubble = ChatBubble(
-            self.chat_frame,
-            message=message,
-            role=role
-        )
-        bubble.pack(fill=tk.X, pady=2, padx=10)
-        self.bubbles.append(bubble)
+        self._append({
+            'id': message_id,
+            'role': role,
+            'content': message,
+            'timestamp': datetime.now().strftime("%H:%M:%S")
+        })
 
         # 滚动到底部
         self.scroll_to_bottom()
 
+    def add_streaming_message(self) -> ChatBubble:
+        """在末尾添加流式回复气泡，生成结束前该气泡不参与复用"""
+        self.streaming_index = self._append({
+            'id': None,
+            'role': 'assistant',
+            'content': '',
+            'timestamp': datetime.now().strftime("%H:%M:%S")
+        })
+        self.streaming_bubble = ChatBubble(self.canvas, message="", role="assistant", streaming=True)
+        self.streaming_window = self.canvas.create_window(
+            0, self.offsets[self.streaming_index], window=self.streaming_bubble, anchor="nw", width=self._width
+        )
+        self.scroll_to_bottom()
+        return self.streaming_bubble
+
+    def finish_streaming_message(self):
+        """流式回复结束：内容写回消息列表，之后由复用的气泡显示"""
+        if self.streaming_bubble is None:
+            return
+        index = self.streaming_index
+        self.messages[index] = dict(self.messages[index], content=self.streaming_bubble.message)
+        self._discard_streaming_bubble()
+        self._schedule_render()
+
     def scroll_to_bottom(self):
         """滚动到底部"""
-        self.canvas.update_idletasks()
+        if self.streaming_bubble is not None:
+            # 流式气泡的高度随内容增长
+            self.canvas.update_idletasks()
+            height = self.streaming_bubble.winfo_reqheight() + self.BUBBLE_SPACING
+            if height != self.heights[self.streaming_index]:
+                self.heights[self.streaming_index] = height
+                self._relayout()
         self.canvas.yview_moveto(1.0)
+        self._schedule_render()
 
     def clear_display(self):
         """清空显示"""
-        for bubble in self.bubbles:
-            bubble.destroy()
-        self.bubbles.clear()
+        self._reset()
         self.show_empty_state()
 
+    def _reset(self):
+        for index in list(self.visible):
+            self._release(index)
+        self._discard_streaming_bubble()
+        self.canvas.itemconfigure(self.empty_window, state="hidden")
+        self.messages = []
+        self.heights = []
+        self.offsets = [0]
+        self.has_more = False
+        self._update_scrollregion()
+
+    def _append(self, message: dict) -> int:
+        self.canvas.itemconfigure(self.empty_window, state="hidden")
+        self.messages.append(message)
+        self.heights.append(self._message_height(message))
+        self.offsets.append(self.offsets[-1] + self.heights[-1])
+        self._update_scrollregion()
+        return len(self.messages) - 1
+
+    def _discard_streaming_bubble(self):
+        if self.streaming_bubble is not None:
+            self.canvas.delete(self.streaming_window)
+            self.streaming_bubble.destroy()
+        self.streaming_index = None
+        self.streaming_bubble = None
+        self.streaming_window = None
+
+    # --- 高度 ---
+
+    @staticmethod
+    def _role_key(message: dict) -> str:
+        return "user" if message.get('role') == "user" else "assistant"
+
+    def _message_height(self, message: dict) -> int:
+        """消息的实测高度，未测量过时按字体度量估算"""
+        key = (self._role_key(message), message.get('content') or "")
+        height = self.height_cache.get(key)
+        if height is not None:
+            self.height_cache.move_to_end(key)
+            return height
+
+        lines = 0
+        for paragraph in key[1].split("\n"):
+            lines += max(1, -(-self.font.measure(paragraph) // ChatBubble.WRAP_LENGTH))
+        return self.chrome_height + lines * self.font.metrics("linespace") + self.BUBBLE_SPACING
+
+    def _cache_height(self, message: dict, height: int):
+        content = message.get('content') or ""
+        self.height_cache[(self._role_key(message), content)] = height
+        while len(self.height_cache) > self.HEIGHT_CACHE_SIZE:
+            self.height_cache.popitem(last=False)
+        if "\n" not in content and self.font.measure(content) <= ChatBubble.WRAP_LENGTH:
+            # 单行消息，据此校正估算用的固定高度
+            self.chrome_height = height - self.font.metrics("linespace") - self.BUBBLE_SPACING
+
+    def _relayout(self):
+        """根据高度重新计算各消息的位置"""
+        self.offsets = [0, *accumulate(self.heights)]
+        self._update_scrollregion()
+        for index, (_, window) in self.visible.items():
+            self.canvas.coords(window, 0, self.offsets[index])
+        if self.streaming_window is not None:
+            self.canvas.coords(self.streaming_window, 0, self.offsets[self.streaming_index])
+
+    def _update_scrollregion(self):
+        self._region_height = max(self.offsets[-1], self.canvas.winfo_height(), 1)
+        self.canvas.configure(scrollregion=(0, 0, self._width, self._region_height))
+
+    # --- 虚拟列表 ---
+
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._schedule_render()
+
+    def _on_canvas_configure(self, event):
+        if event.width != self._width:
+            self._width = event.width
+            windows = [window for _, window in self.visible.values()]
+            windows += [window for entries in self.pool.values() for _, window in entries]
+            if self.streaming_window is not None:
+                windows.append(self.streaming_window)
+            for window in windows:
+                self.canvas.itemconfigure(window, width=event.width)
+            self.canvas.coords(self.empty_window, event.width // 2, 20)
+        self._update_scrollregion()
+        self._schedule_render()
+
+    def _schedule_render(self):
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._render)
+
+    def _render(self):
+        """为可见区域附近的消息放置气泡，回收移出区域的气泡"""
+        self._render_pending = False
+        if not self.messages:
+            return
+
+        top = self.canvas.canvasy(0)
+        if top < self.LOAD_MORE_THRESHOLD and self.has_more and self._load_older():
+            top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+
+        first = max(0, bisect_right(self.offsets, top - self.OVERSCAN) - 1)
+        last = min(len(self.messages), bisect_left(self.offsets, bottom + self.OVERSCAN))
+        for index in list(self.visible):
+            if not first <= index < last:
+                self._release(index)
+
+        placed = []
+        for index in range(first, last):
+            if index not in self.visible and index != self.streaming_index:
+                self._place(index)
+                placed.append(index)
+        if placed:
+            self._measure(placed)
+
+    def _place(self, index: int):
+        message = self.messages[index]
+        role = self._role_key(message)
+        if self.pool[role]:
+            bubble, window = self.pool[role].pop()
+            bubble.show_message(message.get('content', ''), message.get('timestamp', ''))
+            self.canvas.coords(window, 0, self.offsets[index])
+            self.canvas.itemconfigure(window, state="normal")
+        else:
+            bubble = ChatBubble(
+                self.canvas,
+                message=message.get('content', ''),
+                role=role,
+                timestamp=message.get('timestamp', '')
+            )
+            window = self.canvas.create_window(0, self.offsets[index], window=bubble, anchor="nw", width=self._width)
+        self.visible[index] = (bubble, window)
+
+    def _release(self, index: int):
+        bubble, window = self.visible.pop(index)
+        self.canvas.itemconfigure(window, state="hidden")
+        self.pool[bubble.role if bubble.role == "user" else "assistant"].append((bubble, window))
+
+    def _measure(self, indices):
+        """实测新放置气泡的高度，修正估算值并保持当前阅读位置不动"""
+        self.canvas.update_idletasks()
+        changed = False
+        for index in indices:
+            bubble, _ = self.visible[index]
+            height = bubble.winfo_reqheight() + self.BUBBLE_SPACING
+            self._cache_height(self.messages[index], height)
+            if height != self.heights[index]:
+                self.heights[index] = height
+                changed = True
+        if not changed:
+            return
+
+        at_bottom = self.canvas.yview()[1] >= 0.999
+        top = self.canvas.canvasy(0)
+        anchor = max(0, bisect_right(self.offsets, top) - 1)
+        anchor_delta = top - self.offsets[anchor]
+        self._relayout()
+        if at_bottom:
+            self.canvas.yview_moveto(1.0)
+        else:
+            self.canvas.yview_moveto((self.offsets[anchor] + anchor_delta) / self._region_height)
+        self._schedule_render()
+
+    def _load_older(self) -> bool:
+        """键集分页加载更早的一页消息，插入到列表开头并保持当前阅读位置"""
+        before_id = self.messages[0].get('id')
+        if before_id is None:
+            self.has_more = False
+            return False
+        older = self.chat_app.conversation_manager.get_conversation_page(
+            self.chat_app.current_session_id, before_id=before_id, limit=self.PAGE_SIZE
+        )
+        self.has_more = len(older) == self.PAGE_SIZE
+        if not older:
+            return False
+
+        top = self.canvas.canvasy(0)
+        heights = [self._message_height(message) for message in older]
+        self.messages[:0] = older
+        self.heights[:0] = heights
+        self.visible = {index + len(older): entry for index, entry in self.visible.items()}
+        if self.streaming_index is not None:
+            self.streaming_index += len(older)
+        self._relayout()
+        self.canvas.yview_moveto((top + sum(heights)) / self._region_height)
+        return True
+
+
+class StreamingRenderer:
+    """流式回复渲染器
+
+    后台线程把增量文本放入线程安全的队列，主线程按固定帧率取出合并后一次性追加到气泡，
+    界面开销与回复长度成线性关系，且与chunk数量无关
+    """
+
+    # 刷新间隔（毫秒），约30帧每秒
+    FRAME_INTERVAL_MS = 33
+
+    def __init__(self, root, on_delta, on_frame=None):
+        self.root = root
+        self.on_delta = on_delta  # 主线程中调用，参数为本帧新增的文本
+        self.on_frame = on_frame  # 每次有新文本追加后调用，例如滚动到底部
+        self.deltas = queue.Queue()
+        self.closed = False
+        self._after_id = None
+
+    def start(self):
+        """开始按帧刷新（在主线程中调用）"""
+        self.closed = False
+        self._after_id = self.root.after(self.FRAME_INTERVAL_MS, self._tick)
+
+    def push(self, delta: str):
+        """加入一段增量文本（可在任意线程中调用）"""
+        if delta:
+            self.deltas.put(delta)
+
+    def close(self):
+        """不再有新的文本，剩余内容会在下一帧刷新后停止（可在任意线程中调用）"""
+        self.closed = True
+
+    def flush(self):
+        """立即把队列中的文本追加到界面（在主线程中调用）"""
+        parts = []
+        while True:
+            try:
+                parts.append(self.deltas.get_nowait())
+            except queue.Empty:
+                break
+        if parts:
+            self.on_delta("".join(parts))
+            if self.on_frame:
+                self.on_frame()
+
+    def stop(self):
+        """刷新剩余文本并停止（在主线程中调用）"""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self.flush()
+
+    def _tick(self):
+        self._after_id = None
+        self.flush()
+        if self.closed and self.deltas.empty():
+            return
+        self._after_id = self.root.after(self.FRAME_INTERVAL_MS, self._tick)
+
 
 class InputFrame(ttb.Frame):
     """输入框架"""
@@ -608,6 +962,8 @@ class InputFrame(ttb.Frame):
         # 当前状态
         self.is_generating = False
         self.current_thread = None
+        self.ai_bubble = None
+        self.renderer = None
 
     def update_agent_button_text(self):
         """更新Agent按钮文本"""
@@ -681,13 +1037,15 @@ class InputFrame(ttb.Frame):
             return
 
         # 创建流式回复气泡
-        self.ai_bubble = ChatBubble(
-            self.chat_app.chat_display.chat_frame,
-            message="",
-            role="assistant"
+        self.ai_bubble = self.chat_app.chat_display.add_streaming_message()
+
+        # 增量文本按帧合并后追加到气泡
+        self.renderer = StreamingRenderer(
+            self.chat_app.root,
+            on_delta=self.ai_bubble.append_message,
+            on_frame=self.chat_app.chat_display.scroll_to_bottom
         )
-        self.ai_bubble.pack(fill=tk.X, pady=2)
-        self.chat_app.chat_display.bubbles.append(self.ai_bubble)
+        self.renderer.start()
 
         # 在新线程中执行AI生成
         self.current_thread = threading.Thread(
@@ -699,8 +1057,9 @@ class InputFrame(ttb.Frame):
 
     def generate_ai_response(self, user_message: str, agent_config):
         """生成AI响应（在后台线程中执行）"""
+        renderer = self.renderer
         try:
-            full_response = ""
+            response_parts = []
             print(f"[调试] 开始生成AI响应，用户消息: {user_message[:50]}...")
 
             # 获取流式响应
@@ -712,11 +1071,11 @@ class InputFrame(ttb.Frame):
 
                 if chunk:
                     chunk_count += 1
-                    full_response += chunk
-                    print(f"[调试] 收到chunk {chunk_count}: {chunk[:20]}...")
-                    # 更新UI（需要在主线程中执行）
-                    self.chat_app.root.after(0, self.update_ai_bubble, full_response)
+                    response_parts.append(chunk)
+                    # 交给渲染器，由主线程按帧追加到界面
+                    renderer.push(chunk)
 
+            full_response = "".join(response_parts)
             print(f"[调试] AI响应生成完成，总共{chunk_count}个chunk，长度: {len(full_response)}")
 
             # 在主线程中保存完整的AI回复到数据库
@@ -732,16 +1091,22 @@ class InputFrame(ttb.Frame):
             self.chat_app.root.after(0, self.update_ai_bubble, error_message)
 
         finally:
+            renderer.close()
             # 重置状态
             self.chat_app.root.after(0, self.reset_generation_state)
 
     def update_ai_bubble(self, text: str):
         """更新AI气泡内容"""
-        if hasattr(self, 'ai_bubble') and self.ai_bubble:
+        if self.renderer:
+            # 先追加已缓冲的文本，避免其在替换之后才显示
+            self.renderer.stop()
+        if self.ai_bubble:
             # 直接使用ChatBubble的update_message方法
             self.ai_bubble.update_message(text)
             # 滚动到底部
             self.chat_app.chat_display.scroll_to_bottom()
+        else:
+            self.chat_app.chat_display.add_message(text, "assistant")
 
     def save_ai_response(self, response_text: str):
         """在主线程中保存AI响应到数据库"""
@@ -765,6 +1130,11 @@ class InputFrame(ttb.Frame):
     def reset_generation_state(self):
         """重置生成状态"""
         self.is_generating = False
+        if self.renderer:
+            self.renderer.stop()
+        # 回复结束后由复用的气泡显示
+        self.chat_app.chat_display.finish_streaming_message()
+        self.ai_bubble = None
         self.send_button.configure(text="发送", bootstyle=SUCCESS)
         self.input_text.configure(state=tk.NORMAL)
         self.input_text.focus_set()
@@ -10,6 +10,8 @@ import asyncio
 import threading
 import time
 import uuid
+import hashlib
+from collections import OrderedDict
 from threading import Thread
 from typing import List, Dict, Optional, Any, Literal, Callable, Union, Coroutine
 from pathlib import Path
@@ -83,8 +85,11 @@ class ChatEngine:
             # 智能体相关初始化
             self.current_agent = None
             self.current_agent_name = None
-            self.agents = {}
+            self.agents = OrderedDict()  # 已创建的智能体实例，按名称索引，最近使用的在末尾
             self.agent_configs = {}
+            self.agent_cache_size = 8  # 最多保留的智能体实例数
+            self._agent_config_hashes = {}  # 智能体名称 -> 创建实例时配置的哈希
+            self._agents_lock = threading.RLock()
 
             # 消息相关初始化
             self.messages = []
@@ -133,7 +138,7 @@ class ChatEngine:
                 'session_config': {
                     'database_path': self.db_file,
                     'user_token': self.user_token,
-                    'agents_count': len(self.agents)
+                    'agents_count': len(self.agent_configs)
                 }
             })
 
@@ -662,35 +667,16 @@ class ChatEngine:
                 self.db.upsert_agent_config(agent_config_obj)
 
                 # 保存到内存
-                self.agent_configs['Default Agent'] = default_config
+                self.agent_configs['Default Agent'] = self._agent_config_to_dict(agent_config_obj)
 
-                # 创建智能体实例
-                self.create_new_agent('Default Agent', default_config)
-
-                # 设置为当前智能体
+                # 设置为当前智能体，此时才创建实例
                 self.select_agent_by_name('Default Agent')
 
                 log_info("Created default agent: Default Agent")
             else:
                 # 如果有智能体配置，选择第一个作为当前智能体
                 first_config = agent_configs[0]
-                config_dict = {
-                    'agent_id': first_config.agent_id,
-                    'name': first_config.name,
-                    'model_id': first_config.model_id,
-                    'model_provider': first_config.model_provider,
-                    'model_kwargs': first_config.model_kwargs or {},
-                    'instructions': first_config.instructions or '',
-                    'tools': first_config.tools or [],
-                    'knowledge': first_config.knowledge,
-                    'memory': first_config.memory,
-                    'guardrails': first_config.guardrails or [],
-                    'metadata': first_config.metadata or {},
-                    'user_id': first_config.user_id
-                }
-
-                self.agent_configs[first_config.name] = config_dict
-                self.create_new_agent(first_config.name, config_dict)
+                self.agent_configs[first_config.name] = self._agent_config_to_dict(first_config)
                 self.select_agent_by_name(first_config.name)
 
                 log_info(f"Loaded existing agent: {first_config.name}")
@@ -708,8 +694,7 @@ class ChatEngine:
                     'tools': [],
                     'user_id': self.user_token
                 }
-                self.agent_configs['Minimal Agent'] = minimal_config
-                self.create_new_agent('Minimal Agent', minimal_config)
+                self.agent_configs['Minimal Agent'] = self._agent_config_to_dict(AgentConfig.from_dict(minimal_config))
                 self.select_agent_by_name('Minimal Agent')
                 log_info("Created minimal fallback agent")
             except Exception as fallback_error:
@@ -717,73 +702,132 @@ class ChatEngine:
                 raise
 
     def load_agents(self):
-        """加载所有智能体,如果默认为空"""
+        """
+        加载所有智能体配置
+
+        只读取数据库中的配置记录，不创建模型和智能体实例；实例在首次选择时由get_agent创建，
+        启动耗时与智能体数量无关
+        """
         try:
             # 从数据库加载智能体配置
             agent_configs = self.db.get_agent_configs(user_id=self.user_token)
 
-            self.agents = {}
-            self.agent_configs = {}
+            self.agent_configs = {
+                agent_config.name: self._agent_config_to_dict(agent_config) for agent_config in agent_configs
+            }
 
-            for agent_config in agent_configs:
-                # 转换为嵌套格式
-                config_dict = {
-                    'agent_id': agent_config.agent_id,
-                    'name': agent_config.name,
-                    'model_id': agent_config.model_id,
-                    'model_provider': agent_config.model_provider,
-                    'model_kwargs': agent_config.model_kwargs or {},
-                    'instructions': agent_config.instructions or '',
-                    'tools': agent_config.tools or [],
-                    'knowledge': agent_config.knowledge,
-                    'memory': agent_config.memory,
-                    'guardrails': agent_config.guardrails or [],
-                    'metadata': agent_config.metadata or {},
-                    'user_id': agent_config.user_id
-                }
+            # 丢弃已删除智能体的实例，配置变化的实例在下次使用时重新创建
+            with self._agents_lock:
+                for agent_name in list(self.agents):
+                    if agent_name not in self.agent_configs:
+                        self.invalidate_agent(agent_name)
 
-                # 构建嵌套的model结构
-                model_dict = {
-                    'name': agent_config.model_id,
-                    'provider': agent_config.model_provider,
-                    'kwargs': agent_config.model_kwargs or {}
-                }
+            log_info(f"Loaded {len(self.agent_configs)} agent configs from database")
+        except Exception as e:
+            log_error(f"Error loading agents: {e}")
 
-                # 获取agent类型
-                metadata = agent_config.metadata or {}
-                agent_type = metadata.get('type', 'text') if metadata else 'text'
-
-                # 转换为嵌套格式
-                nested_config = {
-                    'agent_id': agent_config.agent_id,
-                    'name': agent_config.name,
-                    'type': agent_type,
-                    'model': model_dict if model_dict else {'name': 'gpt-3.5-turbo', 'provider': 'openai'},
-                    'instructions': agent_config.instructions or '',
-                    'tools': agent_config.tools or [],
-                    'knowledge': agent_config.knowledge,
-                    'memory': agent_config.memory,
-                    'guardrails': agent_config.guardrails or [],
-                    'metadata': metadata,
-                    'user_id': agent_config.user_id,
-                    'status': agent_config.status or 'active'
-                }
+    @staticmethod
+    def _agent_config_to_dict(agent_config: AgentConfig) -> Dict[str, Any]:
+        """将数据库中的智能体配置转换为create_new_agent使用的嵌套格式"""
+        metadata = agent_config.metadata or {}
+        return {
+            'agent_id': agent_config.agent_id,
+            'name': agent_config.name,
+            'type': metadata.get('type', 'text'),
+            'model': {
+                'name': agent_config.model_id or 'gpt-3.5-turbo',
+                'provider': agent_config.model_provider or 'openai',
+                'kwargs': agent_config.model_kwargs or {}
+            },
+            'instructions': agent_config.instructions or '',
+            'tools': agent_config.tools or [],
+            'knowledge': agent_config.knowledge,
+            'memory': agent_config.memory,
+            'guardrails': agent_config.guardrails or [],
+            'metadata': metadata,
+            'user_id': agent_config.user_id,
+            'status': agent_config.status or 'active'
+        }
 
-                self.agent_configs[agent_config.name] = nested_config
+    def _agent_dict_to_config(self, agent_dict: Dict[str, Any]) -> AgentConfig:
+        """将嵌套格式的智能体配置转换为数据库中的配置记录"""
+        model = agent_dict.get('model') or {}
+        metadata = dict(agent_dict.get('metadata') or {})
+        metadata.setdefault('type', agent_dict.get('type', 'text'))
+        return AgentConfig(
+            agent_id=agent_dict.get('agent_id') or str(uuid.uuid4()),
+            name=agent_dict['name'],
+            model_id=model.get('name'),
+            model_provider=model.get('provider'),
+            model_kwargs=model.get('kwargs') or {},
+            instructions=agent_dict.get('instructions'),
+            tools=agent_dict.get('tools'),
+            knowledge=agent_dict.get('knowledge'),
+            memory=agent_dict.get('memory'),
+            guardrails=agent_dict.get('guardrails'),
+            metadata=metadata,
+            user_id=agent_dict.get('user_id') or self.user_token,
+            status=agent_dict.get('status', 'active')
+        )
 
-                # 创建智能体实例（如果AGNO框架可用）
-                if AGENT_CLASS_DICT and agent_type in AGENT_CLASS_DICT:
-                    agent = self.create_new_agent(agent_config.name, nested_config)
-                    if agent:
-                        self.agents[agent_config.name] = agent
+    @staticmethod
+    def _hash_agent_config(agent_dict: Dict[str, Any]) -> str:
+        """智能体配置的哈希，配置变化时实例需要重新创建"""
+        payload = json.dumps(agent_dict, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
 
-            log_info(f"Loaded {len(self.agents)} agents from database")
-        except Exception as e:
-            log_error(f"Error loading agents: {e}")
+    def get_agent(self, agent_name):
+        """
+        获取智能体实例，首次使用时才根据配置创建
+
+        实例按名称缓存并记录创建时配置的哈希，配置变化后重新创建；
+        最多保留agent_cache_size个实例，超出时丢弃最久未使用的
+
+        Args:
+            agent_name: 智能体名称
+
+        Returns:
+            智能体实例，不存在或创建失败时返回None
+        """
+        agent_dict = self.agent_configs.get(agent_name)
+        if agent_dict is None:
+            return None
+
+        config_hash = self._hash_agent_config(agent_dict)
+        with self._agents_lock:
+            agent = self.agents.get(agent_name)
+            if agent is not None and self._agent_config_hashes.get(agent_name) == config_hash:
+                self.agents.move_to_end(agent_name)
+                return agent
+
+            agent = self.create_new_agent(agent_name, agent_dict)
+            if agent is None:
+                self.invalidate_agent(agent_name)
+                return None
+
+            self.agents[agent_name] = agent
+            self.agents.move_to_end(agent_name)
+            self._agent_config_hashes[agent_name] = config_hash
+            while len(self.agents) > max(1, self.agent_cache_size):
+                evicted_name, _ = self.agents.popitem(last=False)
+                self._agent_config_hashes.pop(evicted_name, None)
+                log_debug(f"Evicted agent instance: {evicted_name}")
+            return agent
+
+    def invalidate_agent(self, agent_name):
+        """
+        丢弃智能体的缓存实例，下次使用时按最新配置重新创建
+
+        Args:
+            agent_name: 智能体名称
+        """
+        with self._agents_lock:
+            self.agents.pop(agent_name, None)
+            self._agent_config_hashes.pop(agent_name, None)
 
     def select_agent_by_name(self, agent_name):
         """
-        通过名称选择智能体
+        通过名称选择智能体，智能体实例在此时才创建
 
         Args:
             agent_name: 智能体名称
@@ -791,7 +835,18 @@ class ChatEngine:
         Returns:
             是否选择成功
         """
-        pass
+        if agent_name not in self.agent_configs:
+            log_warning(f"Agent not found: {agent_name}")
+            return False
+
+        agent = self.get_agent(agent_name)
+        if agent is None:
+            log_error(f"Failed to create agent: {agent_name}")
+            return False
+
+        self.current_agent = agent
+        self.current_agent_name = agent_name
+        return True
 
     def create_model_from_dict(self, model_dict):
         """
@@ -1294,15 +1349,35 @@ class ChatEngine:
 
     def update_agent_settings(self, agent_config):
         """
-        更新智能体设置
+        更新智能体设置，保存到数据库并丢弃按旧配置创建的实例
 
         Args:
-            agent_config: 新的智能体配置字典
+            agent_config: 新的智能体配置字典（嵌套格式），按name合并到现有配置
 
         Returns:
-            更新后的智能体对象
+            更新后的智能体对象，失败时返回None
         """
-        pass
+        try:
+            agent_name = agent_config.get('name') if agent_config else None
+            if not agent_name:
+                log_error("agent_config必须包含'name'字段")
+                return None
+
+            agent_dict = {**self.agent_configs.get(agent_name, {}), **agent_config}
+            if self.db:
+                agent_config_obj = self.db.upsert_agent_config(self._agent_dict_to_config(agent_dict))
+                agent_dict = self._agent_config_to_dict(agent_config_obj)
+
+            self.agent_configs[agent_name] = agent_dict
+            self.invalidate_agent(agent_name)
+
+            if agent_name == self.current_agent_name:
+                self.select_agent_by_name(agent_name)
+                return self.current_agent
+            return self.get_agent(agent_name)
+        except Exception as e:
+            log_error(f"Error updating agent settings: {e}")
+            return None
 
     def delete_agent_by_name(self, agent_name):
         """
@@ -1327,15 +1402,23 @@ class ChatEngine:
 
     def update_agent_model(self, model_dict):
         """
-        更新智能体的模型，并保存
+        更新当前智能体的模型，并保存
 
         Args:
-            model_dict: 模型字典配置字典
+            model_dict: 模型字典配置字典，也可以只传模型名称
 
         Returns:
             成功与否
         """
-        pass
+        if not self.current_agent_name or self.current_agent_name not in self.agent_configs:
+            log_warning("No agent selected")
+            return False
+
+        if isinstance(model_dict, str):
+            model_dict = {'name': model_dict}
+        agent_dict = self.agent_configs[self.current_agent_name]
+        model = {**(agent_dict.get('model') or {}), **model_dict}
+        return self.update_agent_settings({**agent_dict, 'model': model}) is not None
 
 
     def list_agent_session(self):
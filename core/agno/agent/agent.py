@@ -15,6 +15,7 @@ from typing import (
     Literal,
     Optional,
     Sequence,
+    TYPE_CHECKING,
     Set,
     Tuple,
     Type,
@@ -38,7 +39,6 @@ from core.agno.exceptions import (
     StopAgentRun,
 )
 from core.agno.guardrails import BaseGuardrail
-from core.agno.knowledge.knowledge import Knowledge
 from core.agno.knowledge.types import KnowledgeFilter
 from core.agno.media import Audio, File, Image, Video
 from core.agno.memory import MemoryManager
@@ -118,12 +118,6 @@ from core.agno.utils.log import (
 )
 from core.agno.utils.merge_dict import merge_dictionaries
 from core.agno.utils.message import filter_tool_calls, get_text_from_message
-from core.agno.utils.print_response.agent import (
-    aprint_response,
-    aprint_response_stream,
-    print_response,
-    print_response_stream,
-)
 from core.agno.utils.prompts import get_json_output_prompt, get_response_model_format_prompt
 from core.agno.utils.reasoning import (
     add_reasoning_metrics_to_metadata,
@@ -140,6 +134,9 @@ from core.agno.utils.safe_formatter import SafeFormatter
 from core.agno.utils.string import generate_id_from_name, parse_response_model_str
 from core.agno.utils.timer import Timer
 
+if TYPE_CHECKING:
+    from core.agno.knowledge.knowledge import Knowledge
+
 
 @dataclass(init=False)
 class Agent:
@@ -7724,6 +7721,7 @@ class Agent:
             Optional[List[Dict[str, Any]]]: List of relevant document dicts.
         """
         from core.agno.knowledge.document import Document
+        from core.agno.knowledge.knowledge import Knowledge
 
         if num_documents is None and self.knowledge is not None:
             num_documents = self.knowledge.max_results
@@ -9539,6 +9537,9 @@ class Agent:
         if stream_events is None:
             stream_events = False if self.stream_events is None else self.stream_events
 
+        # The terminal rendering helpers pull in rich, only load them when printing
+        from core.agno.utils.print_response.agent import print_response, print_response_stream
+
         if stream:
             print_response_stream(
                 agent=self,
@@ -9647,6 +9648,8 @@ class Agent:
         if stream_events is None:
             stream_events = False if self.stream_events is None else self.stream_events
 
+        from core.agno.utils.print_response.agent import aprint_response, aprint_response_stream
+
         if stream:
             await aprint_response_stream(
                 agent=self,
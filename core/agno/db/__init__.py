@@ -1,24 +1,28 @@
 from core.agno.db.base import BaseDb, SessionType
+from core.agno.utils.lazy_import import lazy_attributes
 
 __all__ = [
     "BaseDb",
     "SessionType",
 ]
 
-
-def __getattr__(name: str):
-    """Lazy import for database implementations to avoid forcing all dependencies."""
-    if name == "DynamoDb":
-        from core.agno.db.dynamo import DynamoDb
-
-        return DynamoDb
-    elif name == "MongoDb":
-        from core.agno.db.mongo import MongoDb
-
-        return MongoDb
-    elif name == "PostgresDb":
-        from core.agno.db.postgres import PostgresDb
-
-        return PostgresDb
-    # Add other db implementations as needed
-    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+# Database implementations are imported on first access, so only the drivers of the backend in use are needed
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AsyncPostgresDb": "core.agno.db.async_postgres",
+        "DynamoDb": "core.agno.db.dynamo",
+        "FirestoreDb": "core.agno.db.firestore",
+        "GcsJsonDb": "core.agno.db.gcs_json",
+        "InMemoryDb": "core.agno.db.in_memory",
+        "JsonDb": "core.agno.db.json",
+        "JsonLogDb": "core.agno.db.json",
+        "MongoDb": "core.agno.db.mongo",
+        "MySQLDb": "core.agno.db.mysql",
+        "PostgresDb": "core.agno.db.postgres",
+        "RedisDb": "core.agno.db.redis",
+        "SingleStoreDb": "core.agno.db.singlestore",
+        "SqliteDb": "core.agno.db.sqlite",
+        "SurrealDb": "core.agno.db.surrealdb",
+    },
+)
@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from core.agno.db.base import BaseDb, SessionType
+from core.agno.db.in_memory.index import IndexedRecords
 from core.agno.db.in_memory.utils import (
     apply_sorting,
     calculate_date_metrics,
@@ -27,8 +28,16 @@ class InMemoryDb(BaseDb):
         super().__init__()
 
         # Initialize in-memory storage dictionaries
-        self._sessions: List[Dict[str, Any]] = []
-        self._memories: List[Dict[str, Any]] = []
+        self._sessions = IndexedRecords(
+            key_field="session_id",
+            hash_fields=("session_type", "user_id", "agent_id", "team_id", "workflow_id"),
+            sorted_fields=("created_at", "updated_at"),
+        )
+        self._memories = IndexedRecords(
+            key_field="memory_id",
+            hash_fields=("user_id", "agent_id", "team_id"),
+            sorted_fields=("created_at", "updated_at"),
+        )
         self._metrics: List[Dict[str, Any]] = []
         self._eval_runs: List[Dict[str, Any]] = []
         self._knowledge: List[Dict[str, Any]] = []
@@ -49,10 +58,7 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            original_count = len(self._sessions)
-            self._sessions = [s for s in self._sessions if s.get("session_id") != session_id]
-
-            if len(self._sessions) < original_count:
+            if self._sessions.remove(session_id) is not None:
                 log_debug(f"Successfully deleted session with session_id: {session_id}")
                 return True
             else:
@@ -73,7 +79,8 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            self._sessions = [s for s in self._sessions if s.get("session_id") not in session_ids]
+            for session_id in session_ids:
+                self._sessions.remove(session_id)
             log_debug(f"Successfully deleted sessions with ids: {session_ids}")
 
         except Exception as e:
@@ -104,27 +111,26 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs while reading the session.
         """
         try:
-            for session_data in self._sessions:
-                if session_data.get("session_id") == session_id:
-                    if user_id is not None and session_data.get("user_id") != user_id:
-                        continue
-                    session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
-                    if session_data.get("session_type") != session_type_value:
-                        continue
-
-                    session_data_copy = deepcopy(session_data)
+            session_data = self._sessions.get(session_id)
+            if session_data is None:
+                return None
+            if user_id is not None and session_data.get("user_id") != user_id:
+                return None
+            session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
+            if session_data.get("session_type") != session_type_value:
+                return None
 
-                    if not deserialize:
-                        return session_data_copy
+            session_data_copy = deepcopy(session_data)
 
-                    if session_type == SessionType.AGENT:
-                        return AgentSession.from_dict(session_data_copy)
-                    elif session_type == SessionType.TEAM:
-                        return TeamSession.from_dict(session_data_copy)
-                    else:
-                        return WorkflowSession.from_dict(session_data_copy)
+            if not deserialize:
+                return session_data_copy
 
-            return None
+            if session_type == SessionType.AGENT:
+                return AgentSession.from_dict(session_data_copy)
+            elif session_type == SessionType.TEAM:
+                return TeamSession.from_dict(session_data_copy)
+            else:
+                return WorkflowSession.from_dict(session_data_copy)
 
         except Exception as e:
             import traceback
@@ -171,43 +177,33 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs while reading the sessions.
         """
         try:
-            # Apply filters
-            filtered_sessions = []
-            for session_data in self._sessions:
-                if user_id is not None and session_data.get("user_id") != user_id:
-                    continue
-                if component_id is not None:
-                    if session_type == SessionType.AGENT and session_data.get("agent_id") != component_id:
-                        continue
-                    elif session_type == SessionType.TEAM and session_data.get("team_id") != component_id:
-                        continue
-                    elif session_type == SessionType.WORKFLOW and session_data.get("workflow_id") != component_id:
-                        continue
-                if start_timestamp is not None and session_data.get("created_at", 0) < start_timestamp:
-                    continue
-                if end_timestamp is not None and session_data.get("created_at", 0) > end_timestamp:
-                    continue
-                if session_name is not None:
-                    stored_name = session_data.get("session_data", {}).get("session_name", "")
-                    if session_name.lower() not in stored_name.lower():
-                        continue
-                session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
-                if session_data.get("session_type") != session_type_value:
-                    continue
-
-                filtered_sessions.append(deepcopy(session_data))
-
-            total_count = len(filtered_sessions)
-
-            # Apply sorting
-            filtered_sessions = apply_sorting(filtered_sessions, sort_by, sort_order)
-
-            # Apply pagination
-            if limit is not None:
-                start_idx = 0
-                if page is not None:
-                    start_idx = (page - 1) * limit
-                filtered_sessions = filtered_sessions[start_idx : start_idx + limit]
+            session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
+            equals: Dict[str, Any] = {"user_id": user_id}
+            if component_id is not None:
+                if session_type == SessionType.AGENT:
+                    equals["agent_id"] = component_id
+                elif session_type == SessionType.TEAM:
+                    equals["team_id"] = component_id
+                elif session_type == SessionType.WORKFLOW:
+                    equals["workflow_id"] = component_id
+
+            def matches_name(session_data: Dict[str, Any]) -> bool:
+                stored_name = session_data.get("session_data", {}).get("session_name", "")
+                return session_name.lower() in stored_name.lower()
+
+            # Filter, sort and paginate through the indexes, then copy only the page being returned
+            page_sessions, total_count = self._sessions.query(
+                equals={**equals, "session_type": session_type_value},
+                range_field="created_at",
+                start=start_timestamp,
+                end=end_timestamp,
+                predicate=matches_name if session_name is not None else None,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=limit,
+                page=page,
+            )
+            filtered_sessions = [deepcopy(session_data) for session_data in page_sessions]
 
             if not deserialize:
                 return filtered_sessions, total_count
@@ -229,29 +225,27 @@ class InMemoryDb(BaseDb):
         self, session_id: str, session_type: SessionType, session_name: str, deserialize: Optional[bool] = True
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         try:
-            for i, session in enumerate(self._sessions):
-                if session.get("session_id") == session_id and session.get("session_type") == session_type.value:
-                    # Update session name in session_data
-                    if "session_data" not in session:
-                        session["session_data"] = {}
-                    session["session_data"]["session_name"] = session_name
-
-                    self._sessions[i] = session
+            session = self._sessions.get(session_id)
+            if session is None or session.get("session_type") != session_type.value:
+                return None
 
-                    log_debug(f"Renamed session with id '{session_id}' to '{session_name}'")
+            # Update session name in session_data
+            if "session_data" not in session:
+                session["session_data"] = {}
+            session["session_data"]["session_name"] = session_name
 
-                    session_copy = deepcopy(session)
-                    if not deserialize:
-                        return session_copy
+            log_debug(f"Renamed session with id '{session_id}' to '{session_name}'")
 
-                    if session_type == SessionType.AGENT:
-                        return AgentSession.from_dict(session_copy)
-                    elif session_type == SessionType.TEAM:
-                        return TeamSession.from_dict(session_copy)
-                    else:
-                        return WorkflowSession.from_dict(session_copy)
+            session_copy = deepcopy(session)
+            if not deserialize:
+                return session_copy
 
-            return None
+            if session_type == SessionType.AGENT:
+                return AgentSession.from_dict(session_copy)
+            elif session_type == SessionType.TEAM:
+                return TeamSession.from_dict(session_copy)
+            else:
+                return WorkflowSession.from_dict(session_copy)
 
         except Exception as e:
             log_error(f"Exception renaming session: {e}")
@@ -271,21 +265,14 @@ class InMemoryDb(BaseDb):
             elif isinstance(session, WorkflowSession):
                 session_dict["session_type"] = SessionType.WORKFLOW.value
 
-            # Find existing session to update
-            session_updated = False
-            for i, existing_session in enumerate(self._sessions):
-                if existing_session.get("session_id") == session_dict.get("session_id") and self._matches_session_key(
-                    existing_session, session
-                ):
-                    session_dict["updated_at"] = int(time.time())
-                    self._sessions[i] = deepcopy(session_dict)
-                    session_updated = True
-                    break
-
-            if not session_updated:
+            # session_id is the primary key, as in the SQL backends
+            existing_session = self._sessions.get(session_dict.get("session_id"))
+            if existing_session is not None and self._matches_session_key(existing_session, session):
+                session_dict["updated_at"] = int(time.time())
+            else:
                 session_dict["created_at"] = session_dict.get("created_at", int(time.time()))
                 session_dict["updated_at"] = session_dict.get("created_at")
-                self._sessions.append(deepcopy(session_dict))
+            self._sessions.put(deepcopy(session_dict))
 
             session_dict_copy = deepcopy(session_dict)
             if not deserialize:
@@ -358,17 +345,11 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            original_count = len(self._memories)
+            memory = self._memories.get(memory_id)
 
             # If user_id is provided, verify ownership before deleting
-            if user_id is not None:
-                self._memories = [
-                    m for m in self._memories if not (m.get("memory_id") == memory_id and m.get("user_id") == user_id)
-                ]
-            else:
-                self._memories = [m for m in self._memories if m.get("memory_id") != memory_id]
-
-            if len(self._memories) < original_count:
+            if memory is not None and (user_id is None or memory.get("user_id") == user_id):
+                self._memories.remove(memory_id)
                 log_debug(f"Successfully deleted user memory id: {memory_id}")
             else:
                 log_debug(f"No memory found with id: {memory_id}")
@@ -388,13 +369,11 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            # If user_id is provided, verify ownership before deleting
-            if user_id is not None:
-                self._memories = [
-                    m for m in self._memories if not (m.get("memory_id") in memory_ids and m.get("user_id") == user_id)
-                ]
-            else:
-                self._memories = [m for m in self._memories if m.get("memory_id") not in memory_ids]
+            for memory_id in memory_ids:
+                memory = self._memories.get(memory_id)
+                # If user_id is provided, verify ownership before deleting
+                if memory is not None and (user_id is None or memory.get("user_id") == user_id):
+                    self._memories.remove(memory_id)
             log_debug(f"Successfully deleted {len(memory_ids)} user memories")
 
         except Exception as e:
@@ -439,18 +418,18 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs while reading the memory.
         """
         try:
-            for memory_data in self._memories:
-                if memory_data.get("memory_id") == memory_id:
-                    # Filter by user_id if provided
-                    if user_id is not None and memory_data.get("user_id") != user_id:
-                        continue
+            memory_data = self._memories.get(memory_id)
+            if memory_data is None:
+                return None
 
-                    memory_data_copy = deepcopy(memory_data)
-                    if not deserialize:
-                        return memory_data_copy
-                    return UserMemory.from_dict(memory_data_copy)
+            # Filter by user_id if provided
+            if user_id is not None and memory_data.get("user_id") != user_id:
+                return None
 
-            return None
+            memory_data_copy = deepcopy(memory_data)
+            if not deserialize:
+                return memory_data_copy
+            return UserMemory.from_dict(memory_data_copy)
 
         except Exception as e:
             log_error(f"Exception reading from memory storage: {e}")
@@ -470,37 +449,28 @@ class InMemoryDb(BaseDb):
         deserialize: Optional[bool] = True,
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         try:
-            # Apply filters
-            filtered_memories = []
-            for memory_data in self._memories:
-                if user_id is not None and memory_data.get("user_id") != user_id:
-                    continue
-                if agent_id is not None and memory_data.get("agent_id") != agent_id:
-                    continue
-                if team_id is not None and memory_data.get("team_id") != team_id:
-                    continue
+
+            def matches(memory_data: Dict[str, Any]) -> bool:
                 if topics is not None:
                     memory_topics = memory_data.get("topics", [])
                     if not any(topic in memory_topics for topic in topics):
-                        continue
+                        return False
                 if search_content is not None:
                     memory_content = str(memory_data.get("memory", ""))
                     if search_content.lower() not in memory_content.lower():
-                        continue
-
-                filtered_memories.append(deepcopy(memory_data))
-
-            total_count = len(filtered_memories)
-
-            # Apply sorting
-            filtered_memories = apply_sorting(filtered_memories, sort_by, sort_order)
+                        return False
+                return True
 
-            # Apply pagination
-            if limit is not None:
-                start_idx = 0
-                if page is not None:
-                    start_idx = (page - 1) * limit
-                filtered_memories = filtered_memories[start_idx : start_idx + limit]
+            # Filter, sort and paginate through the indexes, then copy only the page being returned
+            page_memories, total_count = self._memories.query(
+                equals={"user_id": user_id, "agent_id": agent_id, "team_id": team_id},
+                predicate=matches if topics is not None or search_content is not None else None,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=limit,
+                page=page,
+            )
+            filtered_memories = [deepcopy(memory_data) for memory_data in page_memories]
 
             if not deserialize:
                 return filtered_memories, total_count
@@ -572,16 +542,7 @@ class InMemoryDb(BaseDb):
             memory_dict = memory.to_dict() if hasattr(memory, "to_dict") else memory.__dict__
             memory_dict["updated_at"] = int(time.time())
 
-            # Find existing memory to update
-            memory_updated = False
-            for i, existing_memory in enumerate(self._memories):
-                if existing_memory.get("memory_id") == memory.memory_id:
-                    self._memories[i] = memory_dict
-                    memory_updated = True
-                    break
-
-            if not memory_updated:
-                self._memories.append(memory_dict)
+            self._memories.put(memory_dict)
 
             memory_dict_copy = deepcopy(memory_dict)
             if not deserialize:
@@ -719,10 +680,9 @@ class InMemoryDb(BaseDb):
                 return datetime.strptime(latest_metric["date"], "%Y-%m-%d").date()
 
         # No metrics records. Return the date of the first recorded session.
-        if self._sessions:
-            # Sort by created_at
-            sorted_sessions = sorted(self._sessions, key=lambda x: x.get("created_at", 0))
-            first_session_date = sorted_sessions[0]["created_at"]
+        first_session = self._sessions.first("created_at")
+        if first_session is not None:
+            first_session_date = first_session["created_at"]
             return datetime.fromtimestamp(first_session_date, tz=timezone.utc).date()
 
         return None
@@ -733,10 +693,9 @@ class InMemoryDb(BaseDb):
         """Get all sessions for metrics calculation."""
         try:
             filtered_sessions = []
-            for session in self._sessions:
+            for session_id in self._sessions.in_range("created_at", start_timestamp, end_timestamp):
+                session = self._sessions.get(session_id)
                 created_at = session.get("created_at", 0)
-                if start_timestamp is not None and created_at < start_timestamp:
-                    continue
                 if end_timestamp is not None and created_at >= end_timestamp:
                     continue
 
@@ -0,0 +1,212 @@
+from bisect import bisect_left, bisect_right, insort
+from itertools import count
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+def _sort_value(record: Dict[str, Any], field: str) -> Any:
+    value = record.get(field)
+    return value if isinstance(value, (int, float)) else 0
+
+
+class IndexedRecords:
+    """Records keyed by a primary key, with hash indexes on lookup fields and sorted indexes on timestamps.
+
+    Iterating yields records in insertion order, like the list this replaces. A record keeps its position
+    when it is updated in place.
+    """
+
+    def __init__(self, key_field: str, hash_fields: Sequence[str] = (), sorted_fields: Sequence[str] = ()):
+        self.key_field = key_field
+        self.hash_fields = tuple(hash_fields)
+        self.sorted_fields = tuple(sorted_fields)
+
+        self._records: Dict[Any, Dict[str, Any]] = {}
+        # key -> insertion sequence number, used to break ties in insertion order
+        self._seq: Dict[Any, int] = {}
+        # key -> (hash values, sort values) as indexed, so callers mutating a stored record cannot orphan it
+        self._indexed: Dict[Any, Tuple[Tuple[Any, ...], Tuple[Any, ...]]] = {}
+        self._counter = count()
+        # field -> value -> keys holding that value
+        self._hash: Dict[str, Dict[Any, Dict[Any, None]]] = {field: {} for field in self.hash_fields}
+        # field -> [(value, seq, key)] kept sorted
+        self._sorted: Dict[str, List[Tuple[Any, int, Any]]] = {field: [] for field in self.sorted_fields}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(list(self._records.values()))
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._records
+
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        return self._records.get(key)
+
+    def put(self, record: Dict[str, Any]) -> None:
+        """Insert a record, replacing the one with the same key."""
+        key = record.get(self.key_field)
+        seq = self._seq.get(key)
+        if seq is None:
+            seq = next(self._counter)
+            self._seq[key] = seq
+        else:
+            self._unindex(key, seq)
+        self._records[key] = record
+        self._index(key, record, seq)
+
+    def remove(self, key: Any) -> Optional[Dict[str, Any]]:
+        record = self._records.pop(key, None)
+        if record is not None:
+            self._unindex(key, self._seq.pop(key))
+        return record
+
+    def clear(self) -> None:
+        self._records.clear()
+        self._seq.clear()
+        self._indexed.clear()
+        for buckets in self._hash.values():
+            buckets.clear()
+        for entries in self._sorted.values():
+            entries.clear()
+
+    def in_range(self, field: str, start: Optional[Any] = None, end: Optional[Any] = None) -> List[Any]:
+        """Keys whose `field` is within [start, end], found by bisecting the sorted index."""
+        entries = self._sorted[field]
+        low = bisect_left(entries, (start,)) if start is not None else 0
+        high = bisect_right(entries, (end, float("inf"))) if end is not None else len(entries)
+        return [entry[2] for entry in entries[low:high]]
+
+    def first(self, field: str) -> Optional[Dict[str, Any]]:
+        """The record with the smallest `field`."""
+        entries = self._sorted[field]
+        return self._records[entries[0][2]] if entries else None
+
+    def query(
+        self,
+        equals: Optional[Dict[str, Any]] = None,
+        range_field: Optional[str] = None,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Filter, sort and paginate records without touching the ones outside the candidate set.
+
+        Candidates come from the smallest of the hash buckets for `equals` and the `range_field` slice;
+        the remaining conditions are checked per candidate. Sorting and tie-breaking follow `apply_sorting`
+        on the insertion-ordered list. The returned records are the stored ones, not copies.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: The requested page of records and the total number of matches.
+        """
+        # Conditions every record satisfies (e.g. a single session type) cannot narrow anything down
+        equals = {
+            field: value
+            for field, value in (equals or {}).items()
+            if value is not None
+            and not (field in self._hash and len(self._hash[field].get(value, ())) == len(self._records))
+        }
+        has_range = range_field is not None and (start is not None or end is not None)
+
+        start_idx = 0
+        if limit is not None and page is not None:
+            start_idx = (page - 1) * limit
+        stop_idx = start_idx + limit if limit is not None else None
+
+        # Unfiltered sort on an indexed field: walk the sorted index and stop at the end of the page
+        if not equals and not has_range and predicate is None and sort_by in self._sorted:
+            first = next(iter(self._records.values()), None)
+            if first is not None and sort_by in first:
+                ordered = self._walk_sorted(sort_by, descending=sort_order != "asc" if sort_order else True)
+                page_records = []
+                for i, key in enumerate(ordered):
+                    if stop_idx is not None and i >= stop_idx:
+                        break
+                    if i >= start_idx:
+                        page_records.append(self._records[key])
+                return page_records, len(self._records)
+
+        candidates: Optional[List[Any]] = None
+        for field, value in equals.items():
+            if field in self._hash:
+                bucket = self._hash[field].get(value, {})
+                if candidates is None or len(bucket) < len(candidates):
+                    candidates = list(bucket)
+        if has_range and range_field in self._sorted:
+            range_keys = self.in_range(range_field, start, end)
+            if candidates is None or len(range_keys) < len(candidates):
+                candidates = range_keys
+
+        if candidates is None:
+            records = list(self._records.values())
+        else:
+            candidates.sort(key=self._seq.__getitem__)
+            records = [self._records[key] for key in candidates]
+
+        matches = []
+        for record in records:
+            if any(record.get(field) != value for field, value in equals.items()):
+                continue
+            if has_range:
+                value = record.get(range_field, 0)  # type: ignore
+                if start is not None and value < start:
+                    continue
+                if end is not None and value > end:
+                    continue
+            if predicate is not None and not predicate(record):
+                continue
+            matches.append(record)
+
+        total_count = len(matches)
+
+        if sort_by is not None and matches and sort_by in matches[0]:
+            reverse_order = sort_order != "asc" if sort_order else True
+            try:
+                matches = sorted(matches, key=lambda x: x.get(sort_by, 0), reverse=reverse_order)
+            except TypeError:
+                pass
+
+        return matches[start_idx:stop_idx], total_count
+
+    def _walk_sorted(self, field: str, descending: bool) -> Iterator[Any]:
+        entries = self._sorted[field]
+        if not descending:
+            for entry in entries:
+                yield entry[2]
+            return
+
+        # Descending by value, but equal values stay in insertion order as with a stable reverse sort
+        high = len(entries)
+        while high > 0:
+            low = bisect_left(entries, (entries[high - 1][0],), 0, high)
+            for entry in entries[low:high]:
+                yield entry[2]
+            high = low
+
+    def _index(self, key: Any, record: Dict[str, Any], seq: int) -> None:
+        hash_values = tuple(record.get(field) for field in self.hash_fields)
+        sort_values = tuple(_sort_value(record, field) for field in self.sorted_fields)
+        self._indexed[key] = (hash_values, sort_values)
+        for field, value in zip(self.hash_fields, hash_values):
+            self._hash[field].setdefault(value, {})[key] = None
+        for field, value in zip(self.sorted_fields, sort_values):
+            insort(self._sorted[field], (value, seq, key))
+
+    def _unindex(self, key: Any, seq: int) -> None:
+        hash_values, sort_values = self._indexed.pop(key)
+        for field, value in zip(self.hash_fields, hash_values):
+            bucket = self._hash[field].get(value)
+            if bucket is not None:
+                bucket.pop(key, None)
+                if not bucket:
+                    del self._hash[field][value]
+        for field, value in zip(self.sorted_fields, sort_values):
+            entries = self._sorted[field]
+            entry = (value, seq, key)
+            position = bisect_left(entries, entry)
+            if position < len(entries) and entries[position] == entry:
+                del entries[position]
@@ -1,3 +1,4 @@
 from core.agno.db.json.json_db import JsonDb
+from core.agno.db.json.json_log_db import JsonLogDb
 
-__all__ = ["JsonDb"]
+__all__ = ["JsonDb", "JsonLogDb"]
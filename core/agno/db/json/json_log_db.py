@@ -0,0 +1,768 @@
+"""Append-log variant of JsonDb.
+
+Each table is a JSON-lines file where every line is either a record (`{"k": key, "v": record}`) or a
+tombstone (`{"k": key, "d": true}`). The file is scanned once to build an in-memory index of key ->
+(offset, length) of the latest line for that key, so single-record reads seek straight to the line and
+writes append one line instead of rewriting the table. Once the log holds much more dead data than live
+data it is compacted into a fresh file that atomically replaces the old one.
+
+Processes sharing a table coordinate through an advisory lock on a `<table>.jsonl.lock` file: writes and
+compactions hold it exclusively, reads hold it shared, so no append can land in a log while it is being
+compacted and no read seeks into a file that was replaced under it. The lock file also holds a counter of
+compactions, which tells the other processes to rebuild their index (inode numbers are reused, so the
+replaced file cannot be told apart by its inode).
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from uuid import uuid4
+
+from core.agno.db.base import SessionType
+from core.agno.db.json.json_db import JsonDb
+from core.agno.db.json.utils import hydrate_session
+from core.agno.db.schemas.evals import EvalRunRecord
+from core.agno.db.schemas.knowledge import KnowledgeRow
+from core.agno.db.schemas.memory import UserMemory
+from core.agno.session import AgentSession, Session, TeamSession, WorkflowSession
+from core.agno.utils.log import log_debug, log_error, log_warning
+
+DEFAULT_COMPACTION_RATIO = 2.0
+DEFAULT_COMPACTION_MIN_BYTES = 1024 * 1024
+
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+
+def _lock_file(fd: int, shared: bool) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        return
+    # msvcrt has no shared locks, readers take the exclusive lock too
+    os.lseek(fd, 0, os.SEEK_SET)
+    while True:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            # LK_LOCK gives up after 10 seconds, keep waiting like flock does
+            continue
+
+
+def _unlock_file(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        return
+    os.lseek(fd, 0, os.SEEK_SET)
+    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+def _read_generation(fd: int) -> int:
+    os.lseek(fd, 0, os.SEEK_SET)
+    data = os.read(fd, 8)
+    return int.from_bytes(data, "little") if len(data) == 8 else 0
+
+
+def _write_generation(fd: int, generation: int) -> None:
+    os.lseek(fd, 0, os.SEEK_SET)
+    os.write(fd, generation.to_bytes(8, "little"))
+
+
+def _encode_line(key: str, record: Optional[Dict[str, Any]]) -> bytes:
+    entry: Dict[str, Any] = {"k": key, "d": True} if record is None else {"k": key, "v": record}
+    return (json.dumps(entry, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+
+
+class LogTable:
+    """One JSON-lines table file and its in-memory index"""
+
+    def __init__(self, path: Path, compaction_ratio: float, compaction_min_bytes: int):
+        self.path = path
+        self.compaction_ratio = compaction_ratio
+        self.compaction_min_bytes = compaction_min_bytes
+        self.lock = threading.RLock()
+        # Cross-process lock, held while `_lock_depth` > 0
+        self.lock_path = path.with_name(f"{path.name}.lock")
+        self._lock_fd: Optional[int] = None
+        self._lock_depth: int = 0
+        self._lock_shared: bool = False
+
+        # key -> (offset, length) of the latest record line, in first-insertion order
+        self.index: Dict[str, Tuple[int, int]] = {}
+        self.live_bytes: int = 0
+        self._size: int = 0
+        # Compaction counter the index was built against
+        self._generation: int = 0
+
+    @contextmanager
+    def locked(self, shared: bool = False) -> Iterator[None]:
+        """Hold the table against other threads and processes, with the index synced to the file.
+
+        Reentrant: nested sections reuse the outermost lock, which must be exclusive if any of them writes.
+        """
+        with self.lock:
+            if self._lock_depth == 0:
+                if self._lock_fd is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+                _lock_file(self._lock_fd, shared)
+                self._lock_shared = shared
+            elif self._lock_shared and not shared:
+                raise RuntimeError(f"Cannot write to {self.path} while holding its shared lock")
+            self._lock_depth += 1
+            try:
+                if self._lock_depth == 1:
+                    self.sync()
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0:
+                    _unlock_file(self._lock_fd)
+
+    def sync(self) -> None:
+        """Pick up lines appended by other processes, or reload if the file was compacted elsewhere.
+
+        Must hold the lock.
+        """
+        generation = _read_generation(self._lock_fd)
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            # Created by the first append
+            size = 0
+
+        if generation != self._generation or size < self._size:
+            self.index = {}
+            self.live_bytes = 0
+            self._size = 0
+            self._generation = generation
+        if size > self._size:
+            self._scan()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read the latest record for `key` with a single seek."""
+        location = self.index.get(key)
+        if location is None:
+            return None
+        with open(self.path, "rb") as f:
+            f.seek(location[0])
+            return json.loads(f.read(location[1]))["v"]
+
+    def read_all(self) -> List[Dict[str, Any]]:
+        """Read every live record in index order."""
+        if not self.index:
+            return []
+        with open(self.path, "rb") as f:
+            data = f.read(self._size)
+        return [json.loads(data[offset : offset + length])["v"] for offset, length in self.index.values()]
+
+    def read_raw(self) -> bytes:
+        if self._size == 0:
+            return b""
+        with open(self.path, "rb") as f:
+            return f.read(self._size)
+
+    def append(self, entries: Iterable[Tuple[str, Optional[Dict[str, Any]]]]) -> None:
+        """Append records (or tombstones, for a None record) in a single write, then index them."""
+        payload = b"".join(_encode_line(key, record) for key, record in entries)
+        if not payload:
+            return
+        with self.locked():
+            if self.path.exists() and os.path.getsize(self.path) > self._size:
+                # Terminate a line left unfinished by a crashed writer so ours start on a fresh line
+                payload = b"\n" + payload
+            with open(self.path, "ab") as f:
+                f.write(payload)
+                f.flush()
+            self._scan()
+            self.maybe_compact()
+
+    def rewrite(self, entries: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Atomically replace the table with `entries`, dropping all history. Must hold the exclusive lock."""
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{uuid4().hex}.tmp")
+        index: Dict[str, Tuple[int, int]] = {}
+        offset = 0
+        try:
+            with open(tmp_path, "wb") as f:
+                for key, record in entries:
+                    line = _encode_line(key, record)
+                    f.write(line)
+                    index[key] = (offset, len(line))
+                    offset += len(line)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+
+        self.index = index
+        self.live_bytes = offset
+        self._size = offset
+        self._generation += 1
+        _write_generation(self._lock_fd, self._generation)
+
+    def maybe_compact(self) -> None:
+        """Compact the log if it holds too much dead data. Must hold the exclusive lock."""
+        if self._size < self.compaction_min_bytes or self._size <= self.live_bytes * self.compaction_ratio:
+            return
+        start = time.perf_counter()
+        previous_size = self._size
+        data = self.read_raw()
+        self.rewrite(
+            (key, json.loads(data[offset : offset + length])["v"]) for key, (offset, length) in self.index.items()
+        )
+        log_debug(
+            f"Compacted {self.path.name} from {previous_size} to {self._size} bytes "
+            f"in {time.perf_counter() - start:.3f}s"
+        )
+
+    def _scan(self) -> None:
+        """Index every complete line between the indexed end of the file and its current end."""
+        with open(self.path, "rb") as f:
+            f.seek(self._size)
+            data = f.read()
+
+        offset = self._size
+        position = 0
+        while True:
+            end = data.find(b"\n", position)
+            if end == -1:
+                # A line another writer has not finished yet is picked up on the next sync
+                break
+            line = data[position : end + 1]
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                log_warning(f"Skipping corrupt line at offset {offset + position} in {self.path}")
+            else:
+                key = entry["k"]
+                previous = self.index.get(key)
+                if previous is not None:
+                    self.live_bytes -= previous[1]
+                if entry.get("d"):
+                    self.index.pop(key, None)
+                else:
+                    self.index[key] = (offset + position, len(line))
+                    self.live_bytes += len(line)
+            position = end + 1
+        self._size = offset + position
+
+
+_tables: Dict[str, LogTable] = {}
+_tables_lock = threading.Lock()
+
+
+def get_log_table(path: Path, compaction_ratio: float, compaction_min_bytes: int) -> LogTable:
+    """Return the process-wide table for `path`, so every JsonLogDb on the same file shares one index."""
+    table_key = str(path.resolve())
+    with _tables_lock:
+        table = _tables.get(table_key)
+        if table is None:
+            table = LogTable(path, compaction_ratio, compaction_min_bytes)
+            _tables[table_key] = table
+        return table
+
+
+class JsonLogDb(JsonDb):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        session_table: Optional[str] = None,
+        culture_table: Optional[str] = None,
+        memory_table: Optional[str] = None,
+        metrics_table: Optional[str] = None,
+        eval_table: Optional[str] = None,
+        knowledge_table: Optional[str] = None,
+        id: Optional[str] = None,
+        compaction_ratio: float = DEFAULT_COMPACTION_RATIO,
+        compaction_min_bytes: int = DEFAULT_COMPACTION_MIN_BYTES,
+    ):
+        """
+        Interface for interacting with JSON-lines append logs as database.
+
+        Tables are stored as `<table>.jsonl`. An existing `<table>.json` file written by JsonDb is imported
+        the first time its table is opened.
+
+        Args:
+            db_path (Optional[str]): Path to the directory where the log files will be stored.
+            session_table (Optional[str]): Name of the log file to store sessions (without extension).
+            culture_table (Optional[str]): Name of the log file to store cultural knowledge.
+            memory_table (Optional[str]): Name of the log file to store memories.
+            metrics_table (Optional[str]): Name of the log file to store metrics.
+            eval_table (Optional[str]): Name of the log file to store evaluation runs.
+            knowledge_table (Optional[str]): Name of the log file to store knowledge content.
+            id (Optional[str]): ID of the database.
+            compaction_ratio (float): Compact a log once its size exceeds this multiple of its live data.
+            compaction_min_bytes (int): Never compact logs smaller than this.
+        """
+        super().__init__(
+            db_path=db_path,
+            session_table=session_table,
+            culture_table=culture_table,
+            memory_table=memory_table,
+            metrics_table=metrics_table,
+            eval_table=eval_table,
+            knowledge_table=knowledge_table,
+            id=id,
+        )
+        self.compaction_ratio = compaction_ratio
+        self.compaction_min_bytes = compaction_min_bytes
+
+        # Field holding the primary key of each table's records
+        self._key_fields: Dict[str, str] = {
+            self.session_table_name: "session_id",
+            self.memory_table_name: "memory_id",
+            self.eval_table_name: "run_id",
+            self.knowledge_table_name: "id",
+            self.culture_table_name: "id",
+            self.metrics_table_name: "id",
+        }
+
+    def _table(self, filename: str) -> LogTable:
+        """Return the synced table for `filename`, importing a legacy JSON file on first use."""
+        log_path = self.db_path / f"{filename}.jsonl"
+        table = get_log_table(log_path, self.compaction_ratio, self.compaction_min_bytes)
+        legacy_path = self.db_path / f"{filename}.json"
+        if not log_path.exists() and legacy_path.exists():
+            with table.locked():
+                # Check again under the lock, another process may have imported the file meanwhile
+                if not log_path.exists():
+                    with open(legacy_path, "r") as f:
+                        records = json.load(f)
+                    table.rewrite(self._keyed(filename, records, skip_missing=True))
+                    log_debug(f"Imported {len(records)} records from {legacy_path} into {log_path}")
+        return table
+
+    def _keyed(
+        self, filename: str, records: List[Dict[str, Any]], skip_missing: bool = False
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Pair every record with its primary key.
+
+        Raises:
+            ValueError: If a record has no key, unless `skip_missing` is set, in which case it is left out.
+        """
+        key_field = self._key_fields.get(filename, "id")
+        keyed: List[Tuple[str, Dict[str, Any]]] = []
+        for record in records:
+            key = record.get(key_field)
+            if key is None or key == "":
+                if skip_missing:
+                    log_warning(f"Skipping a {filename} record without {key_field}")
+                    continue
+                raise ValueError(f"Cannot write a {filename} record without {key_field}")
+            keyed.append((str(key), record))
+        return keyed
+
+    def _read_json_file(self, filename: str, create_table_if_not_found: Optional[bool] = True) -> List[Dict[str, Any]]:
+        """Read every live record of a table, in insertion order.
+
+        Args:
+            filename (str): The name of the table to read.
+
+        Returns:
+            List[Dict[str, Any]]: The live records of the table.
+        """
+        table = self._table(filename)
+        with table.locked(shared=True):
+            return table.read_all()
+
+    def _write_json_file(self, filename: str, data: List[Dict[str, Any]]) -> None:
+        """Make a table hold exactly `data`, appending only the records that changed.
+
+        Args:
+            filename (str): The name of the table to write.
+            data (List[Dict[str, Any]]): The full contents of the table.
+
+        Raises:
+            Exception: If an error occurs while writing to the log file.
+        """
+        table = self._table(filename)
+        try:
+            with table.locked():
+                raw = table.read_raw()
+                entries: List[Tuple[str, Optional[Dict[str, Any]]]] = []
+                keys = set()
+                for key, record in self._keyed(filename, data):
+                    keys.add(key)
+                    location = table.index.get(key)
+                    if location is not None and raw[location[0] : location[0] + location[1]] == _encode_line(
+                        key, record
+                    ):
+                        continue
+                    entries.append((key, record))
+                entries.extend((key, None) for key in table.index if key not in keys)
+                table.append(entries)
+
+        except Exception as e:
+            log_error(f"Error writing to the {table.path} log file: {e}")
+            raise e
+
+    def _session_from_dict(
+        self, session: Dict[str, Any], session_type: SessionType
+    ) -> Union[AgentSession, TeamSession, WorkflowSession]:
+        if session_type == SessionType.AGENT:
+            return AgentSession.from_dict(session)  # type: ignore
+        elif session_type == SessionType.TEAM:
+            return TeamSession.from_dict(session)  # type: ignore
+        elif session_type == SessionType.WORKFLOW:
+            return WorkflowSession.from_dict(session)  # type: ignore
+        else:
+            raise ValueError(f"Invalid session type: {session_type}")
+
+    # -- Session methods --
+
+    def delete_session(self, session_id: str) -> bool:
+        """Delete a session by appending a tombstone.
+
+        Args:
+            session_id (str): The ID of the session to delete.
+
+        Returns:
+            bool: True if the session was deleted, False otherwise.
+        """
+        try:
+            table = self._table(self.session_table_name)
+            with table.locked():
+                if session_id not in table.index:
+                    log_debug(f"No session found to delete with session_id: {session_id}")
+                    return False
+                table.append([(session_id, None)])
+            log_debug(f"Successfully deleted session with session_id: {session_id}")
+            return True
+
+        except Exception as e:
+            log_error(f"Error deleting session: {e}")
+            raise e
+
+    def delete_sessions(self, session_ids: List[str]) -> None:
+        """Delete multiple sessions by appending tombstones.
+
+        Args:
+            session_ids (List[str]): The IDs of the sessions to delete.
+        """
+        try:
+            table = self._table(self.session_table_name)
+            with table.locked():
+                table.append([(session_id, None) for session_id in session_ids if session_id in table.index])
+            log_debug(f"Successfully deleted sessions with ids: {session_ids}")
+
+        except Exception as e:
+            log_error(f"Error deleting sessions: {e}")
+            raise e
+
+    def get_session(
+        self,
+        session_id: str,
+        session_type: SessionType,
+        user_id: Optional[str] = None,
+        deserialize: Optional[bool] = True,
+    ) -> Optional[Union[AgentSession, TeamSession, WorkflowSession, Dict[str, Any]]]:
+        """Read a session through the index.
+
+        Args:
+            session_id (str): The ID of the session to read.
+            session_type (SessionType): The type of the session to read.
+            user_id (Optional[str]): The ID of the user to read the session for.
+            deserialize (Optional[bool]): Whether to deserialize the session.
+
+        Returns:
+            Union[Session, Dict[str, Any], None]:
+                - When deserialize=True: Session object
+                - When deserialize=False: Session dictionary
+        """
+        try:
+            table = self._table(self.session_table_name)
+            with table.locked(shared=True):
+                session_data = table.get(session_id)
+
+            if session_data is None:
+                return None
+            if user_id is not None and session_data.get("user_id") != user_id:
+                return None
+            session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
+            if session_data.get("session_type") != session_type_value:
+                return None
+
+            session = hydrate_session(session_data)
+            if not deserialize:
+                return session
+            return self._session_from_dict(session, session_type)
+
+        except Exception as e:
+            log_error(f"Exception reading from session file: {e}")
+            raise e
+
+    def rename_session(
+        self, session_id: str, session_type: SessionType, session_name: str, deserialize: Optional[bool] = True
+    ) -> Optional[Union[Session, Dict[str, Any]]]:
+        """Rename a session by appending its updated record."""
+        try:
+            table = self._table(self.session_table_name)
+            with table.locked():
+                session = table.get(session_id)
+                if session is None or session.get("session_type") != session_type.value:
+                    return None
+
+                if "session_data" not in session or session["session_data"] is None:
+                    session["session_data"] = {}
+                session["session_data"]["session_name"] = session_name
+                table.append([(session_id, session)])
+
+            log_debug(f"Renamed session with id '{session_id}' to '{session_name}'")
+
+            if not deserialize:
+                return session
+            return self._session_from_dict(session, session_type)
+
+        except Exception as e:
+            log_error(f"Exception renaming session: {e}")
+            raise e
+
+    def upsert_session(
+        self, session: Session, deserialize: Optional[bool] = True
+    ) -> Optional[Union[Session, Dict[str, Any]]]:
+        """Insert or update a session by appending its record.
+
+        `session_id` is the primary key of the table, as in the SQL backends: upserting a session whose id
+        already belongs to another component replaces that record.
+        """
+        try:
+            session_dict = session.to_dict()
+
+            # Add session_type based on session instance type
+            if isinstance(session, AgentSession):
+                session_dict["session_type"] = SessionType.AGENT.value
+            elif isinstance(session, TeamSession):
+                session_dict["session_type"] = SessionType.TEAM.value
+            elif isinstance(session, WorkflowSession):
+                session_dict["session_type"] = SessionType.WORKFLOW.value
+
+            table = self._table(self.session_table_name)
+            with table.locked():
+                existing_session = table.get(session.session_id)
+                if existing_session is not None and self._matches_session_key(existing_session, session):
+                    session_dict["updated_at"] = int(time.time())
+                else:
+                    session_dict["created_at"] = session_dict.get("created_at", int(time.time()))
+                    session_dict["updated_at"] = session_dict.get("created_at")
+                table.append([(session.session_id, session_dict)])
+
+            if not deserialize:
+                return session_dict
+
+            return session
+
+        except Exception as e:
+            log_error(f"Exception upserting session: {e}")
+            raise e
+
+    # -- Memory methods --
+
+    def delete_user_memory(self, memory_id: str, user_id: Optional[str] = None):
+        """Delete a user memory by appending a tombstone.
+
+        Args:
+            memory_id (str): The ID of the memory to delete.
+            user_id (Optional[str]): The ID of the user (optional, for filtering).
+        """
+        try:
+            table = self._table(self.memory_table_name)
+            with table.locked():
+                memory = table.get(memory_id)
+                if memory is None:
+                    log_debug(f"No memory found with id: {memory_id}")
+                    return
+                if user_id and memory.get("user_id") != user_id:
+                    log_debug(f"Memory {memory_id} does not belong to user {user_id}")
+                    return
+                table.append([(memory_id, None)])
+            log_debug(f"Successfully deleted user memory id: {memory_id}")
+
+        except Exception as e:
+            log_error(f"Error deleting memory: {e}")
+            raise e
+
+    def delete_user_memories(self, memory_ids: List[str], user_id: Optional[str] = None) -> None:
+        """Delete multiple user memories by appending tombstones.
+
+        Args:
+            memory_ids (List[str]): List of memory IDs to delete.
+            user_id (Optional[str]): The ID of the user (optional, for filtering).
+        """
+        try:
+            table = self._table(self.memory_table_name)
+            with table.locked():
+                to_delete = [memory_id for memory_id in memory_ids if memory_id in table.index]
+                if user_id:
+                    to_delete = [
+                        memory_id for memory_id in to_delete if (table.get(memory_id) or {}).get("user_id") == user_id
+                    ]
+                table.append([(memory_id, None) for memory_id in to_delete])
+            log_debug(f"Successfully deleted {len(to_delete)} user memories")
+
+        except Exception as e:
+            log_error(f"Error deleting memories: {e}")
+            raise e
+
+    def get_user_memory(
+        self,
+        memory_id: str,
+        deserialize: Optional[bool] = True,
+        user_id: Optional[str] = None,
+    ) -> Optional[Union[UserMemory, Dict[str, Any]]]:
+        """Get a memory through the index.
+
+        Args:
+            memory_id (str): The ID of the memory to get.
+            deserialize (Optional[bool]): Whether to deserialize the memory.
+            user_id (Optional[str]): The ID of the user (optional, for filtering).
+
+        Returns:
+            Optional[Union[UserMemory, Dict[str, Any]]]: The user memory data if found, None otherwise.
+        """
+        try:
+            table = self._table(self.memory_table_name)
+            with table.locked(shared=True):
+                memory_data = table.get(memory_id)
+
+            if memory_data is None:
+                return None
+            if user_id and memory_data.get("user_id") != user_id:
+                return None
+            if not deserialize:
+                return memory_data
+            return UserMemory.from_dict(memory_data)
+
+        except Exception as e:
+            log_error(f"Exception reading from memory file: {e}")
+            raise e
+
+    def upsert_user_memory(
+        self, memory: UserMemory, deserialize: Optional[bool] = True
+    ) -> Optional[Union[UserMemory, Dict[str, Any]]]:
+        """Upsert a user memory by appending its record."""
+        try:
+            if memory.memory_id is None:
+                memory.memory_id = str(uuid4())
+
+            memory_dict = memory.to_dict() if hasattr(memory, "to_dict") else memory.__dict__
+            memory_dict["updated_at"] = int(time.time())
+
+            table = self._table(self.memory_table_name)
+            with table.locked():
+                table.append([(memory.memory_id, memory_dict)])
+
+            if not deserialize:
+                return memory_dict
+            return UserMemory.from_dict(memory_dict)
+
+        except Exception as e:
+            log_warning(f"Exception upserting user memory: {e}")
+            raise e
+
+    # -- Knowledge methods --
+
+    def delete_knowledge_content(self, id: str):
+        """Delete a knowledge row by appending a tombstone.
+
+        Args:
+            id (str): The ID of the knowledge row to delete.
+        """
+        try:
+            table = self._table(self.knowledge_table_name)
+            with table.locked():
+                if id in table.index:
+                    table.append([(id, None)])
+
+        except Exception as e:
+            log_error(f"Error deleting knowledge content: {e}")
+            raise e
+
+    def get_knowledge_content(self, id: str) -> Optional[KnowledgeRow]:
+        """Get a knowledge row through the index.
+
+        Args:
+            id (str): The ID of the knowledge row to get.
+
+        Returns:
+            Optional[KnowledgeRow]: The knowledge row, or None if it doesn't exist.
+        """
+        try:
+            table = self._table(self.knowledge_table_name)
+            with table.locked(shared=True):
+                item = table.get(id)
+            return KnowledgeRow.model_validate(item) if item is not None else None
+
+        except Exception as e:
+            log_error(f"Error getting knowledge content: {e}")
+            raise e
+
+    def upsert_knowledge_content(self, knowledge_row: KnowledgeRow):
+        """Upsert knowledge content by appending its record.
+
+        Args:
+            knowledge_row (KnowledgeRow): The knowledge row to upsert.
+
+        Returns:
+            Optional[KnowledgeRow]: The upserted knowledge row.
+        """
+        try:
+            table = self._table(self.knowledge_table_name)
+            with table.locked():
+                table.append([(knowledge_row.id, knowledge_row.model_dump())])
+            return knowledge_row
+
+        except Exception as e:
+            log_error(f"Error upserting knowledge row: {e}")
+            raise e
+
+    # -- Eval methods --
+
+    def create_eval_run(self, eval_run: EvalRunRecord) -> Optional[EvalRunRecord]:
+        """Create an EvalRunRecord by appending its record."""
+        try:
+            current_time = int(time.time())
+            eval_dict = eval_run.model_dump()
+            eval_dict["created_at"] = current_time
+            eval_dict["updated_at"] = current_time
+
+            table = self._table(self.eval_table_name)
+            with table.locked():
+                table.append([(eval_run.run_id, eval_dict)])
+
+            log_debug(f"Created eval run with id '{eval_run.run_id}'")
+
+            return eval_run
+
+        except Exception as e:
+            log_error(f"Error creating eval run: {e}")
+            raise e
+
+    def get_eval_run(
+        self, eval_run_id: str, deserialize: Optional[bool] = True
+    ) -> Optional[Union[EvalRunRecord, Dict[str, Any]]]:
+        """Get an eval run through the index."""
+        try:
+            table = self._table(self.eval_table_name)
+            with table.locked(shared=True):
+                run_data = table.get(eval_run_id)
+
+            if run_data is None:
+                return None
+            if not deserialize:
+                return run_data
+            return EvalRunRecord.model_validate(run_data)
+
+        except Exception as e:
+            log_error(f"Exception getting eval run {eval_run_id}: {e}")
+            raise e
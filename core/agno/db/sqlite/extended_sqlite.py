@@ -2,11 +2,13 @@
 
 import json
 import time
+import zlib
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from core.agno.db.sqlite.sqlite import SqliteDb
 from core.agno.db.sqlite.config_data import AgentConfig, ToolConfig, ModelConfig
 from core.agno.db.sqlite.runtime_data import RuntimeData, ReasoningStep, ToolCallRecord
+from core.agno.db.sqlite.trace_writer import RuntimeRow, RuntimeTraceWriter, StatusUpdate
 from core.agno.utils.log import log_debug, log_error, log_info
 
 try:
@@ -16,16 +18,51 @@ except ImportError:
         return sql
 
 
+# The first byte of an encoded value tells which codec wrote it, so values written with different
+# codecs, and the plain JSON text of older rows, can all be read back
+_CODEC_TAGS = {"zlib": b"z", "zstd": b"Z", "msgpack": b"m"}
+
+
 class ExtendedSqliteDb(SqliteDb):
     """Extended SQLite database implementation with configuration and runtime data support."""
 
-    def __init__(self, *args, **kwargs):
-        """Initialize extended SQLite database."""
+    def __init__(
+        self,
+        *args,
+        runtime_codec: Optional[str] = None,
+        async_runtime_writes: bool = False,
+        runtime_queue_size: int = 10000,
+        runtime_batch_size: int = 256,
+        **kwargs,
+    ):
+        """Initialize extended SQLite database.
+
+        Args:
+            runtime_codec (Optional[str]): Binary encoding of the large runtime data columns: "zlib", "zstd"
+                (requires `zstandard`) or "msgpack" (requires `msgpack`). None stores them as JSON text.
+            async_runtime_writes (bool): Write runtime data from a background thread in batched transactions
+                instead of on the caller's thread. See `RuntimeTraceWriter`.
+            runtime_queue_size (int): Maximum number of runtime records waiting to be written.
+            runtime_batch_size (int): Maximum number of runtime records written per transaction.
+        """
         super().__init__(*args, **kwargs)
 
+        if runtime_codec is not None and runtime_codec not in _CODEC_TAGS:
+            raise ValueError(f"Unknown runtime codec: {runtime_codec}. Use one of {', '.join(_CODEC_TAGS)}")
+        self.runtime_codec = runtime_codec
+        if runtime_codec is not None:
+            # Fail early when the codec's package is missing
+            self._encode_blob([])
+
         # Initialize additional tables
         self._initialize_extended_tables()
 
+        self.runtime_writer: Optional[RuntimeTraceWriter] = None
+        if async_runtime_writes:
+            self.runtime_writer = RuntimeTraceWriter(
+                self, max_queue_size=runtime_queue_size, batch_size=runtime_batch_size
+            )
+
     def _get_connection(self):
         """Get database connection context manager."""
         return self.Session()
@@ -378,14 +415,49 @@ class ExtendedSqliteDb(SqliteDb):
     # --- Runtime Data Methods ---
 
     def upsert_runtime_data(self, data: RuntimeData) -> RuntimeData:
-        """Insert or update runtime data."""
+        """Insert or update runtime data.
+
+        With `async_runtime_writes`, the record is queued and written by the background writer.
+        """
+        if self.runtime_writer is not None:
+            self.runtime_writer.put(data)
+            return data
+
         try:
-            with self._get_connection() as conn:
-                current_time = int(time.time())
-                if data.created_at is None:
-                    data.created_at = current_time
-                data.updated_at = current_time
+            current_time = int(time.time())
+            if data.created_at is None:
+                data.created_at = current_time
+            data.updated_at = current_time
+            self._write_runtime_batch([self._runtime_row(data)], [])
+            return data
 
+        except Exception as e:
+            log_error(f"Error upserting runtime data: {e}")
+            raise
+
+    def _runtime_row(self, data: RuntimeData) -> RuntimeRow:
+        """Encode a runtime record into the columns of its row. The large columns are encoded with `runtime_codec`."""
+        return {
+            'run_id': data.run_id,
+            'session_id': data.session_id,
+            'agent_id': data.agent_id,
+            'user_id': data.user_id,
+            'input_data': self._encode_blob(data.input_data),
+            'output_data': self._encode_blob(data.output_data),
+            'reasoning_steps': self._encode_blob(data.reasoning_steps),
+            'tool_calls': self._encode_blob(data.tool_calls),
+            'metrics': self._json_dumps(data.metrics),
+            'status': data.status,
+            'error_message': data.error_message,
+            'execution_time': data.execution_time,
+            'created_at': data.created_at,
+            'updated_at': data.updated_at
+        }
+
+    def _write_runtime_batch(self, records: List[RuntimeRow], status_updates: List[StatusUpdate]) -> None:
+        """Write encoded runtime records and status updates in a single transaction."""
+        with self._get_connection() as conn:
+            if records:
                 conn.execute(text("""
                     INSERT OR REPLACE INTO agno_runtime_data (
                         run_id, session_id, agent_id, user_id, input_data, output_data,
@@ -396,37 +468,46 @@ class ExtendedSqliteDb(SqliteDb):
                         :reasoning_steps, :tool_calls, :metrics, :status, :error_message,
                         :execution_time, :created_at, :updated_at
                     )
-                """), {
-                    'run_id': data.run_id,
-                    'session_id': data.session_id,
-                    'agent_id': data.agent_id,
-                    'user_id': data.user_id,
-                    'input_data': self._json_dumps(data.input_data),
-                    'output_data': self._json_dumps(data.output_data),
-                    'reasoning_steps': self._json_dumps(data.reasoning_steps),
-                    'tool_calls': self._json_dumps(data.tool_calls),
-                    'metrics': self._json_dumps(data.metrics),
-                    'status': data.status,
-                    'error_message': data.error_message,
-                    'execution_time': data.execution_time,
-                    'created_at': data.created_at,
-                    'updated_at': data.updated_at
-                })
-                conn.commit()
-                log_debug(f"Upserted runtime data: {data.run_id}")
-                return data
+                """), records)
 
-        except Exception as e:
-            log_error(f"Error upserting runtime data: {e}")
-            raise
+            if status_updates:
+                conn.execute(text("""
+                    UPDATE agno_runtime_data
+                    SET status = :status, updated_at = :updated_at,
+                        error_message = COALESCE(:error_message, error_message)
+                    WHERE run_id = :run_id
+                """), [{
+                    'run_id': run_id,
+                    'status': status,
+                    'error_message': error_message,
+                    'updated_at': updated_at
+                } for run_id, status, error_message, updated_at in status_updates])
+
+            conn.commit()
+            for record in records:
+                log_debug(f"Upserted runtime data: {record['run_id']}")
+
+    def flush_runtime_data(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the queued runtime data is written. Returns False if `timeout` expired first."""
+        if self.runtime_writer is None:
+            return True
+        return self.runtime_writer.flush(timeout)
+
+    def close_runtime_writer(self, timeout: Optional[float] = None) -> None:
+        """Write the queued runtime data and stop the background writer."""
+        if self.runtime_writer is not None:
+            self.runtime_writer.close(timeout)
+            self.runtime_writer = None
 
     def get_runtime_data(self, run_id: str) -> Optional[RuntimeData]:
         """Get runtime data by run ID."""
+        # Reads see the runs queued for writing
+        self.flush_runtime_data()
         try:
             with self._get_connection() as conn:
                 cursor = conn.execute(
-                    text("SELECT * FROM agno_runtime_data WHERE run_id = ?"),
-                    (run_id,)
+                    text("SELECT * FROM agno_runtime_data WHERE run_id = :run_id"),
+                    {'run_id': run_id}
                 )
                 row = cursor.fetchone()
 
@@ -439,10 +520,10 @@ class ExtendedSqliteDb(SqliteDb):
                     "session_id": data_dict["session_id"],
                     "agent_id": data_dict["agent_id"],
                     "user_id": data_dict["user_id"],
-                    "input_data": self._json_loads(data_dict["input_data"]),
-                    "output_data": self._json_loads(data_dict["output_data"]),
-                    "reasoning_steps": self._json_loads(data_dict["reasoning_steps"]),
-                    "tool_calls": self._json_loads(data_dict["tool_calls"]),
+                    "input_data": self._decode_blob(data_dict["input_data"]),
+                    "output_data": self._decode_blob(data_dict["output_data"]),
+                    "reasoning_steps": self._decode_blob(data_dict["reasoning_steps"]),
+                    "tool_calls": self._decode_blob(data_dict["tool_calls"]),
                     "metrics": self._json_loads(data_dict["metrics"]),
                     "status": data_dict["status"],
                     "error_message": data_dict["error_message"],
@@ -464,6 +545,8 @@ class ExtendedSqliteDb(SqliteDb):
         limit: Optional[int] = None
     ) -> List[RuntimeData]:
         """Get runtime data list with optional filters."""
+        # Reads see the runs queued for writing
+        self.flush_runtime_data()
         try:
             with self._get_connection() as conn:
                 query = "SELECT * FROM agno_runtime_data WHERE 1=1"
@@ -502,10 +585,10 @@ class ExtendedSqliteDb(SqliteDb):
                         "session_id": data_dict["session_id"],
                         "agent_id": data_dict["agent_id"],
                         "user_id": data_dict["user_id"],
-                        "input_data": self._json_loads(data_dict["input_data"]),
-                        "output_data": self._json_loads(data_dict["output_data"]),
-                        "reasoning_steps": self._json_loads(data_dict["reasoning_steps"]),
-                        "tool_calls": self._json_loads(data_dict["tool_calls"]),
+                        "input_data": self._decode_blob(data_dict["input_data"]),
+                        "output_data": self._decode_blob(data_dict["output_data"]),
+                        "reasoning_steps": self._decode_blob(data_dict["reasoning_steps"]),
+                        "tool_calls": self._decode_blob(data_dict["tool_calls"]),
                         "metrics": self._json_loads(data_dict["metrics"]),
                         "status": data_dict["status"],
                         "error_message": data_dict["error_message"],
@@ -521,34 +604,27 @@ class ExtendedSqliteDb(SqliteDb):
             raise
 
     def update_runtime_data_status(self, run_id: str, status: str, error_message: Optional[str] = None) -> bool:
-        """Update runtime data status."""
+        """Update runtime data status.
+
+        With `async_runtime_writes`, the change is queued and True only means it was accepted.
+        """
+        if self.runtime_writer is not None:
+            self.runtime_writer.put_status(run_id, status, error_message)
+            return True
+
         try:
             with self._get_connection() as conn:
-                update_fields = ["status = ?", "updated_at = ?"]
-                params = [status, int(time.time())]
-
-                if error_message is not None:
-                    update_fields.append("error_message = ?")
-                    params.append(error_message)
-
-                set_clauses = []
-                update_dict = {}
-
-                for field in update_fields:
-                    if field == "status = ?":
-                        set_clauses.append("status = :status")
-                        update_dict['status'] = params[0]
-                    elif field == "updated_at = ?":
-                        set_clauses.append("updated_at = :updated_at")
-                        update_dict['updated_at'] = params[1]
-                    elif field == "error_message = ?":
-                        set_clauses.append("error_message = :error_message")
-                        update_dict['error_message'] = params[2]
-
-                update_dict['run_id'] = run_id
-                query = f"UPDATE agno_runtime_data SET {', '.join(set_clauses)} WHERE run_id = :run_id"
-
-                cursor = conn.execute(text(query), update_dict)
+                cursor = conn.execute(text("""
+                    UPDATE agno_runtime_data
+                    SET status = :status, updated_at = :updated_at,
+                        error_message = COALESCE(:error_message, error_message)
+                    WHERE run_id = :run_id
+                """), {
+                    'run_id': run_id,
+                    'status': status,
+                    'error_message': error_message,
+                    'updated_at': int(time.time())
+                })
                 conn.commit()
                 success = cursor.rowcount > 0
                 if success:
@@ -573,11 +649,59 @@ class ExtendedSqliteDb(SqliteDb):
             return None
         return json.loads(data)
 
+    def _encode_blob(self, data: Any) -> Optional[Union[str, bytes]]:
+        """Encode a large runtime data value with `runtime_codec`, or as JSON text without one."""
+        if data is None:
+            return None
+        if self.runtime_codec is None:
+            return self._json_dumps(data)
+
+        if self.runtime_codec == "msgpack":
+            try:
+                import msgpack
+            except ImportError:
+                raise ImportError("`msgpack` not installed. Please install it with `pip install msgpack`")
+            payload = msgpack.packb(data, use_bin_type=True, default=str)
+        else:
+            payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode("utf-8")
+            if self.runtime_codec == "zstd":
+                try:
+                    import zstandard
+                except ImportError:
+                    raise ImportError("`zstandard` not installed. Please install it with `pip install zstandard`")
+                payload = zstandard.ZstdCompressor(level=3).compress(payload)
+            else:
+                payload = zlib.compress(payload, 6)
+        return _CODEC_TAGS[self.runtime_codec] + payload
+
+    def _decode_blob(self, data: Optional[Union[str, bytes]]) -> Any:
+        """Decode a value written by `_encode_blob`, whichever codec wrote it."""
+        if not isinstance(data, (bytes, memoryview)):
+            return self._json_loads(data)
+
+        data = bytes(data)
+        tag, payload = data[:1], data[1:]
+        if tag == _CODEC_TAGS["msgpack"]:
+            import msgpack
+
+            return msgpack.unpackb(payload, raw=False)
+        if tag == _CODEC_TAGS["zstd"]:
+            import zstandard
+
+            return json.loads(zstandard.ZstdDecompressor().decompress(payload))
+        if tag == _CODEC_TAGS["zlib"]:
+            return json.loads(zlib.decompress(payload))
+        raise ValueError(f"Unknown runtime data encoding: {tag!r}")
+
     # --- Statistics Methods ---
 
     def get_agent_statistics(self, agent_id: str) -> Dict[str, Any]:
         """Get statistics for a specific agent."""
+        # Statistics include the runs queued for writing
+        self.flush_runtime_data()
         try:
+            # The sessions table is only created with the first session
+            has_sessions = self._get_table(table_type="sessions") is not None
             with self._get_connection() as conn:
                 stats = {}
 
@@ -590,9 +714,9 @@ class ExtendedSqliteDb(SqliteDb):
                         COUNT(CASE WHEN status = 'failed' THEN 1 END) as failed_runs,
                         AVG(execution_time) as avg_execution_time
                     FROM agno_runtime_data
-                    WHERE agent_id = ?
+                    WHERE agent_id = :agent_id
                     """),
-                    (agent_id,)
+                    {'agent_id': agent_id}
                 )
                 runtime_stats = cursor.fetchone()
                 if runtime_stats:
@@ -605,17 +729,19 @@ class ExtendedSqliteDb(SqliteDb):
                     })
 
                 # Get session statistics
-                cursor = conn.execute(
-                    text("""
-                    SELECT COUNT(*) as total_sessions
-                    FROM agno_sessions
-                    WHERE agent_id = ?
-                    """),
-                    (agent_id,)
-                )
-                session_stats = cursor.fetchone()
-                if session_stats:
-                    stats["total_sessions"] = session_stats[0]
+                stats["total_sessions"] = 0
+                if has_sessions:
+                    cursor = conn.execute(
+                        text(f"""
+                        SELECT COUNT(*) as total_sessions
+                        FROM {self.session_table_name}
+                        WHERE agent_id = :agent_id
+                        """),
+                        {'agent_id': agent_id}
+                    )
+                    session_stats = cursor.fetchone()
+                    if session_stats:
+                        stats["total_sessions"] = session_stats[0]
 
                 return stats
 
@@ -625,6 +751,8 @@ class ExtendedSqliteDb(SqliteDb):
 
     def get_database_statistics(self) -> Dict[str, Any]:
         """Get overall database statistics."""
+        # Statistics include the runs queued for writing
+        self.flush_runtime_data()
         try:
             with self._get_connection() as conn:
                 stats = {}
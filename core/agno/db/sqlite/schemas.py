@@ -93,6 +93,30 @@ METRICS_TABLE_SCHEMA = {
     ],
 }
 
+SESSION_METRICS_TABLE_SCHEMA = {
+    "session_id": {"type": String, "primary_key": True, "nullable": False},
+    "session_type": {"type": String, "nullable": False},
+    "user_id": {"type": String, "nullable": True},
+    "date": {"type": Date, "nullable": False, "index": True},
+    "runs_count": {"type": BigInteger, "nullable": False, "default": 0},
+    "token_metrics": {"type": JSON, "nullable": False, "default": "{}"},
+    "model_counts": {"type": JSON, "nullable": False, "default": "{}"},
+}
+
+DAILY_METRICS_TABLE_SCHEMA = {
+    "date": {"type": Date, "primary_key": True, "nullable": False},
+    "agent_runs_count": {"type": BigInteger, "nullable": False, "default": 0},
+    "team_runs_count": {"type": BigInteger, "nullable": False, "default": 0},
+    "workflow_runs_count": {"type": BigInteger, "nullable": False, "default": 0},
+    "agent_sessions_count": {"type": BigInteger, "nullable": False, "default": 0},
+    "team_sessions_count": {"type": BigInteger, "nullable": False, "default": 0},
+    "workflow_sessions_count": {"type": BigInteger, "nullable": False, "default": 0},
+    "token_metrics": {"type": JSON, "nullable": False, "default": "{}"},
+    "model_counts": {"type": JSON, "nullable": False, "default": "{}"},
+    "user_counts": {"type": JSON, "nullable": False, "default": "{}"},
+    "updated_at": {"type": BigInteger, "nullable": True},
+}
+
 CULTURAL_KNOWLEDGE_TABLE_SCHEMA = {
     "id": {"type": String, "primary_key": True, "nullable": False},
     "name": {"type": String, "nullable": False, "index": True},
@@ -121,6 +145,8 @@ def get_table_schema_definition(table_type: str) -> Dict[str, Any]:
         "sessions": SESSION_TABLE_SCHEMA,
         "evals": EVAL_TABLE_SCHEMA,
         "metrics": METRICS_TABLE_SCHEMA,
+        "session_metrics": SESSION_METRICS_TABLE_SCHEMA,
+        "daily_metrics": DAILY_METRICS_TABLE_SCHEMA,
         "memories": USER_MEMORY_TABLE_SCHEMA,
         "knowledge": KNOWLEDGE_TABLE_SCHEMA,
         "culture": CULTURAL_KNOWLEDGE_TABLE_SCHEMA,
@@ -1,3 +1,4 @@
+import threading
 import time
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
@@ -11,12 +12,14 @@ from core.agno.db.schemas.knowledge import KnowledgeRow
 from core.agno.db.schemas.memory import UserMemory
 from core.agno.db.sqlite.schemas import get_table_schema_definition
 from core.agno.db.sqlite.utils import (
+    apply_session_metrics_contribution,
     apply_sorting,
     bulk_upsert_metrics,
-    calculate_date_metrics,
     deserialize_cultural_knowledge_from_db,
-    fetch_all_sessions_data,
+    empty_daily_metrics,
+    get_daily_metrics_record,
     get_dates_to_calculate_metrics_for,
+    get_session_metrics_contribution,
     is_table_available,
     is_valid_table,
     serialize_cultural_knowledge_for_db,
@@ -112,6 +115,10 @@ class SqliteDb(BaseDb):
         # Initialize database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
 
+        # Per-session and per-day metrics counters, kept up to date as sessions are written
+        self._metrics_counter_tables: Optional[Tuple[Table, Table]] = None
+        self._metrics_counter_lock = threading.Lock()
+
     # -- DB methods --
 
     def _create_table(self, table_name: str, table_type: str) -> Table:
@@ -218,6 +225,22 @@ class SqliteDb(BaseDb):
             )
             return self.metrics_table
 
+        elif table_type == "session_metrics":
+            self.session_metrics_table = self._get_or_create_table(
+                table_name=f"{self.metrics_table_name}_sessions",
+                table_type="session_metrics",
+                create_table_if_not_found=create_table_if_not_found,
+            )
+            return self.session_metrics_table
+
+        elif table_type == "daily_metrics":
+            self.daily_metrics_table = self._get_or_create_table(
+                table_name=f"{self.metrics_table_name}_daily",
+                table_type="daily_metrics",
+                create_table_if_not_found=create_table_if_not_found,
+            )
+            return self.daily_metrics_table
+
         elif table_type == "evals":
             self.eval_table = self._get_or_create_table(
                 table_name=self.eval_table_name,
@@ -300,7 +323,10 @@ class SqliteDb(BaseDb):
             if table is None:
                 return False
 
+            counter_tables = self._get_metrics_counter_tables()
             with self.Session() as sess, sess.begin():
+                if counter_tables is not None:
+                    self._remove_from_metrics_counters(sess, counter_tables, [session_id])
                 delete_stmt = table.delete().where(table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
                 if result.rowcount == 0:
@@ -329,7 +355,10 @@ class SqliteDb(BaseDb):
             if table is None:
                 return
 
+            counter_tables = self._get_metrics_counter_tables()
             with self.Session() as sess, sess.begin():
+                if counter_tables is not None:
+                    self._remove_from_metrics_counters(sess, counter_tables, session_ids)
                 delete_stmt = table.delete().where(table.c.session_id.in_(session_ids))
                 result = sess.execute(delete_stmt)
 
@@ -567,6 +596,7 @@ class SqliteDb(BaseDb):
                 return None
 
             serialized_session = serialize_session_json_fields(session.to_dict())
+            counter_tables = self._get_metrics_counter_tables(create_table_if_not_found=True)
 
             if isinstance(session, AgentSession):
                 with self.Session() as sess, sess.begin():
@@ -599,6 +629,8 @@ class SqliteDb(BaseDb):
                     stmt = stmt.returning(*table.columns)  # type: ignore
                     result = sess.execute(stmt)
                     row = result.fetchone()
+                    if row is not None and counter_tables is not None:
+                        self._update_metrics_counters(sess, counter_tables, [dict(row._mapping)])
 
                     session_raw = deserialize_session_json_fields(dict(row._mapping)) if row else None
                     if session_raw is None or not deserialize:
@@ -637,6 +669,8 @@ class SqliteDb(BaseDb):
                     stmt = stmt.returning(*table.columns)  # type: ignore
                     result = sess.execute(stmt)
                     row = result.fetchone()
+                    if row is not None and counter_tables is not None:
+                        self._update_metrics_counters(sess, counter_tables, [dict(row._mapping)])
 
                     session_raw = deserialize_session_json_fields(dict(row._mapping)) if row else None
                     if session_raw is None or not deserialize:
@@ -674,6 +708,8 @@ class SqliteDb(BaseDb):
                     stmt = stmt.returning(*table.columns)  # type: ignore
                     result = sess.execute(stmt)
                     row = result.fetchone()
+                    if row is not None and counter_tables is not None:
+                        self._update_metrics_counters(sess, counter_tables, [dict(row._mapping)])
 
                     session_raw = deserialize_session_json_fields(dict(row._mapping)) if row else None
                     if session_raw is None or not deserialize:
@@ -733,6 +769,7 @@ class SqliteDb(BaseDb):
                     workflow_sessions.append(session)
 
             results: List[Union[Session, Dict[str, Any]]] = []
+            counter_tables = self._get_metrics_counter_tables(create_table_if_not_found=True)
 
             with self.Session() as sess, sess.begin():
                 # Bulk upsert agent sessions
@@ -779,6 +816,8 @@ class SqliteDb(BaseDb):
                         agent_ids = [session.session_id for session in agent_sessions]
                         select_stmt = select(table).where(table.c.session_id.in_(agent_ids))
                         result = sess.execute(select_stmt).fetchall()
+                        if counter_tables is not None:
+                            self._update_metrics_counters(sess, counter_tables, [dict(row._mapping) for row in result])
 
                         for row in result:
                             session_dict = deserialize_session_json_fields(dict(row._mapping))
@@ -834,6 +873,8 @@ class SqliteDb(BaseDb):
                         team_ids = [session.session_id for session in team_sessions]
                         select_stmt = select(table).where(table.c.session_id.in_(team_ids))
                         result = sess.execute(select_stmt).fetchall()
+                        if counter_tables is not None:
+                            self._update_metrics_counters(sess, counter_tables, [dict(row._mapping) for row in result])
 
                         for row in result:
                             session_dict = deserialize_session_json_fields(dict(row._mapping))
@@ -889,6 +930,8 @@ class SqliteDb(BaseDb):
                         workflow_ids = [session.session_id for session in workflow_sessions]
                         select_stmt = select(table).where(table.c.session_id.in_(workflow_ids))
                         result = sess.execute(select_stmt).fetchall()
+                        if counter_tables is not None:
+                            self._update_metrics_counters(sess, counter_tables, [dict(row._mapping) for row in result])
 
                         for row in result:
                             session_dict = deserialize_session_json_fields(dict(row._mapping))
@@ -1377,47 +1420,160 @@ class SqliteDb(BaseDb):
 
     # -- Metrics methods --
 
-    def _get_all_sessions_for_metrics_calculation(
-        self, start_timestamp: Optional[int] = None, end_timestamp: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+    def _get_metrics_counter_tables(
+        self, create_table_if_not_found: Optional[bool] = False
+    ) -> Optional[Tuple[Table, Table]]:
         """
-        Get all sessions of all types (agent, team, workflow) as raw dictionaries.
+        Get the session metrics and daily metrics counter tables.
 
-         Args:
-            start_timestamp (Optional[int]): The start timestamp to filter by. Defaults to None.
-            end_timestamp (Optional[int]): The end timestamp to filter by. Defaults to None.
+        When the tables are first created they are filled from the sessions already stored, after which every
+        session write keeps them up to date.
 
-        Returns:
-            List[Dict[str, Any]]: List of session dictionaries with session_type field.
+        Args:
+            create_table_if_not_found (Optional[bool]): Whether to create the tables if they don't exist.
 
-        Raises:
-            Exception: If an error occurs during retrieval.
+        Returns:
+            Optional[Tuple[Table, Table]]: The session metrics and daily metrics tables, or None if they don't exist.
         """
-        try:
-            table = self._get_table(table_type="sessions")
-            if table is None:
-                return []
+        if self._metrics_counter_tables is not None:
+            return self._metrics_counter_tables
+
+        with self._metrics_counter_lock:
+            if self._metrics_counter_tables is None:
+                with self.Session() as sess, sess.begin():
+                    tables_exist = is_table_available(session=sess, table_name=f"{self.metrics_table_name}_daily")
+                if not tables_exist and not create_table_if_not_found:
+                    return None
+
+                session_metrics_table = self._get_table(table_type="session_metrics", create_table_if_not_found=True)
+                daily_metrics_table = self._get_table(table_type="daily_metrics", create_table_if_not_found=True)
+                counter_tables = (session_metrics_table, daily_metrics_table)
+                if not tables_exist:
+                    try:
+                        self._rebuild_metrics_counters(counter_tables)  # type: ignore
+                    except Exception:
+                        # Drop the daily table so the next attempt rebuilds the counters from scratch
+                        daily_metrics_table.drop(self.db_engine)  # type: ignore
+                        raise
+                self._metrics_counter_tables = counter_tables  # type: ignore
+
+        return self._metrics_counter_tables
+
+    def _rebuild_metrics_counters(self, counter_tables: Tuple[Table, Table]) -> None:
+        """Recompute the metrics counters from every stored session, in a single pass over the sessions table."""
+        session_metrics_table, daily_metrics_table = counter_tables
+        sessions_table = self._get_table(table_type="sessions")
+
+        with self.Session() as sess, sess.begin():
+            sess.execute(session_metrics_table.delete())
+            sess.execute(daily_metrics_table.delete())
+            if sessions_table is None:
+                return
 
             stmt = select(
-                table.c.user_id,
-                table.c.session_data,
-                table.c.runs,
-                table.c.created_at,
-                table.c.session_type,
+                sessions_table.c.session_id,
+                sessions_table.c.session_type,
+                sessions_table.c.user_id,
+                sessions_table.c.session_data,
+                sessions_table.c.runs,
+                sessions_table.c.created_at,
             )
+            daily_metrics: Dict[date, Dict[str, Any]] = {}
+            sessions_count = 0
+            for rows in sess.execute(stmt).partitions(1000):
+                contributions = [get_session_metrics_contribution(dict(row._mapping)) for row in rows]
+                for contribution in contributions:
+                    day = daily_metrics.setdefault(contribution["date"], empty_daily_metrics(contribution["date"]))
+                    apply_session_metrics_contribution(day, contribution, 1)
+                self._save_session_metrics(sess, session_metrics_table, contributions)
+                sessions_count += len(contributions)
+            self._save_daily_metrics(sess, daily_metrics_table, list(daily_metrics.values()))
+
+        log_info(f"Built metrics counters for {sessions_count} sessions over {len(daily_metrics)} days")
+
+    def _update_metrics_counters(
+        self, sess: Any, counter_tables: Tuple[Table, Table], session_rows: List[Dict[str, Any]]
+    ) -> None:
+        """Move the metrics counters from the previously stored version of each session to the given one."""
+        if not session_rows:
+            return
 
-            if start_timestamp is not None:
-                stmt = stmt.where(table.c.created_at >= start_timestamp)
-            if end_timestamp is not None:
-                stmt = stmt.where(table.c.created_at <= end_timestamp)
+        session_metrics_table, daily_metrics_table = counter_tables
+        contributions = {row["session_id"]: get_session_metrics_contribution(row) for row in session_rows}
+        previous = {
+            row.session_id: dict(row._mapping)
+            for row in sess.execute(
+                select(session_metrics_table).where(session_metrics_table.c.session_id.in_(list(contributions)))
+            ).fetchall()
+        }
+        changed = [
+            contribution
+            for session_id, contribution in contributions.items()
+            if previous.get(session_id) != contribution
+        ]
+        if not changed:
+            return
 
-            with self.Session() as sess:
-                result = sess.execute(stmt).fetchall()
-                return [record._mapping for record in result]
+        dates = {contribution["date"] for contribution in changed}
+        dates.update(previous[c["session_id"]]["date"] for c in changed if c["session_id"] in previous)
+        daily_metrics = self._load_daily_metrics(sess, daily_metrics_table, dates)
+        for contribution in changed:
+            previous_contribution = previous.get(contribution["session_id"])
+            if previous_contribution is not None:
+                previous_day = daily_metrics[previous_contribution["date"]]
+                apply_session_metrics_contribution(previous_day, previous_contribution, -1)
+            apply_session_metrics_contribution(daily_metrics[contribution["date"]], contribution, 1)
+
+        self._save_session_metrics(sess, session_metrics_table, changed)
+        self._save_daily_metrics(sess, daily_metrics_table, list(daily_metrics.values()))
+
+    def _remove_from_metrics_counters(
+        self, sess: Any, counter_tables: Tuple[Table, Table], session_ids: List[str]
+    ) -> None:
+        """Take the given sessions out of the metrics counters."""
+        session_metrics_table, daily_metrics_table = counter_tables
+        previous = [
+            dict(row._mapping)
+            for row in sess.execute(
+                select(session_metrics_table).where(session_metrics_table.c.session_id.in_(session_ids))
+            ).fetchall()
+        ]
+        if not previous:
+            return
 
-        except Exception as e:
-            log_error(f"Error reading from sessions table: {e}")
-            raise e
+        daily_metrics = self._load_daily_metrics(sess, daily_metrics_table, {c["date"] for c in previous})
+        for contribution in previous:
+            apply_session_metrics_contribution(daily_metrics[contribution["date"]], contribution, -1)
+
+        sess.execute(session_metrics_table.delete().where(session_metrics_table.c.session_id.in_(session_ids)))
+        self._save_daily_metrics(sess, daily_metrics_table, list(daily_metrics.values()))
+
+    def _load_daily_metrics(self, sess: Any, table: Table, dates: set) -> Dict[date, Dict[str, Any]]:
+        daily_metrics = {day: empty_daily_metrics(day) for day in dates}
+        for row in sess.execute(select(table).where(table.c.date.in_(list(dates)))).fetchall():
+            daily_metrics[row.date] = dict(row._mapping)
+        return daily_metrics
+
+    def _save_session_metrics(self, sess: Any, table: Table, contributions: List[Dict[str, Any]]) -> None:
+        if not contributions:
+            return
+        stmt = sqlite.insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["session_id"],
+            set_={col.name: stmt.excluded[col.name] for col in table.columns if col.name != "session_id"},
+        )
+        sess.execute(stmt, contributions)
+
+    def _save_daily_metrics(self, sess: Any, table: Table, daily_metrics: List[Dict[str, Any]]) -> None:
+        if not daily_metrics:
+            return
+        current_time = int(time.time())
+        stmt = sqlite.insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["date"],
+            set_={col.name: stmt.excluded[col.name] for col in table.columns if col.name != "date"},
+        )
+        sess.execute(stmt, [{**day, "updated_at": current_time} for day in daily_metrics])
 
     def _get_metrics_calculation_starting_date(self, table: Table) -> Optional[date]:
         """Get the first date for which metrics calculation is needed:
@@ -1477,40 +1633,28 @@ class SqliteDb(BaseDb):
                 log_info("Metrics already calculated for all relevant dates.")
                 return None
 
-            start_timestamp = int(
-                datetime.combine(dates_to_process[0], datetime.min.time()).replace(tzinfo=timezone.utc).timestamp()
-            )
-            end_timestamp = int(
-                datetime.combine(dates_to_process[-1] + timedelta(days=1), datetime.min.time())
-                .replace(tzinfo=timezone.utc)
-                .timestamp()
-            )
-
-            sessions = self._get_all_sessions_for_metrics_calculation(
-                start_timestamp=start_timestamp, end_timestamp=end_timestamp
-            )
-            all_sessions_data = fetch_all_sessions_data(
-                sessions=sessions,
-                dates_to_process=dates_to_process,
-                start_timestamp=start_timestamp,
-            )
-            if not all_sessions_data:
-                log_info("No new session data found. Won't calculate metrics.")
+            counter_tables = self._get_metrics_counter_tables(create_table_if_not_found=True)
+            if counter_tables is None:
                 return None
+            daily_metrics_table = counter_tables[1]
 
-            results = []
-            metrics_records = []
-
-            for date_to_process in dates_to_process:
-                date_key = date_to_process.isoformat()
-                sessions_for_date = all_sessions_data.get(date_key, {})
+            # The daily counters are maintained on every session write, so this reads one row per day
+            with self.Session() as sess:
+                stmt = (
+                    select(daily_metrics_table)
+                    .where(daily_metrics_table.c.date >= dates_to_process[0])
+                    .where(daily_metrics_table.c.date <= dates_to_process[-1])
+                    .order_by(daily_metrics_table.c.date)
+                )
+                daily_metrics = [dict(row._mapping) for row in sess.execute(stmt).fetchall()]
 
+            results = []
+            metrics_records = [
+                get_daily_metrics_record(day)
                 # Skip dates with no sessions
-                if not any(len(sessions) > 0 for sessions in sessions_for_date.values()):
-                    continue
-
-                metrics_record = calculate_date_metrics(date_to_process, sessions_for_date)
-                metrics_records.append(metrics_record)
+                for day in daily_metrics
+                if day["agent_sessions_count"] or day["team_sessions_count"] or day["workflow_sessions_count"]
+            ]
 
             if metrics_records:
                 with self.Session() as sess, sess.begin():
@@ -0,0 +1,157 @@
+"""Background writer for runtime traces.
+
+Runs report their `RuntimeData` and status changes as they happen. Writing each of them on the caller's thread,
+in its own transaction, adds the latency of an SQLite commit to every run and contends with the session writes
+of the app. `RuntimeTraceWriter` queues the records instead and writes them from a single background thread,
+in one transaction per batch.
+
+Records are encoded into their table rows on the caller's thread before they are queued. The queue holds a
+snapshot of each record, and the writer never serializes objects a run is still mutating.
+"""
+
+import atexit
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from core.agno.db.sqlite.runtime_data import RuntimeData
+from core.agno.utils.log import log_debug, log_error
+
+if TYPE_CHECKING:
+    from core.agno.db.sqlite.extended_sqlite import ExtendedSqliteDb
+
+# A status change: (run_id, status, error_message, updated_at)
+StatusUpdate = Tuple[str, str, Optional[str], int]
+# A runtime record encoded into the columns of its table row
+RuntimeRow = Dict[str, Any]
+
+_STOP = object()
+# Makes the writer write its partial batch right away instead of waiting for the flush interval
+_FLUSH = object()
+
+
+class RuntimeTraceWriter:
+    """Queue runtime traces and write them to the database in batched transactions.
+
+    Args:
+        db: The database the traces are written to.
+        max_queue_size: Maximum number of queued records. When the queue is full, producers block until the
+            writer catches up, so a stalled database slows runs down instead of growing memory without bound.
+        batch_size: Maximum number of records written per transaction.
+        flush_interval: Seconds the writer waits for more records before writing a partial batch.
+    """
+
+    def __init__(
+        self,
+        db: "ExtendedSqliteDb",
+        max_queue_size: int = 10000,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+    ):
+        self.db = db
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, max_queue_size))
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="agno-trace-writer", daemon=True)
+        self._thread.start()
+        # Write what is still queued when the interpreter exits
+        atexit.register(self.close)
+
+    def put(self, data: RuntimeData) -> None:
+        """Queue a runtime record, replacing any earlier record of the same run."""
+        current_time = int(time.time())
+        if data.created_at is None:
+            data.created_at = current_time
+        data.updated_at = current_time
+        self._put(self.db._runtime_row(data))
+
+    def put_status(self, run_id: str, status: str, error_message: Optional[str] = None) -> None:
+        """Queue a status change of a run."""
+        self._put((run_id, status, error_message, int(time.time())))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every record queued so far is written. Returns False if `timeout` expired first."""
+        if not self._thread.is_alive():
+            return self._queue.unfinished_tasks == 0
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._closed:
+            try:
+                self._queue.put(_FLUSH, timeout=timeout)
+            except queue.Full:
+                return False
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Write the queued records and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _put(self, item) -> None:
+        if self._closed:
+            raise RuntimeError("RuntimeTraceWriter is closed")
+        self._queue.put(item)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            batch = [item]
+            # Collect what else arrives within the flush interval, up to a full batch
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and item is not _STOP and item is not _FLUSH:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                batch.append(item)
+
+            stopping = batch[-1] is _STOP
+            records = [item for item in batch if item is not _STOP and item is not _FLUSH]
+            try:
+                if records:
+                    self._write(records)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, items: List) -> None:
+        """Write a batch, coalescing the records and status changes of the same run."""
+        records: Dict[str, RuntimeRow] = {}
+        status_updates: Dict[str, StatusUpdate] = {}
+        for item in items:
+            if isinstance(item, dict):
+                records[item["run_id"]] = item
+                status_updates.pop(item["run_id"], None)
+                continue
+            run_id, status, error_message, updated_at = item
+            record = records.get(run_id)
+            if record is not None:
+                # The run's record is written in this batch anyway, apply the change to it
+                record["status"] = status
+                record["updated_at"] = updated_at
+                if error_message is not None:
+                    record["error_message"] = error_message
+                continue
+            previous = status_updates.get(run_id)
+            if error_message is None and previous is not None:
+                error_message = previous[2]
+            status_updates[run_id] = (run_id, status, error_message, updated_at)
+
+        try:
+            self.db._write_runtime_batch(list(records.values()), list(status_updates.values()))
+            log_debug(f"Wrote {len(records)} runtime records and {len(status_updates)} status updates")
+        except Exception as e:
+            # The batch is lost, but the writer keeps serving later runs
+            log_error(f"Error writing a batch of {len(items)} runtime trace records: {e}")
@@ -134,144 +134,135 @@ def bulk_upsert_metrics(session: Session, table: Table, metrics_records: List[di
     return results  # type: ignore
 
 
-def calculate_date_metrics(date_to_process: date, sessions_data: dict) -> dict:
-    """Calculate metrics for the given single date.
+def get_dates_to_calculate_metrics_for(starting_date: date) -> List[date]:
+    """Return the list of dates to calculate metrics for.
 
     Args:
-        date_to_process (date): The date to calculate metrics for.
-        sessions_data (dict): The sessions data to calculate metrics for.
+        starting_date (date): The starting date to calculate metrics for.
 
     Returns:
-        dict: The calculated metrics.
+        List[date]: The list of dates to calculate metrics for.
     """
-    metrics = {
-        "users_count": 0,
-        "agent_sessions_count": 0,
-        "team_sessions_count": 0,
-        "workflow_sessions_count": 0,
-        "agent_runs_count": 0,
-        "team_runs_count": 0,
-        "workflow_runs_count": 0,
-    }
-    token_metrics = {
-        "input_tokens": 0,
-        "output_tokens": 0,
-        "total_tokens": 0,
-        "audio_total_tokens": 0,
-        "audio_input_tokens": 0,
-        "audio_output_tokens": 0,
-        "cache_read_tokens": 0,
-        "cache_write_tokens": 0,
-        "reasoning_tokens": 0,
-    }
+    today = datetime.now(timezone.utc).date()
+    days_diff = (today - starting_date).days + 1
+    if days_diff <= 0:
+        return []
+    return [starting_date + timedelta(days=x) for x in range(days_diff)]
+
+
+TOKEN_METRIC_FIELDS = [
+    "input_tokens",
+    "output_tokens",
+    "total_tokens",
+    "audio_total_tokens",
+    "audio_input_tokens",
+    "audio_output_tokens",
+    "cache_read_tokens",
+    "cache_write_tokens",
+    "reasoning_tokens",
+]
+
+
+def get_session_metrics_contribution(session: Dict[str, Any]) -> Dict[str, Any]:
+    """Return what a single session adds to the daily metrics of the day it was created on.
+
+    Args:
+        session (Dict[str, Any]): The session row, with `runs` and `session_data` as JSON strings or parsed.
+
+    Returns:
+        Dict[str, Any]: A row for the session metrics table.
+    """
+    runs = session.get("runs") or []
+    runs = json.loads(runs) if isinstance(runs, str) else runs
     model_counts: Dict[str, int] = {}
+    for run in runs:
+        if model_id := run.get("model"):
+            model_key = f"{model_id}:{run.get('model_provider', '')}"
+            model_counts[model_key] = model_counts.get(model_key, 0) + 1
 
-    session_types = [
-        ("agent", "agent_sessions_count", "agent_runs_count"),
-        ("team", "team_sessions_count", "team_runs_count"),
-        ("workflow", "workflow_sessions_count", "workflow_runs_count"),
-    ]
-    all_user_ids = set()
-
-    for session_type, sessions_count_key, runs_count_key in session_types:
-        sessions = sessions_data.get(session_type, [])
-        metrics[sessions_count_key] = len(sessions)
-
-        for session in sessions:
-            if session.get("user_id"):
-                all_user_ids.add(session["user_id"])
-
-            # Parse runs from JSON string
-            if runs := session.get("runs", []):
-                runs = json.loads(runs) if isinstance(runs, str) else runs
-                metrics[runs_count_key] += len(runs)
-                for run in runs:
-                    if model_id := run.get("model"):
-                        model_provider = run.get("model_provider", "")
-                        model_counts[f"{model_id}:{model_provider}"] = (
-                            model_counts.get(f"{model_id}:{model_provider}", 0) + 1
-                        )
-
-            # Parse session_data from JSON string
-            session_data = session.get("session_data", {})
-            if isinstance(session_data, str):
-                session_data = json.loads(session_data)
-            session_metrics = session_data.get("session_metrics", {})
-            for field in token_metrics:
-                token_metrics[field] += session_metrics.get(field, 0)
+    session_data = session.get("session_data") or {}
+    if isinstance(session_data, str):
+        session_data = json.loads(session_data)
+    session_metrics = session_data.get("session_metrics") or {}
 
-    model_metrics = []
-    for model, count in model_counts.items():
-        model_id, model_provider = model.split(":")
-        model_metrics.append({"model_id": model_id, "model_provider": model_provider, "count": count})
+    created_at = session.get("created_at") or int(time.time())
+    return {
+        "session_id": session["session_id"],
+        "session_type": session["session_type"],
+        "user_id": session.get("user_id") or None,
+        "date": datetime.fromtimestamp(created_at, tz=timezone.utc).date(),
+        "runs_count": len(runs),
+        "token_metrics": {field: session_metrics.get(field) or 0 for field in TOKEN_METRIC_FIELDS},
+        "model_counts": model_counts,
+    }
 
-    metrics["users_count"] = len(all_user_ids)
-    current_time = int(time.time())
 
+def empty_daily_metrics(date_to_process: date) -> Dict[str, Any]:
+    """Return a daily metrics counters row with nothing counted yet."""
     return {
-        "id": str(uuid4()),
         "date": date_to_process,
-        "completed": date_to_process < datetime.now(timezone.utc).date(),
-        "token_metrics": token_metrics,
-        "model_metrics": model_metrics,
-        "created_at": current_time,
-        "updated_at": current_time,
-        "aggregation_period": "daily",
-        **metrics,
+        "agent_runs_count": 0,
+        "team_runs_count": 0,
+        "workflow_runs_count": 0,
+        "agent_sessions_count": 0,
+        "team_sessions_count": 0,
+        "workflow_sessions_count": 0,
+        "token_metrics": {field: 0 for field in TOKEN_METRIC_FIELDS},
+        "model_counts": {},
+        "user_counts": {},
     }
 
 
-def fetch_all_sessions_data(
-    sessions: List[Dict[str, Any]], dates_to_process: List[date], start_timestamp: int
-) -> Optional[dict]:
-    """Return all session data for the given dates, for all session types.
-
-    Args:
-        dates_to_process (List[date]): The dates to fetch session data for.
+def _add_count(counts: Dict[str, int], key: str, delta: int) -> None:
+    count = counts.get(key, 0) + delta
+    if count:
+        counts[key] = count
+    else:
+        counts.pop(key, None)
 
-    Returns:
-        dict: A dictionary with dates as keys and session data as values, for all session types.
-
-    Example:
-    {
-        "2000-01-01": {
-            "agent": [<session1>, <session2>, ...],
-            "team": [...],
-            "workflow": [...],
-        }
-    }
-    """
-    if not dates_to_process:
-        return None
 
-    all_sessions_data: Dict[str, Dict[str, List[Dict[str, Any]]]] = {
-        date_to_process.isoformat(): {"agent": [], "team": [], "workflow": []} for date_to_process in dates_to_process
-    }
+def apply_session_metrics_contribution(daily_metrics: Dict[str, Any], contribution: Dict[str, Any], sign: int) -> None:
+    """Add (sign=1) or remove (sign=-1) a session's contribution to a daily metrics counters row, in place."""
+    session_type = contribution["session_type"]
+    daily_metrics[f"{session_type}_sessions_count"] += sign
+    daily_metrics[f"{session_type}_runs_count"] += sign * contribution["runs_count"]
 
-    for session in sessions:
-        session_date = (
-            datetime.fromtimestamp(session.get("created_at", start_timestamp), tz=timezone.utc).date().isoformat()
-        )
-        if session_date in all_sessions_data:
-            all_sessions_data[session_date][session["session_type"]].append(session)
+    token_metrics = daily_metrics["token_metrics"]
+    for field, value in contribution["token_metrics"].items():
+        token_metrics[field] = token_metrics.get(field, 0) + sign * value
 
-    return all_sessions_data
+    for model_key, count in contribution["model_counts"].items():
+        _add_count(daily_metrics["model_counts"], model_key, sign * count)
 
+    if contribution.get("user_id"):
+        _add_count(daily_metrics["user_counts"], contribution["user_id"], sign)
 
-def get_dates_to_calculate_metrics_for(starting_date: date) -> List[date]:
-    """Return the list of dates to calculate metrics for.
 
-    Args:
-        starting_date (date): The starting date to calculate metrics for.
+def get_daily_metrics_record(daily_metrics: Dict[str, Any]) -> dict:
+    """Build a metrics table record from a daily counters row."""
+    model_metrics = []
+    for model, count in daily_metrics["model_counts"].items():
+        model_id, model_provider = model.rsplit(":", 1)
+        model_metrics.append({"model_id": model_id, "model_provider": model_provider, "count": count})
 
-    Returns:
-        List[date]: The list of dates to calculate metrics for.
-    """
-    today = datetime.now(timezone.utc).date()
-    days_diff = (today - starting_date).days + 1
-    if days_diff <= 0:
-        return []
-    return [starting_date + timedelta(days=x) for x in range(days_diff)]
+    current_time = int(time.time())
+    return {
+        "id": str(uuid4()),
+        "date": daily_metrics["date"],
+        "completed": daily_metrics["date"] < datetime.now(timezone.utc).date(),
+        "token_metrics": daily_metrics["token_metrics"],
+        "model_metrics": model_metrics,
+        "created_at": current_time,
+        "updated_at": current_time,
+        "aggregation_period": "daily",
+        "users_count": len(daily_metrics["user_counts"]),
+        "agent_sessions_count": daily_metrics["agent_sessions_count"],
+        "team_sessions_count": daily_metrics["team_sessions_count"],
+        "workflow_sessions_count": daily_metrics["workflow_sessions_count"],
+        "agent_runs_count": daily_metrics["agent_runs_count"],
+        "team_runs_count": daily_metrics["team_runs_count"],
+        "workflow_runs_count": daily_metrics["workflow_runs_count"],
+    }
 
 
 # -- Cultural Knowledge util methods --
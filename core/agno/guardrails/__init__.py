@@ -1,6 +1,14 @@
 from core.agno.guardrails.base import BaseGuardrail
-from core.agno.guardrails.openai import OpenAIModerationGuardrail
-from core.agno.guardrails.pii import PIIDetectionGuardrail
-from core.agno.guardrails.prompt_injection import PromptInjectionGuardrail
+from core.agno.utils.lazy_import import lazy_attributes
 
 __all__ = ["BaseGuardrail", "OpenAIModerationGuardrail", "PIIDetectionGuardrail", "PromptInjectionGuardrail"]
+
+# Concrete guardrails are imported on first access
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "OpenAIModerationGuardrail": "core.agno.guardrails.openai",
+        "PIIDetectionGuardrail": "core.agno.guardrails.pii",
+        "PromptInjectionGuardrail": "core.agno.guardrails.prompt_injection",
+    },
+)
@@ -1,5 +1,8 @@
-from core.agno.knowledge.knowledge import Knowledge
+from core.agno.utils.lazy_import import lazy_attributes
 
 __all__ = [
     "Knowledge",
 ]
+
+# Knowledge pulls in content fetching, readers and remote storage; load it when it is first used
+__getattr__, __dir__ = lazy_attributes(__name__, {"Knowledge": "core.agno.knowledge.knowledge"})
@@ -1,22 +1,45 @@
-from typing import List
+from typing import List, Optional, Union
 
 from core.agno.knowledge.chunking.strategy import ChunkingStrategy
+from core.agno.knowledge.chunking.tokens import (
+    ChunkTokenizer,
+    Span,
+    TokenSpanChunker,
+    documents_from_spans,
+    get_chunk_tokenizer,
+)
 from core.agno.knowledge.document.base import Document
 
 
 class FixedSizeChunking(ChunkingStrategy):
     """Chunking strategy that splits text into fixed-size chunks with optional overlap"""
 
-    def __init__(self, chunk_size: int = 5000, overlap: int = 0):
+    def __init__(
+        self, chunk_size: int = 5000, overlap: int = 0, tokenizer: Optional[Union[str, ChunkTokenizer]] = None
+    ):
         # overlap must be less than chunk size
         if overlap >= chunk_size:
             raise ValueError(f"Invalid parameters: overlap ({overlap}) must be less than chunk size ({chunk_size}).")
 
         self.chunk_size = chunk_size
         self.overlap = overlap
+        # If set, chunk_size and overlap count tokens of this tokenizer instead of characters
+        self.tokenizer = get_chunk_tokenizer(tokenizer) if tokenizer is not None else None
+
+    def chunk_spans(self, document: Document) -> List[Span]:
+        """Return the (start, end) offsets of the token-measured chunks over `document.content`"""
+        if self.tokenizer is None:
+            raise ValueError("chunk_spans requires a tokenizer")
+        chunker = TokenSpanChunker(
+            self.tokenizer, self.chunk_size, self.overlap, separators=(" ", "\n", "\r", "\t")
+        )
+        return chunker.spans(document.content)
 
     def chunk(self, document: Document) -> List[Document]:
         """Split document into fixed-size chunks with optional overlap"""
+        if self.tokenizer is not None:
+            return documents_from_spans(document, document.content, self.chunk_spans(document))
+
         content = self.clean_text(document.content)
         content_length = len(content)
         chunked_documents: List[Document] = []
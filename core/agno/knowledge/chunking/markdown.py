@@ -1,6 +1,6 @@
 import os
 import tempfile
-from typing import List
+from typing import List, Optional, Union
 
 try:
     from unstructured.chunking.title import chunk_by_title  # type: ignore
@@ -9,15 +9,45 @@ except ImportError:
     raise ImportError("`unstructured` not installed. Please install it using `pip install unstructured markdown`")
 
 from core.agno.knowledge.chunking.strategy import ChunkingStrategy
+from core.agno.knowledge.chunking.tokens import ChunkTokenizer, TokenSpanChunker, get_chunk_tokenizer
 from core.agno.knowledge.document.base import Document
 
 
 class MarkdownChunking(ChunkingStrategy):
     """A chunking strategy that splits markdown based on structure like headers, paragraphs and sections"""
 
-    def __init__(self, chunk_size: int = 5000, overlap: int = 0):
+    def __init__(
+        self, chunk_size: int = 5000, overlap: int = 0, tokenizer: Optional[Union[str, ChunkTokenizer]] = None
+    ):
         self.chunk_size = chunk_size
         self.overlap = overlap
+        # If set, chunk_size and overlap count tokens of this tokenizer instead of characters
+        self.tokenizer = get_chunk_tokenizer(tokenizer) if tokenizer is not None else None
+
+    def _size(self, text: str) -> int:
+        return self.tokenizer.count(text) if self.tokenizer is not None else len(text)
+
+    def _tail(self, text: str) -> str:
+        """The last `overlap` characters, or tokens, of `text`"""
+        if self.tokenizer is None:
+            return text[-self.overlap :]
+        starts, _ = self.tokenizer.offsets(text)
+        if not starts:
+            return ""
+        return text[starts[max(0, len(starts) - self.overlap)] :]
+
+    def _split_oversized(self, sections: List[str]) -> List[str]:
+        """Split sections longer than chunk_size tokens, which would otherwise be truncated by the embedder"""
+        if self.tokenizer is None:
+            return sections
+        chunker = TokenSpanChunker(self.tokenizer, self.chunk_size, separators=("\n", "."), ordered=True)
+        split_sections: List[str] = []
+        for section in sections:
+            if self.tokenizer.count(section) <= self.chunk_size:
+                split_sections.append(section)
+            else:
+                split_sections.extend(section[start:end] for start, end in chunker.spans(section))
+        return split_sections
 
     def _partition_markdown_content(self, content: str) -> List[str]:
         """
@@ -69,11 +99,11 @@ class MarkdownChunking(ChunkingStrategy):
 
     def chunk(self, document: Document) -> List[Document]:
         """Split markdown document into chunks based on markdown structure"""
-        if not document.content or len(document.content) <= self.chunk_size:
+        if not document.content or self._size(document.content) <= self.chunk_size:
             return [document]
 
         # Split using markdown chunking logic, or fallback to paragraphs
-        sections = self._partition_markdown_content(document.content)
+        sections = self._split_oversized(self._partition_markdown_content(document.content))
 
         chunks: List[Document] = []
         current_chunk = []
@@ -83,7 +113,7 @@ class MarkdownChunking(ChunkingStrategy):
 
         for section in sections:
             section = section.strip()
-            section_size = len(section)
+            section_size = self._size(section)
 
             if current_size + section_size <= self.chunk_size:
                 current_chunk.append(section)
@@ -128,7 +158,7 @@ class MarkdownChunking(ChunkingStrategy):
             for i in range(len(chunks)):
                 if i > 0:
                     # Add overlap from previous chunk
-                    prev_text = chunks[i - 1].content[-self.overlap :]
+                    prev_text = self._tail(chunks[i - 1].content)
                     meta_data = chunk_meta_data.copy()
                     meta_data["chunk"] = chunks[i].meta_data["chunk"]
                     chunk_id = chunks[i].id
@@ -9,7 +9,15 @@ class RowChunking(ChunkingStrategy):
         self.skip_header = skip_header
         self.clean_rows = clean_rows
 
-    def chunk(self, document: Document) -> List[Document]:
+    def chunk(self, document: Document, row_offset: int = 0) -> List[Document]:
+        """Split a document into one chunk per row.
+
+        Args:
+            document: The document to split.
+            row_offset: Number of lines of the source file before this document, when the document is one
+                batch of a file read in batches. Rows are numbered from the start of the file, and the header is
+                only skipped in the batch that starts the file.
+        """
         if not document or not document.content:
             return []
 
@@ -18,11 +26,11 @@ class RowChunking(ChunkingStrategy):
 
         rows = document.content.splitlines()
 
-        if self.skip_header and rows:
+        if self.skip_header and rows and row_offset == 0:
             rows = rows[1:]
             start_index = 2
         else:
-            start_index = 1
+            start_index = row_offset + 1
 
         chunks = []
         for i, row in enumerate(rows):
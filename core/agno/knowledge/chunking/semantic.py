@@ -7,6 +7,30 @@ from core.agno.knowledge.embedder.base import Embedder
 from core.agno.knowledge.embedder.openai import OpenAIEmbedder
 
 
+def _chonkie_embeddings(embedder: Embedder) -> Any:
+    """Wrap an embedder as a chonkie `BaseEmbeddings`, so chonkie embeds sentences through the batch API."""
+    import numpy as np
+    from chonkie.embeddings import BaseEmbeddings
+
+    class _EmbedderEmbeddings(BaseEmbeddings):
+        def embed(self, text: str) -> "np.ndarray":
+            return np.asarray(embedder.get_embedding(text), dtype=np.float32)
+
+        def embed_batch(self, texts: List[str]) -> List["np.ndarray"]:
+            embeddings, _ = embedder.get_embeddings_batch_and_usage(texts)  # type: ignore[attr-defined]
+            return [np.asarray(embedding, dtype=np.float32) for embedding in embeddings]
+
+        @property
+        def dimension(self) -> int:
+            return embedder.dimensions or 0
+
+        def get_tokenizer(self) -> Any:
+            # chunk_size counts characters, like the other chunking strategies
+            return "character"
+
+    return _EmbedderEmbeddings()
+
+
 class SemanticChunking(ChunkingStrategy):
     """Chunking strategy that splits text into semantic chunks using chonkie"""
 
@@ -46,6 +70,9 @@ class SemanticChunking(ChunkingStrategy):
                 elif "embedder" in param_names:
                     # Some versions may accept an embedder object directly
                     params["embedder"] = self.embedder
+                elif "embedding_model" in param_names and self.embedder.supports_batch:
+                    # Embed all sentences of a document with a few batch calls instead of one call per sentence
+                    params["embedding_model"] = _chonkie_embeddings(self.embedder)
                 else:
                     # Fallback to model id
                     params["embedding_model"] = getattr(self.embedder, "id", None) or "text-embedding-3-small"
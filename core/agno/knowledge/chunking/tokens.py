@@ -0,0 +1,271 @@
+"""Token-aware chunking on offsets.
+
+A `ChunkTokenizer` turns a text into the character spans of its tokens, kept in two compact arrays of start
+and end offsets. `TokenSpanChunker` then cuts the token sequence into windows of `chunk_size` tokens with an
+overlap of `overlap` tokens and returns the (start, end) character span of each window over the original
+text. Nothing is copied until `documents_from_spans` materializes the chunks that are actually needed.
+"""
+
+import re
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+from core.agno.knowledge.document.base import Document
+
+Span = Tuple[int, int]
+
+# A word, or a single character of any other kind (CJK ideographs, kana, punctuation). Counting each CJK
+# character as a token is close to what BPE/WordPiece tokenizers of embedding models do for Chinese text.
+WORD_PATTERN = r"[^\W\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]+|\S"
+CJK_RANGES = ((0x3040, 0x30FF), (0x3400, 0x4DBF), (0x4E00, 0x9FFF), (0xAC00, 0xD7AF), (0xF900, 0xFAFF))
+
+
+@lru_cache(maxsize=1)
+def _word_tables() -> Tuple[Any, Any]:
+    """Per code point lookup tables of the `WORD_PATTERN` classes: (word character, whitespace)."""
+    import numpy as np
+
+    size = sys.maxunicode + 1
+    # Same definitions as `\w` and `\s` of the re module
+    word = np.fromiter((chr(cp).isalnum() for cp in range(size)), dtype=bool, count=size)
+    word[ord("_")] = True
+    for first, last in CJK_RANGES:
+        word[first : last + 1] = False
+    space = np.fromiter((chr(cp).isspace() for cp in range(size)), dtype=bool, count=size)
+    return word, space
+
+
+def _word_offsets(text: str) -> Tuple[array, array]:
+    """`WORD_PATTERN` token offsets computed with array operations over the code points of `text`."""
+    import numpy as np
+
+    word_table, space_table = _word_tables()
+    # surrogatepass keeps lone surrogates (e.g. from broken PDF text extraction) as single code points
+    code_points = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    word = word_table[code_points]
+    single = ~word & ~space_table[code_points]
+    previous_word = np.concatenate(([False], word[:-1]))
+    next_word = np.concatenate((word[1:], [False]))
+
+    starts = array("q")
+    starts.frombytes(np.flatnonzero(single | (word & ~previous_word)).astype(np.int64).tobytes())
+    ends = array("q")
+    ends.frombytes((np.flatnonzero(single | (word & ~next_word)) + 1).astype(np.int64).tobytes())
+    return starts, ends
+
+
+class ChunkTokenizer(ABC):
+    """Tokenizer used to measure chunks, reporting where each token is in the text."""
+
+    @abstractmethod
+    def offsets(self, text: str) -> Tuple[array, array]:
+        """Return the start and end character offsets of every token of `text`, in order."""
+        raise NotImplementedError
+
+    def count(self, text: str) -> int:
+        """Return the number of tokens in `text`."""
+        return len(self.offsets(text)[0])
+
+
+class CharacterTokenizer(ChunkTokenizer):
+    """Every character is a token, which is how the chunkers measure `chunk_size` by default."""
+
+    def offsets(self, text: str) -> Tuple[array, array]:
+        return array("q", range(len(text))), array("q", range(1, len(text) + 1))
+
+    def count(self, text: str) -> int:
+        return len(text)
+
+
+class RegexTokenizer(ChunkTokenizer):
+    """Tokens are the matches of a regular expression, words and single CJK characters by default.
+
+    Needs no model, and stays within a few percent of subword tokenizers on mixed CJK and Latin text. The
+    default pattern is evaluated with numpy array operations when numpy is installed, an order of magnitude
+    faster than iterating over the regex matches.
+    """
+
+    def __init__(self, pattern: str = WORD_PATTERN):
+        self.pattern = re.compile(pattern)
+
+    def offsets(self, text: str) -> Tuple[array, array]:
+        if self.pattern.pattern == WORD_PATTERN and text:
+            try:
+                return _word_offsets(text)
+            except ImportError:
+                pass
+
+        starts = array("q")
+        ends = array("q")
+        for match in self.pattern.finditer(text):
+            starts.append(match.start())
+            ends.append(match.end())
+        return starts, ends
+
+    def count(self, text: str) -> int:
+        if self.pattern.pattern == WORD_PATTERN:
+            return len(self.offsets(text)[0])
+        return len(self.pattern.findall(text))
+
+
+class HuggingFaceTokenizer(ChunkTokenizer):
+    """Tokens of a Hugging Face fast tokenizer, e.g. the one of the embedding model."""
+
+    def __init__(self, tokenizer: Union[str, Any]):
+        if isinstance(tokenizer, str):
+            try:
+                from tokenizers import Tokenizer
+            except ImportError:
+                raise ImportError("`tokenizers` not installed. Please install it with `pip install tokenizers`")
+            tokenizer = Tokenizer.from_pretrained(tokenizer)
+        self.tokenizer = tokenizer
+
+    def offsets(self, text: str) -> Tuple[array, array]:
+        if hasattr(self.tokenizer, "encode_plus"):
+            # transformers PreTrainedTokenizerFast
+            mapping = self.tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)["offset_mapping"]
+        else:
+            # tokenizers.Tokenizer
+            mapping = self.tokenizer.encode(text, add_special_tokens=False).offsets
+        return array("q", (start for start, _ in mapping)), array("q", (end for _, end in mapping))
+
+
+class TiktokenTokenizer(ChunkTokenizer):
+    """Tokens of a tiktoken encoding."""
+
+    def __init__(self, encoding: str = "cl100k_base"):
+        try:
+            import tiktoken
+        except ImportError:
+            raise ImportError("`tiktoken` not installed. Please install it with `pip install tiktoken`")
+        self.encoding = tiktoken.get_encoding(encoding)
+
+    def offsets(self, text: str) -> Tuple[array, array]:
+        tokens = self.encoding.encode(text, disallowed_special=())
+        _, token_starts = self.encoding.decode_with_offsets(tokens)
+        starts = array("q", token_starts)
+        ends = array("q", token_starts[1:])
+        ends.append(len(text))
+        return starts, ends
+
+    def count(self, text: str) -> int:
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+
+def get_chunk_tokenizer(tokenizer: Union[str, ChunkTokenizer]) -> ChunkTokenizer:
+    """Resolve a tokenizer given by name.
+
+    Names are "character", "word" (`RegexTokenizer`), "tiktoken" or "tiktoken:<encoding>", and anything else
+    is loaded as a Hugging Face tokenizer, e.g. "BAAI/bge-m3".
+    """
+    if isinstance(tokenizer, ChunkTokenizer):
+        return tokenizer
+    if tokenizer == "character":
+        return CharacterTokenizer()
+    if tokenizer == "word":
+        return RegexTokenizer()
+    if tokenizer == "tiktoken" or tokenizer.startswith("tiktoken:"):
+        _, _, encoding = tokenizer.partition(":")
+        return TiktokenTokenizer(encoding or "cl100k_base")
+    return HuggingFaceTokenizer(tokenizer)
+
+
+class TokenSpanChunker:
+    """Cut a text into windows of at most `chunk_size` tokens overlapping by `overlap` tokens.
+
+    Args:
+        tokenizer: The tokenizer measuring the chunks.
+        chunk_size: Maximum number of tokens per chunk.
+        overlap: Number of tokens repeated at the start of the next chunk.
+        separators: Strings a chunk should preferably end after. A window is shortened to end after the last
+            separator it contains, provided at least half of the window is kept.
+        ordered: If True, separators are tried in order and the first one found wins. Otherwise the chunk ends
+            after whichever separator comes last.
+    """
+
+    def __init__(
+        self,
+        tokenizer: ChunkTokenizer,
+        chunk_size: int,
+        overlap: int = 0,
+        separators: Sequence[str] = (),
+        ordered: bool = False,
+    ):
+        if overlap >= chunk_size:
+            raise ValueError(f"Invalid parameters: overlap ({overlap}) must be less than chunk size ({chunk_size}).")
+        self.tokenizer = tokenizer
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.separators = tuple(separators)
+        self.ordered = ordered
+
+    def spans(self, text: str) -> List[Span]:
+        """Return the (start, end) character span of every chunk of `text`."""
+        starts, ends = self.tokenizer.offsets(text)
+        token_count = len(starts)
+        spans: List[Span] = []
+        first = 0
+        while first < token_count:
+            last = min(first + self.chunk_size, token_count)
+            if last < token_count and self.separators:
+                last = self._break(text, starts, first, last)
+            spans.append((starts[first], ends[last - 1]))
+            if last >= token_count:
+                break
+            # Overlap, but always make progress
+            first = max(last - self.overlap, first + 1)
+        return spans
+
+    def _break(self, text: str, starts: array, first: int, last: int) -> int:
+        """Move the end of the window [first, last) back to just after a separator."""
+        window_start = starts[first]
+        window_end = starts[last]
+        # Keep at least half a chunk so separators near the start do not produce tiny chunks
+        min_last = first + max(1, (last - first) // 2)
+
+        best = -1
+        for separator in self.separators:
+            position = text.rfind(separator, window_start, window_end)
+            if position == -1:
+                continue
+            position += len(separator)
+            if self.ordered:
+                best = position
+                break
+            best = max(best, position)
+        if best == -1:
+            return last
+
+        # The first token starting at or after the separator begins the next chunk
+        new_last = bisect_left(starts, best, first + 1, last)
+        return new_last if new_last >= min_last else last
+
+
+def documents_from_spans(document: Document, text: str, spans: Sequence[Span]) -> List[Document]:
+    """Materialize chunks of `document` from spans over `text`, numbered from 1 like the other chunkers."""
+    chunked_documents: List[Document] = []
+    for chunk_number, (start, end) in enumerate(spans, 1):
+        chunk_id: Optional[str] = None
+        if document.id:
+            chunk_id = f"{document.id}_{chunk_number}"
+        elif document.name:
+            chunk_id = f"{document.name}_{chunk_number}"
+        chunked_documents.append(
+            Document(
+                id=chunk_id,
+                name=document.name,
+                meta_data={
+                    **document.meta_data,
+                    "chunk": chunk_number,
+                    "chunk_size": end - start,
+                    "chunk_start": start,
+                    "chunk_end": end,
+                },
+                content=text[start:end],
+            )
+        )
+    return chunked_documents
@@ -48,6 +48,8 @@ class Content:
     created_at: Optional[int] = None
     updated_at: Optional[int] = None
     external_id: Optional[str] = None
+    # Size, mtime and content digest of the source file, used to detect changed files
+    fingerprint: Optional[Dict[str, Any]] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Content":
@@ -71,4 +73,5 @@ class Content:
             created_at=data.get("created_at"),
             updated_at=data.get("updated_at"),
             external_id=data.get("external_id"),
+            fingerprint=data.get("fingerprint"),
         )
@@ -1,5 +1,29 @@
 from core.agno.knowledge.embedder.base import Embedder
+from core.agno.utils.lazy_import import lazy_attributes
 
 __all__ = [
     "Embedder",
 ]
+
+# Embedders are imported on first access, so only the SDKs of the embedders in use are needed
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AwsBedrockEmbedder": "core.agno.knowledge.embedder.aws_bedrock",
+        "AzureOpenAIEmbedder": "core.agno.knowledge.embedder.azure_openai",
+        "CohereEmbedder": "core.agno.knowledge.embedder.cohere",
+        "FastEmbedEmbedder": "core.agno.knowledge.embedder.fastembed",
+        "FireworksEmbedder": "core.agno.knowledge.embedder.fireworks",
+        "GeminiEmbedder": "core.agno.knowledge.embedder.google",
+        "HuggingfaceCustomEmbedder": "core.agno.knowledge.embedder.huggingface",
+        "JinaEmbedder": "core.agno.knowledge.embedder.jina",
+        "LangDBEmbedder": "core.agno.knowledge.embedder.langdb",
+        "MistralEmbedder": "core.agno.knowledge.embedder.mistral",
+        "NebiusEmbedder": "core.agno.knowledge.embedder.nebius",
+        "OllamaEmbedder": "core.agno.knowledge.embedder.ollama",
+        "OpenAIEmbedder": "core.agno.knowledge.embedder.openai",
+        "SentenceTransformerEmbedder": "core.agno.knowledge.embedder.sentence_transformer",
+        "TogetherEmbedder": "core.agno.knowledge.embedder.together",
+        "VoyageAIEmbedder": "core.agno.knowledge.embedder.voyageai",
+    },
+)
@@ -10,6 +10,14 @@ class Embedder:
     enable_batch: bool = False
     batch_size: int = 100  # Number of texts to process in each API call
 
+    @property
+    def supports_batch(self) -> bool:
+        """Whether callers should embed many texts per call through `get_embeddings_batch_and_usage`.
+
+        True when batching is enabled and the embedder implements the batch API natively.
+        """
+        return self.enable_batch and hasattr(self, "get_embeddings_batch_and_usage")
+
     def get_embedding(self, text: str) -> List[float]:
         raise NotImplementedError
 
@@ -24,10 +24,21 @@ class FastEmbedEmbedder(Embedder):
 
     id: str = "BAAI/bge-small-en-v1.5"
     dimensions: Optional[int] = 384
+    enable_batch: bool = True
+    batch_size: int = 256
+    # Worker processes used to embed batches, 0 uses every core and None embeds in-process
+    parallel: Optional[int] = None
+    fastembed_client: Optional[TextEmbedding] = None
+
+    @property
+    def model(self) -> TextEmbedding:
+        # Loading the ONNX model is expensive, keep it for the lifetime of the embedder
+        if self.fastembed_client is None:
+            self.fastembed_client = TextEmbedding(model_name=self.id)
+        return self.fastembed_client
 
     def get_embedding(self, text: str) -> List[float]:
-        model = TextEmbedding(model_name=self.id)
-        embeddings = model.embed(text)
+        embeddings = self.model.embed(text)
         embedding_list = list(embeddings)[0]
         if isinstance(embedding_list, np.ndarray):
             return embedding_list.tolist()
@@ -45,6 +56,26 @@ class FastEmbedEmbedder(Embedder):
 
         return embedding, usage
 
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings for multiple texts with one `embed` call, `batch_size` texts per inference run.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        if not texts:
+            return [], []
+
+        embeddings = [
+            embedding.tolist() if isinstance(embedding, np.ndarray) else list(embedding)
+            for embedding in self.model.embed(texts, batch_size=self.batch_size, parallel=self.parallel)
+        ]
+        # FastEmbed does not provide usage information
+        return embeddings, [None] * len(embeddings)
+
     async def async_get_embedding(self, text: str) -> List[float]:
         """Async version using thread executor for CPU-bound operations."""
         import asyncio
@@ -60,3 +91,13 @@ class FastEmbedEmbedder(Embedder):
         loop = asyncio.get_event_loop()
         # Run the CPU-bound operation in a thread executor
         return await loop.run_in_executor(None, self.get_embedding_and_usage, text)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Async version using thread executor for CPU-bound operations."""
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        # Run the CPU-bound operation in a thread executor
+        return await loop.run_in_executor(None, self.get_embeddings_batch_and_usage, texts)
@@ -22,11 +22,6 @@ class HuggingfaceCustomEmbedder(Embedder):
     huggingface_client: Optional[InferenceClient] = None
     async_client: Optional[AsyncInferenceClient] = None
 
-    def __post_init__(self):
-        if self.enable_batch:
-            log_warning("HuggingfaceEmbedder does not support batch embeddings, setting enable_batch to False")
-            self.enable_batch = False
-
     @property
     def client(self) -> InferenceClient:
         if self.huggingface_client:
@@ -72,6 +67,36 @@ class HuggingfaceCustomEmbedder(Embedder):
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
 
+    def _batch_embeddings(self, texts: List[str], response: Any) -> List[List[float]]:
+        embeddings = response.tolist() if hasattr(response, "tolist") else list(response)
+        if len(embeddings) != len(texts):
+            raise ValueError(f"Expected {len(texts)} embeddings, but got {len(embeddings)}")
+        return [list(embedding) for embedding in embeddings]
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings for multiple texts, sending `batch_size` texts per feature extraction request.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        all_embeddings: List[List[float]] = []
+        for i in range(0, len(texts), self.batch_size):
+            batch_texts = texts[i : i + self.batch_size]
+            try:
+                # The inference API embeds every input of a list in one request
+                response = self.client.feature_extraction(text=batch_texts, model=self.id)  # type: ignore[arg-type]
+                all_embeddings.extend(self._batch_embeddings(batch_texts, response))
+            except Exception as e:
+                log_warning(f"Error in batch embedding: {e}")
+                # Fallback to individual calls for this batch
+                all_embeddings.extend(self.get_embedding(text) for text in batch_texts)
+
+        return all_embeddings, [None] * len(all_embeddings)
+
     async def async_get_embedding(self, text: str) -> List[float]:
         """Async version of get_embedding using AsyncInferenceClient."""
         response = await self.aclient.feature_extraction(text=text, model=self.id)
@@ -92,3 +117,21 @@ class HuggingfaceCustomEmbedder(Embedder):
         """Async version of get_embedding_and_usage."""
         embedding = await self.async_get_embedding(text=text)
         return embedding, None
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Async version of get_embeddings_batch_and_usage using AsyncInferenceClient."""
+        all_embeddings: List[List[float]] = []
+        for i in range(0, len(texts), self.batch_size):
+            batch_texts = texts[i : i + self.batch_size]
+            try:
+                response = await self.aclient.feature_extraction(text=batch_texts, model=self.id)  # type: ignore[arg-type]
+                all_embeddings.extend(self._batch_embeddings(batch_texts, response))
+            except Exception as e:
+                log_warning(f"Error in async batch embedding: {e}")
+                # Fallback to individual calls for this batch
+                for text in batch_texts:
+                    all_embeddings.append(await self.async_get_embedding(text))
+
+        return all_embeddings, [None] * len(all_embeddings)
@@ -44,11 +44,7 @@ class OllamaEmbedder(Embedder):
     client_kwargs: Optional[Dict[str, Any]] = None
     ollama_client: Optional[OllamaClient] = None
     async_client: Optional[AsyncOllamaClient] = None
-
-    def __post_init__(self):
-        if self.enable_batch:
-            logger.warning("OllamaEmbedder does not support batch embeddings, setting enable_batch to False")
-            self.enable_batch = False
+    enable_batch: bool = True
 
     @property
     def client(self) -> OllamaClient:
@@ -94,6 +90,24 @@ class OllamaEmbedder(Embedder):
                 return {"embeddings": embeddings}  # Return as-is if already flat
         return {"embeddings": []}  # Return an empty list if no valid embedding is found
 
+    def _batch_kwargs(self, texts: List[str]) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {"input": texts, "model": self.id}
+        if self.options is not None:
+            kwargs["options"] = self.options
+        return kwargs
+
+    def _check_batch_embeddings(self, texts: List[str], response: Any) -> List[List[float]]:
+        embeddings = response["embeddings"] if response and "embeddings" in response else []
+        if len(embeddings) != len(texts):
+            raise ValueError(f"Expected {len(texts)} embeddings, but got {len(embeddings)}")
+        checked: List[List[float]] = []
+        for embedding in embeddings:
+            if len(embedding) != self.dimensions:
+                logger.warning(f"Expected embedding dimension {self.dimensions}, but got {len(embedding)}")
+                embedding = []
+            checked.append(list(embedding))
+        return checked
+
     def get_embedding(self, text: str) -> List[float]:
         try:
             response = self._response(text=text)
@@ -111,6 +125,29 @@ class OllamaEmbedder(Embedder):
         usage = None
         return embedding, usage
 
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings for multiple texts, sending `batch_size` texts per `embed` request.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        all_embeddings: List[List[float]] = []
+        for i in range(0, len(texts), self.batch_size):
+            batch_texts = texts[i : i + self.batch_size]
+            try:
+                response = self.client.embed(**self._batch_kwargs(batch_texts))
+                all_embeddings.extend(self._check_batch_embeddings(batch_texts, response))
+            except Exception as e:
+                logger.warning(f"Error in batch embedding: {e}")
+                # Fallback to individual calls for this batch
+                all_embeddings.extend(self.get_embedding(text) for text in batch_texts)
+
+        return all_embeddings, [None] * len(all_embeddings)
+
     async def _async_response(self, text: str) -> Dict[str, Any]:
         """Async version of _response using AsyncOllamaClient."""
         kwargs: Dict[str, Any] = {}
@@ -144,3 +181,21 @@ class OllamaEmbedder(Embedder):
         embedding = await self.async_get_embedding(text=text)
         usage = None
         return embedding, usage
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Async version of get_embeddings_batch_and_usage."""
+        all_embeddings: List[List[float]] = []
+        for i in range(0, len(texts), self.batch_size):
+            batch_texts = texts[i : i + self.batch_size]
+            try:
+                response = await self.aclient.embed(**self._batch_kwargs(batch_texts))
+                all_embeddings.extend(self._check_batch_embeddings(batch_texts, response))
+            except Exception as e:
+                logger.warning(f"Error in async batch embedding: {e}")
+                # Fallback to individual calls for this batch
+                for text in batch_texts:
+                    all_embeddings.append(await self.async_get_embedding(text))
+
+        return all_embeddings, [None] * len(all_embeddings)
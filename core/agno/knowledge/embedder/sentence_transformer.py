@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from core.agno.knowledge.embedder.base import Embedder
 from core.agno.utils.log import logger
@@ -24,12 +24,20 @@ class SentenceTransformerEmbedder(Embedder):
     sentence_transformer_client: Optional[SentenceTransformer] = None
     prompt: Optional[str] = None
     normalize_embeddings: bool = False
+    enable_batch: bool = True
+    batch_size: int = 32
+    # Devices of a multi-process encoding pool for batches, e.g. ["cpu"] * 4 or ["cuda:0", "cuda:1"]
+    pool_devices: Optional[List[str]] = None
+    _pool: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
 
-    def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
+    @property
+    def model(self) -> SentenceTransformer:
         if not self.sentence_transformer_client:
             self.sentence_transformer_client = SentenceTransformer(model_name_or_path=self.id)
+        return self.sentence_transformer_client
 
-        model = self.sentence_transformer_client
+    def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
+        model = self.model
         embedding = model.encode(text, prompt=self.prompt, normalize_embeddings=self.normalize_embeddings)
         try:
             if isinstance(embedding, np.ndarray):
@@ -43,6 +51,48 @@ class SentenceTransformerEmbedder(Embedder):
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
 
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings for multiple texts with one `encode` call, `batch_size` texts per forward pass.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        if not texts:
+            return [], []
+
+        if self.pool_devices:
+            if self._pool is None:
+                logger.debug(f"Starting encoding pool on {self.pool_devices}")
+                self._pool = self.model.start_multi_process_pool(target_devices=self.pool_devices)
+            embeddings = self.model.encode_multi_process(
+                texts,
+                self._pool,
+                prompt=self.prompt,
+                batch_size=self.batch_size,
+                normalize_embeddings=self.normalize_embeddings,
+            )
+        else:
+            embeddings = self.model.encode(
+                texts,
+                prompt=self.prompt,
+                batch_size=self.batch_size,
+                normalize_embeddings=self.normalize_embeddings,
+                show_progress_bar=False,
+            )
+        if isinstance(embeddings, np.ndarray):
+            return embeddings.tolist(), [None] * len(texts)
+        return [list(embedding) for embedding in embeddings], [None] * len(texts)
+
+    def stop_pool(self) -> None:
+        """Stop the multi-process encoding pool, if one was started."""
+        if self._pool is not None:
+            SentenceTransformer.stop_multi_process_pool(self._pool)
+            self._pool = None
+
     async def async_get_embedding(self, text: Union[str, List[str]]) -> List[float]:
         """Async version using thread executor for CPU-bound operations."""
         import asyncio
@@ -57,3 +107,12 @@ class SentenceTransformerEmbedder(Embedder):
 
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, self.get_embedding_and_usage, text)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Async version using thread executor for CPU-bound operations."""
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.get_embeddings_batch_and_usage, texts)
@@ -1,13 +1,16 @@
 import asyncio
 import hashlib
 import io
+import os
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-from functools import cached_property
+from functools import cached_property, partial
 from io import BytesIO
 from os.path import basename
 from pathlib import Path
+from pickle import PicklingError
 from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast, overload
 
 from httpx import AsyncClient
@@ -25,6 +28,50 @@ from core.agno.utils.string import generate_id
 ContentDict = Dict[str, Union[str, Dict[str, str]]]
 
 
+# Key under which the source fingerprint is kept in the contents DB row metadata
+FINGERPRINT_KEY = "_fingerprint"
+
+
+def _user_metadata(metadata: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Metadata of a contents DB row without the internal fingerprint."""
+    if not metadata or FINGERPRINT_KEY not in metadata:
+        return metadata
+    return {key: value for key, value in metadata.items() if key != FINGERPRINT_KEY} or None
+
+
+def _row_metadata(
+    metadata: Optional[Dict[str, Any]], fingerprint: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """Metadata to store in a contents DB row, including the fingerprint if known."""
+    if fingerprint is None:
+        return metadata
+    return {**(metadata or {}), FINGERPRINT_KEY: fingerprint}
+
+
+def _fingerprint_file(path: Path, previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Fingerprint a file by size, mtime and content digest.
+
+    The digest of `previous` is reused when size and mtime are unchanged, so unchanged files are never read.
+    """
+    stat = path.stat()
+    fingerprint: Dict[str, Any] = {"path": str(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if previous and previous.get("size") == stat.st_size and previous.get("mtime_ns") == stat.st_mtime_ns:
+        fingerprint["digest"] = previous.get("digest")
+        return fingerprint
+
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    fingerprint["digest"] = digest.hexdigest()
+    return fingerprint
+
+
+def _read_file(reader: Reader, path: Path, read_kwargs: Dict[str, Any]) -> List[Document]:
+    """Module-level so it can be sent to a process pool."""
+    return reader.read(path, **read_kwargs)
+
+
 class KnowledgeContentOrigin(Enum):
     PATH = "path"
     URL = "url"
@@ -42,6 +89,13 @@ class Knowledge:
     contents_db: Optional[Union[BaseDb, AsyncBaseDb]] = None
     max_results: int = 10
     readers: Optional[Dict[str, Reader]] = None
+    # Maximum number of files read, embedded and inserted at the same time when adding a directory
+    max_concurrent_files: int = 4
+    # If True, file readers run in a process pool instead of threads (readers must be picklable)
+    use_process_pool: bool = False
+    # Number of documents embedded and inserted at a time when a streaming reader (e.g. CSVReader(streaming=True))
+    # reads a file
+    stream_batch_size: int = 1000
 
     def __post_init__(self):
         from core.agno.vectordb import VectorDb
@@ -52,6 +106,9 @@ class Knowledge:
 
         self.construct_readers()
         self.valid_metadata_filters = set()
+        self._reader_executor: Optional[Executor] = None
+        # Number of path loads using the reader executor, the pool is shut down when the last one finishes
+        self._reader_executor_users = 0
 
     # --- SDK Specific Methods ---
 
@@ -398,44 +455,46 @@ class Knowledge:
             if self._should_include_file(str(path), include, exclude):
                 log_info(f"Adding file {path} due to include/exclude filters")
 
-                await self._add_to_contents_db(content)
-                if self._should_skip(content.content_hash, skip_if_exists):  # type: ignore[arg-type]
-                    content.status = ContentStatus.COMPLETED
-                    await self._aupdate_content(content)
-                    return
+                previous_row = None
+                previous_fingerprint = None
+                if self.contents_db:
+                    previous_row = await self._aget_content_row(content.id)  # type: ignore[arg-type]
+                    if previous_row is not None and previous_row.status == ContentStatus.COMPLETED:
+                        previous_fingerprint = (previous_row.metadata or {}).get(FINGERPRINT_KEY)
+                    content.fingerprint = await asyncio.to_thread(_fingerprint_file, path, previous_fingerprint)
+
+                if previous_row is not None and previous_fingerprint is not None:
+                    # The fingerprint tells whether the file changed since it was last ingested
+                    if previous_fingerprint.get("digest") == content.fingerprint["digest"]:  # type: ignore[index]
+                        if skip_if_exists:
+                            log_debug(f"Content unchanged: {path}, skipping...")
+                            if previous_fingerprint != content.fingerprint:
+                                # Only the mtime moved, remember it so the file is not hashed again
+                                previous_row.metadata = _row_metadata(
+                                    _user_metadata(previous_row.metadata), content.fingerprint
+                                )
+                                contents_db = self.contents_db
+                                if isinstance(contents_db, AsyncBaseDb):
+                                    await contents_db.upsert_knowledge_content(knowledge_row=previous_row)
+                                else:
+                                    contents_db.upsert_knowledge_content(knowledge_row=previous_row)  # type: ignore
+                            return
+                    elif self.vector_db:
+                        log_info(f"Content changed: {path}, replacing its documents")
+                        self.vector_db.delete_by_content_id(content.id)  # type: ignore[arg-type]
+                    await self._add_to_contents_db(content)
+                else:
+                    await self._add_to_contents_db(content)
+                    if self._should_skip(content.content_hash, skip_if_exists):  # type: ignore[arg-type]
+                        content.status = ContentStatus.COMPLETED
+                        await self._aupdate_content(content)
+                        return
 
                 # Handle LightRAG special case - read file and upload directly
                 if self.vector_db.__class__.__name__ == "LightRag":
                     await self._process_lightrag_content(content, KnowledgeContentOrigin.PATH)
                     return
 
-                if content.reader:
-                    # TODO: We will refactor this to eventually pass authorization to all readers
-                    import inspect
-
-                    read_signature = inspect.signature(content.reader.read)
-                    if "password" in read_signature.parameters and content.auth and content.auth.password:
-                        read_documents = content.reader.read(
-                            path, name=content.name or path.name, password=content.auth.password
-                        )
-                    else:
-                        read_documents = content.reader.read(path, name=content.name or path.name)
-
-                else:
-                    reader = ReaderFactory.get_reader_for_extension(path.suffix)
-                    log_info(f"Using Reader: {reader.__class__.__name__}")
-                    if reader:
-                        # TODO: We will refactor this to eventually pass authorization to all readers
-                        import inspect
-
-                        read_signature = inspect.signature(reader.read)
-                        if "password" in read_signature.parameters and content.auth and content.auth.password:
-                            read_documents = reader.read(
-                                path, name=content.name or path.name, password=content.auth.password
-                            )
-                        else:
-                            read_documents = reader.read(path, name=content.name or path.name)
-
                 if not content.file_type:
                     content.file_type = path.suffix
 
@@ -448,31 +507,238 @@ class Knowledge:
                         log_warning(f"Could not get file size for {path}: {e}")
                         content.size = 0
 
+                reader = self._get_path_reader(content, path)
+                if getattr(reader, "streaming", False) and hasattr(reader, "async_iter_read"):
+                    await self._stream_path_to_vector_db(content, reader, path, upsert)  # type: ignore[arg-type]
+                    return
+
+                read_documents = await self._read_path(content, path)
+
                 for read_document in read_documents:
                     read_document.content_id = content.id
 
                 await self._handle_vector_db_insert(content, read_documents, upsert)
 
         elif path.is_dir():
-            for file_path in path.iterdir():
-                # Apply include/exclude filtering
-                if not self._should_include_file(str(file_path), include, exclude):
-                    log_debug(f"Skipping file {file_path} due to include/exclude filters")
-                    continue
+            await self._load_from_directory(content, path, upsert, skip_if_exists, include, exclude)
+        else:
+            log_warning(f"Invalid path: {path}")
+
+    async def _aget_content_row(self, content_id: str) -> Optional[KnowledgeRow]:
+        if not self.contents_db:
+            return None
+        try:
+            if isinstance(self.contents_db, AsyncBaseDb):
+                return await self.contents_db.get_knowledge_content(content_id)
+            return self.contents_db.get_knowledge_content(content_id)
+        except Exception as e:
+            log_warning(f"Could not get content row {content_id}: {e}")
+            return None
+
+    async def _aget_content_rows(self) -> List[KnowledgeRow]:
+        if not self.contents_db:
+            return []
+        try:
+            if isinstance(self.contents_db, AsyncBaseDb):
+                rows, _ = await self.contents_db.get_knowledge_contents()
+            else:
+                rows, _ = self.contents_db.get_knowledge_contents()
+            return rows
+        except Exception as e:
+            log_warning(f"Could not get content rows: {e}")
+            return []
+
+    async def _remove_deleted_files(self, path: Path, content_rows: List[KnowledgeRow]) -> None:
+        """Remove the documents and contents DB rows of files under `path` that no longer exist."""
+        directory = os.path.join(str(path), "")
+        for content_row in content_rows:
+            fingerprint = (content_row.metadata or {}).get(FINGERPRINT_KEY)
+            if not fingerprint or not str(fingerprint.get("path", "")).startswith(directory):
+                continue
+            if os.path.exists(fingerprint["path"]):
+                continue
+
+            log_info(f"File removed: {fingerprint['path']}, deleting its documents")
+            if self.vector_db:
+                self.vector_db.delete_by_content_id(content_row.id)
+            if isinstance(self.contents_db, AsyncBaseDb):
+                await self.contents_db.delete_knowledge_content(content_row.id)  # type: ignore[arg-type]
+            else:
+                self.contents_db.delete_knowledge_content(content_row.id)  # type: ignore[union-attr, arg-type]
+
+    def _get_path_reader(self, content: Content, path: Path) -> Optional[Reader]:
+        reader = content.reader
+        if reader is None:
+            reader = ReaderFactory.get_reader_for_extension(path.suffix)
+            log_info(f"Using Reader: {reader.__class__.__name__}")
+        return reader
+
+    async def _read_path(self, content: Content, path: Path) -> List[Document]:
+        """Read a file off the event loop, in the reader executor."""
+        reader = self._get_path_reader(content, path)
+        if reader is None:
+            return []
+
+        # TODO: We will refactor this to eventually pass authorization to all readers
+        import inspect
+
+        read_kwargs: Dict[str, Any] = {"name": content.name or path.name}
+        read_signature = inspect.signature(reader.read)
+        if "password" in read_signature.parameters and content.auth and content.auth.password:
+            read_kwargs["password"] = content.auth.password
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_reader_executor()
+        try:
+            return await loop.run_in_executor(executor, partial(_read_file, reader, path, read_kwargs))
+        except (PicklingError, TypeError, AttributeError) as e:
+            if not isinstance(executor, ProcessPoolExecutor):
+                raise
+            # Readers holding clients or locks cannot be sent to another process
+            log_debug(f"Reader {reader.__class__.__name__} cannot run in a process pool, using a thread: {e}")
+            return await loop.run_in_executor(None, partial(_read_file, reader, path, read_kwargs))
+
+    async def _stream_path_to_vector_db(self, content: Content, reader: Reader, path: Path, upsert: bool) -> None:
+        """Embed and insert the documents of a streaming reader `stream_batch_size` at a time, as they are read.
+
+        Only one batch of documents is held in memory, whatever the size of the file.
+        """
+        from core.agno.vectordb import VectorDb
+
+        self.vector_db = cast(VectorDb, self.vector_db)
+
+        if not self.vector_db:
+            log_error("No vector database configured")
+            content.status = ContentStatus.FAILED
+            content.status_message = "No vector database configured"
+            await self._aupdate_content(content)
+            return
 
-                file_content = Content(
-                    name=content.name,
-                    path=str(file_path),
-                    metadata=content.metadata,
-                    description=content.description,
-                    reader=content.reader,
+        # An upsert replaces the documents of a previous version once, later batches are added to the new ones
+        replace = self.vector_db.upsert_available() and upsert
+        batch: List[Document] = []
+        total = 0
+
+        async def _flush() -> None:
+            nonlocal replace, total
+            if replace:
+                await self.vector_db.async_upsert(content.content_hash, batch, content.metadata)  # type: ignore[union-attr, arg-type]
+                replace = False
+            else:
+                await self.vector_db.async_insert(  # type: ignore[union-attr]
+                    content.content_hash,  # type: ignore[arg-type]
+                    documents=batch,
+                    filters=content.metadata,  # type: ignore[arg-type]
                 )
-                file_content.content_hash = self._build_content_hash(file_content)
-                file_content.id = generate_id(file_content.content_hash)
+            total += len(batch)
+            log_debug(f"Inserted {total} documents from {path}")
 
-                await self._load_from_path(file_content, upsert, skip_if_exists, include, exclude)
-        else:
-            log_warning(f"Invalid path: {path}")
+        try:
+            async for document in reader.async_iter_read(path, name=content.name or path.name):  # type: ignore[attr-defined]
+                document.content_id = content.id
+                batch.append(document)
+                if len(batch) >= max(1, self.stream_batch_size):
+                    await _flush()
+                    batch = []
+            if batch:
+                await _flush()
+        except Exception as e:
+            log_error(f"Error streaming {path} into the vector db: {e}")
+            content.status = ContentStatus.FAILED
+            content.status_message = "Could not insert embedding"
+            await self._aupdate_content(content)
+            return
+
+        content.status = ContentStatus.COMPLETED
+        await self._aupdate_content(content)
+
+    def _get_reader_executor(self) -> Optional[Executor]:
+        if not self.use_process_pool:
+            return None
+        if self._reader_executor is None:
+            self._reader_executor = ProcessPoolExecutor(max_workers=self.max_concurrent_files)
+        return self._reader_executor
+
+    def close(self) -> None:
+        """Shut down the reader process pool, if one was started. It is started again on the next load."""
+        executor, self._reader_executor = self._reader_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _walk_directory(
+        self, path: Path, include: Optional[List[str]] = None, exclude: Optional[List[str]] = None
+    ) -> List[Path]:
+        """Collect the files under `path` recursively, pruning excluded directories."""
+        file_paths: List[Path] = []
+        for root, dir_names, file_names in os.walk(path):
+            if exclude:
+                dir_names[:] = [
+                    dir_name
+                    for dir_name in dir_names
+                    if self._should_include_file(os.path.join(root, dir_name), None, exclude)
+                ]
+            dir_names.sort()
+            for file_name in sorted(file_names):
+                file_path = os.path.join(root, file_name)
+                if not self._should_include_file(file_path, include, exclude):
+                    log_debug(f"Skipping file {file_path} due to include/exclude filters")
+                    continue
+                file_paths.append(Path(file_path))
+        return file_paths
+
+    async def _load_from_directory(
+        self,
+        content: Content,
+        path: Path,
+        upsert: bool,
+        skip_if_exists: bool,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ) -> None:
+        """Load every file under a directory, processing up to `max_concurrent_files` files at a time."""
+        file_contents: List[Content] = []
+        for file_path in self._walk_directory(path, include, exclude):
+            file_content = Content(
+                name=content.name,
+                path=str(file_path),
+                metadata=content.metadata,
+                description=content.description,
+                reader=content.reader,
+            )
+            file_content.content_hash = self._build_content_hash(file_content)
+            file_content.id = generate_id(file_content.content_hash)
+            file_contents.append(file_content)
+
+        total = len(file_contents)
+        log_info(f"Adding {total} files from directory {path}")
+
+        content_rows = await self._aget_content_rows()
+        await self._remove_deleted_files(path, content_rows)
+
+        # Register new files up front so the contents DB shows the whole queue while it is processed
+        known_ids = {content_row.id for content_row in content_rows}
+        for file_content in file_contents:
+            if file_content.id not in known_ids:
+                await self._add_to_contents_db(file_content)
+
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrent_files))
+        completed = 0
+
+        async def _load_file(file_content: Content) -> None:
+            nonlocal completed
+            async with semaphore:
+                try:
+                    await self._load_from_path(file_content, upsert, skip_if_exists, include, exclude)
+                except Exception as e:
+                    log_error(f"Error adding file {file_content.path}: {e}")
+                    file_content.status = ContentStatus.FAILED
+                    file_content.status_message = str(e)
+                    await self._aupdate_content(file_content)
+            completed += 1
+            log_debug(f"Processed {completed}/{total} files from directory {path}")
+
+        await asyncio.gather(*[_load_file(file_content) for file_content in file_contents])
+        log_info(f"Finished adding {total} files from directory {path}")
 
     async def _load_from_url(
         self,
@@ -994,7 +1260,13 @@ class Knowledge:
             self.add_filters(content.metadata)
 
         if content.path:
-            await self._load_from_path(content, upsert, skip_if_exists, include, exclude)
+            self._reader_executor_users += 1
+            try:
+                await self._load_from_path(content, upsert, skip_if_exists, include, exclude)
+            finally:
+                self._reader_executor_users -= 1
+                if self._reader_executor_users == 0:
+                    self.close()
 
         if content.url:
             await self._load_from_url(content, upsert, skip_if_exists)
@@ -1102,7 +1374,7 @@ class Knowledge:
                 id=content.id,
                 name=safe_name,
                 description=safe_description,
-                metadata=content.metadata,
+                metadata=_row_metadata(content.metadata, content.fingerprint),
                 type=file_type,
                 size=content.size
                 if content.size
@@ -1148,8 +1420,11 @@ class Knowledge:
                 content_row.description = self._ensure_string_field(
                     content.description, "content.description", default=""
                 )
-            if content.metadata is not None:
-                content_row.metadata = content.metadata
+            if content.metadata is not None or content.fingerprint is not None:
+                content_row.metadata = _row_metadata(
+                    content.metadata if content.metadata is not None else _user_metadata(content_row.metadata),
+                    content.fingerprint or (content_row.metadata or {}).get(FINGERPRINT_KEY),
+                )
             if content.status is not None:
                 content_row.status = content.status
             if content.status_message is not None:
@@ -1197,8 +1472,11 @@ class Knowledge:
                 content_row.name = content.name
             if content.description is not None:
                 content_row.description = content.description
-            if content.metadata is not None:
-                content_row.metadata = content.metadata
+            if content.metadata is not None or content.fingerprint is not None:
+                content_row.metadata = _row_metadata(
+                    content.metadata if content.metadata is not None else _user_metadata(content_row.metadata),
+                    content.fingerprint or (content_row.metadata or {}).get(FINGERPRINT_KEY),
+                )
             if content.status is not None:
                 content_row.status = content.status
             if content.status_message is not None:
@@ -1551,7 +1829,7 @@ class Knowledge:
             id=content_row.id,
             name=content_row.name,
             description=content_row.description,
-            metadata=content_row.metadata,
+            metadata=_user_metadata(content_row.metadata),
             file_type=content_row.type,
             size=content_row.size,
             status=ContentStatus(content_row.status) if content_row.status else None,
@@ -1577,7 +1855,7 @@ class Knowledge:
             id=content_row.id,
             name=content_row.name,
             description=content_row.description,
-            metadata=content_row.metadata,
+            metadata=_user_metadata(content_row.metadata),
             file_type=content_row.type,
             size=content_row.size,
             status=ContentStatus(content_row.status) if content_row.status else None,
@@ -1612,7 +1890,7 @@ class Knowledge:
                 id=content_row.id,
                 name=content_row.name,
                 description=content_row.description,
-                metadata=content_row.metadata,
+                metadata=_user_metadata(content_row.metadata),
                 size=content_row.size,
                 file_type=content_row.type,
                 status=ContentStatus(content_row.status) if content_row.status else None,
@@ -1650,7 +1928,7 @@ class Knowledge:
                 id=content_row.id,
                 name=content_row.name,
                 description=content_row.description,
-                metadata=content_row.metadata,
+                metadata=_user_metadata(content_row.metadata),
                 size=content_row.size,
                 file_type=content_row.type,
                 status=ContentStatus(content_row.status) if content_row.status else None,
@@ -1,7 +1,32 @@
 from core.agno.knowledge.reader.base import Reader
 from core.agno.knowledge.reader.reader_factory import ReaderFactory
+from core.agno.utils.lazy_import import lazy_attributes
 
 __all__ = [
     "Reader",
     "ReaderFactory",
 ]
+
+# Readers are imported on first access, so only the parsers of the formats in use are needed
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "ArxivReader": "core.agno.knowledge.reader.arxiv_reader",
+        "CSVReader": "core.agno.knowledge.reader.csv_reader",
+        "DocxReader": "core.agno.knowledge.reader.docx_reader",
+        "FieldLabeledCSVReader": "core.agno.knowledge.reader.field_labeled_csv_reader",
+        "FirecrawlReader": "core.agno.knowledge.reader.firecrawl_reader",
+        "JSONReader": "core.agno.knowledge.reader.json_reader",
+        "MarkdownReader": "core.agno.knowledge.reader.markdown_reader",
+        "BasePDFReader": "core.agno.knowledge.reader.pdf_reader",
+        "PDFReader": "core.agno.knowledge.reader.pdf_reader",
+        "PDFImageReader": "core.agno.knowledge.reader.pdf_reader",
+        "PPTXReader": "core.agno.knowledge.reader.pptx_reader",
+        "S3Reader": "core.agno.knowledge.reader.s3_reader",
+        "TextReader": "core.agno.knowledge.reader.text_reader",
+        "WebSearchReader": "core.agno.knowledge.reader.web_search_reader",
+        "WebsiteReader": "core.agno.knowledge.reader.website_reader",
+        "WikipediaReader": "core.agno.knowledge.reader.wikipedia_reader",
+        "YouTubeReader": "core.agno.knowledge.reader.youtube_reader",
+    },
+)
@@ -2,7 +2,7 @@ import asyncio
 import csv
 import io
 from pathlib import Path
-from typing import IO, Any, List, Optional, Union
+from typing import IO, Any, AsyncIterator, Iterator, List, Optional, Union
 from uuid import uuid4
 
 try:
@@ -21,8 +21,22 @@ from core.agno.utils.log import logger
 class CSVReader(Reader):
     """Reader for CSV files"""
 
-    def __init__(self, chunking_strategy: Optional[ChunkingStrategy] = RowChunking(), **kwargs):
+    def __init__(
+        self,
+        chunking_strategy: Optional[ChunkingStrategy] = RowChunking(),
+        streaming: bool = False,
+        batch_rows: int = 1000,
+        **kwargs,
+    ):
+        """
+        Args:
+            streaming: If True, `Knowledge` reads the file with `iter_read`, embedding and inserting documents
+                as they are produced so memory stays bounded regardless of file size.
+            batch_rows: Number of data rows per document yielded by `iter_read`.
+        """
         super().__init__(chunking_strategy=chunking_strategy, **kwargs)
+        self.streaming = streaming
+        self.batch_rows = batch_rows
 
     @classmethod
     def get_supported_chunking_strategies(self) -> List[ChunkingStrategyType]:
@@ -39,6 +53,49 @@ class CSVReader(Reader):
     def get_supported_content_types(self) -> List[ContentType]:
         return [ContentType.CSV, ContentType.XLSX, ContentType.XLS]
 
+    def _get_name(self, file: Union[Path, IO[Any]], name: Optional[str] = None) -> str:
+        return name or (
+            Path(file.name).stem
+            if isinstance(file, Path)
+            else (getattr(file, "name", "csv_file").split(".")[0] if hasattr(file, "name") else "csv_file")
+        )
+
+    def _iter_rows(self, file: Union[Path, IO[Any]], delimiter: str, quotechar: str) -> Iterator[List[str]]:
+        """Lazily yield the rows of a CSV or XLSX file, without loading the whole file in memory."""
+        if str(getattr(file, "name", "") or "").lower().endswith(ContentType.XLSX.value):
+            yield from self._iter_xlsx_rows(file)
+            return
+
+        if isinstance(file, Path):
+            with file.open(newline="", mode="r", encoding=self.encoding or "utf-8") as csvfile:
+                yield from csv.reader(csvfile, delimiter=delimiter, quotechar=quotechar)
+            return
+
+        file.seek(0)
+        text_stream = io.TextIOWrapper(file, encoding=self.encoding or "utf-8", newline="")  # type: ignore[arg-type]
+        try:
+            yield from csv.reader(text_stream, delimiter=delimiter, quotechar=quotechar)
+        finally:
+            # Detach so closing the wrapper does not close the caller's file
+            text_stream.detach()
+
+    def _iter_xlsx_rows(self, file: Union[Path, IO[Any]]) -> Iterator[List[str]]:
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ImportError("`openpyxl` not installed. Please install it with `pip install openpyxl`")
+
+        if not isinstance(file, Path):
+            file.seek(0)
+        # read_only streams rows from the archive instead of building the whole workbook
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            for sheet in workbook.worksheets:
+                for row in sheet.iter_rows(values_only=True):
+                    yield ["" if value is None else str(value) for value in row]
+        finally:
+            workbook.close()
+
     def read(
         self, file: Union[Path, IO[Any]], delimiter: str = ",", quotechar: str = '"', name: Optional[str] = None
     ) -> List[Document]:
@@ -47,22 +104,11 @@ class CSVReader(Reader):
                 if not file.exists():
                     raise FileNotFoundError(f"Could not find file: {file}")
                 logger.info(f"Reading: {file}")
-                file_content = file.open(newline="", mode="r", encoding=self.encoding or "utf-8")
             else:
                 logger.info(f"Reading retrieved file: {name or file.name}")
-                file.seek(0)
-                file_content = io.StringIO(file.read().decode("utf-8"))  # type: ignore
 
-            csv_name = name or (
-                Path(file.name).stem
-                if isinstance(file, Path)
-                else (getattr(file, "name", "csv_file").split(".")[0] if hasattr(file, "name") else "csv_file")
-            )
-            csv_content = ""
-            with file_content as csvfile:
-                csv_reader = csv.reader(csvfile, delimiter=delimiter, quotechar=quotechar)
-                for row in csv_reader:
-                    csv_content += ", ".join(row) + "\n"
+            csv_name = self._get_name(file, name)
+            csv_content = "".join(", ".join(row) + "\n" for row in self._iter_rows(file, delimiter, quotechar))
 
             documents = [
                 Document(
@@ -81,6 +127,81 @@ class CSVReader(Reader):
             logger.error(f"Error reading: {getattr(file, 'name', str(file)) if isinstance(file, IO) else file}: {e}")
             return []
 
+    def iter_read(
+        self, file: Union[Path, IO[Any]], delimiter: str = ",", quotechar: str = '"', name: Optional[str] = None
+    ) -> Iterator[Document]:
+        """
+        Read a CSV or XLSX file lazily, yielding one document per `batch_rows` data rows.
+
+        The header row is repeated at the top of every batch so each document can be understood on its own.
+        Batches are chunked with the reader's chunking strategy when `chunk` is enabled. `RowChunking` chunks
+        every row on its own, so with it the header is only emitted with the first batch and rows keep their
+        row numbers in the file, as with `read`.
+
+        Args:
+            file: Path or file-like object
+            delimiter: CSV delimiter
+            quotechar: CSV quote character
+            name: Name of the documents, defaults to the file name
+
+        Yields:
+            Document objects, as the rows they cover are read
+        """
+        if isinstance(file, Path):
+            if not file.exists():
+                raise FileNotFoundError(f"Could not find file: {file}")
+            logger.info(f"Streaming: {file}")
+        else:
+            logger.info(f"Streaming retrieved file: {name or file.name}")
+
+        csv_name = self._get_name(file, name)
+        batch_rows = max(1, self.batch_rows)
+        rows = self._iter_rows(file, delimiter, quotechar)
+        header = next(rows, None)
+        if header is None:
+            return
+        header_line = ", ".join(header) + "\n"
+
+        page = 0
+        batch: List[str] = []
+        row_chunking = self.chunk and isinstance(self.chunking_strategy, RowChunking)
+
+        def _make_documents() -> List[Document]:
+            start_row = (page - 1) * batch_rows + 2
+            with_header = page == 1 or not row_chunking
+            document = Document(
+                name=csv_name,
+                id=str(uuid4()),
+                meta_data={"page": page, "start_row": start_row, "rows": len(batch)},
+                content=(header_line if with_header else "") + "".join(batch),
+            )
+            if row_chunking:
+                # Lines of the file before this document: none for the first batch, which holds the header
+                row_offset = 0 if with_header else start_row - 1
+                return self.chunking_strategy.chunk(document, row_offset=row_offset)  # type: ignore[union-attr, call-arg]
+            return self.chunk_document(document) if self.chunk else [document]
+
+        for row in rows:
+            batch.append(", ".join(row) + "\n")
+            if len(batch) >= batch_rows:
+                page += 1
+                yield from _make_documents()
+                batch = []
+        if batch or page == 0:
+            page += 1
+            yield from _make_documents()
+
+    async def async_iter_read(
+        self, file: Union[Path, IO[Any]], delimiter: str = ",", quotechar: str = '"', name: Optional[str] = None
+    ) -> AsyncIterator[Document]:
+        """Async version of `iter_read`, reading and chunking each batch in a worker thread."""
+        documents = self.iter_read(file, delimiter=delimiter, quotechar=quotechar, name=name)
+        while True:
+            document = await asyncio.to_thread(next, documents, None)
+            if document is None:
+                return
+            yield document
+
     async def async_read(
         self,
         file: Union[Path, IO[Any]],
@@ -1,3 +1,4 @@
+import asyncio
 from typing import List
 
 from pydantic import BaseModel, ConfigDict
@@ -12,3 +13,7 @@ class Reranker(BaseModel):
 
     def rerank(self, query: str, documents: List[Document]) -> List[Document]:
         raise NotImplementedError
+
+    async def arerank(self, query: str, documents: List[Document]) -> List[Document]:
+        """Rerank without blocking the event loop. Defaults to running `rerank` in a worker thread."""
+        return await asyncio.to_thread(self.rerank, query, documents)
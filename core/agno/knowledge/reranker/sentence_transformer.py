@@ -1,4 +1,11 @@
-from typing import Any, Dict, List, Optional
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import md5
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import PrivateAttr
 
 from core.agno.knowledge.document import Document
 from core.agno.knowledge.reranker.base import Reranker
@@ -10,17 +17,109 @@ except ImportError:
     raise ImportError("`sentence-transformers` not installed, please run `pip install sentence-transformers`")
 
 
+# Loaded cross-encoders shared by every reranker in the process: (model, max_length, model_kwargs) -> (model, lock).
+# The lock serializes predictions, the tokenizers behind a cross-encoder are not safe to use from several threads.
+_cross_encoders: Dict[Tuple[str, Optional[int], str], Tuple[CrossEncoder, threading.Lock]] = {}
+_cross_encoders_lock = threading.Lock()
+
+# Predictions are serialized per model, so async reranking runs on one dedicated thread
+# instead of occupying threads of the event loop's default executor
+_rerank_executor: Optional[ThreadPoolExecutor] = None
+_rerank_executor_lock = threading.Lock()
+
+
+def get_cross_encoder(
+    model: str, max_length: Optional[int] = None, model_kwargs: Optional[Dict[str, Any]] = None
+) -> Tuple[CrossEncoder, threading.Lock]:
+    """Return the process-wide cross-encoder for `model` and the lock guarding it, loading it on first use."""
+    key = (model, max_length, repr(sorted((model_kwargs or {}).items())))
+    with _cross_encoders_lock:
+        entry = _cross_encoders.get(key)
+        if entry is None:
+            logger.debug(f"Loading cross-encoder {model}")
+            entry = (
+                CrossEncoder(model_name_or_path=model, max_length=max_length, model_kwargs=model_kwargs),
+                threading.Lock(),
+            )
+            _cross_encoders[key] = entry
+        return entry
+
+
+def _get_rerank_executor() -> ThreadPoolExecutor:
+    global _rerank_executor
+    with _rerank_executor_lock:
+        if _rerank_executor is None:
+            _rerank_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agno-reranker")
+        return _rerank_executor
+
+
 class SentenceTransformerReranker(Reranker):
     model: str = "BAAI/bge-reranker-v2-m3"
     model_kwargs: Optional[Dict[str, Any]] = None
     top_n: Optional[int] = None
+    # Number of query/document pairs scored per forward pass
+    batch_size: int = 32
+    # Pairs longer than this many tokens are truncated, None uses the model's own limit
+    max_length: Optional[int] = 512
+    # Number of (query, document) scores kept in memory, 0 disables the cache
+    score_cache_size: int = 4096
+
+    _score_cache: "OrderedDict[Tuple[str, str], float]" = PrivateAttr(default_factory=OrderedDict)
+    _score_cache_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def _score(self, query: str, documents: List[Document]) -> List[float]:
+        """Score every document against the query, reusing cached scores and batching the rest by length."""
+        scores: List[float] = [0.0] * len(documents)
+        pending: List[Tuple[int, Tuple[str, str]]] = []
+        for index, doc in enumerate(documents):
+            key = (query, md5(doc.content.encode("utf-8")).hexdigest())
+            score = self._get_cached_score(key)
+            if score is None:
+                pending.append((index, key))
+            else:
+                scores[index] = score
+
+        if not pending:
+            return scores
+
+        cross_encoder, lock = get_cross_encoder(self.model, self.max_length, self.model_kwargs)
+        # Batching pairs of similar length keeps the padding, and the compute spent on it, small
+        pending.sort(key=lambda item: len(documents[item[0]].content))
+        batch_size = max(1, self.batch_size)
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start : start + batch_size]
+            sentence_pairs = [[query, documents[index].content] for index, _ in batch]
+            with lock:
+                batch_scores = cross_encoder.predict(
+                    sentence_pairs, batch_size=len(sentence_pairs), show_progress_bar=False
+                ).tolist()
+            for (index, key), score in zip(batch, batch_scores):
+                scores[index] = score
+                self._cache_score(key, score)
+        return scores
+
+    def _get_cached_score(self, key: Tuple[str, str]) -> Optional[float]:
+        if self.score_cache_size <= 0:
+            return None
+        with self._score_cache_lock:
+            score = self._score_cache.get(key)
+            if score is not None:
+                self._score_cache.move_to_end(key)
+            return score
+
+    def _cache_score(self, key: Tuple[str, str], score: float) -> None:
+        if self.score_cache_size <= 0:
+            return
+        with self._score_cache_lock:
+            self._score_cache[key] = score
+            self._score_cache.move_to_end(key)
+            while len(self._score_cache) > self.score_cache_size:
+                self._score_cache.popitem(last=False)
 
     def _rerank(self, query: str, documents: List[Document]) -> List[Document]:
         if not documents:
             return []
 
-        sentence_transformer_client = CrossEncoder(model_name_or_path=self.model, model_kwargs=self.model_kwargs)
-
         top_n = self.top_n
         if top_n and not (0 < top_n):
             logger.warning(f"top_n should be a positive integer, got {self.top_n}, setting top_n to None")
@@ -28,9 +127,7 @@ class SentenceTransformerReranker(Reranker):
 
         compressed_docs: List[Document] = []
 
-        sentence_pairs = [[query, doc.content] for doc in documents]
-
-        scores = sentence_transformer_client.predict(sentence_pairs).tolist()
+        scores = self._score(query, documents)
         for index, score in enumerate(scores):
             doc = documents[index]
             doc.reranking_score = score
@@ -52,3 +149,7 @@ class SentenceTransformerReranker(Reranker):
         except Exception as e:
             logger.error(f"Error reranking documents: {e}. Returning original documents")
             return documents
+
+    async def arerank(self, query: str, documents: List[Document]) -> List[Document]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_rerank_executor(), self.rerank, query, documents)
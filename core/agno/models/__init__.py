@@ -0,0 +1,47 @@
+from core.agno.utils.lazy_import import lazy_attributes
+
+# Model providers are imported on first access, so only the SDKs of the providers in use are needed
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AIMLAPI": "core.agno.models.aimlapi",
+        "Claude": "core.agno.models.anthropic",
+        "AwsBedrock": "core.agno.models.aws",
+        "Cerebras": "core.agno.models.cerebras",
+        "CerebrasOpenAI": "core.agno.models.cerebras",
+        "Cohere": "core.agno.models.cohere",
+        "CometAPI": "core.agno.models.cometapi",
+        "DashScope": "core.agno.models.dashscope",
+        "DeepInfra": "core.agno.models.deepinfra",
+        "DeepSeek": "core.agno.models.deepseek",
+        "Fireworks": "core.agno.models.fireworks",
+        "Gemini": "core.agno.models.google",
+        "Groq": "core.agno.models.groq",
+        "HuggingFace": "core.agno.models.huggingface",
+        "WatsonX": "core.agno.models.ibm",
+        "InternLM": "core.agno.models.internlm",
+        "LiteLLM": "core.agno.models.litellm",
+        "LlamaCpp": "core.agno.models.llama_cpp",
+        "LMStudio": "core.agno.models.lmstudio",
+        "Llama": "core.agno.models.meta",
+        "LlamaOpenAI": "core.agno.models.meta",
+        "MistralChat": "core.agno.models.mistral",
+        "Nebius": "core.agno.models.nebius",
+        "Nexus": "core.agno.models.nexus",
+        "Nvidia": "core.agno.models.nvidia",
+        "Ollama": "core.agno.models.ollama",
+        "OpenAIChat": "core.agno.models.openai",
+        "OpenAILike": "core.agno.models.openai",
+        "OpenAIResponses": "core.agno.models.openai",
+        "OpenRouter": "core.agno.models.openrouter",
+        "Perplexity": "core.agno.models.perplexity",
+        "Portkey": "core.agno.models.portkey",
+        "Requesty": "core.agno.models.requesty",
+        "Sambanova": "core.agno.models.sambanova",
+        "Siliconflow": "core.agno.models.siliconflow",
+        "Together": "core.agno.models.together",
+        "V0": "core.agno.models.vercel",
+        "VLLM": "core.agno.models.vllm",
+        "xAI": "core.agno.models.xai",
+    },
+)
@@ -1,5 +1,6 @@
 import asyncio
 import contextlib
+import contextvars
 import json
 from collections import ChainMap, deque
 from copy import copy
@@ -168,6 +169,8 @@ class Team:
     respond_directly: bool = False
     # If True, the team leader will delegate the task to all members, instead of deciding for a subset
     delegate_task_to_all_members: bool = False
+    # Maximum number of members that run at the same time when delegating to all members
+    max_concurrent_members: int = 8
     # Set to false if you want to send the run input directly to the member agents
     determine_input_for_members: bool = True
 
@@ -415,6 +418,7 @@ class Team:
         respond_directly: bool = False,
         determine_input_for_members: bool = True,
         delegate_task_to_all_members: bool = False,
+        max_concurrent_members: int = 8,
         user_id: Optional[str] = None,
         session_id: Optional[str] = None,
         session_state: Optional[Dict[str, Any]] = None,
@@ -515,6 +519,7 @@ class Team:
         self.respond_directly = respond_directly
         self.determine_input_for_members = determine_input_for_members
         self.delegate_task_to_all_members = delegate_task_to_all_members
+        self.max_concurrent_members = max_concurrent_members
 
         self.user_id = user_id
         self.session_id = session_id
@@ -7112,13 +7117,21 @@ class Team:
                 str: The result of the delegated task.
             """
 
-            # Run all the members sequentially
-            for _, member_agent in enumerate(self.members):
+            # Run all the members concurrently on the team's member executor
+            member_runs = []
+            for member_agent in self.members:
                 member_agent_task, history = _setup_delegate_task_to_member(
                     member_agent=member_agent, task_description=task
                 )
-
-                member_session_state_copy = copy(session_state)
+                member_runs.append((member_agent, member_agent_task, history, copy(session_state)))
+
+            def run_member(
+                member_agent: Union[Agent, "Team"],
+                member_agent_task: Union[str, Message],
+                history: Optional[List[Message]],
+                member_session_state_copy: Dict[str, Any],
+                emit: Optional[Callable[[Any], None]] = None,
+            ) -> Optional[Union[TeamRunOutput, RunOutput]]:
                 if stream:
                     member_agent_run_response_stream = member_agent.run(
                         input=member_agent_task if not history else history,
@@ -7142,72 +7155,140 @@ class Team:
                         metadata=metadata,
                         yield_run_response=True,
                     )
-                    member_agent_run_response = None
                     for member_agent_run_response_chunk in member_agent_run_response_stream:
                         # If we get the final response, we can break out of the loop
                         if isinstance(member_agent_run_response_chunk, TeamRunOutput) or isinstance(
                             member_agent_run_response_chunk, RunOutput
                         ):
-                            member_agent_run_response = member_agent_run_response_chunk  # type: ignore
-                            break
+                            return member_agent_run_response_chunk  # type: ignore
 
                         # Check if the run is cancelled
                         check_if_run_cancelled(member_agent_run_response_chunk)
 
-                        # Yield the member event directly
+                        # Forward the member event to the delegating thread
                         member_agent_run_response_chunk.parent_run_id = (
                             member_agent_run_response_chunk.parent_run_id or run_response.run_id
                         )
-                        yield member_agent_run_response_chunk
+                        emit(member_agent_run_response_chunk)  # type: ignore
+                    return None
 
-                else:
-                    member_agent_run_response = member_agent.run(  # type: ignore
-                        input=member_agent_task if not history else history,
-                        user_id=user_id,
-                        # All members have the same session_id
-                        session_id=session.session_id,
-                        session_state=member_session_state_copy,  # Send a copy to the agent
-                        images=images,
-                        videos=videos,
-                        audio=audio,
-                        files=files,
-                        stream=False,
-                        knowledge_filters=knowledge_filters
-                        if not member_agent.knowledge_filters and member_agent.knowledge
-                        else None,
-                        debug_mode=debug_mode,
-                        dependencies=dependencies,
-                        add_dependencies_to_context=add_dependencies_to_context,
-                        add_session_state_to_context=add_session_state_to_context,
-                        metadata=metadata,
-                    )
+                member_agent_run_response = member_agent.run(  # type: ignore
+                    input=member_agent_task if not history else history,
+                    user_id=user_id,
+                    # All members have the same session_id
+                    session_id=session.session_id,
+                    session_state=member_session_state_copy,  # Send a copy to the agent
+                    images=images,
+                    videos=videos,
+                    audio=audio,
+                    files=files,
+                    stream=False,
+                    knowledge_filters=knowledge_filters
+                    if not member_agent.knowledge_filters and member_agent.knowledge
+                    else None,
+                    debug_mode=debug_mode,
+                    dependencies=dependencies,
+                    add_dependencies_to_context=add_dependencies_to_context,
+                    add_session_state_to_context=add_session_state_to_context,
+                    metadata=metadata,
+                )
+                check_if_run_cancelled(member_agent_run_response)  # type: ignore
+                return member_agent_run_response  # type: ignore
 
-                    check_if_run_cancelled(member_agent_run_response)  # type: ignore
+            def format_member_response(member_agent: Union[Agent, "Team"], member_agent_run_response: Any) -> str:
+                try:
+                    if member_agent_run_response.content is None and (
+                        member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0
+                    ):
+                        return f"Agent {member_agent.name}: No response from the member agent."
+                    elif isinstance(member_agent_run_response.content, str):
+                        if len(member_agent_run_response.content.strip()) > 0:
+                            return f"Agent {member_agent.name}: {member_agent_run_response.content}"
+                        elif member_agent_run_response.tools is not None and len(member_agent_run_response.tools) > 0:
+                            return f"Agent {member_agent.name}: {','.join([tool.result for tool in member_agent_run_response.tools])}"
+                    elif issubclass(type(member_agent_run_response.content), BaseModel):
+                        return f"Agent {member_agent.name}: {member_agent_run_response.content.model_dump_json(indent=2)}"
+                    else:
+                        import json
 
-                    try:
-                        if member_agent_run_response.content is None and (  # type: ignore
-                            member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0  # type: ignore
-                        ):
-                            yield f"Agent {member_agent.name}: No response from the member agent."
-                        elif isinstance(member_agent_run_response.content, str):  # type: ignore
-                            if len(member_agent_run_response.content.strip()) > 0:  # type: ignore
-                                yield f"Agent {member_agent.name}: {member_agent_run_response.content}"  # type: ignore
-                            elif (
-                                member_agent_run_response.tools is not None and len(member_agent_run_response.tools) > 0  # type: ignore
-                            ):
-                                yield f"Agent {member_agent.name}: {','.join([tool.result for tool in member_agent_run_response.tools])}"  # type: ignore
-                        elif issubclass(type(member_agent_run_response.content), BaseModel):  # type: ignore
-                            yield f"Agent {member_agent.name}: {member_agent_run_response.content.model_dump_json(indent=2)}"  # type: ignore
-                        else:
-                            import json
+                        return f"Agent {member_agent.name}: {json.dumps(member_agent_run_response.content, indent=2)}"
+                except Exception as e:
+                    return f"Agent {member_agent.name}: Error - {str(e)}"
+                return f"Agent {member_agent.name}: No Response"
 
-                            yield f"Agent {member_agent.name}: {json.dumps(member_agent_run_response.content, indent=2)}"  # type: ignore
-                    except Exception as e:
-                        yield f"Agent {member_agent.name}: Error - {str(e)}"
+            # Make sure for the member agents, we are using the agent logger
+            use_agent_logger()
 
-                _process_delegate_task_to_member(
-                    member_agent_run_response, member_agent, member_agent_task, member_session_state_copy
-                )
+            from concurrent.futures import ThreadPoolExecutor
+
+            # One pool per delegation, bounded by max_concurrent_members and shut down once the member runs finish
+            executor = ThreadPoolExecutor(
+                max_workers=max(1, min(self.max_concurrent_members, len(member_runs))),
+                thread_name_prefix="agno-member",
+            )
+            if stream:
+                # Member events are merged in arrival order; each member's own events stay in order
+                import queue as queue_module
+                import threading
+
+                events: "queue_module.Queue[Tuple[int, str, Any]]" = queue_module.Queue()
+                stop_event = threading.Event()
+
+                def stream_member(index: int) -> None:
+                    def emit(event: Any) -> None:
+                        if stop_event.is_set():
+                            raise RunCancelledException("Delegation to members was stopped")
+                        events.put((index, "event", event))
+
+                    try:
+                        member_agent, member_agent_task, history, member_session_state_copy = member_runs[index]
+                        response = run_member(member_agent, member_agent_task, history, member_session_state_copy, emit)
+                        events.put((index, "done", response))
+                    except BaseException as e:
+                        events.put((index, "error", e))
+
+                futures = [
+                    executor.submit(contextvars.copy_context().run, stream_member, index)
+                    for index in range(len(member_runs))
+                ]
+                pending = len(futures)
+                try:
+                    while pending > 0:
+                        index, kind, item = events.get()
+                        if kind == "event":
+                            yield item
+                            continue
+                        pending -= 1
+                        if kind == "error":
+                            raise item
+                        member_agent, member_agent_task, _, member_session_state_copy = member_runs[index]
+                        _process_delegate_task_to_member(
+                            item, member_agent, member_agent_task, member_session_state_copy
+                        )
+                finally:
+                    stop_event.set()
+                    for future in futures:
+                        future.cancel()
+                    executor.shutdown(wait=False)
+            else:
+                futures = [
+                    executor.submit(contextvars.copy_context().run, run_member, *member_run)
+                    for member_run in member_runs
+                ]
+                try:
+                    # Results are reported in member order, as soon as each one is available
+                    for future, (member_agent, member_agent_task, _, member_session_state_copy) in zip(
+                        futures, member_runs
+                    ):
+                        member_agent_run_response = future.result()
+                        yield format_member_response(member_agent, member_agent_run_response)
+                        _process_delegate_task_to_member(
+                            member_agent_run_response, member_agent, member_agent_task, member_session_state_copy
+                        )
+                finally:
+                    for future in futures:
+                        future.cancel()
+                    executor.shutdown(wait=False)
 
             # After all the member runs, switch back to the team logger
             use_team_logger()
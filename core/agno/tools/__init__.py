@@ -1,6 +1,7 @@
 from core.agno.tools.decorator import tool
 from core.agno.tools.function import Function, FunctionCall
 from core.agno.tools.toolkit import Toolkit
+from core.agno.utils.lazy_import import lazy_attributes
 
 __all__ = [
     "tool",
@@ -8,3 +9,120 @@ __all__ = [
     "FunctionCall",
     "Toolkit",
 ]
+
+# Toolkits are imported on first access, so only the dependencies of the toolkits in use are needed
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AgentQLTools": "core.agno.tools.agentql",
+        "AirflowTools": "core.agno.tools.airflow",
+        "CustomApiTools": "core.agno.tools.api",
+        "ApifyTools": "core.agno.tools.apify",
+        "ArxivTools": "core.agno.tools.arxiv",
+        "AWSLambdaTools": "core.agno.tools.aws_lambda",
+        "AWSSESTool": "core.agno.tools.aws_ses",
+        "BaiduSearchTools": "core.agno.tools.baidusearch",
+        "BitbucketTools": "core.agno.tools.bitbucket",
+        "BrandfetchTools": "core.agno.tools.brandfetch",
+        "BraveSearchTools": "core.agno.tools.bravesearch",
+        "BrightDataTools": "core.agno.tools.brightdata",
+        "BrowserbaseTools": "core.agno.tools.browserbase",
+        "CalComTools": "core.agno.tools.calcom",
+        "CalculatorTools": "core.agno.tools.calculator",
+        "CartesiaTools": "core.agno.tools.cartesia",
+        "ClickUpTools": "core.agno.tools.clickup",
+        "ConfluenceTools": "core.agno.tools.confluence",
+        "Crawl4aiTools": "core.agno.tools.crawl4ai",
+        "CsvTools": "core.agno.tools.csv_toolkit",
+        "DalleTools": "core.agno.tools.dalle",
+        "DaytonaTools": "core.agno.tools.daytona",
+        "DesiVocalTools": "core.agno.tools.desi_vocal",
+        "DiscordTools": "core.agno.tools.discord",
+        "DockerTools": "core.agno.tools.docker",
+        "DuckDbTools": "core.agno.tools.duckdb",
+        "DuckDuckGoTools": "core.agno.tools.duckduckgo",
+        "E2BTools": "core.agno.tools.e2b",
+        "ElevenLabsTools": "core.agno.tools.eleven_labs",
+        "EmailTools": "core.agno.tools.email",
+        "EvmTools": "core.agno.tools.evm",
+        "ExaTools": "core.agno.tools.exa",
+        "FalTools": "core.agno.tools.fal",
+        "FileTools": "core.agno.tools.file",
+        "FileGenerationTools": "core.agno.tools.file_generation",
+        "FinancialDatasetsTools": "core.agno.tools.financial_datasets",
+        "FirecrawlTools": "core.agno.tools.firecrawl",
+        "GiphyTools": "core.agno.tools.giphy",
+        "GithubTools": "core.agno.tools.github",
+        "GmailTools": "core.agno.tools.gmail",
+        "GoogleBigQueryTools": "core.agno.tools.google_bigquery",
+        "GoogleDriveTools": "core.agno.tools.google_drive",
+        "GoogleMapTools": "core.agno.tools.google_maps",
+        "GoogleCalendarTools": "core.agno.tools.googlecalendar",
+        "GoogleSearchTools": "core.agno.tools.googlesearch",
+        "GoogleSheetsTools": "core.agno.tools.googlesheets",
+        "HackerNewsTools": "core.agno.tools.hackernews",
+        "JinaReaderTools": "core.agno.tools.jina",
+        "JiraTools": "core.agno.tools.jira",
+        "KnowledgeTools": "core.agno.tools.knowledge",
+        "LinearTools": "core.agno.tools.linear",
+        "LinkupTools": "core.agno.tools.linkup",
+        "LocalFileSystemTools": "core.agno.tools.local_file_system",
+        "LumaLabTools": "core.agno.tools.lumalab",
+        "MCPTools": "core.agno.tools.mcp",
+        "MultiMCPTools": "core.agno.tools.mcp",
+        "Mem0Tools": "core.agno.tools.mem0",
+        "MemoriTools": "core.agno.tools.memori",
+        "MemoryTools": "core.agno.tools.memory",
+        "MLXTranscribeTools": "core.agno.tools.mlx_transcribe",
+        "ModelsLabTools": "core.agno.tools.models_labs",
+        "MoviePyVideoTools": "core.agno.tools.moviepy_video",
+        "Neo4jTools": "core.agno.tools.neo4j",
+        "NewspaperTools": "core.agno.tools.newspaper",
+        "Newspaper4kTools": "core.agno.tools.newspaper4k",
+        "OpenAITools": "core.agno.tools.openai",
+        "OpenBBTools": "core.agno.tools.openbb",
+        "OpenCVTools": "core.agno.tools.opencv",
+        "OpenWeatherTools": "core.agno.tools.openweather",
+        "OxylabsTools": "core.agno.tools.oxylabs",
+        "PandasTools": "core.agno.tools.pandas",
+        "PostgresTools": "core.agno.tools.postgres",
+        "PubmedTools": "core.agno.tools.pubmed",
+        "PythonTools": "core.agno.tools.python",
+        "ReasoningTools": "core.agno.tools.reasoning",
+        "RedditTools": "core.agno.tools.reddit",
+        "ReplicateTools": "core.agno.tools.replicate",
+        "ResendTools": "core.agno.tools.resend",
+        "ScrapeGraphTools": "core.agno.tools.scrapegraph",
+        "Searxng": "core.agno.tools.searxng",
+        "SerpApiTools": "core.agno.tools.serpapi",
+        "SerperTools": "core.agno.tools.serper",
+        "ShellTools": "core.agno.tools.shell",
+        "SlackTools": "core.agno.tools.slack",
+        "SleepTools": "core.agno.tools.sleep",
+        "SpiderTools": "core.agno.tools.spider",
+        "SQLTools": "core.agno.tools.sql",
+        "TavilyTools": "core.agno.tools.tavily",
+        "TelegramTools": "core.agno.tools.telegram",
+        "TodoistTools": "core.agno.tools.todoist",
+        "TrafilaturaTools": "core.agno.tools.trafilatura",
+        "TrelloTools": "core.agno.tools.trello",
+        "TwilioTools": "core.agno.tools.twilio",
+        "UserControlFlowTools": "core.agno.tools.user_control_flow",
+        "ValyuTools": "core.agno.tools.valyu",
+        "VisualizationTools": "core.agno.tools.visualization",
+        "WebBrowserTools": "core.agno.tools.webbrowser",
+        "WebexTools": "core.agno.tools.webex",
+        "WebsiteTools": "core.agno.tools.website",
+        "WebTools": "core.agno.tools.webtools",
+        "WhatsAppTools": "core.agno.tools.whatsapp",
+        "WikipediaTools": "core.agno.tools.wikipedia",
+        "WorkflowTools": "core.agno.tools.workflow",
+        "XTools": "core.agno.tools.x",
+        "YFinanceTools": "core.agno.tools.yfinance",
+        "YouTubeTools": "core.agno.tools.youtube",
+        "ZendeskTools": "core.agno.tools.zendesk",
+        "ZepTools": "core.agno.tools.zep",
+        "ZepAsyncTools": "core.agno.tools.zep",
+        "ZoomTools": "core.agno.tools.zoom",
+    },
+)
@@ -0,0 +1,284 @@
+"""Two-tier cache for tool call results.
+
+Results are kept in an in-process LRU in front of a single SQLite store per cache directory.
+The store indexes entries by expiry and last access so expired rows can be purged and the
+least recently used rows evicted once the store grows past its byte budget. The total size of
+the store is kept in the database by triggers, so caches sharing a directory, in this process
+or in others, evict against the same total.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from tempfile import gettempdir
+from time import time
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+
+from core.agno.utils.log import log_debug, log_error
+
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Seconds between writes of in-memory hits to the last access times of the store
+ACCESS_FLUSH_INTERVAL = 1.0
+
+
+class ToolResultCache:
+    """Bounded tool result cache backed by an in-memory LRU and a SQLite store."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ):
+        base_cache_dir = Path(cache_dir) if cache_dir else Path(gettempdir()) / "agno_cache"
+        base_cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_file: Path = base_cache_dir / "tool_results.db"
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+
+        # In-memory tier: key -> (expires_at, serialized result). Results are kept serialized so
+        # every caller gets its own copy and cannot mutate what later callers receive.
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+        # Hits served from memory, key -> access time, written to the store in batches so
+        # frequently used results are not evicted from it as least recently used
+        self._pending_access: Dict[str, float] = {}
+        self._last_access_flush = time()
+
+        # Persistent tier, shared by all threads of this process
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_file), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tool_results (
+                key TEXT PRIMARY KEY,
+                function_name TEXT NOT NULL,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tool_results_expires_at ON tool_results (expires_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tool_results_last_access ON tool_results (last_access)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tool_results_size (id INTEGER PRIMARY KEY CHECK (id = 0), total INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "INSERT OR IGNORE INTO tool_results_size (id, total) "
+            "SELECT 0, COALESCE(SUM(size), 0) FROM tool_results"
+        )
+        self._conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS tool_results_size_insert AFTER INSERT ON tool_results BEGIN "
+            "UPDATE tool_results_size SET total = total + NEW.size WHERE id = 0; END"
+        )
+        self._conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS tool_results_size_update AFTER UPDATE OF size ON tool_results BEGIN "
+            "UPDATE tool_results_size SET total = total + NEW.size - OLD.size WHERE id = 0; END"
+        )
+        self._conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS tool_results_size_delete AFTER DELETE ON tool_results BEGIN "
+            "UPDATE tool_results_size SET total = total - OLD.size WHERE id = 0; END"
+        )
+
+        # Single-flight bookkeeping: key -> [lock, number of waiters]
+        self._flight_guard = threading.Lock()
+        self._flights: Dict[str, list] = {}
+        self._async_flights: Dict[Tuple[int, str], list] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached result for `key`, or None if it is missing or expired."""
+        now = time()
+        value = None
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] >= now:
+                    self._memory.move_to_end(key)
+                    value = entry[1]
+                    self._pending_access[key] = now
+                else:
+                    del self._memory[key]
+            flush_access = now - self._last_access_flush >= ACCESS_FLUSH_INTERVAL
+        if value is not None:
+            if flush_access:
+                try:
+                    with self._db_lock:
+                        self._write_pending_access()
+                except Exception as e:
+                    log_error(f"Error updating cache access times: {e}")
+            return json.loads(value)
+
+        try:
+            with self._db_lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM tool_results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                if row[1] < now:
+                    self._delete_expired(now)
+                    return None
+                self._conn.execute("UPDATE tool_results SET last_access = ? WHERE key = ?", (now, key))
+            result = json.loads(row[0])
+        except Exception as e:
+            log_error(f"Error reading cache: {e}")
+            return None
+
+        self._remember(key, row[1], row[0])
+        return result
+
+    def set(self, key: str, result: Any, ttl: int, function_name: str = "") -> None:
+        """Store `result` under `key` for `ttl` seconds."""
+        try:
+            value = json.dumps(result)
+        except Exception as e:
+            log_error(f"Error writing cache: {e}")
+            return
+
+        now = time()
+        expires_at = now + ttl
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            log_debug(f"Result of {function_name} is larger than the cache budget, not caching")
+            return
+
+        try:
+            with self._db_lock:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    # An upsert rather than INSERT OR REPLACE, which would bypass the delete trigger
+                    self._conn.execute(
+                        "INSERT INTO tool_results "
+                        "(key, function_name, value, size, created_at, expires_at, last_access) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT (key) DO UPDATE SET function_name = excluded.function_name, "
+                        "value = excluded.value, size = excluded.size, created_at = excluded.created_at, "
+                        "expires_at = excluded.expires_at, last_access = excluded.last_access",
+                        (key, function_name, value, size, now, expires_at, now),
+                    )
+                    if self._total_bytes() > self.max_bytes:
+                        self._evict(now)
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        except Exception as e:
+            log_error(f"Error writing cache: {e}")
+            return
+
+        self._remember(key, expires_at, value)
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._memory_lock:
+            self._memory.clear()
+            self._pending_access.clear()
+        with self._db_lock:
+            self._conn.execute("DELETE FROM tool_results")
+
+    @contextmanager
+    def single_flight(self, key: str) -> Iterator[None]:
+        """Serialize threads computing the same key so only the first one runs the tool."""
+        with self._flight_guard:
+            flight = self._flights.setdefault(key, [threading.Lock(), 0])
+            flight[1] += 1
+        try:
+            with flight[0]:
+                yield
+        finally:
+            with self._flight_guard:
+                flight[1] -= 1
+                if flight[1] == 0:
+                    self._flights.pop(key, None)
+
+    @asynccontextmanager
+    async def asingle_flight(self, key: str) -> AsyncIterator[None]:
+        """Serialize coroutines on the running loop computing the same key."""
+        flight_key = (id(asyncio.get_running_loop()), key)
+        with self._flight_guard:
+            flight = self._async_flights.setdefault(flight_key, [asyncio.Lock(), 0])
+            flight[1] += 1
+        try:
+            async with flight[0]:
+                yield
+        finally:
+            with self._flight_guard:
+                flight[1] -= 1
+                if flight[1] == 0:
+                    self._async_flights.pop(flight_key, None)
+
+    def _remember(self, key: str, expires_at: float, value: str) -> None:
+        with self._memory_lock:
+            self._memory[key] = (expires_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _write_pending_access(self) -> None:
+        """Write the access times of hits served from memory to the store. Must hold the db lock."""
+        with self._memory_lock:
+            pending, self._pending_access = self._pending_access, {}
+            self._last_access_flush = time()
+        if pending:
+            self._conn.executemany(
+                "UPDATE tool_results SET last_access = MAX(last_access, ?) WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in pending.items()],
+            )
+
+    def _total_bytes(self) -> int:
+        """Size of every entry in the store, across all caches sharing it. Must hold the db lock."""
+        return self._conn.execute("SELECT total FROM tool_results_size WHERE id = 0").fetchone()[0]
+
+    def _delete_expired(self, now: float) -> None:
+        """Purge expired rows. Must be called while holding the db lock."""
+        self._conn.execute("DELETE FROM tool_results WHERE expires_at < ?", (now,))
+
+    def _evict(self, now: float) -> None:
+        """Drop expired rows, then least recently used rows until under budget. Must hold the db lock."""
+        self._write_pending_access()
+        self._delete_expired(now)
+        excess = self._total_bytes() - self.max_bytes
+        if excess <= 0:
+            return
+
+        evicted = []
+        for key, size in self._conn.execute("SELECT key, size FROM tool_results ORDER BY last_access"):
+            evicted.append(key)
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM tool_results WHERE key = ?", [(key,) for key in evicted])
+        with self._memory_lock:
+            for key in evicted:
+                self._memory.pop(key, None)
+        log_debug(f"Evicted {len(evicted)} tool results from cache")
+
+
+_caches: Dict[Tuple[str, int, int], ToolResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_tool_result_cache(
+    cache_dir: Optional[str] = None,
+    max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+) -> ToolResultCache:
+    """Return the process-wide cache for `cache_dir` and limits, creating it on first use."""
+    cache_key = (str(Path(cache_dir).resolve()) if cache_dir else "", max_entries, max_bytes)
+    with _caches_lock:
+        cache = _caches.get(cache_key)
+        if cache is None:
+            cache = ToolResultCache(cache_dir=cache_dir, max_entries=max_entries, max_bytes=max_bytes)
+            _caches[cache_key] = cache
+        return cache
@@ -76,6 +76,8 @@ def tool(
     cache_results: bool = False,
     cache_dir: Optional[str] = None,
     cache_ttl: int = 3600,
+    cache_max_entries: int = 1024,
+    cache_max_bytes: int = 256 * 1024 * 1024,
 ) -> Callable[[F], Function]: ...
 
 
@@ -104,6 +106,8 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
         cache_results: bool - If True, enable caching of function results
         cache_dir: Optional[str] - Directory to store cache files
         cache_ttl: int - Time-to-live for cached results in seconds
+        cache_max_entries: int - Maximum number of results kept in the in-process LRU
+        cache_max_bytes: int - Maximum size of the persistent cache before least recently used results are evicted
 
     Returns:
         Union[Function, Callable[[F], Function]]: Decorated function or decorator
@@ -141,6 +145,8 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
             "cache_results",
             "cache_dir",
             "cache_ttl",
+            "cache_max_entries",
+            "cache_max_bytes",
         }
     )
 
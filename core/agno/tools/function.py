@@ -9,7 +9,7 @@ from pydantic import BaseModel, Field, validate_call
 
 from core.agno.exceptions import AgentRunException
 from core.agno.media import Audio, File, Image, Video
-from core.agno.utils.log import log_debug, log_error, log_exception, log_warning
+from core.agno.utils.log import log_debug, log_exception, log_warning
 
 T = TypeVar("T")
 
@@ -116,6 +116,10 @@ class Function(BaseModel):
     cache_results: bool = False
     cache_dir: Optional[str] = None
     cache_ttl: int = 3600
+    # Maximum number of results kept in the in-process LRU tier
+    cache_max_entries: int = 1024
+    # Maximum size in bytes of the persistent tier before least recently used results are evicted
+    cache_max_bytes: int = 256 * 1024 * 1024
 
     # --*-- FOR INTERNAL USE ONLY --*--
     # The agent that the function is associated with
@@ -501,53 +505,21 @@ class Function(BaseModel):
         key_str = f"{self.name}:{args_str}:{kwargs_str}"
         return md5(key_str.encode()).hexdigest()
 
-    def _get_cache_file_path(self, cache_key: str) -> str:
-        """Get the full path for the cache file."""
-        from pathlib import Path
-        from tempfile import gettempdir
+    def _get_cache(self):
+        """Get the shared result cache for this function's cache directory."""
+        from core.agno.tools.cache import get_tool_result_cache
 
-        base_cache_dir = self.cache_dir or Path(gettempdir()) / "agno_cache"
-        func_cache_dir = Path(base_cache_dir) / "functions" / self.name
-        func_cache_dir.mkdir(parents=True, exist_ok=True)
-        return str(func_cache_dir / f"{cache_key}.json")
+        return get_tool_result_cache(
+            cache_dir=self.cache_dir, max_entries=self.cache_max_entries, max_bytes=self.cache_max_bytes
+        )
 
-    def _get_cached_result(self, cache_file: str) -> Optional[Any]:
+    def _get_cached_result(self, cache_key: str) -> Optional[Any]:
         """Retrieve cached result if valid."""
-        import json
-        from pathlib import Path
-        from time import time
-
-        cache_path = Path(cache_file)
-        if not cache_path.exists():
-            return None
-
-        try:
-            with cache_path.open("r") as f:
-                cache_data = json.load(f)
-
-            timestamp = cache_data.get("timestamp", 0)
-            result = cache_data.get("result")
+        return self._get_cache().get(cache_key)
 
-            if time() - timestamp <= self.cache_ttl:
-                return result
-
-            # Remove expired entry
-            cache_path.unlink()
-        except Exception as e:
-            log_error(f"Error reading cache: {e}")
-
-        return None
-
-    def _save_to_cache(self, cache_file: str, result: Any):
+    def _save_to_cache(self, cache_key: str, result: Any):
         """Save result to cache."""
-        import json
-        from time import time
-
-        try:
-            with open(cache_file, "w") as f:
-                json.dump({"timestamp": time(), "result": result}, f)
-        except Exception as e:
-            log_error(f"Error writing cache: {e}")
+        self._get_cache().set(cache_key, result, ttl=self.cache_ttl, function_name=self.name)
 
 
 class FunctionExecutionResult(BaseModel):
@@ -777,7 +749,7 @@ class FunctionCall(BaseModel):
 
     def execute(self) -> FunctionExecutionResult:
         """Runs the function call."""
-        from inspect import isgenerator, isgeneratorfunction
+        from inspect import isgeneratorfunction
 
         if self.function.entrypoint is None:
             return FunctionExecutionResult(status="failure", error="Entrypoint is not set")
@@ -792,13 +764,27 @@ class FunctionCall(BaseModel):
         # Check cache if enabled and not a generator function
         if self.function.cache_results and not isgeneratorfunction(self.function.entrypoint):
             cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
-
+            cached_result = self.function._get_cached_result(cache_key)
             if cached_result is not None:
-                log_debug(f"Cache hit for: {self.get_call_str()}")
-                self.result = cached_result
-                return FunctionExecutionResult(status="success", result=cached_result)
+                return self._cache_hit(cached_result)
+
+            # Identical concurrent calls wait for the first one instead of running the tool again
+            with self.function._get_cache().single_flight(cache_key):
+                cached_result = self.function._get_cached_result(cache_key)
+                if cached_result is not None:
+                    return self._cache_hit(cached_result)
+                return self._run(entrypoint_args, cache_key=cache_key)
+
+        return self._run(entrypoint_args)
+
+    def _cache_hit(self, cached_result: Any) -> FunctionExecutionResult:
+        log_debug(f"Cache hit for: {self.get_call_str()}")
+        self.result = cached_result
+        return FunctionExecutionResult(status="success", result=cached_result)
+
+    def _run(self, entrypoint_args: Dict[str, Any], cache_key: Optional[str] = None) -> FunctionExecutionResult:
+        """Runs the entrypoint and the post-hook, storing the result under `cache_key` if given."""
+        from inspect import isgenerator
 
         # Execute function
         execution_result = None
@@ -822,10 +808,8 @@ class FunctionCall(BaseModel):
             else:
                 self.result = result
                 # Only cache non-generator results
-                if self.function.cache_results:
-                    cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                    cache_file = self.function._get_cache_file_path(cache_key)
-                    self.function._save_to_cache(cache_file, self.result)
+                if cache_key is not None:
+                    self.function._save_to_cache(cache_key, self.result)
 
             execution_result = FunctionExecutionResult(
                 status="success", result=self.result, updated_session_state=updated_session_state
@@ -973,7 +957,7 @@ class FunctionCall(BaseModel):
 
     async def aexecute(self) -> FunctionExecutionResult:
         """Runs the function call asynchronously."""
-        from inspect import isasyncgen, isasyncgenfunction, iscoroutinefunction, isgenerator, isgeneratorfunction
+        from inspect import isasyncgenfunction, iscoroutinefunction, isgeneratorfunction
 
         if self.function.entrypoint is None:
             return FunctionExecutionResult(status="failure", error="Entrypoint is not set")
@@ -993,12 +977,24 @@ class FunctionCall(BaseModel):
             isasyncgenfunction(self.function.entrypoint) or isgeneratorfunction(self.function.entrypoint)
         ):
             cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
+            cached_result = self.function._get_cached_result(cache_key)
             if cached_result is not None:
-                log_debug(f"Cache hit for: {self.get_call_str()}")
-                self.result = cached_result
-                return FunctionExecutionResult(status="success", result=cached_result)
+                return self._cache_hit(cached_result)
+
+            # Identical concurrent calls wait for the first one instead of running the tool again
+            async with self.function._get_cache().asingle_flight(cache_key):
+                cached_result = self.function._get_cached_result(cache_key)
+                if cached_result is not None:
+                    return self._cache_hit(cached_result)
+                return await self._arun(entrypoint_args, cache_key=cache_key)
+
+        return await self._arun(entrypoint_args)
+
+    async def _arun(
+        self, entrypoint_args: Dict[str, Any], cache_key: Optional[str] = None
+    ) -> FunctionExecutionResult:
+        """Runs the entrypoint and the post-hook asynchronously, storing the result under `cache_key` if given."""
+        from inspect import isasyncgen, isasyncgenfunction, iscoroutinefunction, isgenerator
 
         # Execute function
         execution_result = None
@@ -1021,10 +1017,8 @@ class FunctionCall(BaseModel):
                     self.result = await result
 
             # Only cache if not a generator
-            if self.function.cache_results and not (isgenerator(self.result) or isasyncgen(self.result)):
-                cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                cache_file = self.function._get_cache_file_path(cache_key)
-                self.function._save_to_cache(cache_file, self.result)
+            if cache_key is not None and not (isgenerator(self.result) or isasyncgen(self.result)):
+                self.function._save_to_cache(cache_key, self.result)
 
             updated_session_state = None
             if entrypoint_args.get("session_state") is not None:
@@ -21,6 +21,8 @@ class Toolkit:
         cache_results: bool = False,
         cache_ttl: int = 3600,
         cache_dir: Optional[str] = None,
+        cache_max_entries: int = 1024,
+        cache_max_bytes: int = 256 * 1024 * 1024,
         auto_register: bool = True,
     ):
         """Initialize a new Toolkit.
@@ -37,6 +39,8 @@ class Toolkit:
             cache_results (bool): Enable in-memory caching of function results.
             cache_ttl (int): Time-to-live for cached results in seconds.
             cache_dir (Optional[str]): Directory to store cache files. Defaults to system temp dir.
+            cache_max_entries (int): Maximum number of results kept in the in-process LRU.
+            cache_max_bytes (int): Maximum size of the persistent cache before least recently used results are evicted.
             auto_register (bool): Whether to automatically register all methods in the class.
             stop_after_tool_call_tools (Optional[List[str]]): List of function names that should stop the agent after execution.
             show_result_tools (Optional[List[str]]): List of function names whose results should be shown.
@@ -63,6 +67,8 @@ class Toolkit:
         self.cache_results: bool = cache_results
         self.cache_ttl: int = cache_ttl
         self.cache_dir: Optional[str] = cache_dir
+        self.cache_max_entries: int = cache_max_entries
+        self.cache_max_bytes: int = cache_max_bytes
 
         # Automatically register all methods if auto_register is True
         if auto_register and self.tools:
@@ -128,6 +134,8 @@ class Toolkit:
                 cache_results=self.cache_results,
                 cache_dir=self.cache_dir,
                 cache_ttl=self.cache_ttl,
+                cache_max_entries=self.cache_max_entries,
+                cache_max_bytes=self.cache_max_bytes,
                 requires_confirmation=tool_name in self.requires_confirmation_tools,
                 external_execution=tool_name in self.external_execution_required_tools,
                 stop_after_tool_call=tool_name in self.stop_after_tool_call_tools,
@@ -0,0 +1,36 @@
+"""Lazy module attributes for package ``__init__`` files.
+
+A package lists the names it re-exports together with the module defining each one, and that module is
+only imported the first time the name is accessed. Optional backends then only need their dependencies
+installed, and only cost import time, when they are actually used.
+"""
+
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_attributes(package: str, attributes: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build the module-level ``__getattr__`` and ``__dir__`` of `package`.
+
+    Args:
+        package (str): The ``__name__`` of the package.
+        attributes (Dict[str, str]): Exported name -> module that defines it.
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: The ``__getattr__`` and ``__dir__`` functions.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_path = attributes.get(name)
+        if module_path is None:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+        value = getattr(import_module(module_path), name)
+        # Cache it on the package so later lookups do not go through __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return __getattr__, __dir__
@@ -1,4 +1,102 @@
-from typing import Any, Dict, List
+from copy import deepcopy
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, complex, type(None))
+
+
+class CopyOnWriteDict(dict):
+    """
+    A session state view that shares its values with the state it was created from.
+    A value is deep-copied only when first read or written through this view, so branches that touch
+    a few keys of a large state never pay for copying the rest of it.
+    """
+
+    def __init__(self, base: Dict[str, Any]):
+        super().__init__(base)
+        # Keys whose value belongs to this view (copied on access, assigned or deleted)
+        self._touched: Set[str] = set()
+
+    def _own(self, key: str) -> Any:
+        value = dict.__getitem__(self, key)
+        if key not in self._touched:
+            if not isinstance(value, _IMMUTABLE_TYPES):
+                value = deepcopy(value)
+                dict.__setitem__(self, key, value)
+            self._touched.add(key)
+        return value
+
+    def _own_all(self) -> None:
+        for key in list(dict.keys(self)):
+            self._own(key)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._own(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        dict.__setitem__(self, key, value)
+        self._touched.add(key)
+
+    def __delitem__(self, key: str) -> None:
+        dict.__delitem__(self, key)
+        self._touched.add(key)
+
+    def __iter__(self) -> Iterator[str]:
+        # Defining __iter__ keeps dict(view) and {**view} off the C fast path, so they read through __getitem__
+        return iter(list(dict.keys(self)))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._own(key) if key in self else default
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self._own(key)
+
+    def pop(self, key: str, *args: Any) -> Any:
+        if key in self:
+            value = self._own(key)
+            del self[key]
+            return value
+        return dict.pop(self, key, *args)
+
+    def popitem(self) -> Tuple[str, Any]:
+        key = next(reversed(list(dict.keys(self))))
+        return key, self.pop(key)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        self._touched.update(dict.keys(self))
+        dict.clear(self)
+
+    def values(self):  # type: ignore[override]
+        self._own_all()
+        return dict.values(self)
+
+    def items(self):  # type: ignore[override]
+        self._own_all()
+        return dict.items(self)
+
+    def changes(self) -> Dict[str, Any]:
+        """The keys read or written through this view, with their current values"""
+        return {key: dict.__getitem__(self, key) for key in self._touched if key in self}
+
+    def __copy__(self) -> "CopyOnWriteDict":
+        # Shallow copy semantics: values already owned by this view are shared, the rest stay lazily copied
+        clone = CopyOnWriteDict.__new__(CopyOnWriteDict)
+        dict.__init__(clone, dict(dict.items(self)))
+        clone._touched = set(self._touched)
+        return clone
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        self._own_all()
+        return deepcopy(dict(dict.items(self)), memo)
+
+    def __reduce__(self):
+        self._own_all()
+        return (dict, (dict(dict.items(self)),))
 
 
 def merge_dictionaries(a: Dict[str, Any], b: Dict[str, Any]) -> None:
@@ -13,6 +111,10 @@ def merge_dictionaries(a: Dict[str, Any], b: Dict[str, Any]) -> None:
     Returns:
         None: The function modifies the first dictionary in place.
     """
+    if isinstance(b, CopyOnWriteDict):
+        # Untouched keys still hold the values they were created from, so there is nothing to merge
+        b = b.changes()
+
     for key in b:
         if key in a and isinstance(a[key], dict) and isinstance(b[key], dict):
             merge_dictionaries(a[key], b[key])
@@ -31,6 +133,8 @@ def merge_parallel_session_states(original_state: Dict[str, Any], modified_state
     # Collect all actual changes (keys where value differs from original)
     all_changes = {}
     for modified_state in modified_states:
+        if isinstance(modified_state, CopyOnWriteDict):
+            modified_state = modified_state.changes()
         if modified_state:
             for key, value in modified_state.items():
                 if key not in original_state or original_state[key] != value:
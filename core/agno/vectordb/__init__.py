@@ -1,3 +1,30 @@
+from core.agno.utils.lazy_import import lazy_attributes
 from core.agno.vectordb.base import VectorDb
 
 __all__ = ["VectorDb"]
+
+# Vector databases are imported on first access, so only the clients of the backend in use are needed
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Cassandra": "core.agno.vectordb.cassandra",
+        "ChromaDb": "core.agno.vectordb.chroma",
+        "Clickhouse": "core.agno.vectordb.clickhouse",
+        "Distance": "core.agno.vectordb.distance",
+        "CouchbaseSearch": "core.agno.vectordb.couchbase",
+        "LanceDb": "core.agno.vectordb.lancedb",
+        "SearchType": "core.agno.vectordb.search",
+        "LangChainVectorDb": "core.agno.vectordb.langchaindb",
+        "LightRag": "core.agno.vectordb.lightrag",
+        "LlamaIndexVectorDb": "core.agno.vectordb.llamaindex",
+        "Milvus": "core.agno.vectordb.milvus",
+        "MongoDb": "core.agno.vectordb.mongodb",
+        "PgVector": "core.agno.vectordb.pgvector",
+        "PineconeDb": "core.agno.vectordb.pineconedb",
+        "Qdrant": "core.agno.vectordb.qdrant",
+        "SingleStore": "core.agno.vectordb.singlestore",
+        "SurrealDb": "core.agno.vectordb.surrealdb",
+        "UpstashVectorDb": "core.agno.vectordb.upstashdb",
+        "Weaviate": "core.agno.vectordb.weaviate",
+    },
+)
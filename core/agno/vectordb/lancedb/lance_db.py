@@ -41,6 +41,7 @@ class LanceDb(VectorDb):
         use_tantivy: Whether to use Tantivy for full text search.
         on_bad_vectors: What to do if the vector is bad. One of "error", "drop", "fill", "null".
         fill_value: The value to fill the vector with if on_bad_vectors is "fill".
+        id_check_batch_size: The number of ids checked per `IN` query when inserting documents.
     """
 
     def __init__(
@@ -63,6 +64,7 @@ class LanceDb(VectorDb):
         use_tantivy: bool = True,
         on_bad_vectors: Optional[str] = None,  # One of "error", "drop", "fill", "null".
         fill_value: Optional[float] = None,  # Only used if on_bad_vectors is "fill"
+        id_check_batch_size: int = 500,
     ):
         # Dynamic ID generation based on unique identifiers
         if id is None:
@@ -143,7 +145,9 @@ class LanceDb(VectorDb):
         self.nprobes: Optional[int] = nprobes
         self.on_bad_vectors: Optional[str] = on_bad_vectors
         self.fill_value: Optional[float] = fill_value
+        self.id_check_batch_size: int = id_check_batch_size
         self.fts_index_exists = False
+        self.filter_index_exists = False
         self.use_tantivy = use_tantivy
 
         if self.use_tantivy and (self.search_type in [SearchType.keyword, SearchType.hybrid]):
@@ -181,14 +185,19 @@ class LanceDb(VectorDb):
 
     async def _get_async_connection(self) -> lancedb.AsyncConnection:
         """Get or create an async connection to LanceDB."""
+        # Concurrent inserts can race here, so keep whichever connection and table were set first
         if self.async_connection is None:
-            self.async_connection = await lancedb.connect_async(self.uri)
+            async_connection = await lancedb.connect_async(self.uri)
+            if self.async_connection is None:
+                self.async_connection = async_connection
         # Only try to open table if it exists and we don't have it already
         if self.async_table is None:
             table_names = await self.async_connection.table_names()
             if self.table_name in table_names:
                 try:
-                    self.async_table = await self.async_connection.open_table(self.table_name)
+                    async_table = await self.async_connection.open_table(self.table_name)
+                    if self.async_table is None:
+                        self.async_table = async_table
                 except ValueError:
                     # Table might have been dropped by another operation
                     pass
@@ -246,9 +255,49 @@ class LanceDb(VectorDb):
                 vector_field,
                 pa.field(self._id, pa.string()),
                 pa.field("payload", pa.string()),
+                # Promoted from the payload so filters and deletes run as `where` clauses inside LanceDB
+                pa.field("content_id", pa.string()),
+                pa.field("content_hash", pa.string()),
+                pa.field("meta_filters", pa.list_(pa.string())),
             ]
         )
 
+    @property
+    def _has_filter_columns(self) -> bool:
+        """Tables created before the filter columns were added only hold the JSON payload."""
+        return self.table is not None and "meta_filters" in self.table.schema.names
+
+    @staticmethod
+    def _meta_filter_terms(meta_data: Optional[Dict[str, Any]]) -> List[str]:
+        """Encode metadata as `key=<json value>` terms so equality filters become list containment."""
+        if not meta_data:
+            return []
+        return [f"{key}={json.dumps(value, sort_keys=True, default=str)}" for key, value in meta_data.items()]
+
+    @staticmethod
+    def _sql_literal(value: str) -> str:
+        return "'" + value.replace("'", "''") + "'"
+
+    def _filters_where(self, filters: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Build a `where` clause matching documents whose metadata contains every filter key and value."""
+        if not filters or not self._has_filter_columns:
+            return None
+        terms = ", ".join(self._sql_literal(term) for term in self._meta_filter_terms(filters))
+        return f"array_has_all(meta_filters, [{terms}])"
+
+    def _ensure_filter_index(self) -> None:
+        """Create a label list index on the metadata terms the first time a filtered search runs."""
+        if self.filter_index_exists or self.table is None:
+            return
+        try:
+            indexed_columns = {column for index in self.table.list_indices() for column in index.columns}
+            if "meta_filters" not in indexed_columns:
+                self.table.create_scalar_index("meta_filters", index_type="LABEL_LIST")
+            self.filter_index_exists = True
+        except Exception as e:
+            # Unindexed filters still run inside LanceDB, just without the index
+            log_debug(f"Could not create metadata filter index: {e}")
+
     def _init_table(self) -> lancedb.db.LanceTable:
         schema = self._base_schema()
 
@@ -269,8 +318,7 @@ class LanceDb(VectorDb):
         """
         try:
             if self.table is not None:
-                cleaned_content = document.content.replace("\x00", "\ufffd")
-                doc_id = md5(cleaned_content.encode()).hexdigest()
+                doc_id = md5(self._clean_content(document).encode()).hexdigest()
                 result = self.table.search().where(f"{self._id}='{doc_id}'").to_arrow()
                 return len(result) > 0
         except Exception:
@@ -293,59 +341,178 @@ class LanceDb(VectorDb):
             self.table = self.connection.open_table(name=self.table_name)
         return self.doc_exists(document)
 
-    def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """
-        Insert documents into the database.
+    @staticmethod
+    def _clean_content(document: Document) -> str:
+        return document.content.replace("\x00", "\ufffd")
 
-        Args:
-            documents (List[Document]): List of documents to insert
-            filters (Optional[Dict[str, Any]]): Filters to add as metadata to documents
-        """
-        if len(documents) <= 0:
-            log_info("No documents to insert")
-            return
+    def _existing_ids(self, ids: List[str]) -> set:
+        """Return the subset of `ids` already stored in the table, using batched `IN` queries."""
+        existing: set = set()
+        if self.table is None or not ids:
+            return existing
 
-        log_debug(f"Inserting {len(documents)} documents")
-        data = []
+        for i in range(0, len(ids), self.id_check_batch_size):
+            batch_ids = ids[i : i + self.id_check_batch_size]
+            id_list = ", ".join(f"'{doc_id}'" for doc_id in batch_ids)
+            try:
+                result = (
+                    self.table.search()
+                    .where(f"{self._id} IN ({id_list})")
+                    .select([self._id])
+                    .limit(len(batch_ids))
+                    .to_arrow()
+                )
+                existing.update(result.column(self._id).to_pylist())
+            except Exception:
+                # Search sometimes fails with stale cache data, it means the docs don't exist
+                continue
+        return existing
 
-        for document in documents:
-            if self.doc_exists(document):
+    def _new_documents(self, documents: List[Document]) -> List[tuple]:
+        """Pair each document with its id, dropping documents already stored or repeated in the batch."""
+        ids = [md5(self._clean_content(document).encode()).hexdigest() for document in documents]
+        seen = self._existing_ids(list(dict.fromkeys(ids)))
+
+        new_documents = []
+        for doc_id, document in zip(ids, documents):
+            if doc_id in seen:
                 continue
+            seen.add(doc_id)
+            new_documents.append((doc_id, document))
+        return new_documents
+
+    @staticmethod
+    def _is_rate_limit_error(error: Exception) -> bool:
+        error_str = str(error).lower()
+        return any(
+            phrase in error_str
+            for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
+        )
 
+    def _embed_documents(self, documents: List[Document]) -> None:
+        """Embed documents, using the embedder's batch API in `batch_size` groups when available."""
+        if not self.embedder.supports_batch:
+            for document in documents:
+                document.embed(embedder=self.embedder)
+            return
+
+        batch_size = self.embedder.batch_size
+        for i in range(0, len(documents), batch_size):
+            batch = documents[i : i + batch_size]
+            try:
+                embeddings, usages = self.embedder.get_embeddings_batch_and_usage([doc.content for doc in batch])
+                for j, doc in enumerate(batch):
+                    if j < len(embeddings):
+                        doc.embedding = embeddings[j]
+                        doc.usage = usages[j] if j < len(usages) else None
+            except Exception as e:
+                # Don't fall back on rate limits as it would make things worse
+                if self._is_rate_limit_error(e):
+                    logger.error(f"Rate limit detected during batch embedding. {e}")
+                    raise e
+                logger.warning(f"Batch embedding failed, falling back to individual embeddings: {e}")
+                for doc in batch:
+                    doc.embed(embedder=self.embedder)
+
+    async def _async_embed_documents(self, documents: List[Document]) -> None:
+        """Asynchronously embed documents, using the embedder's batch API in `batch_size` groups when available."""
+        if not (self.embedder.supports_batch and hasattr(self.embedder, "async_get_embeddings_batch_and_usage")):
+            embed_tasks = [document.async_embed(embedder=self.embedder) for document in documents]
+            await asyncio.gather(*embed_tasks, return_exceptions=True)
+            return
+
+        batch_size = self.embedder.batch_size
+        for i in range(0, len(documents), batch_size):
+            batch = documents[i : i + batch_size]
+            try:
+                embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(
+                    [doc.content for doc in batch]
+                )
+                for j, doc in enumerate(batch):
+                    if j < len(embeddings):
+                        doc.embedding = embeddings[j]
+                        doc.usage = usages[j] if j < len(usages) else None
+            except Exception as e:
+                # Don't fall back on rate limits as it would make things worse
+                if self._is_rate_limit_error(e):
+                    logger.error(f"Rate limit detected during batch embedding. {e}")
+                    raise e
+                logger.warning(f"Async batch embedding failed, falling back to individual embeddings: {e}")
+                embed_tasks = [doc.async_embed(embedder=self.embedder) for doc in batch]
+                await asyncio.gather(*embed_tasks, return_exceptions=True)
+
+    def _build_rows(
+        self, content_hash: str, new_documents: List[tuple], filters: Optional[Dict[str, Any]] = None
+    ) -> pa.Table:
+        """Build a single Arrow table from embedded (id, document) pairs."""
+        ids: List[str] = []
+        vectors: List[List[float]] = []
+        payloads: List[str] = []
+        content_ids: List[Optional[str]] = []
+        meta_filters: List[List[str]] = []
+
+        for doc_id, document in new_documents:
             # Add filters to document metadata if provided
             if filters:
                 meta_data = document.meta_data.copy() if document.meta_data else {}
                 meta_data.update(filters)
                 document.meta_data = meta_data
 
-            document.embed(embedder=self.embedder)
-            cleaned_content = document.content.replace("\x00", "\ufffd")
-            doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
                 "name": document.name,
                 "meta_data": document.meta_data,
-                "content": cleaned_content,
+                "content": self._clean_content(document),
                 "usage": document.usage,
                 "content_id": document.content_id,
                 "content_hash": content_hash,
             }
-            data.append(
-                {
-                    "id": doc_id,
-                    "vector": self._prepare_vector(document.embedding),
-                    "payload": json.dumps(payload),
-                }
-            )
+            ids.append(doc_id)
+            vectors.append(self._prepare_vector(document.embedding))
+            payloads.append(json.dumps(payload))
+            content_ids.append(document.content_id)
+            meta_filters.append(self._meta_filter_terms(document.meta_data))
             log_debug(f"Parsed document: {document.name} ({document.meta_data})")
 
+        schema = self._base_schema()
+        columns = [
+            pa.array(vectors, type=schema.field(self._vector_col).type),
+            pa.array(ids, type=pa.string()),
+            pa.array(payloads, type=pa.string()),
+            pa.array(content_ids, type=pa.string()),
+            pa.array([content_hash] * len(ids), type=pa.string()),
+            pa.array(meta_filters, type=pa.list_(pa.string())),
+        ]
+        if self.table is not None and not self._has_filter_columns:
+            # Keep writing the original three columns to tables created without the filter columns
+            return pa.Table.from_arrays(columns[:3], schema=pa.schema(list(schema)[:3]))
+        return pa.Table.from_arrays(columns, schema=schema)
+
+    def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Insert documents into the database.
+
+        Args:
+            documents (List[Document]): List of documents to insert
+            filters (Optional[Dict[str, Any]]): Filters to add as metadata to documents
+        """
+        if len(documents) <= 0:
+            log_info("No documents to insert")
+            return
+
+        log_debug(f"Inserting {len(documents)} documents")
+
         if self.table is None:
             logger.error("Table not initialized. Please create the table first")
             return
 
-        if not data:
+        new_documents = self._new_documents(documents)
+        if not new_documents:
             log_debug("No new data to insert")
             return
 
+        self._embed_documents([document for _, document in new_documents])
+        data = self._build_rows(content_hash, new_documents, filters)
+
         if self.on_bad_vectors is not None:
             self.table.add(data, on_bad_vectors=self.on_bad_vectors, fill_value=self.fill_value)
         else:
@@ -368,80 +535,18 @@ class LanceDb(VectorDb):
             return
 
         log_debug(f"Inserting {len(documents)} documents")
-        data = []
-
-        if self.embedder.enable_batch and hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
-            # Use batch embedding when enabled and supported
-            try:
-                # Extract content from all documents
-                doc_contents = [doc.content for doc in documents]
-
-                # Get batch embeddings and usage
-                embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(doc_contents)
-
-                # Process documents with pre-computed embeddings
-                for j, doc in enumerate(documents):
-                    try:
-                        if j < len(embeddings):
-                            doc.embedding = embeddings[j]
-                            doc.usage = usages[j] if j < len(usages) else None
-                    except Exception as e:
-                        logger.error(f"Error assigning batch embedding to document '{doc.name}': {e}")
-
-            except Exception as e:
-                # Check if this is a rate limit error - don't fall back as it would make things worse
-                error_str = str(e).lower()
-                is_rate_limit = any(
-                    phrase in error_str
-                    for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
-                )
-
-                if is_rate_limit:
-                    logger.error(f"Rate limit detected during batch embedding. {e}")
-                    raise e
-                else:
-                    logger.warning(f"Async batch embedding failed, falling back to individual embeddings: {e}")
-                    # Fall back to individual embedding
-                    embed_tasks = [doc.async_embed(embedder=self.embedder) for doc in documents]
-                    await asyncio.gather(*embed_tasks, return_exceptions=True)
-        else:
-            # Use individual embedding
-            embed_tasks = [document.async_embed(embedder=self.embedder) for document in documents]
-            await asyncio.gather(*embed_tasks, return_exceptions=True)
-
-        for document in documents:
-            if await self.async_doc_exists(document):
-                continue
-
-            # Add filters to document metadata if provided
-            if filters:
-                meta_data = document.meta_data.copy() if document.meta_data else {}
-                meta_data.update(filters)
-                document.meta_data = meta_data
 
-            cleaned_content = document.content.replace("\x00", "\ufffd")
-            doc_id = str(md5(cleaned_content.encode()).hexdigest())
-            payload = {
-                "name": document.name,
-                "meta_data": document.meta_data,
-                "content": cleaned_content,
-                "usage": document.usage,
-                "content_id": document.content_id,
-                "content_hash": content_hash,
-            }
-            data.append(
-                {
-                    "id": doc_id,
-                    "vector": self._prepare_vector(document.embedding),
-                    "payload": json.dumps(payload),
-                }
-            )
-            log_debug(f"Parsed document: {document.name} ({document.meta_data})")
-
-        if not data:
+        # Check all ids up front so only new documents are embedded
+        if self.connection and self.table_name in self.connection.table_names():
+            self.table = self.connection.open_table(name=self.table_name)
+        new_documents = self._new_documents(documents)
+        if not new_documents:
             log_debug("No new data to insert")
             return
 
+        await self._async_embed_documents([document for _, document in new_documents])
+        data = self._build_rows(content_hash, new_documents, filters)
+
         try:
             await self._get_async_connection()
 
@@ -516,47 +621,7 @@ class LanceDb(VectorDb):
         if self.connection:
             self.table = self.connection.open_table(name=self.table_name)
 
-        results = None
-
-        if self.search_type == SearchType.vector:
-            results = self.vector_search(query, limit)
-        elif self.search_type == SearchType.keyword:
-            results = self.keyword_search(query, limit)
-        elif self.search_type == SearchType.hybrid:
-            results = self.hybrid_search(query, limit)
-        else:
-            logger.error(f"Invalid search type '{self.search_type}'.")
-            return []
-
-        if results is None:
-            return []
-
-        search_results = self._build_search_results(results)
-
-        # Filter results based on metadata if filters are provided
-        if filters and search_results:
-            filtered_results = []
-            for doc in search_results:
-                if doc.meta_data is None:
-                    continue
-
-                # Check if all filter criteria match
-                match = True
-                for key, value in filters.items():
-                    if key not in doc.meta_data or doc.meta_data[key] != value:
-                        match = False
-                        break
-
-                if match:
-                    filtered_results.append(doc)
-
-            search_results = filtered_results
-
-        if self.reranker and search_results:
-            search_results = self.reranker.rerank(query=query, documents=search_results)
-
-        log_info(f"Found {len(search_results)} documents")
-        return search_results
+        return self._search(query=query, limit=limit, filters=filters)
 
     async def async_search(
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
@@ -576,14 +641,21 @@ class LanceDb(VectorDb):
         if self.connection:
             self.table = self.connection.open_table(name=self.table_name)
 
+        return self._search(query=query, limit=limit, filters=filters)
+
+    def _search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        where = self._filters_where(filters)
+        if where is not None:
+            self._ensure_filter_index()
+
         results = None
 
         if self.search_type == SearchType.vector:
-            results = self.vector_search(query, limit)
+            results = self.vector_search(query, limit, where=where)
         elif self.search_type == SearchType.keyword:
-            results = self.keyword_search(query, limit)
+            results = self.keyword_search(query, limit, where=where)
         elif self.search_type == SearchType.hybrid:
-            results = self.hybrid_search(query, limit)
+            results = self.hybrid_search(query, limit, where=where)
         else:
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
@@ -593,8 +665,8 @@ class LanceDb(VectorDb):
 
         search_results = self._build_search_results(results)
 
-        # Filter results based on metadata if filters are provided
-        if filters and search_results:
+        # Tables without the filter columns can only be filtered after the search
+        if filters and where is None and search_results:
             filtered_results = []
             for doc in search_results:
                 if doc.meta_data is None:
@@ -618,7 +690,7 @@ class LanceDb(VectorDb):
         log_info(f"Found {len(search_results)} documents")
         return search_results
 
-    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
+    def vector_search(self, query: str, limit: int = 5, where: Optional[str] = None) -> Optional[pa.Table]:
         query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
@@ -633,20 +705,23 @@ class LanceDb(VectorDb):
             vector_column_name=self._vector_col,
         ).limit(limit)
 
+        if where is not None:
+            results = results.where(where, prefilter=True)
+
         if self.nprobes:
             results.nprobes(self.nprobes)
 
-        return results.to_pandas()
+        return results.to_arrow()
 
-    def hybrid_search(self, query: str, limit: int = 5) -> List[Document]:
+    def hybrid_search(self, query: str, limit: int = 5, where: Optional[str] = None) -> Optional[pa.Table]:
         query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
-            return []
+            return None
 
         if self.table is None:
             logger.error("Table not initialized. Please create the table first")
-            return []
+            return None
 
         if not self.fts_index_exists:
             self.table.create_fts_index("payload", use_tantivy=self.use_tantivy, replace=True)
@@ -662,15 +737,18 @@ class LanceDb(VectorDb):
             .limit(limit)
         )
 
+        if where is not None:
+            results = results.where(where, prefilter=True)
+
         if self.nprobes:
             results.nprobes(self.nprobes)
 
-        return results.to_pandas()
+        return results.to_arrow()
 
-    def keyword_search(self, query: str, limit: int = 5) -> List[Document]:
+    def keyword_search(self, query: str, limit: int = 5, where: Optional[str] = None) -> Optional[pa.Table]:
         if self.table is None:
             logger.error("Table not initialized. Please create the table first")
-            return []
+            return None
 
         if not self.fts_index_exists:
             self.table.create_fts_index("payload", use_tantivy=self.use_tantivy, replace=True)
@@ -681,20 +759,25 @@ class LanceDb(VectorDb):
             query_type="fts",
         ).limit(limit)
 
-        return results.to_pandas()
+        if where is not None:
+            results = results.where(where, prefilter=True)
 
-    def _build_search_results(self, results) -> List[Document]:  # TODO: typehint pandas?
+        return results.to_arrow()
+
+    def _build_search_results(self, results: pa.Table) -> List[Document]:
         search_results: List[Document] = []
         try:
-            for _, item in results.iterrows():
-                payload = json.loads(item["payload"])
+            payloads = results.column("payload").to_pylist()
+            vectors = results.column(self._vector_col).to_pylist()
+            for raw_payload, vector in zip(payloads, vectors):
+                payload = json.loads(raw_payload)
                 search_results.append(
                     Document(
                         name=payload["name"],
                         meta_data=payload["meta_data"],
                         content=payload["content"],
                         embedder=self.embedder,
-                        embedding=item["vector"],
+                        embedding=vector,
                         usage=payload["usage"],
                         content_id=payload.get("content_id"),
                     )
@@ -862,6 +945,10 @@ class LanceDb(VectorDb):
             logger.error("Table not initialized")
             return False
 
+        where = self._filters_where(metadata)
+        if where is not None:
+            return self._delete_where(where, f"metadata '{metadata}'")
+
         try:
             total_count = self.table.count_rows()
             result = self.table.search().select(["id", "payload"]).limit(total_count).to_pandas()
@@ -898,12 +985,29 @@ class LanceDb(VectorDb):
             logger.error(f"Error deleting rows by metadata '{metadata}': {e}")
             return False
 
+    def _delete_where(self, where: str, description: str) -> bool:
+        """Delete the rows matching `where` in a single statement."""
+        try:
+            matching = self.table.count_rows(where)  # type: ignore
+            if matching == 0:
+                log_info(f"No records found with {description} to delete.")
+                return False
+            self.table.delete(where)  # type: ignore
+            log_info(f"Deleted {matching} records with {description} from table '{self.table_name}'.")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting rows by {description}: {e}")
+            return False
+
     def delete_by_content_id(self, content_id: str) -> bool:
         """Delete content by content ID."""
         if self.table is None:
             logger.error("Table not initialized")
             return False
 
+        if self._has_filter_columns:
+            return self._delete_where(f"content_id = {self._sql_literal(content_id)}", f"content_id '{content_id}'")
+
         try:
             total_count = self.table.count_rows()
             result = self.table.search().select(["id", "payload"]).limit(total_count).to_pandas()
@@ -937,6 +1041,11 @@ class LanceDb(VectorDb):
             logger.error("Table not initialized")
             return False
 
+        if self._has_filter_columns:
+            return self._delete_where(
+                f"content_hash = {self._sql_literal(content_hash)}", f"content_hash '{content_hash}'"
+            )
+
         try:
             total_count = self.table.count_rows()
             result = self.table.search().select(["id", "payload"]).limit(total_count).to_pandas()
@@ -970,6 +1079,13 @@ class LanceDb(VectorDb):
             logger.error("Table not initialized")
             return False
 
+        if self._has_filter_columns:
+            try:
+                return self.table.count_rows(f"content_hash = {self._sql_literal(content_hash)}") > 0
+            except Exception as e:
+                logger.error(f"Error checking content_hash existence '{content_hash}': {e}")
+                return False
+
         try:
             total_count = self.table.count_rows()
             result = self.table.search().select(["id", "payload"]).limit(total_count).to_pandas()
@@ -1001,6 +1117,10 @@ class LanceDb(VectorDb):
                 logger.error("Table not initialized")
                 return
 
+            if self._has_filter_columns:
+                self._update_metadata_where(content_id, metadata)
+                return
+
             # Get all documents and filter in Python (LanceDB doesn't support JSON operators)
             total_count = self.table.count_rows()
             results = self.table.search().select(["id", "payload"]).limit(total_count).to_pandas()
@@ -1065,6 +1185,45 @@ class LanceDb(VectorDb):
             logger.error(f"Error updating metadata for content_id '{content_id}': {e}")
             raise
 
+    def _update_metadata_where(self, content_id: str, metadata: Dict[str, Any]) -> None:
+        """Rewrite the payload and metadata terms of the rows with `content_id`, keeping their vectors."""
+        where = f"content_id = {self._sql_literal(content_id)}"
+        matching = self.table.count_rows(where)  # type: ignore
+        if matching == 0:
+            logger.debug(f"No documents found with content_id: {content_id}")
+            return
+
+        rows = self.table.search().where(where).limit(matching).to_arrow()  # type: ignore
+        payloads = []
+        meta_filters = []
+        for raw_payload in rows.column("payload").to_pylist():
+            payload = json.loads(raw_payload)
+            payload.setdefault("meta_data", {}).update(metadata)
+            if isinstance(payload.get("filters"), dict):
+                payload["filters"].update(metadata)
+            else:
+                payload["filters"] = metadata
+            payloads.append(json.dumps(payload))
+            meta_filters.append(self._meta_filter_terms(payload["meta_data"]))
+
+        schema = self._base_schema()
+        updated = pa.Table.from_arrays(
+            [
+                rows.column(self._vector_col).cast(schema.field(self._vector_col).type),
+                rows.column(self._id),
+                pa.array(payloads, type=pa.string()),
+                rows.column("content_id"),
+                rows.column("content_hash"),
+                pa.array(meta_filters, type=pa.list_(pa.string())),
+            ],
+            schema=schema,
+        )
+
+        # LanceDB doesn't have a direct update, so delete and re-insert
+        self.table.delete(where)  # type: ignore
+        self.table.add(updated)  # type: ignore
+        logger.debug(f"Updated metadata for {updated.num_rows} documents with content_id: {content_id}")
+
     def get_supported_search_types(self) -> List[str]:
         """Get the supported search types for this vector database."""
         return [SearchType.vector, SearchType.keyword, SearchType.hybrid]
@@ -1,7 +1,6 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from time import perf_counter
 from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Union
 from uuid import uuid4
 
@@ -16,8 +15,9 @@ from core.agno.run.workflow import (
 )
 from core.agno.session.workflow import WorkflowSession
 from core.agno.utils.log import log_debug, logger
-from core.agno.utils.merge_dict import merge_parallel_session_states
+from core.agno.utils.merge_dict import CopyOnWriteDict, merge_parallel_session_states
 from core.agno.workflow.condition import Condition
+from core.agno.workflow.scheduler import ScheduledTask, get_workflow_scheduler
 from core.agno.workflow.step import Step
 from core.agno.workflow.types import StepInput, StepOutput, StepType
 
@@ -79,6 +79,28 @@ class Parallel:
 
         self.steps = prepared_steps
 
+    def _branch_session_states(self, session_state: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """One session_state per step, sharing values with the original until a step touches them"""
+        if session_state is None:
+            return [{} for _ in self.steps]
+        return [CopyOnWriteDict(session_state) for _ in self.steps]
+
+    def _record_timings(self, result: Union[StepOutput, List[StepOutput]], task: ScheduledTask) -> None:
+        """Attach the time a step spent queued for a worker and executing to its outputs' metrics"""
+        finished_at = task.finished_at if task.finished_at is not None else perf_counter()
+        timings = {"queue_time": task.queue_time or 0.0, "execution_time": finished_at - (task.started_at or finished_at)}
+        for step_output in result if isinstance(result, list) else [result]:
+            if not isinstance(step_output, StepOutput):
+                continue
+            # Copy so the executor's own run metrics are left untouched
+            metrics = replace(step_output.metrics) if step_output.metrics else Metrics()
+            metrics.additional_metrics = {**(metrics.additional_metrics or {}), **timings}
+            step_output.metrics = metrics
+        log_debug(
+            f"Parallel step {getattr(result, 'step_name', None) or 'step'} queued {timings['queue_time']:.3f}s, "
+            f"executed {timings['execution_time']:.3f}s"
+        )
+
     def _aggregate_results(self, step_outputs: List[StepOutput]) -> StepOutput:
         """Aggregate multiple step outputs into a single StepOutput"""
         if not step_outputs:
@@ -211,13 +233,8 @@ class Parallel:
 
         self._prepare_steps()
 
-        # Create individual session_state copies for each step to prevent race conditions
-        session_state_copies = []
-        for _ in range(len(self.steps)):
-            if session_state is not None:
-                session_state_copies.append(deepcopy(session_state))
-            else:
-                session_state_copies.append({})
+        # Give each step a copy-on-write view of session_state to prevent race conditions
+        session_state_copies = self._branch_session_states(session_state)
 
         def execute_step_with_index(step_with_index):
             """Execute a single step and preserve its original index"""
@@ -255,38 +272,37 @@ class Parallel:
         # Use index to preserve order
         indexed_steps = list(enumerate(self.steps))
 
-        with ThreadPoolExecutor(max_workers=len(self.steps)) as executor:
-            # Submit all tasks with their original indices
-            future_to_index = {
-                executor.submit(execute_step_with_index, indexed_step): indexed_step[0]
-                for indexed_step in indexed_steps
-            }
-
-            # Collect results and modified session_state copies
-            results_with_indices = []
-            modified_session_states = []
-            for future in as_completed(future_to_index):
-                try:
-                    index, result, modified_session_state = future.result()
-                    results_with_indices.append((index, result))
-                    modified_session_states.append(modified_session_state)
-                    step_name = getattr(self.steps[index], "name", f"step_{index}")
-                    log_debug(f"Parallel step {step_name} completed")
-                except Exception as e:
-                    index = future_to_index[future]
-                    step_name = getattr(self.steps[index], "name", f"step_{index}")
-                    logger.error(f"Parallel step {step_name} failed: {e}")
-                    results_with_indices.append(
-                        (
-                            index,
-                            StepOutput(
-                                step_name=step_name,
-                                content=f"Step {step_name} failed: {str(e)}",
-                                success=False,
-                                error=str(e),
-                            ),
-                        )
+        # Submit all tasks with their original indices to the shared workflow pool
+        scheduler = get_workflow_scheduler()
+        tasks = [scheduler.submit(execute_step_with_index, indexed_step) for indexed_step in indexed_steps]
+        task_to_index = {id(task): indexed_step[0] for task, indexed_step in zip(tasks, indexed_steps)}
+
+        # Collect results and modified session_state copies
+        results_with_indices = []
+        modified_session_states = []
+        for task in scheduler.as_completed(tasks):
+            try:
+                index, result, modified_session_state = task.future.result()
+                self._record_timings(result, task)
+                results_with_indices.append((index, result))
+                modified_session_states.append(modified_session_state)
+                step_name = getattr(self.steps[index], "name", f"step_{index}")
+                log_debug(f"Parallel step {step_name} completed")
+            except Exception as e:
+                index = task_to_index[id(task)]
+                step_name = getattr(self.steps[index], "name", f"step_{index}")
+                logger.error(f"Parallel step {step_name} failed: {e}")
+                results_with_indices.append(
+                    (
+                        index,
+                        StepOutput(
+                            step_name=step_name,
+                            content=f"Step {step_name} failed: {str(e)}",
+                            success=False,
+                            error=str(e),
+                        ),
                     )
+                )
 
         if session_state is not None:
             merge_parallel_session_states(session_state, modified_session_states)
@@ -335,13 +351,8 @@ class Parallel:
 
         self._prepare_steps()
 
-        # Create individual session_state copies for each step to prevent race conditions
-        session_state_copies = []
-        for _ in range(len(self.steps)):
-            if session_state is not None:
-                session_state_copies.append(deepcopy(session_state))
-            else:
-                session_state_copies.append({})
+        # Give each step a copy-on-write view of session_state to prevent race conditions
+        session_state_copies = self._branch_session_states(session_state)
 
         # Considering both stream_events and stream_intermediate_steps (deprecated)
         stream_events = stream_events or stream_intermediate_steps
@@ -424,48 +435,52 @@ class Parallel:
         # Submit all parallel tasks
         indexed_steps = list(enumerate(self.steps))
 
-        with ThreadPoolExecutor(max_workers=len(self.steps)) as executor:
-            # Submit all tasks
-            futures = [executor.submit(execute_step_stream_with_index, indexed_step) for indexed_step in indexed_steps]
-
-            # Process events from queue as they arrive
-            completed_steps = 0
-            total_steps = len(self.steps)
-
-            while completed_steps < total_steps:
-                try:
-                    message_type, step_idx, *data = event_queue.get(timeout=1.0)
-
-                    if message_type == "event":
-                        event = data[0]
-                        # Yield events immediately as they arrive (except StepOutputs)
-                        if not isinstance(event, StepOutput):
-                            yield event
-
-                    elif message_type == "complete":
-                        step_outputs, step_session_state = data
-                        step_results.extend(step_outputs)
-                        modified_session_states.append(step_session_state)
-                        completed_steps += 1
-
-                        step_name = getattr(self.steps[step_idx], "name", f"step_{step_idx}")
-                        log_debug(f"Parallel step {step_name} streaming completed")
-
-                except queue.Empty:
-                    for i, future in enumerate(futures):
-                        if future.done() and future.exception():
-                            logger.error(f"Parallel step {i} failed: {future.exception()}")
-                            if completed_steps < total_steps:
-                                completed_steps += 1
-                except Exception as e:
-                    logger.error(f"Error processing parallel step events: {e}")
+        # Submit all tasks to the shared workflow pool
+        scheduler = get_workflow_scheduler()
+        tasks = [scheduler.submit(execute_step_stream_with_index, indexed_step) for indexed_step in indexed_steps]
+        if scheduler.in_worker():
+            # Nested inside another pooled step: run queued branches here rather than wait on a busy pool
+            scheduler.run_pending(tasks)
+
+        # Process events from queue as they arrive
+        completed_steps = 0
+        total_steps = len(self.steps)
+
+        while completed_steps < total_steps:
+            try:
+                message_type, step_idx, *data = event_queue.get(timeout=1.0)
+
+                if message_type == "event":
+                    event = data[0]
+                    # Yield events immediately as they arrive (except StepOutputs)
+                    if not isinstance(event, StepOutput):
+                        yield event
+
+                elif message_type == "complete":
+                    step_outputs, step_session_state = data
+                    self._record_timings(step_outputs, tasks[step_idx])
+                    step_results.extend(step_outputs)
+                    modified_session_states.append(step_session_state)
                     completed_steps += 1
 
-            for future in futures:
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(f"Future completion error: {e}")
+                    step_name = getattr(self.steps[step_idx], "name", f"step_{step_idx}")
+                    log_debug(f"Parallel step {step_name} streaming completed")
+
+            except queue.Empty:
+                for i, task in enumerate(tasks):
+                    if task.future.done() and task.future.exception():
+                        logger.error(f"Parallel step {i} failed: {task.future.exception()}")
+                        if completed_steps < total_steps:
+                            completed_steps += 1
+            except Exception as e:
+                logger.error(f"Error processing parallel step events: {e}")
+                completed_steps += 1
+
+        for task in tasks:
+            try:
+                task.future.result()
+            except Exception as e:
+                logger.error(f"Future completion error: {e}")
 
         # Merge all session_state changes back into the original session_state
         if session_state is not None:
@@ -520,13 +535,8 @@ class Parallel:
 
         self._prepare_steps()
 
-        # Create individual session_state copies for each step to prevent race conditions
-        session_state_copies = []
-        for _ in range(len(self.steps)):
-            if session_state is not None:
-                session_state_copies.append(deepcopy(session_state))
-            else:
-                session_state_copies.append({})
+        # Give each step a copy-on-write view of session_state to prevent race conditions
+        session_state_copies = self._branch_session_states(session_state)
 
         async def execute_step_async_with_index(step_with_index):
             """Execute a single step asynchronously and preserve its original index"""
@@ -645,13 +655,8 @@ class Parallel:
 
         self._prepare_steps()
 
-        # Create individual session_state copies for each step to prevent race conditions
-        session_state_copies = []
-        for _ in range(len(self.steps)):
-            if session_state is not None:
-                session_state_copies.append(deepcopy(session_state))
-            else:
-                session_state_copies.append({})
+        # Give each step a copy-on-write view of session_state to prevent race conditions
+        session_state_copies = self._branch_session_states(session_state)
 
         # Considering both stream_events and stream_intermediate_steps (deprecated)
         stream_events = stream_events or stream_intermediate_steps
@@ -0,0 +1,133 @@
+"""Process-wide worker pool for workflow steps that run concurrently.
+
+Parallel steps submit their branches here instead of creating a thread pool per call, so nested
+Parallels and Parallels inside Loop and Router iterations share one bounded set of threads. A thread
+waiting on its own branches runs the ones that have not started yet instead of blocking, which keeps
+nested fan-out from deadlocking on a saturated pool.
+"""
+
+import contextvars
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from os import getenv
+from time import perf_counter
+from typing import Any, Callable, Iterator, List, Optional
+
+from core.agno.utils.log import log_debug
+
+DEFAULT_WORKFLOW_MAX_WORKERS = 8
+
+
+class ScheduledTask:
+    """A unit of work submitted to the workflow scheduler, with its queueing and execution timings."""
+
+    def __init__(self, fn: Callable[..., Any], args: tuple):
+        self._fn = fn
+        self._args = args
+        self._context = contextvars.copy_context()
+        self._claim_lock = threading.Lock()
+        self._claimed = False
+
+        self.future: Future = Future()
+        self.submitted_at: float = perf_counter()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def queue_time(self) -> Optional[float]:
+        """Seconds between submission and the start of execution"""
+        if self.started_at is None:
+            return None
+        return self.started_at - self.submitted_at
+
+    @property
+    def execution_time(self) -> Optional[float]:
+        """Seconds spent executing the task"""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    def run(self) -> bool:
+        """Run the task unless another thread already claimed it. Returns True if this call ran it."""
+        with self._claim_lock:
+            if self._claimed:
+                return False
+            self._claimed = True
+
+        self.started_at = perf_counter()
+        try:
+            result = self._context.run(self._fn, *self._args)
+        except BaseException as e:
+            self.finished_at = perf_counter()
+            self.future.set_exception(e)
+        else:
+            self.finished_at = perf_counter()
+            self.future.set_result(result)
+        return True
+
+
+class WorkflowScheduler:
+    """Bounded thread pool shared by all workflow steps that fan out work"""
+
+    def __init__(self, max_workers: int = DEFAULT_WORKFLOW_MAX_WORKERS):
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="agno-workflow")
+        self._local = threading.local()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> ScheduledTask:
+        """Queue `fn(*args)` on the pool"""
+        task = ScheduledTask(fn, args)
+        self._executor.submit(self._work, task)
+        return task
+
+    def in_worker(self) -> bool:
+        """Whether the current thread is one of the pool's workers"""
+        return getattr(self._local, "is_worker", False)
+
+    def run_pending(self, tasks: List[ScheduledTask]) -> None:
+        """Run, on the calling thread, every task in `tasks` that no worker has started yet"""
+        for task in tasks:
+            task.run()
+
+    def as_completed(self, tasks: List[ScheduledTask]) -> Iterator[ScheduledTask]:
+        """Yield tasks as they finish, helping with the ones still queued first"""
+        self.run_pending(tasks)
+        remaining = {task.future: task for task in tasks}
+        while remaining:
+            done, _ = wait(list(remaining), return_when=FIRST_COMPLETED)
+            for future in done:
+                yield remaining.pop(future)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def _work(self, task: ScheduledTask) -> None:
+        self._local.is_worker = True
+        task.run()
+
+
+_scheduler: Optional[WorkflowScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_workflow_scheduler() -> WorkflowScheduler:
+    """Return the shared workflow scheduler, creating it on first use.
+
+    The pool size defaults to AGNO_WORKFLOW_MAX_WORKERS, or 8 when it is not set.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = WorkflowScheduler(int(getenv("AGNO_WORKFLOW_MAX_WORKERS", DEFAULT_WORKFLOW_MAX_WORKERS)))
+        return _scheduler
+
+
+def set_workflow_max_workers(max_workers: int) -> None:
+    """Resize the shared workflow pool. Work already queued on the previous pool still completes."""
+    global _scheduler
+    with _scheduler_lock:
+        previous = _scheduler
+        _scheduler = WorkflowScheduler(max_workers)
+    if previous is not None:
+        previous.shutdown(wait=False)
+    log_debug(f"Workflow scheduler resized to {max_workers} workers")
@@ -1,6 +1,10 @@
+import hashlib
 import inspect
+import json
+import threading
 from copy import copy
 from dataclasses import dataclass
+from time import time
 from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Union
 from uuid import uuid4
 
@@ -24,6 +28,12 @@ from core.agno.utils.log import log_debug, logger, use_agent_logger, use_team_lo
 from core.agno.utils.merge_dict import merge_dictionaries
 from core.agno.workflow.types import StepInput, StepOutput, StepType
 
+# Maximum number of memoized step outputs kept per workflow session
+STEP_CACHE_MAX_ENTRIES = 128
+STEP_CACHE_KEY = "step_cache"
+# Guards the step caches, Parallel branches read and write the same workflow session concurrently
+_step_cache_lock = threading.Lock()
+
 StepExecutor = Callable[
     [StepInput],
     Union[
@@ -65,6 +75,15 @@ class Step:
     add_workflow_history: Optional[bool] = None
     num_history_runs: int = 3
 
+    # Memoize successful outputs in the workflow session, keyed by step name, input and configuration.
+    # A cache hit skips the executor entirely, including any session_state changes it would have made.
+    cache_results: bool = False
+    # Seconds a memoized output stays valid (None keeps it until evicted)
+    cache_ttl: Optional[int] = None
+
+    # Names of earlier steps whose outputs this step consumes (used when the workflow runs in DAG mode)
+    depends_on: Optional[List[str]] = None
+
     _retry_count: int = 0
 
     def __init__(
@@ -81,6 +100,9 @@ class Step:
         strict_input_validation: bool = False,
         add_workflow_history: Optional[bool] = None,
         num_history_runs: int = 3,
+        cache_results: bool = False,
+        cache_ttl: Optional[int] = None,
+        depends_on: Optional[List[str]] = None,
     ):
         # Auto-detect name for function executors if not provided
         if name is None and executor is not None:
@@ -102,6 +124,9 @@ class Step:
         self.strict_input_validation = strict_input_validation
         self.add_workflow_history = add_workflow_history
         self.num_history_runs = num_history_runs
+        self.cache_results = cache_results
+        self.cache_ttl = cache_ttl
+        self.depends_on = depends_on
         self.step_id = step_id
 
         if step_id is None:
@@ -204,6 +229,95 @@ class Step:
             else:
                 return await func(step_input)
 
+    def _config_fingerprint(self) -> Dict[str, Any]:
+        """Describe the parts of the step configuration that affect its output"""
+        executor = self.active_executor
+        config: Dict[str, Any] = {
+            "name": self.name,
+            "executor_type": self._executor_type,
+            "executor_name": self.executor_name,
+        }
+        if self._executor_type == "function":
+            code = getattr(executor, "__code__", None)
+            config["function"] = f"{getattr(executor, '__module__', '')}.{getattr(executor, '__qualname__', '')}"
+            if code is not None:
+                config["code"] = hashlib.sha256(code.co_code + repr(code.co_consts).encode()).hexdigest()
+        else:
+            model = getattr(executor, "model", None)
+            output_schema = getattr(executor, "output_schema", None)
+            config.update(
+                {
+                    "id": getattr(executor, "id", None),
+                    "model": f"{getattr(model, 'provider', '')}:{getattr(model, 'id', '')}" if model else None,
+                    "instructions": getattr(executor, "instructions", None),
+                    "description": getattr(executor, "description", None),
+                    "role": getattr(executor, "role", None),
+                    "output_schema": getattr(output_schema, "__name__", None),
+                }
+            )
+        return config
+
+    def _get_cache_key(self, step_input: StepInput) -> Optional[str]:
+        """Key for memoized outputs: step name, normalized step input and a hash of the step configuration"""
+        if not self.cache_results:
+            return None
+
+        def strip_ids(media: Optional[List[Dict[str, Any]]]) -> Optional[List[Dict[str, Any]]]:
+            # Media ids are generated per run and would make every key unique
+            if not media:
+                return None
+            return [{k: v for k, v in item.items() if k != "id"} if isinstance(item, dict) else item for item in media]
+
+        normalized = step_input.to_dict()
+        normalized["previous_step_outputs"] = {
+            name: output.get("content") for name, output in normalized["previous_step_outputs"].items()
+        }
+        for media_key in ("images", "videos", "audio", "files"):
+            normalized[media_key] = strip_ids(normalized.get(media_key))
+
+        payload = json.dumps(
+            {"step": self.name, "input": normalized, "config": self._config_fingerprint()},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_cached_output(
+        self, cache_key: Optional[str], workflow_session: Optional[WorkflowSession]
+    ) -> Optional[StepOutput]:
+        """Return the memoized output for cache_key, if there is a fresh one in the workflow session"""
+        if cache_key is None or workflow_session is None or not workflow_session.session_data:
+            return None
+        with _step_cache_lock:
+            entry = workflow_session.session_data.get(STEP_CACHE_KEY, {}).get(cache_key)
+            if entry is None:
+                return None
+            if entry.get("expires_at") is not None and entry["expires_at"] < time():
+                workflow_session.session_data[STEP_CACHE_KEY].pop(cache_key, None)
+                return None
+        log_debug(f"Step {self.name} served from cache")
+        return StepOutput.from_dict(entry["output"])
+
+    def _save_cached_output(
+        self, cache_key: Optional[str], step_output: StepOutput, workflow_session: Optional[WorkflowSession]
+    ) -> None:
+        """Memoize a successful output in the workflow session, which is persisted with the session"""
+        if cache_key is None or workflow_session is None or not step_output.success:
+            return
+        entry = {
+            "output": step_output.to_dict(),
+            "expires_at": time() + self.cache_ttl if self.cache_ttl is not None else None,
+        }
+        with _step_cache_lock:
+            if workflow_session.session_data is None:
+                workflow_session.session_data = {}
+            step_cache = workflow_session.session_data.setdefault(STEP_CACHE_KEY, {})
+            step_cache.pop(cache_key, None)
+            step_cache[cache_key] = entry
+            # Entries are kept in insertion order, so the oldest ones are dropped first
+            while len(step_cache) > STEP_CACHE_MAX_ENTRIES:
+                step_cache.pop(next(iter(step_cache)))
+
     def execute(
         self,
         step_input: StepInput,
@@ -224,6 +338,12 @@ class Step:
 
         if workflow_session:
             step_input.workflow_session = workflow_session
+
+        cache_key = self._get_cache_key(step_input)
+        cached_output = self._get_cached_output(cache_key, workflow_session)
+        if cached_output is not None:
+            return cached_output
+
         session_state_copy = copy(session_state) if session_state is not None else {}
 
         # Execute with retries
@@ -345,6 +465,7 @@ class Step:
 
                 # Create StepOutput from response
                 step_output = self._process_step_output(response)  # type: ignore
+                self._save_cached_output(cache_key, step_output, workflow_session)
 
                 return step_output
 
@@ -423,6 +544,13 @@ class Step:
 
         if workflow_session:
             step_input.workflow_session = workflow_session
+
+        cache_key = self._get_cache_key(step_input)
+        cached_output = self._get_cached_output(cache_key, workflow_session)
+        if cached_output is not None:
+            yield cached_output
+            return
+
         # Create session_state copy once to avoid duplication
         session_state_copy = copy(session_state) if session_state is not None else {}
 
@@ -589,6 +717,7 @@ class Step:
 
                 # Yield the step output
                 final_response = self._process_step_output(final_response)
+                self._save_cached_output(cache_key, final_response, workflow_session)
                 yield final_response
 
                 # Emit StepCompletedEvent
@@ -645,6 +774,12 @@ class Step:
 
         if workflow_session:
             step_input.workflow_session = workflow_session
+
+        cache_key = self._get_cache_key(step_input)
+        cached_output = self._get_cached_output(cache_key, workflow_session)
+        if cached_output is not None:
+            return cached_output
+
         # Create session_state copy once to avoid duplication
         session_state_copy = copy(session_state) if session_state is not None else {}
 
@@ -791,6 +926,7 @@ class Step:
 
                 # Create StepOutput from response
                 step_output = self._process_step_output(response)  # type: ignore
+                self._save_cached_output(cache_key, step_output, workflow_session)
 
                 return step_output
 
@@ -833,6 +969,12 @@ class Step:
         if workflow_session:
             step_input.workflow_session = workflow_session
 
+        cache_key = self._get_cache_key(step_input)
+        cached_output = self._get_cached_output(cache_key, workflow_session)
+        if cached_output is not None:
+            yield cached_output
+            return
+
         # Create session_state copy once to avoid duplication
         session_state_copy = copy(session_state) if session_state is not None else {}
 
@@ -1021,6 +1163,7 @@ class Step:
 
                 # Yield the final response
                 final_response = self._process_step_output(final_response)
+                self._save_cached_output(cache_key, final_response, workflow_session)
                 yield final_response
 
                 if stream_events and workflow_run_response:
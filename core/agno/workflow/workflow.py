@@ -1,7 +1,9 @@
 import asyncio
+from concurrent.futures import FIRST_COMPLETED, wait
 from dataclasses import dataclass
 from datetime import datetime
 from os import getenv
+from time import perf_counter
 from typing import (
     Any,
     AsyncIterator,
@@ -68,10 +70,12 @@ from core.agno.utils.print_response.workflow import (
     print_response,
     print_response_stream,
 )
+from core.agno.utils.merge_dict import CopyOnWriteDict, merge_parallel_session_states
 from core.agno.workflow.condition import Condition
 from core.agno.workflow.loop import Loop
 from core.agno.workflow.parallel import Parallel
 from core.agno.workflow.router import Router
+from core.agno.workflow.scheduler import ScheduledTask, get_workflow_scheduler
 from core.agno.workflow.step import Step
 from core.agno.workflow.steps import Steps
 from core.agno.workflow.types import (
@@ -180,6 +184,9 @@ class Workflow:
     # Number of historical runs to include in the messages
     num_history_runs: int = 3
 
+    # If True, steps run as soon as the steps named in their `depends_on` have completed, instead of in declared order
+    dag_mode: bool = False
+
     def __init__(
         self,
         id: Optional[str] = None,
@@ -205,6 +212,7 @@ class Workflow:
         telemetry: bool = True,
         add_workflow_history_to_steps: bool = False,
         num_history_runs: int = 3,
+        dag_mode: bool = False,
     ):
         self.id = id
         self.name = name
@@ -229,6 +237,7 @@ class Workflow:
         self.telemetry = telemetry
         self.add_workflow_history_to_steps = add_workflow_history_to_steps
         self.num_history_runs = num_history_runs
+        self.dag_mode = dag_mode
         self._workflow_session: Optional[WorkflowSession] = None
 
     def set_id(self) -> None:
@@ -1178,6 +1187,295 @@ class Workflow:
             logger.error(f"Function signature inspection failed: {e}. Falling back to original calling convention.")
             return func(**kwargs)
 
+    def _get_resumed_step_outputs(self, session: WorkflowSession, run_id: Optional[str]) -> List[StepOutput]:
+        """Outputs of the leading steps that completed successfully in an earlier attempt of this run"""
+        if run_id is None:
+            return []
+        previous_run = session.get_run(run_id=run_id)
+        if previous_run is None or not previous_run.step_results:
+            return []
+
+        resumed: List[StepOutput] = []
+        for step_output in previous_run.step_results:
+            if not isinstance(step_output, StepOutput) or step_output.success is False or step_output.stop:
+                break
+            resumed.append(step_output)
+        if resumed:
+            log_debug(f"Resuming run {run_id} after {len(resumed)} completed steps")
+        return resumed
+
+    def _get_resumed_step_output(
+        self, resumed_step_outputs: List[StepOutput], step_index: int, step_name: str
+    ) -> Optional[StepOutput]:
+        """The earlier output for the step at step_index, if it completed under the same name"""
+        if step_index < len(resumed_step_outputs) and resumed_step_outputs[step_index].step_name == step_name:
+            log_debug(f"Skipping step {step_name}, reusing its output from the resumed run")
+            return resumed_step_outputs[step_index]
+        return None
+
+    async def _areplay_step_output(self, step_output: StepOutput) -> AsyncIterator[StepOutput]:
+        yield step_output
+
+    def _get_dag_dependencies(self) -> List[List[int]]:
+        """Indices of the steps each step depends on. Dependencies must name earlier steps, so the graph is acyclic."""
+        step_indices: Dict[str, int] = {}
+        dependencies: List[List[int]] = []
+        for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+            step_name = getattr(step, "name", f"step_{i + 1}")
+            step_dependencies = []
+            for dependency in getattr(step, "depends_on", None) or []:
+                if dependency not in step_indices:
+                    raise ValueError(
+                        f"Step '{step_name}' depends on '{dependency}', which is not an earlier step of the workflow"
+                    )
+                step_dependencies.append(step_indices[dependency])
+            dependencies.append(step_dependencies)
+            step_indices[step_name] = i
+        return dependencies
+
+    def _create_dag_step_input(
+        self,
+        execution_input: WorkflowExecutionInput,
+        step_dependencies: List[int],
+        step_outputs: Dict[int, StepOutput],
+    ) -> StepInput:
+        """StepInput for a DAG step: previous outputs and media come only from the steps it depends on"""
+        previous_step_outputs: Dict[str, StepOutput] = {}
+        shared_images: List[Image] = list(execution_input.images or [])
+        shared_videos: List[Video] = list(execution_input.videos or [])
+        shared_audio: List[Audio] = list(execution_input.audio or [])
+        shared_files: List[File] = list(execution_input.files or [])
+        for dependency in step_dependencies:
+            dependency_output = step_outputs[dependency]
+            dependency_name = getattr(self.steps[dependency], "name", None) or f"step_{dependency + 1}"  # type: ignore[index]
+            previous_step_outputs[dependency_name] = dependency_output
+            shared_images.extend(dependency_output.images or [])
+            shared_videos.extend(dependency_output.videos or [])
+            shared_audio.extend(dependency_output.audio or [])
+            shared_files.extend(dependency_output.files or [])
+
+        return self._create_step_input(
+            execution_input=execution_input,
+            previous_step_outputs=previous_step_outputs,
+            shared_images=shared_images,
+            shared_videos=shared_videos,
+            shared_audio=shared_audio,
+            shared_files=shared_files,
+        )
+
+    def _get_ready_dag_steps(
+        self, dependencies: List[List[int]], waiting: List[int], step_outputs: Dict[int, StepOutput]
+    ) -> List[int]:
+        """Waiting steps whose dependencies have all produced an output, in declared order"""
+        ready = [i for i in waiting if all(dependency in step_outputs for dependency in dependencies[i])]
+        for i in ready:
+            waiting.remove(i)
+        return ready
+
+    def _execute_dag_step(
+        self,
+        step: Any,
+        step_input: StepInput,
+        session: WorkflowSession,
+        workflow_run_response: WorkflowRunOutput,
+        session_state: Optional[Dict[str, Any]],
+    ) -> Tuple[StepOutput, float, float]:
+        started_at = perf_counter()
+        step_output = step.execute(
+            step_input,
+            session_id=session.session_id,
+            user_id=self.user_id,
+            workflow_run_response=workflow_run_response,
+            session_state=session_state,
+            store_executor_outputs=self.store_executor_outputs,
+            workflow_session=session,
+            add_workflow_history_to_steps=self.add_workflow_history_to_steps
+            if self.add_workflow_history_to_steps
+            else None,
+            num_history_runs=self.num_history_runs,
+        )
+        return step_output, started_at, perf_counter()
+
+    async def _aexecute_dag_step(
+        self,
+        step: Any,
+        step_input: StepInput,
+        session: WorkflowSession,
+        workflow_run_response: WorkflowRunOutput,
+        session_state: Optional[Dict[str, Any]],
+    ) -> Tuple[StepOutput, float, float]:
+        started_at = perf_counter()
+        step_output = await step.aexecute(
+            step_input,
+            session_id=session.session_id,
+            user_id=self.user_id,
+            workflow_run_response=workflow_run_response,
+            session_state=session_state,
+            store_executor_outputs=self.store_executor_outputs,
+            workflow_session=session,
+            add_workflow_history_to_steps=self.add_workflow_history_to_steps
+            if self.add_workflow_history_to_steps
+            else None,
+            num_history_runs=self.num_history_runs,
+        )
+        return step_output, started_at, perf_counter()
+
+    def _run_dag(
+        self,
+        session: WorkflowSession,
+        execution_input: WorkflowExecutionInput,
+        workflow_run_response: WorkflowRunOutput,
+        session_state: Optional[Dict[str, Any]],
+        resumed_step_outputs: List[StepOutput],
+    ) -> Iterator[Tuple[int, StepOutput]]:
+        """Run the steps on the workflow pool as their dependencies complete, yielding (index, output) on completion"""
+        dependencies = self._get_dag_dependencies()
+        step_outputs: Dict[int, StepOutput] = {}
+        timings: Dict[int, Tuple[float, float, float]] = {}
+        waiting = list(range(len(dependencies)))
+        for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+            resumed_output = self._get_resumed_step_output(resumed_step_outputs, i, getattr(step, "name", None))
+            if resumed_output is not None:
+                step_outputs[i] = resumed_output
+                waiting.remove(i)
+                yield i, resumed_output
+
+        scheduler = get_workflow_scheduler()
+        running: Dict[ScheduledTask, Tuple[int, float, Optional[Dict[str, Any]]]] = {}
+        stopped = False
+        while waiting or running:
+            raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
+            if not stopped:
+                for i in self._get_ready_dag_steps(dependencies, waiting, step_outputs):
+                    step = self.steps[i]  # type: ignore[index]
+                    log_debug(f"DAG step ready: {getattr(step, 'name', f'step_{i + 1}')}")
+                    # Each step sees a copy-on-write view of session_state, merged back when it completes
+                    step_session_state = CopyOnWriteDict(session_state) if session_state is not None else None
+                    step_input = self._create_dag_step_input(execution_input, dependencies[i], step_outputs)
+                    ready_at = perf_counter()
+                    task = scheduler.submit(
+                        self._execute_dag_step, step, step_input, session, workflow_run_response, step_session_state
+                    )
+                    running[task] = (i, ready_at, step_session_state)
+            if not running:
+                break
+
+            if scheduler.in_worker():
+                scheduler.run_pending(list(running))
+            done, _ = wait([task.future for task in running], return_when=FIRST_COMPLETED)
+            for task in [task for task in running if task.future in done]:
+                i, ready_at, step_session_state = running.pop(task)
+                step_output, started_at, finished_at = task.future.result()
+                step_outputs[i] = step_output
+                timings[i] = (ready_at, started_at, finished_at)
+                if session_state is not None and step_session_state is not None:
+                    merge_parallel_session_states(session_state, [step_session_state])
+                if step_output.stop:
+                    logger.info(f"Early termination requested by step {step_output.step_name}")
+                    stopped = True
+                yield i, step_output
+
+        self._record_critical_path(workflow_run_response, dependencies, timings)
+
+    async def _arun_dag(
+        self,
+        session: WorkflowSession,
+        execution_input: WorkflowExecutionInput,
+        workflow_run_response: WorkflowRunOutput,
+        session_state: Optional[Dict[str, Any]],
+        resumed_step_outputs: List[StepOutput],
+    ) -> AsyncIterator[Tuple[int, StepOutput]]:
+        """Run the steps as event loop tasks as their dependencies complete, yielding (index, output) on completion"""
+        dependencies = self._get_dag_dependencies()
+        step_outputs: Dict[int, StepOutput] = {}
+        timings: Dict[int, Tuple[float, float, float]] = {}
+        waiting = list(range(len(dependencies)))
+        for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+            resumed_output = self._get_resumed_step_output(resumed_step_outputs, i, getattr(step, "name", None))
+            if resumed_output is not None:
+                step_outputs[i] = resumed_output
+                waiting.remove(i)
+                yield i, resumed_output
+
+        running: Dict["asyncio.Task[Tuple[StepOutput, float, float]]", Tuple[int, float, Optional[Dict[str, Any]]]] = {}
+        stopped = False
+        try:
+            while waiting or running:
+                raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
+                if not stopped:
+                    for i in self._get_ready_dag_steps(dependencies, waiting, step_outputs):
+                        step = self.steps[i]  # type: ignore[index]
+                        log_debug(f"DAG step ready: {getattr(step, 'name', f'step_{i + 1}')}")
+                        step_session_state = CopyOnWriteDict(session_state) if session_state is not None else None
+                        step_input = self._create_dag_step_input(execution_input, dependencies[i], step_outputs)
+                        ready_at = perf_counter()
+                        task = asyncio.create_task(
+                            self._aexecute_dag_step(
+                                step, step_input, session, workflow_run_response, step_session_state
+                            )
+                        )
+                        running[task] = (i, ready_at, step_session_state)
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(list(running), return_when=asyncio.FIRST_COMPLETED)
+                for task in [task for task in running if task in done]:
+                    i, ready_at, step_session_state = running.pop(task)
+                    step_output, started_at, finished_at = task.result()
+                    step_outputs[i] = step_output
+                    timings[i] = (ready_at, started_at, finished_at)
+                    if session_state is not None and step_session_state is not None:
+                        merge_parallel_session_states(session_state, [step_session_state])
+                    if step_output.stop:
+                        logger.info(f"Early termination requested by step {step_output.step_name}")
+                        stopped = True
+                    yield i, step_output
+        finally:
+            for task in running:
+                task.cancel()
+
+        self._record_critical_path(workflow_run_response, dependencies, timings)
+
+    def _record_critical_path(
+        self,
+        workflow_run_response: WorkflowRunOutput,
+        dependencies: List[List[int]],
+        timings: Dict[int, Tuple[float, float, float]],
+    ) -> None:
+        """Store the chain of steps that bounded the run's latency in the run metadata.
+
+        The path is traced back from the step that finished last, each time following the dependency that
+        finished last, since that is the one the step had to wait for.
+        """
+        if not timings:
+            return
+
+        current: Optional[int] = max(timings, key=lambda i: timings[i][2])
+        path: List[int] = []
+        while current is not None:
+            path.append(current)
+            timed_dependencies = [dependency for dependency in dependencies[current] if dependency in timings]
+            current = max(timed_dependencies, key=lambda i: timings[i][2]) if timed_dependencies else None
+        path.reverse()
+
+        run_started_at = min(ready_at for ready_at, _, _ in timings.values())
+        critical_path = {
+            "duration": timings[path[-1]][2] - run_started_at,
+            "steps": [
+                {
+                    "step_name": getattr(self.steps[i], "name", None) or f"step_{i + 1}",  # type: ignore[index]
+                    "queue_time": timings[i][1] - timings[i][0],
+                    "execution_time": timings[i][2] - timings[i][1],
+                }
+                for i in path
+            ],
+        }
+        workflow_run_response.metadata = {**(workflow_run_response.metadata or {}), "critical_path": critical_path}
+        log_debug(
+            f"Critical path ({critical_path['duration']:.3f}s): "
+            + " -> ".join(f"{step['step_name']} ({step['execution_time']:.3f}s)" for step in critical_path["steps"])
+        )
+
     def _accumulate_partial_step_data(
         self, event: Union[RunContentEvent, TeamRunContentEvent], partial_step_content: str
     ) -> str:
@@ -1225,6 +1523,8 @@ class Workflow:
             try:
                 # Track outputs from each step for enhanced data flow
                 collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
+                # Shared with the run response so a failed run still records the steps it completed
+                workflow_run_response.step_results = collected_step_outputs
                 previous_step_outputs: Dict[str, StepOutput] = {}
 
                 shared_images: List[Image] = execution_input.images or []
@@ -1236,7 +1536,26 @@ class Workflow:
                 shared_files: List[File] = execution_input.files or []
                 output_files: List[File] = (execution_input.files or []).copy()  # Start with input files
 
-                for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                # Reuse the successful leading steps when resuming an earlier run
+                resumed_step_outputs = self._get_resumed_step_outputs(session, workflow_run_response.run_id)
+
+                if self.dag_mode:
+                    # Run each step as soon as its dependencies complete; results are kept in declared order
+                    dag_step_outputs: Dict[int, StepOutput] = {}
+                    for step_index, step_output in self._run_dag(
+                        session, execution_input, workflow_run_response, session_state, resumed_step_outputs
+                    ):
+                        dag_step_outputs[step_index] = step_output
+                        collected_step_outputs[:] = [dag_step_outputs[i] for i in sorted(dag_step_outputs)]
+                        output_images.extend(step_output.images or [])
+                        output_videos.extend(step_output.videos or [])
+                        output_audio.extend(step_output.audio or [])
+                        output_files.extend(step_output.files or [])
+                    sequential_steps = []
+                else:
+                    sequential_steps = self.steps  # type: ignore[assignment]
+
+                for i, step in enumerate(sequential_steps):  # type: ignore[arg-type]
                     raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
                     step_name = getattr(step, "name", f"step_{i + 1}")
                     log_debug(f"Executing step {i + 1}/{self._get_step_count()}: {step_name}")
@@ -1254,19 +1573,23 @@ class Workflow:
                     # Check for can cellation before executing step
                     raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
 
-                    step_output = step.execute(  # type: ignore[union-attr]
-                        step_input,
-                        session_id=session.session_id,
-                        user_id=self.user_id,
-                        workflow_run_response=workflow_run_response,
-                        session_state=session_state,
-                        store_executor_outputs=self.store_executor_outputs,
-                        workflow_session=session,
-                        add_workflow_history_to_steps=self.add_workflow_history_to_steps
-                        if self.add_workflow_history_to_steps
-                        else None,
-                        num_history_runs=self.num_history_runs,
-                    )
+                    resumed_output = self._get_resumed_step_output(resumed_step_outputs, i, step_name)
+                    if resumed_output is not None:
+                        step_output = resumed_output
+                    else:
+                        step_output = step.execute(  # type: ignore[union-attr]
+                            step_input,
+                            session_id=session.session_id,
+                            user_id=self.user_id,
+                            workflow_run_response=workflow_run_response,
+                            session_state=session_state,
+                            store_executor_outputs=self.store_executor_outputs,
+                            workflow_session=session,
+                            add_workflow_history_to_steps=self.add_workflow_history_to_steps
+                            if self.add_workflow_history_to_steps
+                            else None,
+                            num_history_runs=self.num_history_runs,
+                        )
 
                     # Check for cancellation after step execution
                     raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
@@ -1397,6 +1720,8 @@ class Workflow:
             try:
                 # Track outputs from each step for enhanced data flow
                 collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
+                # Shared with the run response so a failed run still records the steps it completed
+                workflow_run_response.step_results = collected_step_outputs
                 previous_step_outputs: Dict[str, StepOutput] = {}
 
                 shared_images: List[Image] = execution_input.images or []
@@ -1415,7 +1740,29 @@ class Workflow:
                 current_step = None
                 partial_step_content = ""
 
-                for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                # Reuse the successful leading steps when resuming an earlier run
+                resumed_step_outputs = self._get_resumed_step_outputs(session, workflow_run_response.run_id)
+
+                if self.dag_mode:
+                    # Run each step as soon as its dependencies complete; results are kept in declared order
+                    dag_step_outputs: Dict[int, StepOutput] = {}
+                    for step_index, step_output in self._run_dag(
+                        session, execution_input, workflow_run_response, session_state, resumed_step_outputs
+                    ):
+                        dag_step_outputs[step_index] = step_output
+                        collected_step_outputs[:] = [dag_step_outputs[i] for i in sorted(dag_step_outputs)]
+                        output_images.extend(step_output.images or [])
+                        output_videos.extend(step_output.videos or [])
+                        output_audio.extend(step_output.audio or [])
+                        output_files.extend(step_output.files or [])
+                        yield self._transform_step_output_to_event(
+                            step_output, workflow_run_response, step_index=step_index
+                        )
+                    sequential_steps = []
+                else:
+                    sequential_steps = self.steps  # type: ignore[assignment]
+
+                for i, step in enumerate(sequential_steps):  # type: ignore[arg-type]
                     raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
                     step_name = getattr(step, "name", f"step_{i + 1}")
                     log_debug(f"Streaming step {i + 1}/{self._get_step_count()}: {step_name}")
@@ -1437,22 +1784,27 @@ class Workflow:
                     )
 
                     # Execute step with streaming and yield all events
-                    for event in step.execute_stream(  # type: ignore[union-attr]
-                        step_input,
-                        session_id=session.session_id,
-                        user_id=self.user_id,
-                        stream_events=stream_events,
-                        stream_executor_events=self.stream_executor_events,
-                        workflow_run_response=workflow_run_response,
-                        session_state=session_state,
-                        step_index=i,
-                        store_executor_outputs=self.store_executor_outputs,
-                        workflow_session=session,
-                        add_workflow_history_to_steps=self.add_workflow_history_to_steps
-                        if self.add_workflow_history_to_steps
-                        else None,
-                        num_history_runs=self.num_history_runs,
-                    ):
+                    resumed_output = self._get_resumed_step_output(resumed_step_outputs, i, step_name)
+                    if resumed_output is not None:
+                        step_events = iter([resumed_output])
+                    else:
+                        step_events = step.execute_stream(  # type: ignore[union-attr]
+                            step_input,
+                            session_id=session.session_id,
+                            user_id=self.user_id,
+                            stream_events=stream_events,
+                            stream_executor_events=self.stream_executor_events,
+                            workflow_run_response=workflow_run_response,
+                            session_state=session_state,
+                            step_index=i,
+                            store_executor_outputs=self.store_executor_outputs,
+                            workflow_session=session,
+                            add_workflow_history_to_steps=self.add_workflow_history_to_steps
+                            if self.add_workflow_history_to_steps
+                            else None,
+                            num_history_runs=self.num_history_runs,
+                        )
+                    for event in step_events:
                         raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
 
                         # Accumulate partial data from streaming events
@@ -1772,6 +2124,8 @@ class Workflow:
             try:
                 # Track outputs from each step for enhanced data flow
                 collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
+                # Shared with the run response so a failed run still records the steps it completed
+                workflow_run_response.step_results = collected_step_outputs
                 previous_step_outputs: Dict[str, StepOutput] = {}
 
                 shared_images: List[Image] = execution_input.images or []
@@ -1783,7 +2137,26 @@ class Workflow:
                 shared_files: List[File] = execution_input.files or []
                 output_files: List[File] = (execution_input.files or []).copy()  # Start with input files
 
-                for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                # Reuse the successful leading steps when resuming an earlier run
+                resumed_step_outputs = self._get_resumed_step_outputs(workflow_session, workflow_run_response.run_id)
+
+                if self.dag_mode:
+                    # Run each step as soon as its dependencies complete; results are kept in declared order
+                    dag_step_outputs: Dict[int, StepOutput] = {}
+                    async for step_index, step_output in self._arun_dag(
+                        workflow_session, execution_input, workflow_run_response, session_state, resumed_step_outputs
+                    ):
+                        dag_step_outputs[step_index] = step_output
+                        collected_step_outputs[:] = [dag_step_outputs[i] for i in sorted(dag_step_outputs)]
+                        output_images.extend(step_output.images or [])
+                        output_videos.extend(step_output.videos or [])
+                        output_audio.extend(step_output.audio or [])
+                        output_files.extend(step_output.files or [])
+                    sequential_steps = []
+                else:
+                    sequential_steps = self.steps  # type: ignore[assignment]
+
+                for i, step in enumerate(sequential_steps):  # type: ignore[arg-type]
                     raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
                     step_name = getattr(step, "name", f"step_{i + 1}")
                     log_debug(f"Async Executing step {i + 1}/{self._get_step_count()}: {step_name}")
@@ -1801,19 +2174,23 @@ class Workflow:
                     # Check for cancellation before executing step
                     raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
 
-                    step_output = await step.aexecute(  # type: ignore[union-attr]
-                        step_input,
-                        session_id=session_id,
-                        user_id=self.user_id,
-                        workflow_run_response=workflow_run_response,
-                        session_state=session_state,
-                        store_executor_outputs=self.store_executor_outputs,
-                        workflow_session=workflow_session,
-                        add_workflow_history_to_steps=self.add_workflow_history_to_steps
-                        if self.add_workflow_history_to_steps
-                        else None,
-                        num_history_runs=self.num_history_runs,
-                    )
+                    resumed_output = self._get_resumed_step_output(resumed_step_outputs, i, step_name)
+                    if resumed_output is not None:
+                        step_output = resumed_output
+                    else:
+                        step_output = await step.aexecute(  # type: ignore[union-attr]
+                            step_input,
+                            session_id=session_id,
+                            user_id=self.user_id,
+                            workflow_run_response=workflow_run_response,
+                            session_state=session_state,
+                            store_executor_outputs=self.store_executor_outputs,
+                            workflow_session=workflow_session,
+                            add_workflow_history_to_steps=self.add_workflow_history_to_steps
+                            if self.add_workflow_history_to_steps
+                            else None,
+                            num_history_runs=self.num_history_runs,
+                        )
 
                     # Check for cancellation after step execution
                     raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
@@ -1957,6 +2334,8 @@ class Workflow:
             try:
                 # Track outputs from each step for enhanced data flow
                 collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
+                # Shared with the run response so a failed run still records the steps it completed
+                workflow_run_response.step_results = collected_step_outputs
                 previous_step_outputs: Dict[str, StepOutput] = {}
 
                 shared_images: List[Image] = execution_input.images or []
@@ -1975,7 +2354,29 @@ class Workflow:
                 current_step = None
                 partial_step_content = ""
 
-                for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                # Reuse the successful leading steps when resuming an earlier run
+                resumed_step_outputs = self._get_resumed_step_outputs(workflow_session, workflow_run_response.run_id)
+
+                if self.dag_mode:
+                    # Run each step as soon as its dependencies complete; results are kept in declared order
+                    dag_step_outputs: Dict[int, StepOutput] = {}
+                    async for step_index, step_output in self._arun_dag(
+                        workflow_session, execution_input, workflow_run_response, session_state, resumed_step_outputs
+                    ):
+                        dag_step_outputs[step_index] = step_output
+                        collected_step_outputs[:] = [dag_step_outputs[i] for i in sorted(dag_step_outputs)]
+                        output_images.extend(step_output.images or [])
+                        output_videos.extend(step_output.videos or [])
+                        output_audio.extend(step_output.audio or [])
+                        output_files.extend(step_output.files or [])
+                        yield self._transform_step_output_to_event(
+                            step_output, workflow_run_response, step_index=step_index
+                        )
+                    sequential_steps = []
+                else:
+                    sequential_steps = self.steps  # type: ignore[assignment]
+
+                for i, step in enumerate(sequential_steps):  # type: ignore[arg-type]
                     if workflow_run_response.run_id:
                         raise_if_cancelled(workflow_run_response.run_id)
                     step_name = getattr(step, "name", f"step_{i + 1}")
@@ -1997,22 +2398,27 @@ class Workflow:
                     )
 
                     # Execute step with streaming and yield all events
-                    async for event in step.aexecute_stream(  # type: ignore[union-attr]
-                        step_input,
-                        session_id=session_id,
-                        user_id=self.user_id,
-                        stream_events=stream_events,
-                        stream_executor_events=self.stream_executor_events,
-                        workflow_run_response=workflow_run_response,
-                        session_state=session_state,
-                        step_index=i,
-                        store_executor_outputs=self.store_executor_outputs,
-                        workflow_session=workflow_session,
-                        add_workflow_history_to_steps=self.add_workflow_history_to_steps
-                        if self.add_workflow_history_to_steps
-                        else None,
-                        num_history_runs=self.num_history_runs,
-                    ):
+                    resumed_output = self._get_resumed_step_output(resumed_step_outputs, i, step_name)
+                    if resumed_output is not None:
+                        step_events = self._areplay_step_output(resumed_output)
+                    else:
+                        step_events = step.aexecute_stream(  # type: ignore[union-attr]
+                            step_input,
+                            session_id=session_id,
+                            user_id=self.user_id,
+                            stream_events=stream_events,
+                            stream_executor_events=self.stream_executor_events,
+                            workflow_run_response=workflow_run_response,
+                            session_state=session_state,
+                            step_index=i,
+                            store_executor_outputs=self.store_executor_outputs,
+                            workflow_session=workflow_session,
+                            add_workflow_history_to_steps=self.add_workflow_history_to_steps
+                            if self.add_workflow_history_to_steps
+                            else None,
+                            num_history_runs=self.num_history_runs,
+                        )
+                    async for event in step_events:
                         if workflow_run_response.run_id:
                             raise_if_cancelled(workflow_run_response.run_id)
 
@@ -2228,11 +2634,12 @@ class Workflow:
         images: Optional[List[Image]] = None,
         videos: Optional[List[Video]] = None,
         files: Optional[List[File]] = None,
+        resume_run_id: Optional[str] = None,
         **kwargs: Any,
     ) -> WorkflowRunOutput:
         """Execute workflow in background using asyncio.create_task()"""
 
-        run_id = str(uuid4())
+        run_id = resume_run_id or str(uuid4())
 
         self.initialize_workflow()
 
@@ -2255,6 +2662,9 @@ class Workflow:
             created_at=int(datetime.now().timestamp()),
             status=RunStatus.pending,
         )
+        if resume_run_id is not None:
+            # Keep the completed steps of the earlier attempt so the execution can skip them
+            workflow_run_response.step_results = self._get_resumed_step_outputs(workflow_session, resume_run_id)  # type: ignore[assignment]
 
         # Store PENDING response immediately
         workflow_session.upsert_run(run=workflow_run_response)
@@ -2325,11 +2735,12 @@ class Workflow:
         files: Optional[List[File]] = None,
         stream_events: bool = False,
         websocket_handler: Optional[WebSocketHandler] = None,
+        resume_run_id: Optional[str] = None,
         **kwargs: Any,
     ) -> WorkflowRunOutput:
         """Execute workflow in background with streaming and WebSocket broadcasting"""
 
-        run_id = str(uuid4())
+        run_id = resume_run_id or str(uuid4())
 
         self.initialize_workflow()
 
@@ -2352,6 +2763,9 @@ class Workflow:
             created_at=int(datetime.now().timestamp()),
             status=RunStatus.pending,
         )
+        if resume_run_id is not None:
+            # Keep the completed steps of the earlier attempt so the execution can skip them
+            workflow_run_response.step_results = self._get_resumed_step_outputs(workflow_session, resume_run_id)  # type: ignore[assignment]
 
         # Store PENDING response immediately
         workflow_session.upsert_run(run=workflow_run_response)
@@ -2466,6 +2880,7 @@ class Workflow:
         stream_events: Optional[bool] = None,
         stream_intermediate_steps: Optional[bool] = None,
         background: Optional[bool] = False,
+        resume_run_id: Optional[str] = None,
     ) -> WorkflowRunOutput: ...
 
     @overload
@@ -2484,6 +2899,7 @@ class Workflow:
         stream_events: Optional[bool] = None,
         stream_intermediate_steps: Optional[bool] = None,
         background: Optional[bool] = False,
+        resume_run_id: Optional[str] = None,
     ) -> Iterator[WorkflowRunOutputEvent]: ...
 
     def run(
@@ -2501,6 +2917,7 @@ class Workflow:
         stream_events: Optional[bool] = None,
         stream_intermediate_steps: Optional[bool] = None,
         background: Optional[bool] = False,
+        resume_run_id: Optional[str] = None,
         **kwargs: Any,
     ) -> Union[WorkflowRunOutput, Iterator[WorkflowRunOutputEvent]]:
         """Execute the workflow synchronously with optional streaming"""
@@ -2513,7 +2930,8 @@ class Workflow:
 
         self._set_debug()
 
-        run_id = str(uuid4())
+        # Resuming reuses the run_id so completed steps are found and the earlier attempt is replaced
+        run_id = resume_run_id or str(uuid4())
 
         self.initialize_workflow()
         session_id, user_id = self._initialize_session(session_id=session_id, user_id=user_id)
@@ -2605,6 +3023,7 @@ class Workflow:
         stream_events: Optional[bool] = None,
         stream_intermediate_steps: Optional[bool] = None,
         background: Optional[bool] = False,
+        resume_run_id: Optional[str] = None,
         websocket: Optional[WebSocket] = None,
     ) -> WorkflowRunOutput: ...
 
@@ -2624,6 +3043,7 @@ class Workflow:
         stream_events: Optional[bool] = None,
         stream_intermediate_steps: Optional[bool] = None,
         background: Optional[bool] = False,
+        resume_run_id: Optional[str] = None,
         websocket: Optional[WebSocket] = None,
     ) -> AsyncIterator[WorkflowRunOutputEvent]: ...
 
@@ -2642,6 +3062,7 @@ class Workflow:
         stream_events: Optional[bool] = None,
         stream_intermediate_steps: Optional[bool] = False,
         background: Optional[bool] = False,
+        resume_run_id: Optional[str] = None,
         websocket: Optional[WebSocket] = None,
         **kwargs: Any,
     ) -> Union[WorkflowRunOutput, AsyncIterator[WorkflowRunOutputEvent]]:
@@ -2673,6 +3094,7 @@ class Workflow:
                     files=files,
                     stream_events=stream_events,
                     websocket_handler=websocket_handler,
+                    resume_run_id=resume_run_id,
                     **kwargs,
                 )
             elif stream and not websocket:
@@ -2690,12 +3112,14 @@ class Workflow:
                     images=images,
                     videos=videos,
                     files=files,
+                    resume_run_id=resume_run_id,
                     **kwargs,
                 )
 
         self._set_debug()
 
-        run_id = str(uuid4())
+        # Resuming reuses the run_id so completed steps are found and the earlier attempt is replaced
+        run_id = resume_run_id or str(uuid4())
 
         self.initialize_workflow()
         session_id, user_id = self._initialize_session(session_id=session_id, user_id=user_id)
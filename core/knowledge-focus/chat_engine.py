@@ -723,11 +723,13 @@ class ConversationManager:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
         self._conversations = {}  # 简化实现，实际应该使用数据库
+        self._message_positions = {}  # session_id -> {message_id: 在会话中的位置}，用于键集分页
 
     def add_message(self, session_id: str, user_id: str, agent_id: str, role: str, content: str):
         """添加消息"""
         if session_id not in self._conversations:
             self._conversations[session_id] = []
+            self._message_positions[session_id] = {}
 
         message = {
             'id': str(uuid.uuid4()),
@@ -738,7 +740,9 @@ class ConversationManager:
             'content': content,
             'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
+        self._message_positions[session_id][message['id']] = len(self._conversations[session_id])
         self._conversations[session_id].append(message)
+        return message
 
     def get_conversation_history(self, session_id: str, limit: int = 50) -> List[Dict]:
         """获取对话历史"""
@@ -746,10 +750,27 @@ class ConversationManager:
             return self._conversations[session_id][-limit:]
         return []
 
+    def get_conversation_page(self, session_id: str, before_id: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        """键集分页获取对话历史
+
+        返回早于 before_id 的最近 limit 条消息（按时间顺序），before_id 为空时返回最新的一页。
+        以上一页最早一条消息的 id 作为下一次的 before_id 即可继续向前翻页
+        """
+        messages = self._conversations.get(session_id)
+        if not messages:
+            return []
+        end = len(messages)
+        if before_id is not None:
+            end = self._message_positions[session_id].get(before_id)
+            if end is None:
+                return []
+        return messages[max(0, end - limit):end]
+
     def clear_conversation_history(self, session_id: str) -> bool:
         """清空对话历史"""
         if session_id in self._conversations:
             self._conversations[session_id] = []
+            self._message_positions[session_id] = {}
             return True
         return False
 
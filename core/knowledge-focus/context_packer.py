@@ -0,0 +1,278 @@
+"""
+上下文打包器
+
+按当前模型的上下文长度，把系统prompt、工具、历史消息和RAG上下文放进同一个token预算：
+每个组成部分只计数一次（带缓存的分词器），再按可配置的优先级和占比上限分配预算，
+并给出每一轮的分配报告
+"""
+
+import json
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from threading import Lock
+from typing import Any, Dict, List, Optional, Sequence
+
+from core.utils import num_tokens_from_string
+
+logger = logging.getLogger()
+
+# 模型未配置上下文长度时使用的保守默认值
+DEFAULT_CONTEXT_LENGTH = 8192
+# 模型未配置最大输出时为回复预留的token数
+DEFAULT_OUTPUT_RESERVE = 1024
+# 每条消息的格式开销（role、分隔符），与OpenAI cookbook的计数方式一致
+TOKENS_PER_MESSAGE = 3
+
+
+class TokenCounter:
+    """
+    带缓存的token计数器
+
+    分词器（tiktoken编码表）只加载一次；按内容哈希缓存计数结果，
+    历史消息、工具定义这类每轮都会重复出现的内容只需计数一次
+    """
+
+    def __init__(self, encoding_name: str = "o200k_base", cache_size: int = 8192):
+        self.encoding_name = encoding_name
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[bytes, int]" = OrderedDict()
+        self._lock = Lock()
+
+    def count(self, text: Optional[str]) -> int:
+        """计算文本的token数"""
+        if not text:
+            return 0
+        key = blake2b(text.encode("utf-8"), digest_size=16).digest()
+        with self._lock:
+            tokens = self._cache.get(key)
+            if tokens is not None:
+                self._cache.move_to_end(key)
+                return tokens
+
+        tokens = num_tokens_from_string(text, self.encoding_name)
+        with self._lock:
+            self._cache[key] = tokens
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return tokens
+
+    def count_message(self, role: str, content: Optional[str]) -> int:
+        """计算一条对话消息的token数，包含消息格式开销"""
+        return TOKENS_PER_MESSAGE + self.count(role) + self.count(content)
+
+    def count_tool(self, tool: Any) -> int:
+        """计算一个工具定义的token数，按模型收到的JSON schema计数"""
+        return self.count(tool_definition(tool))
+
+
+def tool_name(tool: Any) -> str:
+    """工具发送给模型的名称"""
+    if hasattr(tool, 'function') and hasattr(tool.function, '__name__'):
+        return tool.function.__name__
+    if hasattr(tool, 'name'):
+        return tool.name
+    return getattr(tool, '__name__', "unknown_tool")
+
+
+def tool_definition(tool: Any) -> str:
+    """工具发送给模型的定义（名称、描述、参数schema）的紧凑JSON表示"""
+    return json.dumps({
+        "name": tool_name(tool),
+        "description": getattr(tool, 'description', None) or getattr(tool, '__doc__', None) or "",
+        "parameters": getattr(tool, 'parameters', None) or {},
+    }, ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+# 进程内共用的计数器
+token_counter = TokenCounter()
+
+
+@dataclass
+class ContextComponent:
+    """
+    上下文的一个组成部分
+
+    Attributes:
+        name: 名称，如 system、tools、history、rag
+        items: 组成该部分的条目，按保留优先顺序排列（最重要的在前）
+        tokens: 每个条目的token数，与items一一对应
+        priority: 数值越小越先分配预算
+        required: 必需的部分总是完整保留，先于其他部分扣除
+        max_share: 第一轮分配时最多占用可分配预算的比例，剩余预算在第二轮按优先级补给
+        contiguous: 遇到第一个放不下的条目即停止，保证保留的条目连续（如历史消息不出现断层）
+    """
+    name: str
+    items: List[Any]
+    tokens: List[int]
+    priority: int = 0
+    required: bool = False
+    max_share: float = 1.0
+    contiguous: bool = False
+
+    @property
+    def requested(self) -> int:
+        return sum(self.tokens)
+
+
+@dataclass
+class PackedContext:
+    """打包结果：每个部分保留的条目及本轮的预算分配报告"""
+    budget: int
+    items: Dict[str, List[Any]] = field(default_factory=dict)
+    allocation: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def used(self) -> int:
+        return sum(report["used"] for report in self.allocation.values())
+
+    def report(self) -> Dict[str, Any]:
+        """本轮的分配报告"""
+        return {"budget": self.budget, "used": self.used, "components": self.allocation}
+
+    def summary(self) -> str:
+        """单行的分配摘要，用于日志"""
+        parts = [
+            f"{name} {report['used']}/{report['requested']} ({report['kept']}/{report['total']}项)"
+            for name, report in self.allocation.items()
+        ]
+        return f"上下文预算 {self.used}/{self.budget} tokens: " + ", ".join(parts)
+
+
+class ContextPacker:
+    """
+    上下文打包器
+
+    可分配预算 = 上下文长度 - 回复预留。必需部分先完整扣除；其余部分按优先级依次分配，
+    第一轮每部分最多占用max_share比例的预算，第二轮把剩余预算按优先级补给仍未装满的部分。
+    每个部分按条目顺序贪心装入，放不下的条目跳过，后面更短的条目仍可装入（contiguous的部分则到此为止）
+    """
+
+    # 默认优先级和占比上限，可通过priorities参数覆盖
+    DEFAULT_PRIORITIES = {
+        "system": {"priority": 0, "required": True},
+        "user": {"priority": 0, "required": True},
+        # 工具被裁掉时模型会调用不到它，与系统prompt一样必须完整保留
+        "tools": {"priority": 0, "required": True},
+        "rag": {"priority": 2, "max_share": 0.5},
+        "history": {"priority": 3, "max_share": 0.5, "contiguous": True},
+    }
+
+    def __init__(self, max_context_length: int = 0, max_output_tokens: int = 0,
+                 priorities: Optional[Dict[str, Dict[str, Any]]] = None,
+                 counter: Optional[TokenCounter] = None, budget: Optional[int] = None):
+        """
+        Args:
+            max_context_length: 模型的上下文长度（含输出），为0时使用DEFAULT_CONTEXT_LENGTH
+            max_output_tokens: 为回复预留的token数，为0时使用DEFAULT_OUTPUT_RESERVE
+            priorities: 按名称覆盖各部分的priority、required、max_share、contiguous
+            counter: token计数器，默认使用进程内共用的token_counter
+            budget: 直接指定可分配预算，忽略上下文长度和回复预留
+        """
+        self.max_context_length = max_context_length or DEFAULT_CONTEXT_LENGTH
+        output_reserve = max_output_tokens or DEFAULT_OUTPUT_RESERVE
+        # 回复预留最多占上下文的一半，避免配置错误时没有输入预算
+        self.output_reserve = min(output_reserve, self.max_context_length // 2)
+        self.priorities = {**self.DEFAULT_PRIORITIES, **(priorities or {})}
+        self.counter = counter or token_counter
+        self._budget = budget
+        self._components: List[ContextComponent] = []
+
+    @classmethod
+    def from_model_interface(cls, model_interface, **kwargs) -> "ContextPacker":
+        """根据当前模型的配置（ModelUseInterface）创建"""
+        return cls(
+            max_context_length=model_interface.max_context_length,
+            max_output_tokens=model_interface.max_output_tokens,
+            **kwargs,
+        )
+
+    @property
+    def budget(self) -> int:
+        """可分配给输入的token数"""
+        if self._budget is not None:
+            return self._budget
+        return self.max_context_length - self.output_reserve
+
+    def add(self, name: str, items: Sequence[Any], tokens: Optional[Sequence[int]] = None,
+            **options) -> "ContextPacker":
+        """
+        添加一个组成部分
+
+        Args:
+            name: 名称，默认优先级见DEFAULT_PRIORITIES
+            items: 条目，按保留优先顺序排列（历史消息从新到旧）。未给出tokens时条目必须是字符串
+            tokens: 每个条目的token数，已计数过的条目（如工具）可直接传入
+            options: 覆盖该部分的priority、required、max_share、contiguous
+        """
+        items = list(items)
+        if tokens is None:
+            tokens = [self.counter.count(item) for item in items]
+        config = {"priority": 10, **self.priorities.get(name, {}), **options}
+        self._components.append(ContextComponent(name=name, items=items, tokens=list(tokens), **config))
+        return self
+
+    def add_text(self, name: str, text: Optional[str], **options) -> "ContextPacker":
+        """添加只有一段文本的组成部分"""
+        return self.add(name, [text] if text else [], **options)
+
+    def pack(self) -> PackedContext:
+        """分配预算并选出每个部分保留的条目，条目保持添加时的顺序"""
+        packed = PackedContext(budget=self.budget)
+        kept: Dict[str, List[int]] = {component.name: [] for component in self._components}
+        used: Dict[str, int] = {component.name: 0 for component in self._components}
+
+        # 必需部分完整保留
+        remaining = self.budget
+        for component in self._components:
+            if component.required:
+                kept[component.name] = list(range(len(component.items)))
+                used[component.name] = component.requested
+                remaining -= component.requested
+        if remaining < 0:
+            required = ", ".join(f"{c.name} {c.requested}" for c in self._components if c.required)
+            logger.warning(f"必需的上下文已超出预算 {-remaining} tokens（{required}）")
+            remaining = 0
+
+        optional = sorted((c for c in self._components if not c.required), key=lambda c: c.priority)
+        distributable = remaining
+        # 第一轮受占比上限约束，第二轮补给剩余预算
+        for capped in (True, False):
+            for component in optional:
+                limit = remaining
+                if capped:
+                    limit = min(limit, int(distributable * component.max_share))
+                allowance = limit - used[component.name] if capped else limit
+                if allowance <= 0:
+                    continue
+                taken = self._fill(component, kept[component.name], allowance)
+                used[component.name] += taken
+                remaining -= taken
+
+        for component in self._components:
+            indexes = sorted(kept[component.name])
+            packed.items[component.name] = [component.items[index] for index in indexes]
+            packed.allocation[component.name] = {
+                "requested": component.requested,
+                "used": used[component.name],
+                "kept": len(indexes),
+                "total": len(component.items),
+            }
+        return packed
+
+    @staticmethod
+    def _fill(component: ContextComponent, kept: List[int], allowance: int) -> int:
+        """按顺序贪心装入未保留的条目，返回新占用的token数"""
+        taken = 0
+        chosen = set(kept)
+        for index, tokens in enumerate(component.tokens):
+            if index in chosen:
+                continue
+            if taken + tokens > allowance:
+                if component.contiguous:
+                    break
+                continue
+            kept.append(index)
+            taken += tokens
+        return taken
@@ -15,15 +15,26 @@ from sqlmodel import (
     Enum,
     JSON,
 )
-from sqlalchemy import Engine
+from sqlalchemy import Connection, Engine
+from sqlalchemy.exc import OperationalError
 from datetime import datetime
 from enum import Enum as PyEnum
 from typing import List, Dict, Any, Union, Optional
 import os,sys
+import time
+import logging
 
 sys.path.append(r"D:\Workspace\LeafKnow")
 from core.config import BUILTMODELS
-    
+
+logger = logging.getLogger()
+
+# 数据库结构版本和初始数据版本，初始化完成后记录在 t_system_config 中
+SCHEMA_VERSION = 1
+SEED_VERSION = 1
+SCHEMA_VERSION_KEY = "db_schema_version"
+SEED_VERSION_KEY = "db_seed_version"
+
 # 任务状态枚举
 class TaskStatus(str, PyEnum):
     RESERVED = "reserved"  # 预留/占位状态，等待数据填充
@@ -480,370 +491,424 @@ class DBManager:
         self.engine = engine
 
     def init_db(self) -> bool:
-        """初始化数据库 - 使用统一的Session连接管理，避免多连接冲突"""
-        inspector = inspect(self.engine)
-        
-        with Session(self.engine) as session:
-            # 创建任务表
-            if not inspector.has_table(Task.__tablename__):
-                # 使用engine创建表
-                Task.__table__.create(self.engine, checkfirst=True)
-                print(f"Created table {Task.__tablename__}")
-                # * 删除表中已经完成的24小时之前的任务
-                session.exec(text(f'''
-                    DELETE FROM {Task.__tablename__}
-                    WHERE status = 'completed' AND updated_at < datetime('now', '-24 hours');
-                '''))
-                session.commit()
-        with Session(self.engine) as session:
-            # 创建通知表
-            if not inspector.has_table(Notification.__tablename__):
-                Notification.__table__.create(self.engine, checkfirst=True)
-                # 创建触发器 - 当任务表中洞察任务状态成功完成时插入通知
-                # conn.execute(text(f'''
-                #     CREATE TRIGGER IF NOT EXISTS notify_insight_task
-                #     AFTER UPDATE ON {Task.__tablename__}
-                #     FOR EACH ROW
-                #     WHEN NEW.task_type = 'insight' AND NEW.status = 'completed' AND NEW.result = 'success'
-                #     BEGIN
-                #         INSERT INTO {Notification.__tablename__} (task_id, message, created_at, read)
-                #         VALUES (NEW.id, '洞察任务完成', CURRENT_TIMESTAMP, 0);
-                #     END;
-                # '''))
-                session.commit()
-        with Session(self.engine) as session:
-            # 创建文件夹表
-            if not inspector.has_table(MyFolders.__tablename__):
-                MyFolders.__table__.create(self.engine, checkfirst=True)
-                self._init_default_directories()  # 初始化默认文件夹
-            
-            # 创建Bundle扩展名表
-            if not inspector.has_table(BundleExtension.__tablename__):
-                BundleExtension.__table__.create(self.engine, checkfirst=True)
-                self._init_bundle_extensions()  # 初始化Bundle扩展名数据
-            
-            # 创建系统配置表
-            if not inspector.has_table(SystemConfig.__tablename__):
-                SystemConfig.__table__.create(self.engine, checkfirst=True)
-                system_configs = [
-                    {
-                        "key": "proxy",
-                        "value": "http://127.0.0.1:7890",
-                        "description": "Proxy server address"
-                    },
-                ]
-                for config_data in system_configs:
-                    new_config = SystemConfig(
-                        key=config_data["key"],
-                        value=config_data["value"],
-                        description=config_data["description"]
-                    )
-                    session.add(new_config)
-                session.commit()
-            
-            # 创建文件分类表
-            if not inspector.has_table(FileCategory.__tablename__):
-                FileCategory.__table__.create(self.engine, checkfirst=True)
-                self._init_file_categories()  # 初始化文件分类数据
-            
-            # 创建文件扩展名映射表
-            if not inspector.has_table(FileExtensionMap.__tablename__):
-                FileExtensionMap.__table__.create(self.engine, checkfirst=True)
-                self._init_file_extensions()  # 初始化文件扩展名映射数据
-            
-            # 创建文件过滤规则表
-            if not inspector.has_table(FileFilterRule.__tablename__):
-                FileFilterRule.__table__.create(self.engine, checkfirst=True)
-                self._init_basic_file_filter_rules()  # 初始化基础文件过滤规则（简化版）
-                        
-            # 创建标签表
-            if not inspector.has_table(Tags.__tablename__):
-                Tags.__table__.create(self.engine, checkfirst=True)
-            
-            # 创建文件粗筛结果表
-            if not inspector.has_table(FileScreeningResult.__tablename__):
-                FileScreeningResult.__table__.create(self.engine, checkfirst=True)
-                # 创建索引 - 为文件路径创建唯一索引
-                session.exec(text(f'CREATE UNIQUE INDEX IF NOT EXISTS idx_file_path ON {FileScreeningResult.__tablename__} (file_path);'))
-                # 创建索引 - 为文件状态创建索引，便于查询待处理文件
-                session.exec(text(f'CREATE INDEX IF NOT EXISTS idx_file_status ON {FileScreeningResult.__tablename__} (status);'))
-                # 创建索引 - 为修改时间创建索引，便于按时间查询
-                session.exec(text(f'CREATE INDEX IF NOT EXISTS idx_modified_time ON {FileScreeningResult.__tablename__} (modified_time);'))
-                # 创建索引 - 为task_id创建索引，便于查询关联任务
-                session.exec(text(f'CREATE INDEX IF NOT EXISTS idx_task_id ON {FileScreeningResult.__tablename__} (task_id);'))
-
-            # 创建 FTS5 虚拟表和触发器
-            if not inspector.has_table('t_files_fts'):
-                session.exec(text("""
-                    CREATE VIRTUAL TABLE t_files_fts USING fts5(
-                        file_id UNINDEXED,
-                        tags_search_ids
-                    );
-                """))
-            
-            # 删除旧的触发器（如果存在）
-            session.exec(text("DROP TRIGGER IF EXISTS trg_files_after_insert;"))
-            session.exec(text("DROP TRIGGER IF EXISTS trg_files_after_delete;"))
-            session.exec(text("DROP TRIGGER IF EXISTS trg_files_after_update;"))
-            
-            # 创建新的触发器
+        """初始化数据库
+
+        t_system_config 中记录了已应用的结构版本和初始数据版本，两者都是最新时只需一次查询即可返回。
+        否则在同一个写事务中依次建表、执行迁移、写入初始数据并更新版本号，中途失败则整体回滚。
+        """
+        started = time.perf_counter()
+        schema_version, seed_version = self._get_db_versions()
+        logger.info(f"数据库版本检查耗时 {time.perf_counter() - started:.3f}s (schema={schema_version}, seed={seed_version})")
+        if schema_version >= SCHEMA_VERSION and seed_version >= SEED_VERSION:
+            logger.info("数据库结构和初始数据已是最新，跳过初始化")
+            return True
+
+        with self.engine.connect() as conn:
+            # 先拿到写锁，同时启动的其他进程会在这里等待，而不是并发地建表和写入初始数据
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            try:
+                with Session(bind=conn) as session:
+                    # 等锁期间可能已有其他进程完成了初始化
+                    schema_version, seed_version = self._get_db_versions(session)
+
+                    phase_started = time.perf_counter()
+                    created_tables = self._create_tables(conn, session)
+                    logger.info(f"建表耗时 {time.perf_counter() - phase_started:.3f}s，新建 {len(created_tables)} 张表")
+
+                    phase_started = time.perf_counter()
+                    applied = self._run_migrations(session, schema_version)
+                    logger.info(f"迁移耗时 {time.perf_counter() - phase_started:.3f}s，执行 {applied} 个迁移")
+
+                    phase_started = time.perf_counter()
+                    seeded = self._seed_tables(session, seed_version)
+                    logger.info(f"初始数据写入耗时 {time.perf_counter() - phase_started:.3f}s，执行 {seeded} 个初始数据版本")
+
+                    self._set_db_versions(session)
+                    session.flush()
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        logger.info(f"数据库初始化完成，总耗时 {time.perf_counter() - started:.3f}s")
+        return True
+
+    def _get_db_versions(self, session: Optional[Session] = None) -> tuple:
+        """读取已记录的 (结构版本, 初始数据版本)，没有记录时为 0"""
+        stmt = select(SystemConfig.key, SystemConfig.value).where(
+            SystemConfig.key.in_([SCHEMA_VERSION_KEY, SEED_VERSION_KEY])
+        )
+        try:
+            if session is not None:
+                rows = session.exec(stmt).all()
+            else:
+                with Session(self.engine) as new_session:
+                    rows = new_session.exec(stmt).all()
+        except OperationalError:
+            # 全新数据库，t_system_config 还不存在
+            return 0, 0
+        versions = {key: int(value) for key, value in rows}
+        return versions.get(SCHEMA_VERSION_KEY, 0), versions.get(SEED_VERSION_KEY, 0)
+
+    def _set_db_versions(self, session: Session) -> None:
+        """把当前的结构版本和初始数据版本写入 t_system_config"""
+        for key, version, description in (
+            (SCHEMA_VERSION_KEY, SCHEMA_VERSION, "Applied database schema version"),
+            (SEED_VERSION_KEY, SEED_VERSION, "Applied database seed data version"),
+        ):
+            config = session.exec(select(SystemConfig).where(SystemConfig.key == key)).first()
+            if config is None:
+                config = SystemConfig(key=key, value=str(version), description=description)
+            else:
+                config.value = str(version)
+                config.updated_at = datetime.now()
+            session.add(config)
+
+    def _run_migrations(self, session: Session, schema_version: int) -> int:
+        """按版本顺序执行尚未应用的迁移，返回执行的迁移数。每个迁移都必须可以重复执行"""
+        applied = 0
+        for version, migration in self._migrations():
+            if version > schema_version:
+                migration(session)
+                logger.info(f"已执行数据库迁移 v{version}: {migration.__name__}")
+                applied += 1
+        return applied
+
+    def _migrations(self) -> list:
+        """有序的迁移列表，新增迁移时追加到末尾并同步增大 SCHEMA_VERSION"""
+        return [
+            (1, self._migrate_files_fts_triggers),
+        ]
+
+    def _migrate_files_fts_triggers(self, session: Session) -> None:
+        """重建 t_files_fts 的同步触发器"""
+        # 删除旧的触发器（如果存在）
+        session.exec(text("DROP TRIGGER IF EXISTS trg_files_after_insert;"))
+        session.exec(text("DROP TRIGGER IF EXISTS trg_files_after_delete;"))
+        session.exec(text("DROP TRIGGER IF EXISTS trg_files_after_update;"))
+
+        # 创建新的触发器
+        session.exec(text(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_files_after_insert AFTER INSERT ON {FileScreeningResult.__tablename__}
+            BEGIN
+                INSERT INTO t_files_fts (file_id, tags_search_ids)
+                VALUES (NEW.id, REPLACE(IFNULL(NEW.tags_display_ids, ''), ',', ' '));
+            END;
+        """))
+
+        session.exec(text(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_files_after_delete AFTER DELETE ON {FileScreeningResult.__tablename__}
+            BEGIN
+                DELETE FROM t_files_fts WHERE file_id = OLD.id;
+            END;
+        """))
+
+        session.exec(text(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_files_after_update AFTER UPDATE ON {FileScreeningResult.__tablename__}
+            BEGIN
+                DELETE FROM t_files_fts WHERE file_id = OLD.id;
+                INSERT INTO t_files_fts (file_id, tags_search_ids)
+                VALUES (NEW.id, REPLACE(IFNULL(NEW.tags_display_ids, ''), ',', ' '));
+            END;
+        """))
+
+    def _create_tables(self, conn: Connection, session: Session) -> set:
+        """创建缺失的表及其索引，返回本次新建的表名"""
+        inspector = inspect(conn)
+        created = set()
+        for model in (
+            Task, Notification, MyFolders, BundleExtension, SystemConfig, FileCategory, FileExtensionMap,
+            FileFilterRule, Tags, FileScreeningResult, Document, ParentChunk, ChildChunk, ChatSession,
+            ChatMessage, ChatSessionPinFile, ModelProvider, ModelConfiguration, CapabilityAssignment, User,
+            Tool, Scenario,
+        ):
+            if not inspector.has_table(model.__tablename__):
+                model.__table__.create(conn, checkfirst=True)
+                logger.info(f"Created table {model.__tablename__}")
+                created.add(model.__tablename__)
+
+        if Task.__tablename__ in created:
+            # * 删除表中已经完成的24小时之前的任务
+            session.exec(text(f'''
+                DELETE FROM {Task.__tablename__}
+                WHERE status = 'completed' AND updated_at < datetime('now', '-24 hours');
+            '''))
+        if FileScreeningResult.__tablename__ in created:
+            # 创建索引 - 为文件路径创建唯一索引
+            session.exec(text(f'CREATE UNIQUE INDEX IF NOT EXISTS idx_file_path ON {FileScreeningResult.__tablename__} (file_path);'))
+            # 创建索引 - 为文件状态创建索引，便于查询待处理文件
+            session.exec(text(f'CREATE INDEX IF NOT EXISTS idx_file_status ON {FileScreeningResult.__tablename__} (status);'))
+            # 创建索引 - 为修改时间创建索引，便于按时间查询
+            session.exec(text(f'CREATE INDEX IF NOT EXISTS idx_modified_time ON {FileScreeningResult.__tablename__} (modified_time);'))
+            # 创建索引 - 为task_id创建索引，便于查询关联任务
+            session.exec(text(f'CREATE INDEX IF NOT EXISTS idx_task_id ON {FileScreeningResult.__tablename__} (task_id);'))
+        # 创建 FTS5 虚拟表，触发器由迁移维护
+        if not inspector.has_table('t_files_fts'):
+            session.exec(text("""
+                CREATE VIRTUAL TABLE t_files_fts USING fts5(
+                    file_id UNINDEXED,
+                    tags_search_ids
+                );
+            """))
+            created.add('t_files_fts')
+        if ChatMessage.__tablename__ in created:
+            # INDEX(session_id, created_at)   -- 查询优化
             session.exec(text(f"""
-                CREATE TRIGGER IF NOT EXISTS trg_files_after_insert AFTER INSERT ON {FileScreeningResult.__tablename__}
-                BEGIN
-                    INSERT INTO t_files_fts (file_id, tags_search_ids)
-                    VALUES (NEW.id, REPLACE(IFNULL(NEW.tags_display_ids, ''), ',', ' '));
-                END;
+                CREATE INDEX IF NOT EXISTS idx_chat_message_session ON {ChatMessage.__tablename__} (session_id, created_at);
             """))
-
+        if ChatSessionPinFile.__tablename__ in created:
+            # UNIQUE(session_id, file_path)   -- 同一会话中文件唯一
             session.exec(text(f"""
-                CREATE TRIGGER IF NOT EXISTS trg_files_after_delete AFTER DELETE ON {FileScreeningResult.__tablename__}
-                BEGIN
-                    DELETE FROM t_files_fts WHERE file_id = OLD.id;
-                END;
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_chat_session_pin_file ON {ChatSessionPinFile.__tablename__} (session_id, file_path);
             """))
-
+        if ModelConfiguration.__tablename__ in created:
+            # provider_id和model_identifier的组合唯一
             session.exec(text(f"""
-                CREATE TRIGGER IF NOT EXISTS trg_files_after_update AFTER UPDATE ON {FileScreeningResult.__tablename__}
-                BEGIN
-                    DELETE FROM t_files_fts WHERE file_id = OLD.id;
-                    INSERT INTO t_files_fts (file_id, tags_search_ids)
-                    VALUES (NEW.id, REPLACE(IFNULL(NEW.tags_display_ids, ''), ',', ' '));
-                END;
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_provider_id_model_identifier ON {ModelConfiguration.__tablename__} (provider_id, model_identifier);
             """))
+        if User.__tablename__ in created:
+            # 创建索引
+            session.exec(text(f'CREATE UNIQUE INDEX IF NOT EXISTS idx_oauth_provider_id ON {User.__tablename__} (oauth_provider, oauth_id);'))
+            session.exec(text(f'CREATE INDEX IF NOT EXISTS idx_email ON {User.__tablename__} (email);'))
+        return created
 
-            # 创建文档表
-            # TODO 根据后续代码里的要求创建索引
-            if not inspector.has_table(Document.__tablename__):
-                Document.__table__.create(self.engine, checkfirst=True)
-            # 创建父块表
-            if not inspector.has_table(ParentChunk.__tablename__):
-                ParentChunk.__table__.create(self.engine, checkfirst=True)
-            # 创建子块表
-            if not inspector.has_table(ChildChunk.__tablename__):
-                ChildChunk.__table__.create(self.engine, checkfirst=True)
-        
-            # 创建聊天会话表
-            if not inspector.has_table(ChatSession.__tablename__):
-                ChatSession.__table__.create(self.engine, checkfirst=True)
-            # 创建聊天消息表
-            if not inspector.has_table(ChatMessage.__tablename__):
-                ChatMessage.__table__.create(self.engine, checkfirst=True)
-                # INDEX(session_id, created_at)   -- 查询优化
-                session.exec(text(f"""
-                    CREATE INDEX IF NOT EXISTS idx_chat_message_session ON {ChatMessage.__tablename__} (session_id, created_at);
-                """))
-            # 创建会话Pin文件表
-            if not inspector.has_table(ChatSessionPinFile.__tablename__):
-                ChatSessionPinFile.__table__.create(self.engine, checkfirst=True)
-                # UNIQUE(session_id, file_path)   -- 同一会话中文件唯一
-                session.exec(text(f"""
-                    CREATE UNIQUE INDEX IF NOT EXISTS idx_chat_session_pin_file ON {ChatSessionPinFile.__tablename__} (session_id, file_path);
-                """))
-            
-            # 模型提供者表
-            if not inspector.has_table(ModelProvider.__tablename__):
-                ModelProvider.__table__.create(self.engine, checkfirst=True)
-                # 初始化默认模型提供者
-                data = [
-                    {
-                        "display_name": "OpenAI", 
-                        "provider_type": "openai",
-                        "source_type": ModelSourceType.CONFIGURABLE.value, 
-                        "base_url": "https://api.openai.com/v1", 
-                        "is_user_added": False,
-                        "get_key_url": "https://platform.openai.com/api-keys",
-                        "support_discovery": True,
-                        "use_proxy": False,
-                    },
-                    {
-                        "display_name": "Anthropic", 
-                        "provider_type": "anthropic", 
-                        "source_type": ModelSourceType.CONFIGURABLE.value,
-                        "base_url": "https://api.anthropic.com/v1",
-                        "is_user_added": False,
-                        "get_key_url": "https://console.anthropic.com/settings/keys",
-                        "support_discovery": True,
-                        "use_proxy": False,
-                    },
-                    {
-                        "display_name": "Google Gemini", 
-                        "provider_type": "google", 
-                        "source_type": ModelSourceType.CONFIGURABLE.value, 
-                        "base_url": "https://generativelanguage.googleapis.com/v1beta",
-                        "is_user_added": False,
-                        "get_key_url": "https://aistudio.google.com/apikey",
-                        "support_discovery": True,
-                        "use_proxy": False,
-                    },
-                    {
-                        "display_name": "Grok (xAI)", 
-                        "provider_type": "grok", 
-                        "source_type": ModelSourceType.CONFIGURABLE.value, 
-                        "base_url": "https://api.x.ai/v1",
-                        "is_user_added": False,
-                        "get_key_url": "https://console.x.ai/",
-                        "support_discovery": True,
-                        "use_proxy": False,
-                    },
-                    {
-                        "display_name": "OpenRouter", 
-                        "provider_type": "openai", 
-                        "source_type": ModelSourceType.CONFIGURABLE.value, 
-                        "base_url": "https://openrouter.ai/api/v1",
-                        "is_user_added": False,
-                        "get_key_url": "https://openrouter.ai/keys",
-                        "support_discovery": True,
-                        "use_proxy": False,
-                    },
-                    {
-                        "display_name": "Groq", 
-                        "provider_type": "groq", 
-                        "source_type": ModelSourceType.CONFIGURABLE.value, 
-                        "base_url": "https://api.groq.com/openai/v1",
-                        "is_user_added": False,
-                        "get_key_url": "https://console.groq.com/keys",
-                        "support_discovery": False,
-                        "use_proxy": False,
-                    },
-                    {
-                        "display_name": "Ollama", 
-                        "provider_type": "openai", 
-                        "source_type": ModelSourceType.CONFIGURABLE.value, 
-                        "base_url": "http://127.0.0.1:11434/v1",
-                        "is_user_added": False,
-                        "get_key_url": "",
-                        "support_discovery": True,
-                        "extra_data_json": {"discovery_api": "http://127.0.0.1:11434/api/tags"},
-                        "use_proxy": False,
-                    },
-                    {
-                        "display_name": "LM Studio", 
-                        "provider_type": "openai", 
-                        "source_type": ModelSourceType.CONFIGURABLE.value, 
-                        "base_url": "http://127.0.0.1:1234/api/v0",
-                        "is_user_added": False,
-                        "get_key_url": "",
-                        "support_discovery": True,
-                        "use_proxy": False,
-                    },
-                ]
-                session.add_all([ModelProvider(**provider) for provider in data])
-                session.commit()
-            
-            # 模型配置表
-            if not inspector.has_table(ModelConfiguration.__tablename__):
-                ModelConfiguration.__table__.create(self.engine, checkfirst=True)
-                # provider_id和model_identifier的组合唯一
-                session.exec(text(f"""
-                    CREATE UNIQUE INDEX IF NOT EXISTS idx_provider_id_model_identifier ON {ModelConfiguration.__tablename__} (provider_id, model_identifier);
-                """))
-                data = [
-                    # 内置模型 - 直接运行在本地
-                    {
-                        "provider_id": 1,  # [Builtin]
-                        "model_identifier": BUILTMODELS['VLM_MODEL']['MLXCOMMUNITY'],
-                        "display_name": "Qwen3-VL 4B (3-bit)", 
-                        "capabilities_json": [ModelCapability.VISION.value, ModelCapability.TEXT.value, ModelCapability.STRUCTURED_OUTPUT.value, ModelCapability.TOOL_USE.value],
-                        "max_context_length": 256*1024,
-                        "max_output_tokens": 1024,
-                        "is_enabled": True,
-                    }
-                ]
-                session.add_all([ModelConfiguration(**model) for model in data])
-                session.commit()
-            
-            # 能力指派表
-            if not inspector.has_table(CapabilityAssignment.__tablename__):
-                CapabilityAssignment.__table__.create(self.engine, checkfirst=True)
-                # 将builtin模型指派给各能力
-                data = [
-                    {
-                        "capability_value": ModelCapability.VISION.value,
-                        "model_configuration_id": 1,  # Qwen3-VL 4B
-                    },
-                    {
-                        "capability_value": ModelCapability.TEXT.value,
-                        "model_configuration_id": 1,  # Qwen3-VL 4B
-                    },
-                    {
-                        "capability_value": ModelCapability.STRUCTURED_OUTPUT.value,
-                        "model_configuration_id": 1,  # Qwen3-VL 4B
-                    },
-                    {
-                        "capability_value": ModelCapability.TOOL_USE.value,
-                        "model_configuration_id": 1,  # Qwen3-VL 4B
-                    },
-                ]
-                session.add_all([CapabilityAssignment(**assignment) for assignment in data])
-                session.commit()
-            
-            # OAuth用户表
-            if not inspector.has_table(User.__tablename__):
-                User.__table__.create(self.engine, checkfirst=True)
-                print(f"Created table {User.__tablename__}")
-                # 创建索引
-                session.exec(text(f'CREATE UNIQUE INDEX IF NOT EXISTS idx_oauth_provider_id ON {User.__tablename__} (oauth_provider, oauth_id);'))
-                session.exec(text(f'CREATE INDEX IF NOT EXISTS idx_email ON {User.__tablename__} (email);'))
-                session.commit()
-        
-            # 工具表
-            if not inspector.has_table(Tool.__tablename__):
-                Tool.__table__.create(self.engine, checkfirst=True)
-                data = [
-                    {
-                        "name": "get_current_time",
-                        "description": "取得当前日期和时间，可选timezone参数指定时区",
-                        "tool_type": ToolType.DIRECT.value,
-                        "metadata_json": {"model_path": "tools.datetime_tools:get_current_time"}
-                    },
-                    {
-                        "name": "local_file_search",
-                        "description": "本机文件搜索工具。参数是一个搜索关键词，返回匹配的文件路径列表。",
-                        "tool_type": ToolType.DIRECT.value,  # 直接调用
-                        "metadata_json": {"model_path": "tools.local_file_search:local_file_search"}
-                    },
-                    {
-                        "name": "multimodal_vectorize",
-                        "description": "给文件进行多模态向量化，以便后续支持多模态检索",
-                        "tool_type": ToolType.DIRECT.value,
-                        "metadata_json": {"model_path": "tools.vector_store:multimodal_vectorize"}
-                    },
-                    {
-                        "name": "search_use_tavily",
-                        "description": "使用Tavily进行网络搜索",
-                        "tool_type": ToolType.MCP.value,
-                        "metadata_json": {
-                            "model_path": "tools.web_search:search_use_tavily",
-                            "api_key": "",
-                            "languages": {
-                                "zh": "使用Tavily进行网络搜索",
-                                "en": "Using Tavily for web search",
-                            },
-                            "icon": {
-                                "light": "https://www.tavily.com/images/logo.svg",
-                                "dark": "https://www.tavily.com/images/logo.svg"
-                            }
+    def _seed_tables(self, session: Session, seed_version: int) -> int:
+        """按版本顺序写入尚未应用的初始数据，返回执行的版本数。每个版本都必须可以重复执行"""
+        applied = 0
+        for version, seed in self._seeds():
+            if version > seed_version:
+                seed(session)
+                logger.info(f"已写入初始数据 v{version}: {seed.__name__}")
+                applied += 1
+        return applied
+
+    def _seeds(self) -> list:
+        """有序的初始数据列表，新增或修改初始数据时追加到末尾并同步增大 SEED_VERSION"""
+        return [
+            (1, self._seed_initial_data),
+        ]
+
+    def _seed_initial_data(self, session: Session) -> None:
+        """为空表写入初始数据。已有数据的表（如记录版本号之前就已初始化的数据库）保持不变"""
+        tables = {
+            model.__tablename__
+            for model in (
+                MyFolders, BundleExtension, SystemConfig, FileCategory, FileExtensionMap, FileFilterRule,
+                ModelProvider, ModelConfiguration, CapabilityAssignment, Tool, Scenario,
+            )
+            if session.exec(select(model).limit(1)).first() is None
+        }
+        if MyFolders.__tablename__ in tables:
+            self._init_default_directories(session)  # 初始化默认文件夹
+        if BundleExtension.__tablename__ in tables:
+            self._init_bundle_extensions(session)  # 初始化Bundle扩展名数据
+        if SystemConfig.__tablename__ in tables:
+            system_configs = [
+                {
+                    "key": "proxy",
+                    "value": "http://127.0.0.1:7890",
+                    "description": "Proxy server address"
+                },
+            ]
+            for config_data in system_configs:
+                new_config = SystemConfig(
+                    key=config_data["key"],
+                    value=config_data["value"],
+                    description=config_data["description"]
+                )
+                session.add(new_config)
+            session.flush()
+        if FileCategory.__tablename__ in tables:
+            self._init_file_categories(session)  # 初始化文件分类数据
+        if FileExtensionMap.__tablename__ in tables:
+            self._init_file_extensions(session)  # 初始化文件扩展名映射数据
+        if FileFilterRule.__tablename__ in tables:
+            self._init_basic_file_filter_rules(session)  # 初始化基础文件过滤规则（简化版）
+
+        # 初始化默认模型提供者
+        if ModelProvider.__tablename__ in tables:
+            data = [
+                {
+                    "display_name": "OpenAI", 
+                    "provider_type": "openai",
+                    "source_type": ModelSourceType.CONFIGURABLE.value, 
+                    "base_url": "https://api.openai.com/v1", 
+                    "is_user_added": False,
+                    "get_key_url": "https://platform.openai.com/api-keys",
+                    "support_discovery": True,
+                    "use_proxy": False,
+                },
+                {
+                    "display_name": "Anthropic", 
+                    "provider_type": "anthropic", 
+                    "source_type": ModelSourceType.CONFIGURABLE.value,
+                    "base_url": "https://api.anthropic.com/v1",
+                    "is_user_added": False,
+                    "get_key_url": "https://console.anthropic.com/settings/keys",
+                    "support_discovery": True,
+                    "use_proxy": False,
+                },
+                {
+                    "display_name": "Google Gemini", 
+                    "provider_type": "google", 
+                    "source_type": ModelSourceType.CONFIGURABLE.value, 
+                    "base_url": "https://generativelanguage.googleapis.com/v1beta",
+                    "is_user_added": False,
+                    "get_key_url": "https://aistudio.google.com/apikey",
+                    "support_discovery": True,
+                    "use_proxy": False,
+                },
+                {
+                    "display_name": "Grok (xAI)", 
+                    "provider_type": "grok", 
+                    "source_type": ModelSourceType.CONFIGURABLE.value, 
+                    "base_url": "https://api.x.ai/v1",
+                    "is_user_added": False,
+                    "get_key_url": "https://console.x.ai/",
+                    "support_discovery": True,
+                    "use_proxy": False,
+                },
+                {
+                    "display_name": "OpenRouter", 
+                    "provider_type": "openai", 
+                    "source_type": ModelSourceType.CONFIGURABLE.value, 
+                    "base_url": "https://openrouter.ai/api/v1",
+                    "is_user_added": False,
+                    "get_key_url": "https://openrouter.ai/keys",
+                    "support_discovery": True,
+                    "use_proxy": False,
+                },
+                {
+                    "display_name": "Groq", 
+                    "provider_type": "groq", 
+                    "source_type": ModelSourceType.CONFIGURABLE.value, 
+                    "base_url": "https://api.groq.com/openai/v1",
+                    "is_user_added": False,
+                    "get_key_url": "https://console.groq.com/keys",
+                    "support_discovery": False,
+                    "use_proxy": False,
+                },
+                {
+                    "display_name": "Ollama", 
+                    "provider_type": "openai", 
+                    "source_type": ModelSourceType.CONFIGURABLE.value, 
+                    "base_url": "http://127.0.0.1:11434/v1",
+                    "is_user_added": False,
+                    "get_key_url": "",
+                    "support_discovery": True,
+                    "extra_data_json": {"discovery_api": "http://127.0.0.1:11434/api/tags"},
+                    "use_proxy": False,
+                },
+                {
+                    "display_name": "LM Studio", 
+                    "provider_type": "openai", 
+                    "source_type": ModelSourceType.CONFIGURABLE.value, 
+                    "base_url": "http://127.0.0.1:1234/api/v0",
+                    "is_user_added": False,
+                    "get_key_url": "",
+                    "support_discovery": True,
+                    "use_proxy": False,
+                },
+            ]
+            session.add_all([ModelProvider(**provider) for provider in data])
+            session.flush()
+
+        # 内置模型
+        if ModelConfiguration.__tablename__ in tables:
+            data = [
+                # 内置模型 - 直接运行在本地
+                {
+                    "provider_id": 1,  # [Builtin]
+                    "model_identifier": BUILTMODELS['VLM_MODEL']['MLXCOMMUNITY'],
+                    "display_name": "Qwen3-VL 4B (3-bit)", 
+                    "capabilities_json": [ModelCapability.VISION.value, ModelCapability.TEXT.value, ModelCapability.STRUCTURED_OUTPUT.value, ModelCapability.TOOL_USE.value],
+                    "max_context_length": 256*1024,
+                    "max_output_tokens": 1024,
+                    "is_enabled": True,
+                }
+            ]
+            session.add_all([ModelConfiguration(**model) for model in data])
+            session.flush()
+
+        # 将builtin模型指派给各能力
+        if CapabilityAssignment.__tablename__ in tables:
+            data = [
+                {
+                    "capability_value": ModelCapability.VISION.value,
+                    "model_configuration_id": 1,  # Qwen3-VL 4B
+                },
+                {
+                    "capability_value": ModelCapability.TEXT.value,
+                    "model_configuration_id": 1,  # Qwen3-VL 4B
+                },
+                {
+                    "capability_value": ModelCapability.STRUCTURED_OUTPUT.value,
+                    "model_configuration_id": 1,  # Qwen3-VL 4B
+                },
+                {
+                    "capability_value": ModelCapability.TOOL_USE.value,
+                    "model_configuration_id": 1,  # Qwen3-VL 4B
+                },
+            ]
+            session.add_all([CapabilityAssignment(**assignment) for assignment in data])
+            session.flush()
+
+        # 工具
+        if Tool.__tablename__ in tables:
+            data = [
+                {
+                    "name": "get_current_time",
+                    "description": "取得当前日期和时间，可选timezone参数指定时区",
+                    "tool_type": ToolType.DIRECT.value,
+                    "metadata_json": {"model_path": "tools.datetime_tools:get_current_time"}
+                },
+                {
+                    "name": "local_file_search",
+                    "description": "本机文件搜索工具。参数是一个搜索关键词，返回匹配的文件路径列表。",
+                    "tool_type": ToolType.DIRECT.value,  # 直接调用
+                    "metadata_json": {"model_path": "tools.local_file_search:local_file_search"}
+                },
+                {
+                    "name": "multimodal_vectorize",
+                    "description": "给文件进行多模态向量化，以便后续支持多模态检索",
+                    "tool_type": ToolType.DIRECT.value,
+                    "metadata_json": {"model_path": "tools.vector_store:multimodal_vectorize"}
+                },
+                {
+                    "name": "search_use_tavily",
+                    "description": "使用Tavily进行网络搜索",
+                    "tool_type": ToolType.MCP.value,
+                    "metadata_json": {
+                        "model_path": "tools.web_search:search_use_tavily",
+                        "api_key": "",
+                        "languages": {
+                            "zh": "使用Tavily进行网络搜索",
+                            "en": "Using Tavily for web search",
+                        },
+                        "icon": {
+                            "light": "https://www.tavily.com/images/logo.svg",
+                            "dark": "https://www.tavily.com/images/logo.svg"
                         }
-                    },
-                    # {
-                    #     "name": "handle_pdf_reading",
-                    #     "description": "通过系统默认PDF阅读器打开PDF文件。并重新排布窗口，本App位于左侧，PDF阅读器位于右侧。",
-                    #     "tool_type": "channel",  # 通过工具通道调用
-                    #     "metadata_json": {"model_path": "tools.co_reading:handle_pdf_reading"}
-                    # },
-                ]
-                session.add_all([Tool(**tool) for tool in data])
-                session.commit()
-
-            # 场景表
-            if not inspector.has_table(Scenario.__tablename__):
-                Scenario.__table__.create(self.engine, checkfirst=True)
-                data = [
-                    {
-                        "name": "co_reading", 
-                        "description": "AI跟你一起阅读电子书", 
-                        "display_name": "共读电子书",
-                        "system_prompt": """
+                    }
+                },
+                # {
+                #     "name": "handle_pdf_reading",
+                #     "description": "通过系统默认PDF阅读器打开PDF文件。并重新排布窗口，本App位于左侧，PDF阅读器位于右侧。",
+                #     "tool_type": "channel",  # 通过工具通道调用
+                #     "metadata_json": {"model_path": "tools.co_reading:handle_pdf_reading"}
+                # },
+            ]
+            session.add_all([Tool(**tool) for tool in data])
+            session.flush()
+
+        # 场景
+        if Scenario.__tablename__ in tables:
+            data = [
+                {
+                    "name": "co_reading", 
+                    "description": "AI跟你一起阅读电子书", 
+                    "display_name": "共读电子书",
+                    "system_prompt": """
 你是一个专业的PDF阅读助手，具有视觉能力。用户正在使用PDF阅读器阅读文档，你收到的图片是用户当前阅读页面的截图。
 
 你的任务：
@@ -858,19 +923,15 @@ class DBManager:
 - 结合用户的问题和截图内容提供精准回答
 - 保持简洁专业的回复风格
 """.strip(),
-                        "preset_tool_ids": [],
-                        "metadata_json": []
-                    },
-                ]
-                session.add_all([Scenario(**scenario) for scenario in data])
-                session.commit()
-                
-            # 提交所有数据库更改
-            session.commit()
-            return True
+                    "preset_tool_ids": [],
+                    "metadata_json": []
+                },
+            ]
+            session.add_all([Scenario(**scenario) for scenario in data])
+            session.flush()
 
 
-    def _init_bundle_extensions(self) -> None:
+    def _init_bundle_extensions(self, session: Session) -> None:
         """初始化macOS Bundle扩展名数据"""
         bundle_extensions = [
             # 应用程序Bundle
@@ -936,11 +997,10 @@ class DBManager:
                     is_system_default=True  # 系统初始化的记录标记为不可删除/修改
                 )
             )
-        with Session(self.engine) as session:
-            session.add_all(bundle_objs)
-            session.commit()
+        session.add_all(bundle_objs)
+        session.flush()
     
-    def _init_basic_file_filter_rules(self) -> None:
+    def _init_basic_file_filter_rules(self, session: Session) -> None:
         """初始化基础文件过滤规则（仅保留基础忽略规则）"""
         
         # 基础忽略规则 - 系统文件和临时文件
@@ -1025,11 +1085,10 @@ class DBManager:
                     extra_data=rule_data.get("extra_data")
                 )
             )
-        with Session(self.engine) as session:
-            session.add_all(rule_objs)
-            session.commit()
+        session.add_all(rule_objs)
+        session.flush()
     
-    def _init_file_categories(self) -> None:
+    def _init_file_categories(self, session: Session) -> None:
         """初始化文件分类数据"""
         categories = [
             FileCategory(name="document", description="Document files", icon="📄"),
@@ -1042,179 +1101,176 @@ class DBManager:
             FileCategory(name="temp", description="Temporary files", icon="⏱️"),
             FileCategory(name="other", description="Other files", icon="📎"),
         ]
-        with Session(self.engine) as session:
-            session.add_all(categories)
-            session.commit()
+        session.add_all(categories)
+        session.flush()
 
-    def _init_file_extensions(self) -> None:
+    def _init_file_extensions(self, session: Session) -> None:
         """初始化文件扩展名映射"""
         # 获取分类ID映射
-        with Session(self.engine) as session:
-            stmt = select(FileCategory)
-            category_map = {cat.name: cat.id for cat in session.exec(stmt).all()}
-            
-            # 文档类扩展名
-            doc_extensions = [
-                # MS Office
-                {"extension": "doc", "category_id": category_map["document"], "description": "Microsoft Word Document (Old Version)"},
-                {"extension": "docx", "category_id": category_map["document"], "description": "Microsoft Word Document"},
-                {"extension": "ppt", "category_id": category_map["document"], "description": "Microsoft PowerPoint Presentation (Old Version)"},
-                {"extension": "pptx", "category_id": category_map["document"], "description": "Microsoft PowerPoint Presentation"},
-                {"extension": "xls", "category_id": category_map["document"], "description": "Microsoft Excel Spreadsheet (Old Version)"},
-                {"extension": "xlsx", "category_id": category_map["document"], "description": "Microsoft Excel Spreadsheet"},
-                # Apple iWork
-                {"extension": "pages", "category_id": category_map["document"], "description": "Apple Pages Document"},
-                {"extension": "key", "category_id": category_map["document"], "description": "Apple Keynote Presentation"},
-                {"extension": "numbers", "category_id": category_map["document"], "description": "Apple Numbers Spreadsheet"},
-                # Text Documents
-                {"extension": "md", "category_id": category_map["document"], "description": "Markdown Document"},
-                {"extension": "markdown", "category_id": category_map["document"], "description": "Markdown Document"},
-                {"extension": "txt", "category_id": category_map["document"], "description": "Plain Text Document"},
-                {"extension": "rtf", "category_id": category_map["document"], "description": "Rich Text Format Document"},
-                # E-books/Fixed Format
-                {"extension": "pdf", "category_id": category_map["document"], "description": "PDF Document", "priority": "high"},
-                {"extension": "epub", "category_id": category_map["document"], "description": "EPUB E-book"},
-                {"extension": "mobi", "category_id": category_map["document"], "description": "MOBI E-book"},
-                # Web Documents
-                {"extension": "html", "category_id": category_map["document"], "description": "HTML Web Page"},
-                {"extension": "htm", "category_id": category_map["document"], "description": "HTML Web Page"},
-            ]
-            
-            # Image Extensions
-            image_extensions = [
-                {"extension": "jpg", "category_id": category_map["image"], "description": "JPEG Image", "priority": "high"},
-                {"extension": "jpeg", "category_id": category_map["image"], "description": "JPEG Image", "priority": "high"},
-                {"extension": "png", "category_id": category_map["image"], "description": "PNG Image", "priority": "high"},
-                {"extension": "gif", "category_id": category_map["image"], "description": "GIF Image"},
-                {"extension": "bmp", "category_id": category_map["image"], "description": "BMP Image"},
-                {"extension": "tiff", "category_id": category_map["image"], "description": "TIFF Image"},
-                {"extension": "heic", "category_id": category_map["image"], "description": "HEIC Image (Apple Devices)"},
-                {"extension": "webp", "category_id": category_map["image"], "description": "WebP Image"},
-                {"extension": "svg", "category_id": category_map["image"], "description": "SVG Vector Image"},
-                {"extension": "cr2", "category_id": category_map["image"], "description": "Canon RAW Image"},
-                {"extension": "nef", "category_id": category_map["image"], "description": "Nikon RAW Image"},
-                {"extension": "arw", "category_id": category_map["image"], "description": "Sony RAW Image"},
-                {"extension": "dng", "category_id": category_map["image"], "description": "Generic RAW Image"},
-            ]
-            
-            # Audio/Video Extensions
-            av_extensions = [
-                # Audio
-                {"extension": "mp3", "category_id": category_map["audio_video"], "description": "MP3 Audio", "priority": "high"},
-                {"extension": "wav", "category_id": category_map["audio_video"], "description": "WAV Audio"},
-                {"extension": "aac", "category_id": category_map["audio_video"], "description": "AAC Audio"},
-                {"extension": "flac", "category_id": category_map["audio_video"], "description": "FLAC Lossless Audio"},
-                {"extension": "ogg", "category_id": category_map["audio_video"], "description": "OGG Audio"},
-                {"extension": "m4a", "category_id": category_map["audio_video"], "description": "M4A Audio"},
-                # Video
-                {"extension": "mp4", "category_id": category_map["audio_video"], "description": "MP4 Video", "priority": "high"},
-                {"extension": "mov", "category_id": category_map["audio_video"], "description": "MOV Video (Apple Devices)", "priority": "high"},
-                {"extension": "avi", "category_id": category_map["audio_video"], "description": "AVI Video"},
-                {"extension": "mkv", "category_id": category_map["audio_video"], "description": "MKV Video"},
-                {"extension": "wmv", "category_id": category_map["audio_video"], "description": "WMV Video (Windows)"},
-                {"extension": "flv", "category_id": category_map["audio_video"], "description": "Flash Video"},
-                {"extension": "webm", "category_id": category_map["audio_video"], "description": "WebM Video"},
-            ]
-            
-            # Archive Extensions
-            archive_extensions = [
-                {"extension": "zip", "category_id": category_map["archive"], "description": "ZIP Archive", "priority": "high"},
-                {"extension": "rar", "category_id": category_map["archive"], "description": "RAR Archive"},
-                {"extension": "7z", "category_id": category_map["archive"], "description": "7-Zip Archive"},
-                {"extension": "tar", "category_id": category_map["archive"], "description": "TAR Archive"},
-                {"extension": "gz", "category_id": category_map["archive"], "description": "GZIP Archive"},
-                {"extension": "bz2", "category_id": category_map["archive"], "description": "BZIP2 Archive"},
-            ]
-            
-            # Installer Extensions
-            installer_extensions = [
-                {"extension": "dmg", "category_id": category_map["installer"], "description": "macOS Disk Image", "priority": "high"},
-                {"extension": "pkg", "category_id": category_map["installer"], "description": "macOS Installer Package", "priority": "high"},
-                {"extension": "exe", "category_id": category_map["installer"], "description": "Windows Executable File", "priority": "high"},
-                {"extension": "msi", "category_id": category_map["installer"], "description": "Windows Installer Package"},
-            ]
-            
-            # Code Extensions
-            code_extensions = [
-                {"extension": "py", "category_id": category_map["code"], "description": "Python Source Code"},
-                {"extension": "js", "category_id": category_map["code"], "description": "JavaScript Source Code"},
-                {"extension": "ts", "category_id": category_map["code"], "description": "TypeScript Source Code"},
-                {"extension": "java", "category_id": category_map["code"], "description": "Java Source Code"},
-                {"extension": "c", "category_id": category_map["code"], "description": "C Source Code"},
-                {"extension": "cpp", "category_id": category_map["code"], "description": "C++ Source Code"},
-                {"extension": "h", "category_id": category_map["code"], "description": "C/C++ Header File"},
-                {"extension": "cs", "category_id": category_map["code"], "description": "C# Source Code"},
-                {"extension": "php", "category_id": category_map["code"], "description": "PHP Source Code"},
-                {"extension": "rb", "category_id": category_map["code"], "description": "Ruby Source Code"},
-                {"extension": "go", "category_id": category_map["code"], "description": "Go Source Code"},
-                {"extension": "swift", "category_id": category_map["code"], "description": "Swift Source Code"},
-                {"extension": "kt", "category_id": category_map["code"], "description": "Kotlin Source Code"},
-                {"extension": "sh", "category_id": category_map["code"], "description": "Shell Script"},
-                {"extension": "bat", "category_id": category_map["code"], "description": "Windows Batch File"},
-                {"extension": "json", "category_id": category_map["code"], "description": "JSON Data File"},
-                {"extension": "yaml", "category_id": category_map["code"], "description": "YAML Configuration File"},
-                {"extension": "yml", "category_id": category_map["code"], "description": "YAML Configuration File"},
-                {"extension": "toml", "category_id": category_map["code"], "description": "TOML Configuration File"},
-                {"extension": "xml", "category_id": category_map["code"], "description": "XML Data File"},
-                {"extension": "css", "category_id": category_map["code"], "description": "CSS Stylesheet"},
-                {"extension": "scss", "category_id": category_map["code"], "description": "SCSS Stylesheet"},
-            ]
-            
-            # Design Extensions
-            design_extensions = [
-                {"extension": "psd", "category_id": category_map["design"], "description": "Photoshop Design File"},
-                {"extension": "ai", "category_id": category_map["design"], "description": "Adobe Illustrator Design File"},
-                {"extension": "sketch", "category_id": category_map["design"], "description": "Sketch Design File"},
-                {"extension": "fig", "category_id": category_map["design"], "description": "Figma Design File"},
-                {"extension": "xd", "category_id": category_map["design"], "description": "Adobe XD Design File"},
-            ]
-            
-            # Temporary File Extensions
-            temp_extensions = [
-                {"extension": "tmp", "category_id": category_map["temp"], "description": "Temporary File"},
-                {"extension": "temp", "category_id": category_map["temp"], "description": "Temporary File"},
-                {"extension": "part", "category_id": category_map["temp"], "description": "Incomplete Downloaded File"},
-                {"extension": "crdownload", "category_id": category_map["temp"], "description": "Chrome Download Temporary File"},
-                {"extension": "download", "category_id": category_map["temp"], "description": "Download Temporary File"},
-                {"extension": "bak", "category_id": category_map["temp"], "description": "Backup File"},
-            ]
-            
-            # 合并所有扩展名
-            all_extensions = []
-            all_extensions.extend(doc_extensions)
-            all_extensions.extend(image_extensions)
-            all_extensions.extend(av_extensions)
-            all_extensions.extend(archive_extensions)
-            all_extensions.extend(installer_extensions)
-            all_extensions.extend(code_extensions)
-            all_extensions.extend(design_extensions)
-            all_extensions.extend(temp_extensions)
-            
-            # 转换为FileExtensionMap对象并批量插入
-            extension_objs = []
-            for ext_data in all_extensions:
-                priority = ext_data.get("priority", "medium")
-                extension_objs.append(
-                    FileExtensionMap(
-                        extension=ext_data["extension"],
-                        category_id=ext_data["category_id"],
-                        description=ext_data["description"],
-                        priority=priority
-                    )
+        stmt = select(FileCategory)
+        category_map = {cat.name: cat.id for cat in session.exec(stmt).all()}
+        
+        # 文档类扩展名
+        doc_extensions = [
+            # MS Office
+            {"extension": "doc", "category_id": category_map["document"], "description": "Microsoft Word Document (Old Version)"},
+            {"extension": "docx", "category_id": category_map["document"], "description": "Microsoft Word Document"},
+            {"extension": "ppt", "category_id": category_map["document"], "description": "Microsoft PowerPoint Presentation (Old Version)"},
+            {"extension": "pptx", "category_id": category_map["document"], "description": "Microsoft PowerPoint Presentation"},
+            {"extension": "xls", "category_id": category_map["document"], "description": "Microsoft Excel Spreadsheet (Old Version)"},
+            {"extension": "xlsx", "category_id": category_map["document"], "description": "Microsoft Excel Spreadsheet"},
+            # Apple iWork
+            {"extension": "pages", "category_id": category_map["document"], "description": "Apple Pages Document"},
+            {"extension": "key", "category_id": category_map["document"], "description": "Apple Keynote Presentation"},
+            {"extension": "numbers", "category_id": category_map["document"], "description": "Apple Numbers Spreadsheet"},
+            # Text Documents
+            {"extension": "md", "category_id": category_map["document"], "description": "Markdown Document"},
+            {"extension": "markdown", "category_id": category_map["document"], "description": "Markdown Document"},
+            {"extension": "txt", "category_id": category_map["document"], "description": "Plain Text Document"},
+            {"extension": "rtf", "category_id": category_map["document"], "description": "Rich Text Format Document"},
+            # E-books/Fixed Format
+            {"extension": "pdf", "category_id": category_map["document"], "description": "PDF Document", "priority": "high"},
+            {"extension": "epub", "category_id": category_map["document"], "description": "EPUB E-book"},
+            {"extension": "mobi", "category_id": category_map["document"], "description": "MOBI E-book"},
+            # Web Documents
+            {"extension": "html", "category_id": category_map["document"], "description": "HTML Web Page"},
+            {"extension": "htm", "category_id": category_map["document"], "description": "HTML Web Page"},
+        ]
+        
+        # Image Extensions
+        image_extensions = [
+            {"extension": "jpg", "category_id": category_map["image"], "description": "JPEG Image", "priority": "high"},
+            {"extension": "jpeg", "category_id": category_map["image"], "description": "JPEG Image", "priority": "high"},
+            {"extension": "png", "category_id": category_map["image"], "description": "PNG Image", "priority": "high"},
+            {"extension": "gif", "category_id": category_map["image"], "description": "GIF Image"},
+            {"extension": "bmp", "category_id": category_map["image"], "description": "BMP Image"},
+            {"extension": "tiff", "category_id": category_map["image"], "description": "TIFF Image"},
+            {"extension": "heic", "category_id": category_map["image"], "description": "HEIC Image (Apple Devices)"},
+            {"extension": "webp", "category_id": category_map["image"], "description": "WebP Image"},
+            {"extension": "svg", "category_id": category_map["image"], "description": "SVG Vector Image"},
+            {"extension": "cr2", "category_id": category_map["image"], "description": "Canon RAW Image"},
+            {"extension": "nef", "category_id": category_map["image"], "description": "Nikon RAW Image"},
+            {"extension": "arw", "category_id": category_map["image"], "description": "Sony RAW Image"},
+            {"extension": "dng", "category_id": category_map["image"], "description": "Generic RAW Image"},
+        ]
+        
+        # Audio/Video Extensions
+        av_extensions = [
+            # Audio
+            {"extension": "mp3", "category_id": category_map["audio_video"], "description": "MP3 Audio", "priority": "high"},
+            {"extension": "wav", "category_id": category_map["audio_video"], "description": "WAV Audio"},
+            {"extension": "aac", "category_id": category_map["audio_video"], "description": "AAC Audio"},
+            {"extension": "flac", "category_id": category_map["audio_video"], "description": "FLAC Lossless Audio"},
+            {"extension": "ogg", "category_id": category_map["audio_video"], "description": "OGG Audio"},
+            {"extension": "m4a", "category_id": category_map["audio_video"], "description": "M4A Audio"},
+            # Video
+            {"extension": "mp4", "category_id": category_map["audio_video"], "description": "MP4 Video", "priority": "high"},
+            {"extension": "mov", "category_id": category_map["audio_video"], "description": "MOV Video (Apple Devices)", "priority": "high"},
+            {"extension": "avi", "category_id": category_map["audio_video"], "description": "AVI Video"},
+            {"extension": "mkv", "category_id": category_map["audio_video"], "description": "MKV Video"},
+            {"extension": "wmv", "category_id": category_map["audio_video"], "description": "WMV Video (Windows)"},
+            {"extension": "flv", "category_id": category_map["audio_video"], "description": "Flash Video"},
+            {"extension": "webm", "category_id": category_map["audio_video"], "description": "WebM Video"},
+        ]
+        
+        # Archive Extensions
+        archive_extensions = [
+            {"extension": "zip", "category_id": category_map["archive"], "description": "ZIP Archive", "priority": "high"},
+            {"extension": "rar", "category_id": category_map["archive"], "description": "RAR Archive"},
+            {"extension": "7z", "category_id": category_map["archive"], "description": "7-Zip Archive"},
+            {"extension": "tar", "category_id": category_map["archive"], "description": "TAR Archive"},
+            {"extension": "gz", "category_id": category_map["archive"], "description": "GZIP Archive"},
+            {"extension": "bz2", "category_id": category_map["archive"], "description": "BZIP2 Archive"},
+        ]
+        
+        # Installer Extensions
+        installer_extensions = [
+            {"extension": "dmg", "category_id": category_map["installer"], "description": "macOS Disk Image", "priority": "high"},
+            {"extension": "pkg", "category_id": category_map["installer"], "description": "macOS Installer Package", "priority": "high"},
+            {"extension": "exe", "category_id": category_map["installer"], "description": "Windows Executable File", "priority": "high"},
+            {"extension": "msi", "category_id": category_map["installer"], "description": "Windows Installer Package"},
+        ]
+        
+        # Code Extensions
+        code_extensions = [
+            {"extension": "py", "category_id": category_map["code"], "description": "Python Source Code"},
+            {"extension": "js", "category_id": category_map["code"], "description": "JavaScript Source Code"},
+            {"extension": "ts", "category_id": category_map["code"], "description": "TypeScript Source Code"},
+            {"extension": "java", "category_id": category_map["code"], "description": "Java Source Code"},
+            {"extension": "c", "category_id": category_map["code"], "description": "C Source Code"},
+            {"extension": "cpp", "category_id": category_map["code"], "description": "C++ Source Code"},
+            {"extension": "h", "category_id": category_map["code"], "description": "C/C++ Header File"},
+            {"extension": "cs", "category_id": category_map["code"], "description": "C# Source Code"},
+            {"extension": "php", "category_id": category_map["code"], "description": "PHP Source Code"},
+            {"extension": "rb", "category_id": category_map["code"], "description": "Ruby Source Code"},
+            {"extension": "go", "category_id": category_map["code"], "description": "Go Source Code"},
+            {"extension": "swift", "category_id": category_map["code"], "description": "Swift Source Code"},
+            {"extension": "kt", "category_id": category_map["code"], "description": "Kotlin Source Code"},
+            {"extension": "sh", "category_id": category_map["code"], "description": "Shell Script"},
+            {"extension": "bat", "category_id": category_map["code"], "description": "Windows Batch File"},
+            {"extension": "json", "category_id": category_map["code"], "description": "JSON Data File"},
+            {"extension": "yaml", "category_id": category_map["code"], "description": "YAML Configuration File"},
+            {"extension": "yml", "category_id": category_map["code"], "description": "YAML Configuration File"},
+            {"extension": "toml", "category_id": category_map["code"], "description": "TOML Configuration File"},
+            {"extension": "xml", "category_id": category_map["code"], "description": "XML Data File"},
+            {"extension": "css", "category_id": category_map["code"], "description": "CSS Stylesheet"},
+            {"extension": "scss", "category_id": category_map["code"], "description": "SCSS Stylesheet"},
+        ]
+        
+        # Design Extensions
+        design_extensions = [
+            {"extension": "psd", "category_id": category_map["design"], "description": "Photoshop Design File"},
+            {"extension": "ai", "category_id": category_map["design"], "description": "Adobe Illustrator Design File"},
+            {"extension": "sketch", "category_id": category_map["design"], "description": "Sketch Design File"},
+            {"extension": "fig", "category_id": category_map["design"], "description": "Figma Design File"},
+            {"extension": "xd", "category_id": category_map["design"], "description": "Adobe XD Design File"},
+        ]
+        
+        # Temporary File Extensions
+        temp_extensions = [
+            {"extension": "tmp", "category_id": category_map["temp"], "description": "Temporary File"},
+            {"extension": "temp", "category_id": category_map["temp"], "description": "Temporary File"},
+            {"extension": "part", "category_id": category_map["temp"], "description": "Incomplete Downloaded File"},
+            {"extension": "crdownload", "category_id": category_map["temp"], "description": "Chrome Download Temporary File"},
+            {"extension": "download", "category_id": category_map["temp"], "description": "Download Temporary File"},
+            {"extension": "bak", "category_id": category_map["temp"], "description": "Backup File"},
+        ]
+        
+        # 合并所有扩展名
+        all_extensions = []
+        all_extensions.extend(doc_extensions)
+        all_extensions.extend(image_extensions)
+        all_extensions.extend(av_extensions)
+        all_extensions.extend(archive_extensions)
+        all_extensions.extend(installer_extensions)
+        all_extensions.extend(code_extensions)
+        all_extensions.extend(design_extensions)
+        all_extensions.extend(temp_extensions)
+        
+        # 转换为FileExtensionMap对象并批量插入
+        extension_objs = []
+        for ext_data in all_extensions:
+            priority = ext_data.get("priority", "medium")
+            extension_objs.append(
+                FileExtensionMap(
+                    extension=ext_data["extension"],
+                    category_id=ext_data["category_id"],
+                    description=ext_data["description"],
+                    priority=priority
                 )
-            
-            session.add_all(extension_objs)
-            session.commit()
+            )
+        
+        session.add_all(extension_objs)
+        session.flush()
 
-    def _init_default_directories(self) -> None:
+    def _init_default_directories(self, session: Session) -> None:
         """初始化默认系统文件夹"""
         import platform
         
         # 检查是否已有文件夹记录，如果有则跳过初始化
-        with Session(self.engine) as session:
-            existing_count = session.exec(select(MyFolders)).first()
-            if existing_count is not None:
-                return
+        existing_count = session.exec(select(MyFolders)).first()
+        if existing_count is not None:
+            return
         
         default_dirs = []
         system = platform.system()
@@ -1272,9 +1328,8 @@ class DBManager:
                 )
         
         if default_dirs:
-            with Session(self.engine) as session:
-                session.add_all(default_dirs)
-                session.commit()
+            session.add_all(default_dirs)
+            session.flush()
 
 if __name__ == '__main__':
     import os
@@ -1352,16 +1407,7 @@ if __name__ == '__main__':
     try:
         # 使用单个连接完成所有操作
         with engine.connect() as conn:
-            print("设置WAL模式和优化参数...")
-            # 显式设置WAL模式和优化参数
-            conn.execute(text("PRAGMA journal_mode=WAL"))
-            conn.execute(text("PRAGMA synchronous=NORMAL"))
-            conn.execute(text("PRAGMA cache_size=-65536"))
-            conn.execute(text("PRAGMA foreign_keys=ON"))
-            conn.execute(text("PRAGMA temp_store=MEMORY"))
-            conn.execute(text("PRAGMA wal_autocheckpoint=1000"))
-            
-            # 验证WAL模式设置
+            # WAL模式和优化参数已由连接事件设置，这里只做验证
             journal_mode = conn.execute(text("PRAGMA journal_mode")).fetchone()[0]
             if journal_mode.upper() != 'WAL':
                 print(f"警告：WAL模式设置可能失败，当前模式: {journal_mode}")
@@ -10,13 +10,12 @@
 from sqlmodel import Session, select
 from sqlalchemy import Engine
 from typing import List
-from core.utils import num_tokens_from_string, num_tokens_from_messages
 from core.agent.db_mgr import ChatMessage
+from core.agent.context_packer import token_counter
 # from chatsession_mgr import ChatSessionMgr
 # from model_config_mgr import ModelConfigMgr, ModelUseInterface
 # from pydantic import BaseModel
 from core.agno.tools.function import Function as Tool
-import json
 import logging
 
 logger = logging.getLogger()
@@ -29,70 +28,56 @@ class MemoryMgr:
     # 根据剩余token数，裁剪消息列表
     def trim_messages_to_fit(self, session_id: int, max_tokens: int) -> List[str]:
         """
-        裁剪指定会话的消息列表，以适应剩余的token数
+        从最新的消息开始向前保留，直到用完给定的token数
+
+        每条消息只计数一次（计数结果有缓存），保留的条数由token数决定，不再有固定上限。
+        聊天流程已改由ContextPacker统一分配历史消息的预算，保留此方法以兼容现有调用方
 
         Args:
             session_id: 会话ID
             max_tokens: 最大token数
         """
-        limit: int = 20
+        kept = []
+        remaining = max_tokens
+        for chat_msg in self._iter_recent_messages(session_id):
+            if chat_msg.role not in ('user', 'assistant'):
+                continue
+            tokens = token_counter.count_message(chat_msg.role, chat_msg.content)
+            if tokens > remaining:
+                break
+            remaining -= tokens
+            kept.append(chat_msg)
+        logger.debug(f"保留消息数: {len(kept)}, token数: {max_tokens - remaining}, 限制token数: {max_tokens}")
+
+        # 历史消息内容清洗：用户消息前拼接'user:'，助手消息前拼接'assistant:'，按时间顺序返回
+        return [f"{chat_msg.role}: {chat_msg.content}" for chat_msg in reversed(kept)]
+
+    def _iter_recent_messages(self, session_id: int, page_size: int = 50):
+        """按从新到旧的顺序逐页读取会话消息，只读取实际用到的部分"""
+        before_id = None
         with Session(self.engine) as session:
-            messages = session.exec(
-                select(ChatMessage).where(ChatMessage.session_id == session_id).limit(limit)
-            ).all()
-            # 如果当前token数超过限制，则从最早开始裁剪消息
-            while messages:
-                # 计算当前消息列表的token数
-                # 转换ChatMessage为符合OpenAI格式的字典，只包含role和content字段
-                formatted_messages = []
-                for msg in messages:
-                    formatted_msg = {
-                        "role": msg.role,
-                        "content": msg.content if msg.content is not None else ""
-                    }
-                    formatted_messages.append(formatted_msg)
-                
-                current_tokens = num_tokens_from_messages(formatted_messages)
-                print(f"当前消息数: {len(messages)}, 当前token数: {current_tokens}, 限制token数: {max_tokens}")
-                if current_tokens > max_tokens:
-                    # 从最早开始裁剪消息
-                    messages.pop(0)
-                else:
-                    break
-            # 历史消息内容清洗：用户消息前拼接'user:'，助手消息前拼接'assistant:'
-            result = []
-            for chat_msg in messages:
-                if chat_msg.role == 'user':
-                    result.append(f"user: {chat_msg.content}")
-                elif chat_msg.role == 'assistant':
-                    result.append(f"assistant: {chat_msg.content}")
-            return result
+            while True:
+                stmt = select(ChatMessage).where(ChatMessage.session_id == session_id)
+                if before_id is not None:
+                    stmt = stmt.where(ChatMessage.id < before_id)
+                page = session.exec(stmt.order_by(ChatMessage.id.desc()).limit(page_size)).all()
+                yield from page
+                if len(page) < page_size:
+                    return
+                before_id = page[-1].id
 
     # 计算tools的token数
     def calculate_tools_tokens(self, tools: List[Tool]) -> int:
-        result = 0
-        for tool in tools:
-            if hasattr(tool, 'function') and hasattr(tool.function, '__name__'):
-                tool_name = tool.function.__name__
-            elif hasattr(tool, 'name'):
-                tool_name = tool.name
-            else:
-                tool_name = "unknown_tool"
+        """
+        按工具发送给模型的JSON schema计数，每个工具定义只计数一次
 
-            # Create a simple XML representation for token counting
-            tool_xml = f"""
-            <tool>
-                <name>{tool_name}</name>
-                <description>{getattr(tool, 'description', 'No description')}</description>
-                <parameters>{json.dumps(getattr(tool, 'parameters', {}))}</parameters>
-            </tool>
-            """
-            result += num_tokens_from_string(tool_xml.strip())
-        return result
+        聊天流程已改由ContextPacker逐个计数工具，保留此方法以兼容现有调用方
+        """
+        return sum(token_counter.count_tool(tool) for tool in tools)
 
     # 计算字符串的token数
     def calculate_string_tokens(self, text: str) -> int:
-        return num_tokens_from_string(text)
+        return token_counter.count(text)
 
 if __name__ == "__main__":
     from core.config import TEST_DB_PATH
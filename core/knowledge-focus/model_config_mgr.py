@@ -14,9 +14,7 @@ from core.agent.db_mgr import (
 )
 from pydantic import BaseModel
 from core.agno.models.openai.chat import OpenAIChat
-from core.agno.models.anthropic.claude import Claude
-# from core.agno.models.google.gemini import Gemini
-from core.agno.models.groq.groq import Groq
+# 其他提供商的SDK在实际用到时才导入（见 model_adapter）
 import logging
 
 logger = logging.getLogger()
@@ -539,6 +537,7 @@ class ModelConfigMgr:
                 http_client=http_client,
             )
         elif provider_type == "anthropic":
+            from core.agno.models.anthropic.claude import Claude
             model = Claude(
                 id=model_identifier,
                 api_key=api_key,
@@ -547,12 +546,14 @@ class ModelConfigMgr:
             )
         # elif provider_type == "google":
         #     # Gemini API key handling
+        #     from core.agno.models.google.gemini import Gemini
         #     model = Gemini(
         #         id=model_identifier,
         #         api_key=api_key,
         #         # Google specific configuration can be added here
         #     )
         elif provider_type == "groq":
+            from core.agno.models.groq.groq import Groq
             model = Groq(
                 id=model_identifier,
                 api_key=api_key,
@@ -14,10 +14,9 @@ from core.agno.tools.function import Function as Tool
 from core.agno.media import Image as BinaryContent
 # from pydantic_ai.usage import UsageLimits
 from core.agent.model_config_mgr import ModelConfigMgr, ModelUseInterface
-from core.models_builtin import load_embedding_model
 from core.agent.memory_mgr import MemoryMgr
+from core.agent.context_packer import ContextPacker, token_counter, tool_name
 from core.agent.tool_provider import ToolProvider
-from huggingface_hub import snapshot_download
 from tqdm import tqdm
 
 logger = logging.getLogger()
@@ -103,6 +102,7 @@ class ModelsMgr:
         self.model_config_mgr = ModelConfigMgr(engine)
         self.tool_provider = ToolProvider(engine)
         self.memory_mgr = MemoryMgr(engine)
+        self.last_context_allocation = None  # 最近一轮对话的上下文预算分配报告
 
     def get_embedding(self, text_str: str) -> List[float]:
         """
@@ -116,6 +116,8 @@ class ModelsMgr:
             model_path = self.download_huggingface_model(BUILTMODELS['EMBEDDING_MODEL']['MLXCOMMUNITY'], self.base_dir)
             self.model_config_mgr.set_embeddings_model_path(model_path)        
         try:
+            # MLX只在第一次生成向量时加载，不拖慢服务启动
+            from core.models_builtin import load_embedding_model
             model, tokenizer = load_embedding_model(model_path)
             
             # 使用批处理编码并指定参数
@@ -518,23 +520,46 @@ Generate a title that best represents what this conversation will be about. Avoi
             scenario_system_prompt = self.tool_provider.get_session_scenario_system_prompt(session_id)
             system_prompt.append(scenario_system_prompt) if scenario_system_prompt is not None else None
 
-            # 处理用户输入 - 兼容AI SDK v5的parts格式
-            user_prompt = ""
+            # 处理用户输入 - 兼容AI SDK v5的parts格式，最后一条用户消息是本轮输入，之前的是对话历史
+            conversation = []
             for msg in messages:
-                if msg['role'] == 'user':
-                    # 优先从parts中提取文本内容
-                    if "parts" in msg:
-                        for part in msg["parts"]:
-                            if part.get("type") == "text":
-                                user_prompt += part.get("text", "")
-                    # 备用：检查传统的content字段
-                    if not user_prompt:
-                        user_prompt = msg.get("content", "")
+                if msg['role'] in ('user', 'assistant'):
+                    conversation.append((msg['role'], self._extract_message_text(msg)))
+            user_prompt = ""
+            if conversation and conversation[-1][0] == 'user':
+                user_prompt = conversation.pop()[1]
 
             if not user_prompt.strip():
                 yield f'data: {"type": "error", "errorText": "User prompt is empty"}\n\n'
                 return
 
+            # 按模型上下文长度统一分配系统prompt、工具、RAG和历史消息的预算
+            packer = ContextPacker.from_model_interface(model_interface)
+            # 单个资料片段最多占四分之一预算，父块更长时使用较短的检索内容
+            rag_candidates = self._get_rag_candidates(session_id, user_prompt, max_part_tokens=packer.budget // 4)
+            history = [(role, text) for role, text in reversed(conversation) if text]
+            packer.add("system", system_prompt)
+            packer.add_text("user", user_prompt)
+            packer.add("tools", tools, tokens=[token_counter.count_tool(tool) for tool in tools])
+            packer.add("rag", rag_candidates, tokens=[tokens for _, _, tokens in rag_candidates])
+            packer.add("history", [f"{role}: {text}" for role, text in history],
+                       tokens=[token_counter.count_message(role, text) for role, text in history])
+            packed = packer.pack()
+            self.last_context_allocation = packed.report()
+            logger.info(packed.summary())
+
+            kept_tools = {id(tool) for tool in packed.items["tools"]}
+            dropped_tools = [tool_name(tool) for tool in tools if id(tool) not in kept_tools]
+            if dropped_tools:
+                logger.warning(f"上下文预算不足，本轮未提供工具: {', '.join(dropped_tools)}")
+            tools = packed.items["tools"]
+            if packed.items["rag"]:
+                system_prompt.append("参考资料：\n\n" + "\n\n".join(part for part, _, _ in packed.items["rag"]))
+                self._send_rag_to_observation_window([source for _, source, _ in packed.items["rag"]], user_prompt)
+            if packed.items["history"]:
+                # 历史按从新到旧装入，恢复时间顺序
+                system_prompt.append("对话历史：\n" + "\n".join(reversed(packed.items["history"])))
+
             # 创建agent
             agent = Agent(
                 model=model,
@@ -586,7 +611,8 @@ Generate a title that best represents what this conversation will be about. Avoi
         Raises:
             Exception: 下载过程中的其他错误
         """
-        
+        from huggingface_hub import snapshot_download
+
         max_attempts_per_endpoint = 3
         endpoints = ['https://huggingface.co', 'https://hf-mirror.com']
         last_exception = None
@@ -641,9 +667,21 @@ Generate a title that best represents what this conversation will be about. Avoi
         )            
         return ""
 
+    @staticmethod
+    def _extract_message_text(msg: Dict) -> str:
+        """提取AI SDK v5消息的文本内容，优先使用parts，没有文本时使用content字段"""
+        text = ""
+        if "parts" in msg:
+            for part in msg["parts"]:
+                if part.get("type") == "text":
+                    text += part.get("text", "")
+        return text or msg.get("content", "") or ""
+
     def _get_rag_context(self, session_id: int, user_query: str, available_tokens: int) -> Tuple[str, list]:
         """
         获取RAG上下文和来源信息
+
+        检索结果按父块去重，优先使用父块完整内容，按相关度依次装入available_tokens预算
         
         Args:
             session_id: 会话ID  
@@ -653,6 +691,26 @@ Generate a title that best represents what this conversation will be about. Avoi
         Returns:
             tuple: (rag_context_text, rag_sources_list)
         """
+        candidates = self._get_rag_candidates(session_id, user_query, max_part_tokens=available_tokens)
+        packer = ContextPacker(budget=available_tokens)
+        packer.add("rag", candidates, tokens=[tokens for _, _, tokens in candidates], max_share=1.0)
+        kept = packer.pack().items["rag"]
+
+        rag_context = "\n\n".join(part for part, _, _ in kept)
+        sources = [source for _, source, _ in kept]
+        logger.info(f"RAG成功检索 {len(sources)} 个片段，总长度: {len(rag_context)} 字符")
+        return rag_context, sources
+
+    def _get_rag_candidates(self, session_id: int, user_query: str, max_part_tokens: int) -> List[Tuple[str, dict, int]]:
+        """
+        检索会话Pin文档中与查询相关的片段，按相关度排序
+
+        文本类结果使用父块完整内容，父块超过max_part_tokens或是图片/表格（父块存的是文件路径）时
+        使用子块的检索内容
+
+        Returns:
+            list: [(上下文片段文本, 来源信息, 片段token数), ...]
+        """
         try:
             # 获取会话Pin文件对应的文档ID
             from core.agent.chatsession_mgr import ChatSessionMgr
@@ -661,7 +719,7 @@ Generate a title that best represents what this conversation will be about. Avoi
             
             if not document_ids:
                 logger.debug(f"会话 {session_id} 没有Pin文档，跳过RAG")
-                return "", []
+                return []
             
             # 使用SearchManager进行检索
             from core.agent.lancedb_mgr import LanceDBMgr
@@ -683,25 +741,32 @@ Generate a title that best represents what this conversation will be about. Avoi
             if not search_response or not search_response.get('success', False):
                 error_msg = search_response.get('error', '未知错误') if search_response else '搜索响应为空'
                 logger.debug(f"RAG检索失败: {error_msg}")
-                return "", []
+                return []
             
-            # 获取实际的搜索结果
-            search_results = search_response.get('raw_results', [])
+            # 获取按父块去重的搜索结果，已附带父块完整内容和文件路径
+            search_results = search_response.get('parent_results')
+            if search_results is None:
+                search_results = search_response.get('raw_results', [])
             if not search_results:
                 logger.debug(f"RAG检索无结果，查询: {user_query[:50]}...")
-                return "", []
+                return []
             
             logger.debug(f"RAG检索到 {len(search_results)} 个结果")
             if search_results:
                 logger.debug(f"首个结果字段: {list(search_results[0].keys())}")
             
-            # 构建RAG上下文文本
-            context_parts = []
-            sources = []
-            
+            candidates = []
             for result in search_results:
-                # 限制每个片段的长度，避免token超限
-                content = result.get('retrieval_content', '')[:1000]  # 限制1000字符
+                file_path = result.get('file_path') or '未知文件'
+                content = result.get('retrieval_content', '')
+                part = f"**来源**: {file_path}\n{content}"
+                part_tokens = token_counter.count(part)
+                # 文本类父块内容更完整；图片/表格父块存的是文件路径，使用子块的检索内容
+                if result.get('chunk_type', 'text') in ('text', 'knowledge_card') and result.get('parent_content'):
+                    parent_part = f"**来源**: {file_path}\n{result['parent_content']}"
+                    parent_tokens = token_counter.count(parent_part)
+                    if parent_tokens <= max_part_tokens:
+                        part, part_tokens, content = parent_part, parent_tokens, result['parent_content']
                 
                 # 将distance转换为相似度百分比 (1 - normalized_distance)
                 distance = result.get('_distance', 1.0)  # 修正字段名
@@ -715,18 +780,13 @@ Generate a title that best represents what this conversation will be about. Avoi
                     'content': content,
                     'metadata': result.get('metadata', {})
                 }
-                
-                context_parts.append(f"**来源**: {result.get('file_path', '未知文件')}\n{content}")
-                sources.append(source_info)
-            
-            rag_context = "\n\n".join(context_parts)
+                candidates.append((part, source_info, part_tokens))
             
-            logger.info(f"RAG成功检索 {len(sources)} 个片段，总长度: {len(rag_context)} 字符")
-            return rag_context, sources
+            return candidates
             
         except Exception as e:
             logger.error(f"RAG检索失败: {e}", exc_info=True)
-            return "", []
+            return []
 
     def _send_rag_to_observation_window(self, rag_sources: list, user_query: str):
         """
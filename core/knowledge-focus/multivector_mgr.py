@@ -25,26 +25,14 @@ from typing import (
     List, 
     Optional, 
     Tuple,
+    TYPE_CHECKING,
 )
 from sqlmodel import Session, select
 from sqlalchemy import Engine
-from docling.datamodel.base_models import InputFormat
-from docling.datamodel.pipeline_options import (
-    PictureDescriptionApiOptions,
-    PdfPipelineOptions,
-)
-from docling.document_converter import DocumentConverter, PdfFormatOption
-from docling_core.types.doc import (
-    DoclingDocument,
-    ImageRefMode,
-    # PictureItem,
-    # TableItem,
-    # TextItem,
-)
-from docling.datamodel.document import ConversionResult
-from docling.chunking import HybridChunker
-from docling_core.transforms.chunker.tokenizer.huggingface import HuggingFaceTokenizer
-from transformers import AutoTokenizer
+# docling/transformers 导入耗时数秒，只在真正解析文档时才加载，避免拖慢服务启动
+if TYPE_CHECKING:
+    from docling.datamodel.document import ConversionResult
+    from docling_core.types.doc import DoclingDocument
 from core.agent.db_mgr import Document, ParentChunk, ChildChunk, ModelCapability
 from core.agent.lancedb_mgr import LanceDBMgr
 from core.agent.models_mgr import ModelsMgr
@@ -210,6 +198,9 @@ class MultiVectorMgr:
     
     def _init_docling_converter(self):
         """初始化docling文档转换器"""
+        from docling.datamodel.base_models import InputFormat
+        from docling.datamodel.pipeline_options import PictureDescriptionApiOptions, PdfPipelineOptions
+        from docling.document_converter import DocumentConverter, PdfFormatOption
 
         try:
             # 获取当前视觉模型配置
@@ -260,6 +251,10 @@ Give a concise summary of the image that is well optimized for retrieval.
     
     def _init_chunker(self):
         """初始化Docling原生chunker，基于最佳实践配置"""
+        from docling.chunking import HybridChunker
+        from docling_core.transforms.chunker.tokenizer.huggingface import HuggingFaceTokenizer
+        from transformers import AutoTokenizer
+
         try:
             # chunker的tokenizer与embedding模型可以不是同一个
             # HybridChunker的tokenizer主要用于chunk大小控制，不需要与embedding模型完全一致
@@ -410,7 +405,7 @@ Give a concise summary of the image that is well optimized for retrieval.
             logger.error(f"Failed to check existing document: {e}")
             return None
     
-    def _parse_with_docling(self, file_path: str) -> ConversionResult:
+    def _parse_with_docling(self, file_path: str) -> "ConversionResult":
         """使用docling解析文档（在子进程中运行以避免Metal GPU冲突）"""
         
         # 🚀 使用子进程运行Docling，完全隔离Metal上下文
@@ -539,8 +534,10 @@ Give a concise summary of the image that is well optimized for retrieval.
             # 🔓 释放 Metal GPU 锁
             release_metal_lock("Docling PDF parsing")
     
-    def _save_docling_result(self, file_path: str, result: ConversionResult) -> str:
+    def _save_docling_result(self, file_path: str, result: "ConversionResult") -> str:
         """保存docling解析结果到JSON文件"""
+        from docling_core.types.doc import ImageRefMode
+
         try:
             # 使用数据库目录的docling_cache子目录
             output_dir = self.docling_cache_dir
@@ -617,7 +614,7 @@ Give a concise summary of the image that is well optimized for retrieval.
                 status="error"
             )
     
-    def _generate_chunks(self, document_id: int, docling_doc: DoclingDocument) -> Tuple[List[ParentChunk], List[ChildChunk]]:
+    def _generate_chunks(self, document_id: int, docling_doc: "DoclingDocument") -> Tuple[List[ParentChunk], List[ChildChunk]]:
         """
         使用Docling HybridChunker进行智能分块
         
@@ -5,6 +5,7 @@ import logging
 import time
 import threading
 import signal
+import importlib
 
 sys.path.append(r"D:\Workspace\LeafKnow")
 from datetime import datetime
@@ -26,9 +27,7 @@ from core.agent.db_mgr import (
     Task,
     SystemConfig,
 )
-from core.agent.models_mgr import ModelsMgr
-from core.agent.lancedb_mgr import LanceDBMgr
-# from core.agent.multivector_mgr import MultiVectorMgr
+# ModelsMgr/LanceDBMgr/MultiVectorMgr 会拉入 agent、lancedb、docling 等重型依赖，在用到的函数里再导入
 from core.agent.task_mgr import TaskManager
 # API路由导入将在lifespan函数中进行
 
@@ -70,6 +69,35 @@ def create_optimized_sqlite_engine(sqlite_url, **kwargs):
     setup_sqlite_wal_mode(engine)
     return engine
 
+# --- Heavy Module Warm-up ---
+# docling/transformers/torch/mlx/tiktoken 都在首次使用时才导入，/health 不必等它们加载完成。
+# 服务就绪后由后台线程按顺序预热，第一个文档任务或聊天请求就不用再承担导入耗时
+HEAVY_MODULES_TO_WARM_UP = (
+    "tiktoken",
+    "core.models_builtin",
+    "transformers",
+    "docling.document_converter",
+    "docling.chunking",
+    "core.agent.models_mgr",
+    "core.agent.multivector_mgr",
+)
+
+def warm_up_heavy_modules(delay: float = 2.0):
+    """在后台线程中预先导入重型依赖"""
+    time.sleep(delay)  # 先让出启动阶段，保证 /health 尽快响应
+    for module_name in HEAVY_MODULES_TO_WARM_UP:
+        started = time.perf_counter()
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            # 部分依赖只在特定平台上安装（例如mlx只在macOS上可用）
+            logger.debug(f"跳过预热模块 {module_name}: {e}")
+            continue
+        except Exception as e:
+            logger.warning(f"预热模块 {module_name} 失败: {e}")
+            continue
+        logger.info(f"预热模块 {module_name} 完成，耗时 {time.perf_counter() - started:.2f}s")
+
 # --- Centralized Logging Setup ---
 def setup_logging(logging_dir: str):
     """
@@ -161,16 +189,7 @@ async def lifespan(app: FastAPI):
                     logger.info("开始数据库结构初始化...")
                     # 使用单个连接完成所有数据库初始化操作
                     with app.state.engine.connect() as conn:
-                        logger.info("设置WAL模式和优化参数...")
-                        # 显式设置WAL模式和优化参数（确保在生产环境中也正确设置）
-                        conn.execute(text("PRAGMA journal_mode=WAL"))
-                        conn.execute(text("PRAGMA synchronous=NORMAL"))
-                        conn.execute(text("PRAGMA cache_size=-65536"))
-                        conn.execute(text("PRAGMA foreign_keys=ON"))
-                        conn.execute(text("PRAGMA temp_store=MEMORY"))
-                        conn.execute(text("PRAGMA wal_autocheckpoint=1000"))
-                        
-                        # 验证WAL模式设置
+                        # WAL模式和优化参数已由连接事件设置，这里只做验证
                         journal_mode = conn.execute(text("PRAGMA journal_mode")).fetchone()[0]
                         if journal_mode.upper() != 'WAL':
                             logger.warning(f"WAL模式设置可能失败，当前模式: {journal_mode}")
@@ -270,6 +289,9 @@ async def lifespan(app: FastAPI):
             logger.error(f"注册API路由失败: {str(router_err)}", exc_info=True)
             raise
 
+        # 服务就绪后在后台预热重型依赖
+        threading.Thread(target=warm_up_heavy_modules, name="heavy_module_warm_up", daemon=True).start()
+
         # 正式开始服务
         logger.info("应用初始化完成，开始提供服务...")
         yield
@@ -357,6 +379,9 @@ def get_task_manager(engine: Engine = Depends(get_engine)) -> TaskManager:
 # 任务处理者
 def _process_task(task: Task, lancedb_mgr, task_mgr: TaskManager, engine: Engine) -> None:
     """通用任务处理逻辑"""
+    from core.agent.models_mgr import ModelsMgr
+    from core.agent.multivector_mgr import MultiVectorMgr
+
     models_mgr = ModelsMgr(engine=engine, base_dir=app.state.db_directory)
     multivector_mgr = MultiVectorMgr(engine=engine, lancedb_mgr=lancedb_mgr, models_mgr=models_mgr)
 
@@ -428,6 +453,7 @@ def _generic_task_processor(engine, db_directory: str, stop_event: threading.Eve
     """
     logger.info(f"{processor_name}已启动")
     
+    from core.agent.lancedb_mgr import LanceDBMgr
     lancedb_mgr = LanceDBMgr(base_dir=db_directory)
 
     while not stop_event.is_set():
@@ -733,7 +759,9 @@ async def pin_file(
             }
         
         # 检查文件类型是否支持
-        from core.agent.multivector_mgr import SUPPORTED_FORMATS
+        from core.agent.multivector_mgr import SUPPORTED_FORMATS, MultiVectorMgr
+        from core.agent.models_mgr import ModelsMgr
+        from core.agent.lancedb_mgr import LanceDBMgr
         file_ext = Path(file_path).suffix.split('.')[-1].lower()
         if file_ext not in SUPPORTED_FORMATS:
             logger.warning(f"Pin文件失败，不支持的文件类型: {file_ext}")
@@ -6,7 +6,7 @@ import logging
 import os
 import time
 import signal
-import tiktoken
+from functools import lru_cache
 from typing import Dict, Any
 
 # 为当前模块创建专门的日志器（最佳实践）
@@ -252,20 +252,27 @@ def monitor_parent():
     
     logger.info("父进程监控线程已退出")
 
+@lru_cache(maxsize=None)
+def _get_tiktoken_encoding(encoding_name: str):
+    """首次计数时才导入tiktoken并加载编码表"""
+    import tiktoken
+    return tiktoken.get_encoding(encoding_name)
+
 # copy & paste from https://github.com/openai/openai-cookbook/blob/main/examples/How_to_count_tokens_with_tiktoken.ipynb
 def num_tokens_from_string(string: str, encoding_name: str = "o200k_base") -> int:
     """Returns the number of tokens in a text string."""
-    encoding = tiktoken.get_encoding(encoding_name)
+    encoding = _get_tiktoken_encoding(encoding_name)
     num_tokens = len(encoding.encode(string))
     return num_tokens
 
 def num_tokens_from_messages(messages, model="gpt-4o-mini-2024-07-18"):
     """Return the number of tokens used by a list of messages."""
+    import tiktoken
     try:
         encoding = tiktoken.encoding_for_model(model)
     except KeyError:
         print("Warning: model not found. Using o200k_base encoding.")
-        encoding = tiktoken.get_encoding("o200k_base")
+        encoding = _get_tiktoken_encoding("o200k_base")
     if model in {
         "gpt-3.5-turbo-0125",
         "gpt-4-0314",
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark the cold import of `from core.agno.agent import Agent`.
+
+Each run starts a fresh interpreter, imports Agent and reports the import wall time, the peak RSS and the
+number of modules loaded. The median over all runs is printed.
+
+Usage:
+    python tests/benchmark_agent_import.py [--runs 10] [--statement "from core.agno.agent import Agent"]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+MEASURE = """
+import json, resource, sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform != "darwin":
+    rss *= 1024  # ru_maxrss is in KiB on Linux and bytes on macOS
+print(json.dumps({{"seconds": elapsed, "rss": rss, "modules": len(sys.modules)}}))
+"""
+
+
+def measure(statement: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE.format(statement=statement)],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--statement", default="from core.agno.agent import Agent")
+    args = parser.parse_args()
+
+    # Warm the bytecode cache so every run measures imports, not compilation
+    measure(args.statement)
+    samples = [measure(args.statement) for _ in range(args.runs)]
+
+    print(
+        f"{args.statement}: "
+        f"{statistics.median(s['seconds'] for s in samples) * 1000:8.1f} ms | "
+        f"{statistics.median(s['rss'] for s in samples) / 1024 / 1024:7.1f} MiB peak RSS | "
+        f"{statistics.median(s['modules'] for s in samples):5.0f} modules"
+    )
+
+
+if __name__ == "__main__":
+    main()
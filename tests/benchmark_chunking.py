@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark the agno chunkers on a synthetic corpus of mixed Chinese and English text.
+
+Compares the character-measured chunkers with the token-measured ones (`tokenizer=`), reporting the
+throughput, the number of chunks and how many chunks exceed `--max-tokens` tokens of the word tokenizer,
+i.e. would be truncated by an embedding model with that input limit.
+
+Usage:
+    python tests/benchmark_chunking.py [--size-mb 100] [--doc-kb 256] [--chunk-size 5000] [--max-tokens 512]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.agno.knowledge.chunking.fixed import FixedSizeChunking  # noqa: E402
+from core.agno.knowledge.chunking.recursive import RecursiveChunking  # noqa: E402
+from core.agno.knowledge.chunking.tokens import RegexTokenizer  # noqa: E402
+from core.agno.knowledge.document.base import Document  # noqa: E402
+
+ENGLISH_WORDS = "the knowledge base indexes documents so that agents can search relevant chunks quickly".split()
+CHINESE_SENTENCES = [
+    "知识库会为文档建立索引，方便智能体快速检索相关的片段。",
+    "嵌入模型对输入长度有限制，超过限制的部分会被直接截断。",
+    "本地优先的设计让用户的数据始终保存在自己的电脑上。",
+]
+
+
+def make_corpus(size_bytes: int, doc_bytes: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    documents = []
+    total = 0
+    while total < size_bytes:
+        parts = []
+        length = 0
+        while length < doc_bytes:
+            if rng.random() < 0.5:
+                part = " ".join(rng.choice(ENGLISH_WORDS) for _ in range(rng.randint(8, 30))) + ". "
+            else:
+                part = "".join(rng.choice(CHINESE_SENTENCES) for _ in range(rng.randint(1, 4)))
+            if rng.random() < 0.1:
+                part += "\n"
+            parts.append(part)
+            length += len(part.encode("utf-8"))
+        documents.append(Document(content="".join(parts), name=f"doc_{len(documents)}"))
+        total += length
+    return documents
+
+
+def run(label: str, chunker, documents: list, size_mb: float, max_tokens: int, counter: RegexTokenizer) -> None:
+    start = time.perf_counter()
+    chunks = [chunk for document in documents for chunk in chunker.chunk(document)]
+    elapsed = time.perf_counter() - start
+    oversized = sum(1 for chunk in chunks if counter.count(chunk.content) > max_tokens)
+    print(
+        f"{label:42s} {elapsed:8.2f} s | {size_mb / elapsed:7.1f} MB/s | {len(chunks):8d} chunks | "
+        f"{oversized:8d} over {max_tokens} tokens"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=100)
+    parser.add_argument("--doc-kb", type=int, default=256)
+    parser.add_argument("--chunk-size", type=int, default=5000, help="chunk size of the character chunkers")
+    parser.add_argument("--max-tokens", type=int, default=512, help="token limit of the embedding model")
+    args = parser.parse_args()
+
+    documents = make_corpus(int(args.size_mb * 1024 * 1024), args.doc_kb * 1024)
+    counter = RegexTokenizer()
+    print(f"{len(documents)} documents, {args.size_mb:.0f} MB")
+
+    run("FixedSizeChunking (characters)", FixedSizeChunking(args.chunk_size), documents, args.size_mb,
+        args.max_tokens, counter)
+    run("RecursiveChunking (characters)", RecursiveChunking(args.chunk_size), documents, args.size_mb,
+        args.max_tokens, counter)
+    run("FixedSizeChunking (word tokens)", FixedSizeChunking(args.max_tokens, tokenizer=counter), documents,
+        args.size_mb, args.max_tokens, counter)
+    run("RecursiveChunking (word tokens)", RecursiveChunking(args.max_tokens, tokenizer=counter), documents,
+        args.size_mb, args.max_tokens, counter)
+    run("FixedSizeChunking (word tokens, overlap 64)",
+        FixedSizeChunking(args.max_tokens, overlap=64, tokenizer=counter), documents, args.size_mb,
+        args.max_tokens, counter)
+
+
+if __name__ == "__main__":
+    main()
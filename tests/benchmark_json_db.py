@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark JsonDb against the append-log JsonLogDb on a large session fixture.
+
+Both backends start from the same fixture (written once as a JsonDb file and imported by JsonLogDb), then
+run the same mix of random reads and upserts.
+
+Usage:
+    python tests/benchmark_json_db.py [--sessions 50000] [--operations 200]
+"""
+
+import argparse
+import json
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.agno.db.base import SessionType
+from core.agno.db.json import JsonDb, JsonLogDb
+from core.agno.session import AgentSession
+
+
+def write_fixture(db_path: Path, sessions: int) -> None:
+    now = int(time.time())
+    records = [
+        {
+            "session_id": f"session-{i}",
+            "session_type": SessionType.AGENT.value,
+            "agent_id": f"agent-{i % 10}",
+            "user_id": f"user-{i % 100}",
+            "session_data": {"session_name": f"Session {i}"},
+            "runs": [{"run_id": f"run-{i}", "content": "x" * 200}],
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(sessions)
+    ]
+    db_path.mkdir(parents=True, exist_ok=True)
+    with open(db_path / "agno_sessions.json", "w") as f:
+        json.dump(records, f, indent=2)
+
+
+def run(db, sessions: int, operations: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    ids = [f"session-{rng.randrange(sessions)}" for _ in range(operations)]
+
+    start = time.perf_counter()
+    for session_id in ids:
+        db.get_session(session_id, SessionType.AGENT)
+    read_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i, session_id in enumerate(ids):
+        db.upsert_session(
+            AgentSession(session_id=session_id, agent_id="agent-0", user_id="user-0", session_data={"i": i})
+        )
+    write_time = time.perf_counter() - start
+
+    return {
+        "reads_per_second": operations / read_time,
+        "upserts_per_second": operations / write_time,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=50000)
+    parser.add_argument("--operations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="agno_json_bench_"))
+    try:
+        for name, db_class in (("JsonDb", JsonDb), ("JsonLogDb", JsonLogDb)):
+            db_path = root / name
+            write_fixture(db_path, args.sessions)
+
+            start = time.perf_counter()
+            db = db_class(db_path=str(db_path))
+            db.get_session("session-0", SessionType.AGENT)
+            open_time = time.perf_counter() - start
+
+            results = run(db, args.sessions, args.operations, args.seed)
+            print(
+                f"{name:>10}: open {open_time:7.2f}s | "
+                f"{results['reads_per_second']:10.1f} reads/s | "
+                f"{results['upserts_per_second']:10.1f} upserts/s"
+            )
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
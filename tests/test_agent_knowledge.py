@@ -0,0 +1,55 @@
+"""
+Agent 知识库检索单元测试
+测试 Agent.get_relevant_docs_from_knowledge 在延迟导入 Knowledge 后仍能检索文档
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.agno.agent import Agent
+from core.agno.knowledge.document import Document
+from core.agno.knowledge.knowledge import Knowledge
+
+
+class RecordingVectorDb:
+    """记录每次检索的 limit，返回固定的文档"""
+
+    def __init__(self):
+        self.limits = []
+
+    def exists(self):
+        return True
+
+    def search(self, query, limit=None, filters=None):
+        self.limits.append(limit)
+        return [Document(content=f"answer to {query}")]
+
+
+class TestAgentKnowledge(unittest.TestCase):
+    """Agent 知识库检索测试"""
+
+    def test_get_relevant_docs_without_max_results(self):
+        """知识库未设置 max_results 时按默认数量检索，不因 Knowledge 未导入而报错"""
+        vector_db = RecordingVectorDb()
+        agent = Agent(knowledge=Knowledge(vector_db=vector_db, max_results=None))
+
+        docs = agent.get_relevant_docs_from_knowledge("tea")
+
+        self.assertEqual([doc["content"] for doc in docs], ["answer to tea"])
+        self.assertEqual(vector_db.limits, [None])
+
+    def test_get_relevant_docs_with_num_documents(self):
+        """显式传入 num_documents 时按该数量检索"""
+        vector_db = RecordingVectorDb()
+        agent = Agent(knowledge=Knowledge(vector_db=vector_db, max_results=None))
+
+        agent.get_relevant_docs_from_knowledge("tea", num_documents=3)
+
+        self.assertEqual(vector_db.limits, [3])
+
+
+if __name__ == "__main__":
+    unittest.main()
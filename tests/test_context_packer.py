@@ -0,0 +1,142 @@
+"""
+上下文打包器单元测试
+测试必需部分、按占比上限的第一轮分配和补给剩余预算的第二轮分配、历史消息的连续性，
+以及带缓存的token计数
+"""
+
+import os
+import sys
+import types
+import unittest
+from unittest.mock import patch
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+KNOWLEDGE_FOCUS_DIR = os.path.join(PROJECT_ROOT, "core", "knowledge-focus")
+sys.path.insert(0, PROJECT_ROOT)
+
+# 部署后 knowledge-focus 的模块位于 core 包（core.utils）和 core.agent 包中
+import core
+core.__path__ = [os.path.join(PROJECT_ROOT, "core"), KNOWLEDGE_FOCUS_DIR]
+if "core.agent" not in sys.modules:
+    agent_package = types.ModuleType("core.agent")
+    agent_package.__path__ = [KNOWLEDGE_FOCUS_DIR]
+    sys.modules["core.agent"] = core.agent = agent_package
+
+try:
+    from core.agent.context_packer import ContextPacker, TokenCounter
+except ImportError as e:
+    raise unittest.SkipTest(f"上下文打包器无法在当前环境中导入: {e}")
+
+
+class LengthCounter(TokenCounter):
+    """按字符数计数，测试不依赖分词器"""
+
+    def count(self, text):
+        return len(text) if text else 0
+
+
+def make_packer(budget, **kwargs):
+    return ContextPacker(budget=budget, counter=LengthCounter(), **kwargs)
+
+
+class TestContextPacker(unittest.TestCase):
+    """ContextPacker 测试"""
+
+    def test_required_components_are_kept(self):
+        """系统prompt、用户输入和工具总是完整保留，先于其他部分扣除"""
+        packer = make_packer(100)
+        packer.add("system", ["s" * 20])
+        packer.add_text("user", "u" * 10)
+        packer.add("tools", ["tool-a", "tool-b"], tokens=[15, 15])
+        packer.add("rag", ["r" * 50])
+        packed = packer.pack()
+
+        self.assertEqual(packed.items["tools"], ["tool-a", "tool-b"])
+        self.assertEqual(packed.items["rag"], [])
+        self.assertEqual(packed.allocation["rag"], {"requested": 50, "used": 0, "kept": 0, "total": 1})
+        self.assertEqual(packed.used, 60)
+
+    def test_required_components_over_budget(self):
+        """必需部分超出预算时仍完整保留，记录警告并不再分配其他部分"""
+        packer = make_packer(50)
+        packer.add("system", ["s" * 40])
+        packer.add("tools", ["tool-a", "tool-b"], tokens=[20, 20])
+        packer.add("history", ["h" * 5])
+        with self.assertLogs(level="WARNING") as logs:
+            packed = packer.pack()
+
+        self.assertEqual(packed.items["system"], ["s" * 40])
+        self.assertEqual(packed.items["tools"], ["tool-a", "tool-b"])
+        self.assertEqual(packed.items["history"], [])
+        self.assertIn("30 tokens", logs.output[0])
+        self.assertIn("tools 40", logs.output[0])
+
+    def test_capped_then_uncapped_pass(self):
+        """第一轮每部分最多占max_share，第二轮把剩余预算按优先级补给未装满的部分"""
+        packer = make_packer(100)
+        packer.add("rag", ["a" * 30, "b" * 30, "c" * 30])
+        packer.add("history", ["h" * 10] * 10)
+        packed = packer.pack()
+
+        # 第一轮 rag 上限50只放下一个片段，history 上限50放下五条；第二轮剩余20只够再放两条历史
+        self.assertEqual(packed.items["rag"], ["a" * 30])
+        self.assertEqual(packed.allocation["history"]["kept"], 7)
+        self.assertEqual(packed.used, 100)
+
+    def test_leftover_budget_goes_to_other_components(self):
+        """某部分用不完自己的份额时，其余部分在第二轮使用剩余预算"""
+        packer = make_packer(100)
+        packer.add("rag", ["r" * 10])
+        packer.add("history", ["h" * 10] * 10)
+        packed = packer.pack()
+
+        self.assertEqual(packed.items["rag"], ["r" * 10])
+        self.assertEqual(packed.allocation["history"]["kept"], 9)
+        self.assertEqual(packed.used, 100)
+
+    def test_history_is_contiguous(self):
+        """历史消息遇到第一条放不下的即停止，不跳过中间的消息"""
+        history = ["new" * 3, "long" * 20, "old" * 3]
+        packed = make_packer(60).add("history", history).pack()
+        self.assertEqual(packed.items["history"], ["new" * 3])
+
+        packed = make_packer(60).add("history", history, contiguous=False).pack()
+        self.assertEqual(packed.items["history"], ["new" * 3, "old" * 3])
+
+    def test_priorities_override(self):
+        """通过priorities覆盖默认配置，非必需的工具按占比上限装入"""
+        packer = make_packer(100, priorities={"tools": {"priority": 1, "max_share": 0.25}})
+        packer.add("tools", ["tool-a", "tool-b", "tool-c"], tokens=[20, 20, 70])
+        packed = packer.pack()
+
+        self.assertEqual(packed.items["tools"], ["tool-a", "tool-b"])
+        self.assertEqual(packed.allocation["tools"]["used"], 40)
+
+    def test_budget_from_model_limits(self):
+        """可分配预算为上下文长度减去回复预留，回复预留最多占一半"""
+        self.assertEqual(ContextPacker(max_context_length=4096, max_output_tokens=1000).budget, 3096)
+        self.assertEqual(ContextPacker(max_context_length=4096, max_output_tokens=8000).budget, 2048)
+
+
+class TestTokenCounter(unittest.TestCase):
+    """TokenCounter 测试"""
+
+    def test_counts_are_cached(self):
+        """相同内容只调用一次分词器，超过缓存大小时淘汰最久未用的计数"""
+        with patch("core.agent.context_packer.num_tokens_from_string", side_effect=lambda text, _: len(text)) as count:
+            counter = TokenCounter(cache_size=2)
+            self.assertEqual(counter.count("hello"), 5)
+            self.assertEqual(counter.count("hello"), 5)
+            self.assertEqual(count.call_count, 1)
+
+            counter.count("a")
+            counter.count("hello")
+            counter.count("bb")
+            counter.count("a")
+            self.assertEqual(count.call_count, 4)
+            self.assertEqual(counter.count(""), 0)
+            self.assertEqual(counter.count_message("user", "hi"), 3 + 4 + 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
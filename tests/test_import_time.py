@@ -0,0 +1,103 @@
+"""
+后端导入耗时测试
+通过 python -X importtime 在独立进程中导入后端模块，确认 docling/transformers/torch/mlx/tiktoken
+不会在导入阶段被加载，并打印累计导入耗时最高的模块，便于追踪服务启动耗时的变化
+"""
+
+import os
+import re
+import subprocess
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+KNOWLEDGE_FOCUS_DIR = os.path.join(PROJECT_ROOT, "core", "knowledge-focus")
+
+# 部署后 knowledge-focus 的模块位于 core 包（core.utils、core.config、core.server）和 core.agent 包中，
+# 子进程先按这个布局注册 core 和 core.agent 包，再导入被测模块
+PACKAGE_LAYOUT = f"""
+import sys, types
+core = types.ModuleType("core")
+core.__path__ = [{os.path.join(PROJECT_ROOT, "core")!r}, {KNOWLEDGE_FOCUS_DIR!r}]
+agent = types.ModuleType("core.agent")
+agent.__path__ = [{KNOWLEDGE_FOCUS_DIR!r}]
+core.agent = agent
+sys.modules["core"] = core
+sys.modules["core.agent"] = agent
+"""
+
+# 只允许在首次使用时（或服务就绪后的后台预热中）导入的重型依赖
+HEAVY_PACKAGES = (
+    "docling",
+    "docling_core",
+    "transformers",
+    "torch",
+    "mlx",
+    "mlx_lm",
+    "mlx_vlm",
+    "mlx_embeddings",
+    "tiktoken",
+    "huggingface_hub",
+)
+
+# 服务启动阶段会导入的后端模块
+BACKEND_MODULES = (
+    "core.utils",
+    "core.agent.models_mgr",
+    "core.agent.multivector_mgr",
+    "core.server.apps.models_app",
+    "core.server.apps.chatsession_app",
+    "core.server.apps.documents_app",
+)
+
+
+def measure_import_time(module_name):
+    """在独立进程中导入模块，返回 {模块名: 累计导入耗时(微秒)}"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{PACKAGE_LAYOUT}\nimport {module_name}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    if result.returncode != 0:
+        missing = re.search(r"ModuleNotFoundError: No module named '([^']+)'", result.stderr)
+        # 缺少第三方依赖时跳过；缺少项目自身的模块说明布局或导入有误，直接失败
+        if missing and missing.group(1).split(".")[0] != "core":
+            raise unittest.SkipTest(f"{module_name} 无法在当前环境中导入: {result.stderr.strip().splitlines()[-1]}")
+        raise AssertionError(f"导入 {module_name} 失败:\n{result.stderr}")
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        timings[parts[2].strip()] = int(parts[1].strip())
+    return timings
+
+
+class TestBackendImportTime(unittest.TestCase):
+    """后端模块导入耗时测试"""
+
+    def test_backend_modules_do_not_import_heavy_packages(self):
+        """后端模块导入时不加载重型依赖"""
+        for module_name in BACKEND_MODULES:
+            with self.subTest(module=module_name):
+                timings = measure_import_time(module_name)
+
+                slowest = sorted(timings.items(), key=lambda item: item[1], reverse=True)[:10]
+                print(f"\n{module_name} 累计导入耗时 {timings.get(module_name, 0) / 1e6:.3f}s，最慢的模块:")
+                for name, cumulative in slowest:
+                    print(f"  {cumulative / 1e6:8.3f}s  {name}")
+
+                loaded_heavy = sorted(
+                    name for name in timings if name.split(".")[0] in HEAVY_PACKAGES
+                )
+                self.assertEqual(loaded_heavy, [], f"{module_name} 在导入阶段加载了重型依赖")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+JsonLogDb 单元测试
+测试追加日志的写入与重放、压缩（包括多进程并发写入时的压缩）、缺少主键的记录，
+以及通过 BaseDb 公共方法的读写往返
+"""
+
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.agno.db.base import SessionType
+from core.agno.db.json import json_log_db
+from core.agno.db.json.json_log_db import JsonLogDb
+from core.agno.db.schemas.evals import EvalRunRecord, EvalType
+from core.agno.db.schemas.knowledge import KnowledgeRow
+from core.agno.db.schemas.memory import UserMemory
+from core.agno.session import AgentSession
+
+
+def make_session(session_id, content="hello", user_id="user-1"):
+    return AgentSession(
+        session_id=session_id,
+        agent_id="agent-1",
+        user_id=user_id,
+        session_data={"session_name": session_id},
+        runs=[],
+        metadata={"content": content},
+    )
+
+
+def write_sessions(db_path, prefix, count, rounds):
+    """在子进程中反复更新一批会话，频繁触发压缩"""
+    json_log_db._tables.clear()
+    db = JsonLogDb(db_path=db_path, compaction_ratio=1.5, compaction_min_bytes=1)
+    for round_number in range(rounds):
+        for i in range(count):
+            db.upsert_session(make_session(f"{prefix}-{i}", content=f"round {round_number}"))
+
+
+class TestJsonLogDb(unittest.TestCase):
+    """JsonLogDb 测试"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.temp_dir = tempfile.mkdtemp()
+        json_log_db._tables.clear()
+
+    def tearDown(self):
+        """测试后清理"""
+        self.reopen()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def reopen(self, **kwargs):
+        """丢弃进程内的索引，模拟另一个进程打开同一目录"""
+        for table in json_log_db._tables.values():
+            if table._lock_fd is not None:
+                os.close(table._lock_fd)
+        json_log_db._tables.clear()
+        return JsonLogDb(db_path=self.temp_dir, **kwargs)
+
+    def session_log(self):
+        return os.path.join(self.temp_dir, "agno_sessions.jsonl")
+
+    def test_append_and_replay(self):
+        """写入以追加行的形式落盘，重新打开后按最后一次写入重放"""
+        db = JsonLogDb(db_path=self.temp_dir)
+        db.upsert_session(make_session("s1", content="first"))
+        db.upsert_session(make_session("s2"))
+        db.upsert_session(make_session("s1", content="second"))
+        db.delete_session("s2")
+
+        with open(self.session_log()) as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual([line["k"] for line in lines], ["s1", "s2", "s1", "s2"])
+        self.assertTrue(lines[-1]["d"])
+
+        db = self.reopen()
+        session = db.get_session("s1", SessionType.AGENT)
+        self.assertEqual(session.metadata, {"content": "second"})
+        self.assertIsNone(db.get_session("s2", SessionType.AGENT))
+        self.assertEqual([s.session_id for s in db.get_sessions(session_type=SessionType.AGENT)], ["s1"])
+
+    def test_compaction_keeps_latest_records(self):
+        """压缩后只保留每个主键的最后一次写入"""
+        db = JsonLogDb(db_path=self.temp_dir, compaction_ratio=2.0, compaction_min_bytes=1)
+        for round_number in range(20):
+            for i in range(5):
+                db.upsert_session(make_session(f"s{i}", content=f"round {round_number}"))
+        db.delete_session("s4")
+
+        with open(self.session_log()) as f:
+            keys = [json.loads(line)["k"] for line in f]
+        self.assertLess(len(keys), 20 * 5)
+
+        db = self.reopen()
+        sessions = db.get_sessions(session_type=SessionType.AGENT)
+        self.assertEqual(sorted(s.session_id for s in sessions), ["s0", "s1", "s2", "s3"])
+        for session in sessions:
+            self.assertEqual(session.metadata, {"content": "round 19"})
+
+    @unittest.skipUnless(hasattr(os, "fork"), "需要 fork 启动子进程")
+    def test_concurrent_processes_do_not_lose_writes(self):
+        """多个进程同时写入并压缩同一个表时不丢失记录"""
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(target=write_sessions, args=(self.temp_dir, f"p{n}", 10, 15)) for n in range(3)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(120)
+            self.assertEqual(process.exitcode, 0)
+
+        db = self.reopen()
+        sessions = db.get_sessions(session_type=SessionType.AGENT)
+        self.assertEqual(
+            sorted(s.session_id for s in sessions), sorted(f"p{n}-{i}" for n in range(3) for i in range(10))
+        )
+        for session in sessions:
+            self.assertEqual(session.metadata, {"content": "round 14"})
+
+    def test_record_without_key(self):
+        """缺少主键的记录写入时报错，导入旧的 JSON 文件时跳过"""
+        db = JsonLogDb(db_path=self.temp_dir)
+        with self.assertRaises(ValueError):
+            db._write_json_file(db.session_table_name, [{"session_type": "agent"}])
+
+        with open(os.path.join(self.temp_dir, "agno_memories.json"), "w") as f:
+            json.dump([{"memory_id": "m1", "memory": "keep"}, {"memory": "no key"}], f)
+        db = self.reopen()
+        memories = db._read_json_file(db.memory_table_name)
+        self.assertEqual([m["memory_id"] for m in memories], ["m1"])
+
+    def test_public_methods_round_trip(self):
+        """通过 BaseDb 公共方法写入的数据可以原样读回"""
+        db = JsonLogDb(db_path=self.temp_dir)
+
+        db.upsert_session(make_session("s1"))
+        db.rename_session("s1", SessionType.AGENT, "renamed")
+        memory = db.upsert_user_memory(UserMemory(memory_id="m1", memory="likes tea", user_id="user-1"))
+        db.upsert_knowledge_content(KnowledgeRow(id="k1", name="doc", description="a document"))
+        db.create_eval_run(EvalRunRecord(run_id="e1", eval_type=EvalType.ACCURACY, eval_data={"score": 1}))
+
+        db = self.reopen()
+        session = db.get_session("s1", SessionType.AGENT)
+        self.assertEqual(session.session_data["session_name"], "renamed")
+        self.assertEqual(db.get_user_memory("m1").memory, memory.memory)
+        self.assertEqual(db.get_knowledge_content("k1").name, "doc")
+        self.assertEqual(db.get_eval_run("e1").eval_data, {"score": 1})
+
+        db.delete_user_memory("m1")
+        db.delete_knowledge_content("k1")
+        db = self.reopen()
+        self.assertIsNone(db.get_user_memory("m1"))
+        self.assertIsNone(db.get_knowledge_content("k1"))
+        self.assertIsNotNone(db.get_session("s1", SessionType.AGENT))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+"""
+RuntimeTraceWriter 和 ExtendedSqliteDb 运行时数据单元测试
+测试后台写入的快照语义、同一运行的记录合并、flush/close，以及各编码方式的读写往返
+"""
+
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.agno.db.sqlite.extended_sqlite import ExtendedSqliteDb
+from core.agno.db.sqlite.runtime_data import RuntimeData
+from core.agno.db.sqlite.trace_writer import RuntimeTraceWriter
+
+
+def make_runtime_data(run_id, agent_id="agent-1", status="running"):
+    return RuntimeData(
+        run_id=run_id,
+        session_id="session-1",
+        agent_id=agent_id,
+        input_data={"prompt": "你好", "a": 1},
+        output_data={"content": "x" * 100},
+        reasoning_steps=[{"step": 1, "content": "thinking"}],
+        tool_calls=[{"name": "search", "arguments": {"query": "q"}}],
+        metrics={"tokens": 10},
+        status=status,
+        execution_time=0.5,
+    )
+
+
+class RecordingDb:
+    """记录每个批次的写入，用于检查 RuntimeTraceWriter 的合并逻辑"""
+
+    def __init__(self):
+        self.batches = []
+        self._db = ExtendedSqliteDb.__new__(ExtendedSqliteDb)
+        self._db.runtime_codec = None
+
+    def _runtime_row(self, data):
+        return self._db._runtime_row(data)
+
+    def _write_runtime_batch(self, records, status_updates):
+        self.batches.append((records, status_updates))
+
+
+class TestRuntimeTraceWriter(unittest.TestCase):
+    """RuntimeTraceWriter 测试"""
+
+    def test_coalesces_records_and_status_updates(self):
+        """同一批次中同一运行的记录和状态更新合并为一次写入"""
+        db = RecordingDb()
+        writer = RuntimeTraceWriter(db, flush_interval=60)
+        try:
+            writer._write([
+                db._runtime_row(make_runtime_data("r1")),
+                ("r1", "completed", None, 100),
+                db._runtime_row(make_runtime_data("r2")),
+                ("r3", "failed", "boom", 100),
+                ("r3", "cancelled", None, 101),
+            ])
+        finally:
+            writer.close()
+
+        records, status_updates = db.batches[-1]
+        self.assertEqual([(r["run_id"], r["status"]) for r in records], [("r1", "completed"), ("r2", "running")])
+        self.assertEqual(status_updates, [("r3", "cancelled", "boom", 101)])
+
+    def test_flush_and_close(self):
+        """flush 等待已入队的记录写完，close 后不再接受新记录"""
+        db = RecordingDb()
+        writer = RuntimeTraceWriter(db, batch_size=4, flush_interval=60)
+        for i in range(10):
+            writer.put(make_runtime_data(f"r{i}"))
+        self.assertTrue(writer.flush(timeout=10))
+        written = [record["run_id"] for records, _ in db.batches for record in records]
+        self.assertEqual(sorted(written), sorted(f"r{i}" for i in range(10)))
+
+        writer.close()
+        writer.close()
+        with self.assertRaises(RuntimeError):
+            writer.put(make_runtime_data("late"))
+
+
+class TestExtendedSqliteRuntimeData(unittest.TestCase):
+    """ExtendedSqliteDb 运行时数据测试"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.dbs = []
+
+    def tearDown(self):
+        """测试后清理"""
+        for db in self.dbs:
+            db.close_runtime_writer()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def make_db(self, **kwargs):
+        db = ExtendedSqliteDb(db_file=os.path.join(self.temp_dir, "runtime.db"), **kwargs)
+        self.dbs.append(db)
+        return db
+
+    def test_async_writes_store_a_snapshot(self):
+        """异步写入保存的是入队时的记录，之后修改记录不影响已入队的数据"""
+        for async_runtime_writes in (False, True):
+            with self.subTest(async_runtime_writes=async_runtime_writes):
+                db = self.make_db(async_runtime_writes=async_runtime_writes)
+                data = make_runtime_data(f"snapshot-{async_runtime_writes}")
+                db.upsert_runtime_data(data)
+                data.input_data["a"] = 2
+                data.tool_calls.append({"name": "late"})
+
+                stored = db.get_runtime_data(data.run_id)
+                self.assertEqual(stored.input_data, {"prompt": "你好", "a": 1})
+                self.assertEqual(len(stored.tool_calls), 1)
+
+    def test_status_updates_and_statistics(self):
+        """异步模式下状态更新和统计信息都能看到入队的数据"""
+        db = self.make_db(async_runtime_writes=True)
+        db.upsert_runtime_data(make_runtime_data("r1"))
+        db.upsert_runtime_data(make_runtime_data("r2"))
+        db.update_runtime_data_status("r1", "completed")
+        db.update_runtime_data_status("r2", "failed", "boom")
+
+        self.assertEqual(db.get_runtime_data("r2").error_message, "boom")
+        stats = db.get_agent_statistics("agent-1")
+        self.assertEqual(stats["total_runs"], 2)
+        self.assertEqual(stats["completed_runs"], 1)
+        self.assertEqual(stats["failed_runs"], 1)
+
+    def test_codec_round_trips(self):
+        """各编码方式写入的数据都能原样读回，不同编码写入的行可以混合读取"""
+        codecs = [None, "zlib"]
+        if importlib.util.find_spec("zstandard"):
+            codecs.append("zstd")
+        if importlib.util.find_spec("msgpack"):
+            codecs.append("msgpack")
+
+        expected = make_runtime_data("expected")
+        for codec in codecs:
+            db = self.make_db(runtime_codec=codec)
+            db.upsert_runtime_data(make_runtime_data(f"run-{codec}"))
+
+        db = self.make_db(runtime_codec="zlib")
+        for codec in codecs:
+            with self.subTest(codec=codec):
+                stored = db.get_runtime_data(f"run-{codec}")
+                self.assertEqual(stored.input_data, expected.input_data)
+                self.assertEqual(stored.output_data, expected.output_data)
+                self.assertEqual(stored.reasoning_steps, expected.reasoning_steps)
+                self.assertEqual(stored.tool_calls, expected.tool_calls)
+                self.assertEqual(stored.metrics, expected.metrics)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,198 @@
+"""
+搜索管理器单元测试
+测试按父块去重、一次联查预取父块，以及RAG上下文按token预算装入
+"""
+
+import importlib.util
+import os
+import sys
+import types
+import unittest
+from unittest.mock import Mock, patch
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+KNOWLEDGE_FOCUS_DIR = os.path.join(PROJECT_ROOT, "core", "knowledge-focus")
+sys.path.insert(0, PROJECT_ROOT)
+
+# 部署后 knowledge-focus 的模块位于 core 包和 core.agent 包中，search_mgr 以 core.agent.search_mgr 导入
+import core
+core.__path__ = [os.path.join(PROJECT_ROOT, "core"), KNOWLEDGE_FOCUS_DIR]
+if "core.agent" not in sys.modules:
+    agent_package = types.ModuleType("core.agent")
+    agent_package.__path__ = [KNOWLEDGE_FOCUS_DIR]
+    sys.modules["core.agent"] = core.agent = agent_package
+
+try:
+    from sqlalchemy import event
+    from sqlmodel import Session, SQLModel, create_engine
+    from core.agent.db_mgr import Document, ParentChunk
+    from core.agent.models_mgr import ModelsMgr
+    if "core.agent.search_mgr" not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            "core.agent.search_mgr", os.path.join(PROJECT_ROOT, "tests", "unit", "search_mgr.py")
+        )
+        search_mgr = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = search_mgr
+        spec.loader.exec_module(search_mgr)
+    from core.agent.search_mgr import ContextEnhancer, SearchManager, dedupe_by_parent_chunk
+except ImportError as e:
+    raise unittest.SkipTest(f"搜索管理器无法在当前环境中导入: {e}")
+
+
+def make_result(parent_chunk_id, child_chunk_id, distance=None, document_id=1):
+    result = {
+        "parent_chunk_id": parent_chunk_id,
+        "child_chunk_id": child_chunk_id,
+        "document_id": document_id,
+        "retrieval_content": f"child {child_chunk_id}",
+    }
+    if distance is not None:
+        result["_distance"] = distance
+    return result
+
+
+class TestDedupeByParentChunk(unittest.TestCase):
+    """dedupe_by_parent_chunk 测试"""
+
+    def test_keeps_closest_hit_per_parent(self):
+        """同一父块只保留距离最近的子块，结果按距离从近到远排序"""
+        results = [
+            make_result(1, 10, 0.8),
+            make_result(2, 20, 0.3),
+            make_result(1, 11, 0.2),
+            make_result(3, 30, 0.5),
+        ]
+        deduped = dedupe_by_parent_chunk(results)
+        self.assertEqual([r["child_chunk_id"] for r in deduped], [11, 20, 30])
+
+    def test_missing_distance_sorts_last(self):
+        """缺少距离的结果排在最后，也不会替换同一父块中有距离的结果"""
+        results = [
+            make_result(1, 10),
+            make_result(2, 20, 0.9),
+            make_result(1, 11, 0.4),
+            make_result(3, 30),
+        ]
+        deduped = dedupe_by_parent_chunk(results)
+        self.assertEqual([r["child_chunk_id"] for r in deduped], [11, 20, 30])
+
+
+class TestFetchParentChunks(unittest.TestCase):
+    """ContextEnhancer.fetch_parent_chunks 和 SearchManager.search_documents 测试"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(self.engine, tables=[Document.__table__, ParentChunk.__table__])
+        with Session(self.engine) as session:
+            session.add(Document(id=1, file_path="/docs/a.md", file_hash="a", docling_json_path="/a.json"))
+            session.add(Document(id=2, file_path="/docs/b.pdf", file_hash="b", docling_json_path="/b.json"))
+            session.add(ParentChunk(id=1, document_id=1, chunk_type="text", content="parent one", metadata_json="{}"))
+            session.add(ParentChunk(id=2, document_id=2, chunk_type="image", content="/img/2.png", metadata_json="{}"))
+            session.add(ParentChunk(id=3, document_id=2, chunk_type="text", content="parent three", metadata_json="{}"))
+            session.commit()
+
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._record_statement)
+
+    def tearDown(self):
+        """测试后清理"""
+        event.remove(self.engine, "before_cursor_execute", self._record_statement)
+        self.engine.dispose()
+
+    def _record_statement(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def test_single_joined_query(self):
+        """一次联查取回父块内容、类型和文档路径，重复的父块ID只查询一次"""
+        chunks = ContextEnhancer(self.engine).fetch_parent_chunks([1, 2, 1, 99])
+
+        self.assertEqual(len(self.statements), 1)
+        self.assertEqual(sorted(chunks), [1, 2])
+        self.assertEqual(chunks[1]["content"], "parent one")
+        self.assertEqual(chunks[1]["file_path"], "/docs/a.md")
+        self.assertEqual(chunks[2]["chunk_type"], "image")
+        self.assertEqual(chunks[2]["document_name"], "b.pdf")
+
+    def test_empty_ids(self):
+        """没有父块ID时不查询数据库"""
+        self.assertEqual(ContextEnhancer(self.engine).fetch_parent_chunks([]), {})
+        self.assertEqual(self.statements, [])
+
+    def test_search_documents_returns_parent_results(self):
+        """检索流程只查询一次SQLite，parent_results 按父块去重并附带父块内容"""
+        lancedb_mgr = Mock()
+        lancedb_mgr.search_by_query.return_value = [
+            make_result(1, 10, 0.6, document_id=1),
+            make_result(3, 30, 0.2, document_id=2),
+            make_result(1, 11, 0.1, document_id=1),
+        ]
+        response = SearchManager(self.engine, lancedb_mgr, models_mgr=None).search_documents("query")
+
+        self.assertTrue(response["success"])
+        self.assertEqual(len(self.statements), 1)
+        self.assertEqual(len(response["raw_results"]), 3)
+        self.assertEqual(
+            [(r["child_chunk_id"], r["parent_content"]) for r in response["parent_results"]],
+            [(11, "parent one"), (30, "parent three")],
+        )
+        self.assertEqual(response["parent_results"][1]["file_path"], "/docs/b.pdf")
+        self.assertEqual(response["results"]["sources"][0]["chunk_id"], 1)
+
+
+class TestRagContextPacking(unittest.TestCase):
+    """ModelsMgr 的RAG上下文按token预算装入测试"""
+
+    def setUp(self):
+        """测试前准备"""
+        # ModelsMgr 是单例，直接创建未初始化的实例，只测试RAG相关的方法
+        self.mgr = ModelsMgr.__wrapped__.__new__(ModelsMgr.__wrapped__)
+        self.mgr.engine = None
+        self.mgr.base_dir = None
+        counter = Mock()
+        counter.count.side_effect = len
+        counter_patch = patch("core.agent.models_mgr.token_counter", counter)
+        counter_patch.start()
+        self.addCleanup(counter_patch.stop)
+
+    def patch_search(self, parent_results):
+        chat_mgr = Mock()
+        chat_mgr.get_pinned_document_ids.return_value = [1]
+        search_manager = Mock()
+        search_manager.search_documents.return_value = {"success": True, "parent_results": parent_results}
+        for target, value in (
+            ("core.agent.chatsession_mgr.ChatSessionMgr", chat_mgr),
+            ("core.agent.lancedb_mgr.LanceDBMgr", Mock()),
+            ("core.agent.search_mgr.SearchManager", search_manager),
+        ):
+            patcher = patch(target, Mock(return_value=value))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_parent_content_falls_back_to_retrieval_content(self):
+        """父块超过单个片段上限或是图片父块时使用子块检索内容"""
+        self.patch_search([
+            {**make_result(1, 10, 0.2), "file_path": "a", "chunk_type": "text", "parent_content": "p" * 20},
+            {**make_result(2, 20, 0.4), "file_path": "b", "chunk_type": "text", "parent_content": "q" * 200},
+            {**make_result(3, 30, 0.6), "file_path": "c", "chunk_type": "image", "parent_content": "/img.png"},
+        ])
+        candidates = self.mgr._get_rag_candidates(1, "query", max_part_tokens=100)
+
+        self.assertEqual(
+            [source["content"] for _, source, _ in candidates], ["p" * 20, "child 20", "child 30"]
+        )
+        self.assertEqual([tokens for part, _, tokens in candidates], [len(part) for part, _, _ in candidates])
+
+    def test_rag_context_fits_budget(self):
+        """按相关度依次装入预算，放不下的片段跳过，后面更短的片段仍可装入"""
+        candidates = [("a" * 40, {"id": 1}, 40), ("b" * 80, {"id": 2}, 80), ("c" * 30, {"id": 3}, 30)]
+        self.mgr._get_rag_candidates = Mock(return_value=candidates)
+
+        rag_context, sources = self.mgr._get_rag_context(1, "query", available_tokens=100)
+
+        self.assertEqual(sources, [{"id": 1}, {"id": 3}])
+        self.assertEqual(rag_context, "a" * 40 + "\n\n" + "c" * 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+ToolResultCache 单元测试
+测试内存层返回副本、内存命中同步最近访问时间，以及按最近访问淘汰 SQLite 中的结果
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.agno.tools import cache as cache_module
+from core.agno.tools.cache import ToolResultCache
+
+
+class TestToolResultCache(unittest.TestCase):
+    """ToolResultCache 测试"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """测试后清理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def last_access(self, cache, key):
+        return cache._conn.execute("SELECT last_access FROM tool_results WHERE key = ?", (key,)).fetchone()[0]
+
+    def test_memory_hits_return_copies(self):
+        """内存层每次返回新的副本，修改返回值不影响后续命中"""
+        cache = ToolResultCache(cache_dir=self.temp_dir)
+        cache.set("k", {"items": [1]}, ttl=60)
+        cache.get("k")["items"].append(2)
+        self.assertEqual(cache.get("k"), {"items": [1]})
+
+    def test_memory_hits_update_last_access(self):
+        """内存命中按间隔批量写回最近访问时间，常用的结果不会被当作最久未用淘汰"""
+        value = "x" * 100
+        cache = ToolResultCache(cache_dir=self.temp_dir, max_bytes=250)
+        original_interval = cache_module.ACCESS_FLUSH_INTERVAL
+        self.addCleanup(setattr, cache_module, "ACCESS_FLUSH_INTERVAL", original_interval)
+
+        cache.set("old", value, ttl=60)
+        cache.set("new", value, ttl=60)
+        stored_access = self.last_access(cache, "old")
+
+        # 间隔内的命中只记录在内存中
+        cache_module.ACCESS_FLUSH_INTERVAL = 3600
+        self.assertEqual(cache.get("old"), value)
+        self.assertEqual(self.last_access(cache, "old"), stored_access)
+
+        # 间隔到期后写回，淘汰时最久未用的是 new
+        cache_module.ACCESS_FLUSH_INTERVAL = 0
+        self.assertEqual(cache.get("old"), value)
+        self.assertGreater(self.last_access(cache, "old"), self.last_access(cache, "new"))
+
+        cache.set("third", value, ttl=60)
+        keys = [row[0] for row in cache._conn.execute("SELECT key FROM tool_results ORDER BY key")]
+        self.assertEqual(keys, ["old", "third"])
+
+    def test_eviction_applies_pending_hits(self):
+        """淘汰前先写回尚未同步的内存命中"""
+        value = "x" * 100
+        cache = ToolResultCache(cache_dir=self.temp_dir, max_bytes=250)
+        original_interval = cache_module.ACCESS_FLUSH_INTERVAL
+        self.addCleanup(setattr, cache_module, "ACCESS_FLUSH_INTERVAL", original_interval)
+        cache_module.ACCESS_FLUSH_INTERVAL = 3600
+
+        cache.set("old", value, ttl=60)
+        cache.set("new", value, ttl=60)
+        cache.get("old")
+        cache.set("third", value, ttl=60)
+
+        self.assertIsNotNone(cache.get("old"))
+        self.assertIsNone(cache._conn.execute("SELECT 1 FROM tool_results WHERE key = 'new'").fetchone())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,12 +4,13 @@
 """
 
 import logging
+import os
 from typing import List, Dict, Any, Optional
 from sqlmodel import Session, select
 from sqlalchemy import Engine
-from core.lancedb_mgr import LanceDBMgr
-from core.models_mgr import ModelsMgr
-from core.db_mgr import ParentChunk, Document
+from core.agent.lancedb_mgr import LanceDBMgr
+from core.agent.models_mgr import ModelsMgr
+from core.agent.db_mgr import ParentChunk, Document
 
 logger = logging.getLogger()
 
@@ -82,8 +83,15 @@ class ResultFormatter:
     def __init__(self, engine: Engine):
         self.engine = engine
 
-    def format_for_llm(self, search_results: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """组织检索结果为LLM友好格式"""
+    def format_for_llm(self, search_results: List[Dict[str, Any]],
+                       parent_chunks: Optional[Dict[int, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        组织检索结果为LLM友好格式，命中同一父块的多个结果只保留一次
+
+        Args:
+            search_results: 检索结果
+            parent_chunks: 已预取的父块信息（ContextEnhancer.fetch_parent_chunks的返回值），为空时自行查询
+        """
         if not search_results:
             return {
                 "context": "",
@@ -93,14 +101,15 @@ class ResultFormatter:
         
         try:
             # 获取所有相关的父块内容
-            parent_chunk_ids = [result['parent_chunk_id'] for result in search_results]
-            parent_chunks = self._get_parent_chunks_content(parent_chunk_ids)
+            if parent_chunks is None:
+                parent_chunk_ids = [result['parent_chunk_id'] for result in search_results]
+                parent_chunks = ContextEnhancer(self.engine).fetch_parent_chunks(parent_chunk_ids)
             
             # 组织上下文信息
             context_parts = []
             sources = []
             
-            for i, result in enumerate(search_results):
+            for result in dedupe_by_parent_chunk(search_results):
                 parent_chunk_id = result['parent_chunk_id']
                 parent_chunk = parent_chunks.get(parent_chunk_id)
                 
@@ -109,14 +118,14 @@ class ResultFormatter:
                     source_info = {
                         "chunk_id": parent_chunk_id,
                         "document_id": result['document_id'], 
-                        "chunk_type": parent_chunk.chunk_type,
+                        "chunk_type": parent_chunk['chunk_type'],
                         "similarity": 1.0 - result.get('_distance', 0.0),  # 转换为相似度分数
                         "content_preview": result['retrieval_content'][:100] + "..."
                     }
                     sources.append(source_info)
                     
                     # 添加上下文内容
-                    chunk_content = f"[来源-{i+1}] ({parent_chunk.chunk_type}类型)\n{parent_chunk.content}\n"
+                    chunk_content = f"[来源-{len(sources)}] ({parent_chunk['chunk_type']}类型)\n{parent_chunk['content']}\n"
                     context_parts.append(chunk_content)
             
             # 合并所有上下文
@@ -135,22 +144,6 @@ class ResultFormatter:
                 "sources": [],
                 "total_chunks": 0
             }
-    
-    def _get_parent_chunks_content(self, parent_chunk_ids: List[int]) -> Dict[int, ParentChunk]:
-        """批量获取父块内容"""
-        try:
-            with Session(self.engine) as session:
-                stmt = select(ParentChunk).where(ParentChunk.id.in_(parent_chunk_ids))
-                chunks = session.exec(stmt).all()
-                
-                # 转换为字典以便快速查找
-                chunks_dict = {chunk.id: chunk for chunk in chunks}
-                logger.debug(f"Retrieved {len(chunks_dict)} parent chunks")
-                return chunks_dict
-            
-        except Exception as e:
-            logger.error(f"Failed to get parent chunks: {e}")
-            return {}
 
 
 class ContextEnhancer:
@@ -159,41 +152,73 @@ class ContextEnhancer:
     def __init__(self, engine: Engine):
         self.engine = engine
 
-    def get_parent_chunks_by_ids(self, parent_chunk_ids: List[int]) -> List[Dict[str, Any]]:
-        """通过parent_chunk_id获取完整父块内容"""
+    def fetch_parent_chunks(self, parent_chunk_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        一次联查获取父块内容、类型及其文档路径
+
+        结果格式化、类型补充和RAG上下文组装都使用这一份数据，检索流程只需一次SQLite查询
+
+        Returns:
+            parent_chunk_id -> 父块信息字典
+        """
+        parent_chunk_ids = list(dict.fromkeys(parent_chunk_ids))
+        if not parent_chunk_ids:
+            return {}
         try:
             with Session(self.engine) as session:
-                stmt = select(ParentChunk).where(ParentChunk.id.in_(parent_chunk_ids))
-                chunks = session.exec(stmt).all()
+                stmt = select(
+                    ParentChunk.id, ParentChunk.document_id, ParentChunk.chunk_type,
+                    ParentChunk.content, ParentChunk.metadata_json, Document.file_path
+                ).join(
+                    Document, ParentChunk.document_id == Document.id
+                ).where(ParentChunk.id.in_(parent_chunk_ids))
                 
-                # 转换为字典格式，包含chunk类型信息
-                result = []
-                for chunk in chunks:
-                    chunk_data = {
-                        "id": chunk.id,
-                        "document_id": chunk.document_id, 
-                        "chunk_type": chunk.chunk_type,
-                        "content": chunk.content,
-                        "metadata": chunk.metadata_json
+                chunks = {}
+                for chunk_id, document_id, chunk_type, content, metadata_json, file_path in session.exec(stmt).all():
+                    chunks[chunk_id] = {
+                        "id": chunk_id,
+                        "document_id": document_id,
+                        "chunk_type": chunk_type,
+                        "content": content,
+                        "metadata": metadata_json,
+                        "file_path": file_path,
+                        # 从文件路径中提取文件名
+                        "document_name": os.path.basename(file_path) if file_path else 'Unknown'
                     }
-                    result.append(chunk_data)
                 
-                logger.info(f"Retrieved {len(result)} parent chunks with full content")
-                return result
+                logger.debug(f"Retrieved {len(chunks)} parent chunks")
+                return chunks
             
         except Exception as e:
-            logger.error(f"Failed to get parent chunks by IDs: {e}")
-            return []
+            logger.error(f"Failed to fetch parent chunks: {e}")
+            return {}
+
+    def get_parent_chunks_by_ids(self, parent_chunk_ids: List[int]) -> List[Dict[str, Any]]:
+        """通过parent_chunk_id获取完整父块内容"""
+        chunks = self.fetch_parent_chunks(parent_chunk_ids)
+        result = [
+            {key: chunk[key] for key in ("id", "document_id", "chunk_type", "content", "metadata")}
+            for chunk in chunks.values()
+        ]
+        logger.info(f"Retrieved {len(result)} parent chunks with full content")
+        return result
     
-    def add_chunk_type_info(self, search_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """为检索结果添加chunk类型信息"""
+    def add_chunk_type_info(self, search_results: List[Dict[str, Any]],
+                            parent_chunks: Optional[Dict[int, Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """
+        为检索结果添加chunk类型、文档名和文件路径信息
+
+        Args:
+            search_results: 检索结果
+            parent_chunks: 已预取的父块信息（fetch_parent_chunks的返回值），为空时自行查询
+        """
         if not search_results:
             return search_results
         
         try:
             # 获取所有相关的父块
-            parent_chunk_ids = [result['parent_chunk_id'] for result in search_results]
-            parent_chunks = self._get_chunks_type_info(parent_chunk_ids)
+            if parent_chunks is None:
+                parent_chunks = self.fetch_parent_chunks([result['parent_chunk_id'] for result in search_results])
             
             # 为每个结果添加类型信息
             enhanced_results = []
@@ -205,6 +230,7 @@ class ContextEnhancer:
                     chunk_info = parent_chunks[parent_chunk_id]
                     enhanced_result['chunk_type'] = chunk_info['chunk_type']
                     enhanced_result['document_name'] = chunk_info['document_name']
+                    enhanced_result['file_path'] = chunk_info['file_path']
                 else:
                     enhanced_result['chunk_type'] = 'unknown'
                     enhanced_result['document_name'] = 'unknown'
@@ -216,34 +242,17 @@ class ContextEnhancer:
         except Exception as e:
             logger.error(f"Failed to add chunk type info: {e}")
             return search_results
-    
-    def _get_chunks_type_info(self, parent_chunk_ids: List[int]) -> Dict[int, Dict[str, str]]:
-        """获取chunk类型和文档信息"""
-        try:
-            # 联查获取chunk和document信息
-            with Session(self.engine) as session:
-                stmt = select(ParentChunk, Document).join(
-                    Document, ParentChunk.document_id == Document.id
-                ).where(ParentChunk.id.in_(parent_chunk_ids))
-                
-                results = session.exec(stmt).all()
-                
-                chunks_info = {}
-                for chunk, document in results:
-                    # 从文件路径中提取文件名
-                    import os
-                    file_name = os.path.basename(document.file_path) if document.file_path else 'Unknown'
-                    
-                    chunks_info[chunk.id] = {
-                        'chunk_type': chunk.chunk_type,
-                        'document_name': file_name
-                    }
-                
-                return chunks_info
-            
-        except Exception as e:
-            logger.error(f"Failed to get chunks type info: {e}")
-            return {}
+
+
+def dedupe_by_parent_chunk(search_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """多个子块命中同一父块时只保留距离最近的结果，按距离从近到远排序"""
+    best = {}
+    for result in search_results:
+        parent_chunk_id = result['parent_chunk_id']
+        current = best.get(parent_chunk_id)
+        if current is None or result.get('_distance', float('inf')) < current.get('_distance', float('inf')):
+            best[parent_chunk_id] = result
+    return sorted(best.values(), key=lambda result: result.get('_distance', float('inf')))
 
 
 class SearchManager:
@@ -280,6 +289,7 @@ class SearchManager:
                 "success": bool,
                 "results": {...},  # 格式化的检索结果
                 "raw_results": [...],  # 原始LanceDB结果
+                "parent_results": [...],  # 按父块去重的结果，附带父块完整内容
                 "query_info": {...}   # 查询元信息
             }
         """
@@ -316,6 +326,7 @@ class SearchManager:
                         "total_chunks": 0
                     },
                     "raw_results": [],
+                    "parent_results": [],
                     "query_info": {
                         "original_query": query,
                         "cleaned_query": cleaned_query,
@@ -323,11 +334,23 @@ class SearchManager:
                     }
                 }
             
-            # 3. 增强检索结果（添加类型信息）
-            enhanced_results = self.context_enhancer.add_chunk_type_info(raw_results)
+            # 3. 一次联查预取父块内容、类型和文档路径，供后续步骤共用
+            parent_chunks = self.context_enhancer.fetch_parent_chunks(
+                [result['parent_chunk_id'] for result in raw_results]
+            )
+            
+            # 4. 增强检索结果（添加类型信息）
+            enhanced_results = self.context_enhancer.add_chunk_type_info(raw_results, parent_chunks)
+            
+            # 5. 格式化为LLM友好的格式
+            formatted_results = self.result_formatter.format_for_llm(enhanced_results, parent_chunks)
             
-            # 4. 格式化为LLM友好的格式
-            formatted_results = self.result_formatter.format_for_llm(enhanced_results)
+            # 6. 按父块去重，附带父块完整内容
+            parent_results = []
+            for result in dedupe_by_parent_chunk(enhanced_results):
+                parent_chunk = parent_chunks.get(result['parent_chunk_id'])
+                if parent_chunk:
+                    parent_results.append({**result, 'parent_content': parent_chunk['content']})
             
             logger.info(f"Search completed: {len(enhanced_results)} results found")
             
@@ -335,6 +358,7 @@ class SearchManager:
                 "success": True,
                 "results": formatted_results,
                 "raw_results": enhanced_results,
+                "parent_results": parent_results,
                 "query_info": {
                     "original_query": query,
                     "cleaned_query": cleaned_query,